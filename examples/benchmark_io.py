@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Compare gpy.io's chunked readers with naive line-by-line parsing, on synthetic files shaped like GMAT's output.
+# Usage: python benchmark_io.py [number of rows]
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+temp_dir = tempfile.mkdtemp()
+
+epochs = 21545.0 + np.arange(num_rows) * 60 / 86400
+states = np.random.default_rng(0).uniform(-1e4, 1e4, (num_rows, 6))
+
+# ReportFile with a Gregorian epoch column, as written by GMAT
+report_path = os.path.join(temp_dir, 'report.txt')
+with open(report_path, 'w') as f:
+    f.write('Sat.UTCGregorian          Sat.X                  Sat.Y                  Sat.Z                  '
+            'Sat.VX                 Sat.VY                 Sat.VZ\n')
+    gregorian = gpy.time.format_gregorian(epochs)
+    for start in range(0, num_rows, 100_000):
+        stop = min(start + 100_000, num_rows)
+        rows = np.column_stack([gregorian[start:stop]] + [np.char.mod('%-22.12f', states[start:stop, col])
+                                                           for col in range(6)])
+        f.write('\n'.join(' '.join(row) for row in rows) + '\n')
+
+# Single-segment CCSDS OEM
+oem_path = os.path.join(temp_dir, 'ephem.oem')
+with open(oem_path, 'w') as f:
+    f.write('CCSDS_OEM_VERS = 1.0\nCREATION_DATE = 2000-01-01T00:00:00\nORIGINATOR = GMAT\n\nMETA_START\n'
+            'OBJECT_NAME = Sat\nOBJECT_ID = Sat\nCENTER_NAME = Earth\nREF_FRAME = EME2000\nTIME_SYSTEM = UTC\n'
+            f'START_TIME = {gpy.time.format_iso(epochs[0])[0].decode()}\n'
+            f'STOP_TIME = {gpy.time.format_iso(epochs[-1])[0].decode()}\nMETA_STOP\n\n')
+    iso = gpy.time.format_iso(epochs).astype(str)
+    for start in range(0, num_rows, 100_000):
+        stop = min(start + 100_000, num_rows)
+        rows = np.column_stack([iso[start:stop]] + [np.char.mod('%.9f', states[start:stop, col]) for col in range(6)])
+        f.write('\n'.join(' '.join(row) for row in rows) + '\n')
+
+
+def naive_report(path: str):
+    with open(path) as report:
+        next(report)
+        values = []
+        for line in report:
+            tokens = line.split()
+            epoch = datetime.strptime(' '.join(tokens[:4]), '%d %b %Y %H:%M:%S.%f')
+            values.append([epoch] + [float(token) for token in tokens[4:]])
+    return values
+
+
+def naive_oem(path: str):
+    values = []
+    in_data = False
+    with open(path) as oem:
+        for line in oem:
+            line = line.strip()
+            if line == 'META_STOP':
+                in_data = True
+            elif in_data and line and line[0].isdigit():
+                tokens = line.split()
+                values.append([datetime.fromisoformat(tokens[0])] + [float(token) for token in tokens[1:]])
+    return values
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<40}{elapsed:8.3f} s  ({num_rows / elapsed / 1e6:.2f} M rows/s)')
+    return elapsed
+
+
+print(f'{num_rows} rows - report {os.path.getsize(report_path) / 1e6:.0f} MB, '
+      f'OEM {os.path.getsize(oem_path) / 1e6:.0f} MB')
+naive = timed('Report, naive line-by-line', lambda: naive_report(report_path))
+fast = timed('Report, gpy.io.ReportReader', lambda: gpy.io.ReportReader(report_path).read())
+print(f'{"":<40}{naive / fast:8.1f}x faster')
+naive = timed('OEM, naive line-by-line', lambda: naive_oem(oem_path))
+fast = timed('OEM, gpy.io.OemReader', lambda: gpy.io.OemReader(oem_path).read())
+print(f'{"":<40}{naive / fast:8.1f}x faster')
+
+# Time-range reads seek via the sidecar index written during the full reads above
+middle = epochs[num_rows // 2]
+timed('OEM, one hour from the middle (indexed)', lambda: gpy.io.OemReader(oem_path).read(middle, middle + 1 / 24))
+
+# Writing the same ephemeris back out
+
+
+def naive_write_oem(path: str):
+    with open(path, 'w') as oem:
+        oem.write('CCSDS_OEM_VERS = 1.0\n\nMETA_START\nOBJECT_NAME = Sat\nMETA_STOP\n\n')
+        for epoch, state in zip(iso, states):
+            oem.write(epoch + ''.join(f'   {value:.15e}' for value in state) + '\n')
+
+
+out_path = os.path.join(temp_dir, 'written.oem')
+naive = timed('OEM write, naive line-by-line', lambda: naive_write_oem(out_path))
+fast = timed('OEM write, gpy.io.write_oem', lambda: gpy.io.write_oem(out_path, epochs, states, {'OBJECT_NAME': 'Sat'}))
+print(f'{"":<40}{naive / fast:8.1f}x faster')
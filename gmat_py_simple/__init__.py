@@ -49,12 +49,25 @@ gmat: types.ModuleType = load_gmat.gmat
 from .api_funcs import *
 from .basics import *
 from .burn import *
+from .checkpoints import *
 from .commands import *
+from .engine import *
 from .executive import *
+from .fields import *
 from .hardware import *
 from .interpreter import *
+from .mission_cache import *
 from .parameter import *
 from .solver import *
 from .spacecraft import *
 from .orbit import *
+from .recorder import *
+from .results import *
 from .utils import *
+
+from . import data_cache
+from . import time
+from . import interpolation
+from . import analysis
+from . import io
+from . import session
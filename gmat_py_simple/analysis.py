@@ -0,0 +1,1028 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import numpy as np
+
+# Earth shape, matching GMAT's default Earth (EquatorialRadius and Flattening fields)
+EARTH_EQ_RADIUS: float = 6378.1363  # km
+EARTH_FLATTENING: float = 0.0033527
+_EARTH_E2: float = EARTH_FLATTENING * (2 - EARTH_FLATTENING)  # first eccentricity squared
+
+# GMAT's ModJulian epochs are offset from Julian Date by 2430000.0, so J2000 is 21545.0
+J2000_MJD: float = 21545.0
+SECS_PER_DAY: float = 86400.0
+
+# Body radii used by the shadow models, matching GMAT's default SolarSystem (km)
+BODY_RADII: dict[str, float] = {'Sun': 695990.0, 'Earth': EARTH_EQ_RADIUS, 'Luna': 1738.2}
+AU: float = 149597870.691  # km
+_OBLIQUITY_J2000: float = np.radians(23.43929111)
+
+
+class Ephemeris:
+    def __init__(self, epochs: np.ndarray | list, states: np.ndarray | list, names: list[str] = None):
+        """
+        Container for one or more recorded trajectories sampled at a common set of epochs.
+
+        :param epochs: 1D array of A1ModJulian epochs, strictly increasing
+        :param states: Cartesian states (X, Y, Z, VX, VY, VZ) in EarthMJ2000Eq, in km and km/s. Shape (n, 6) for
+        a single spacecraft or (m, n, 6) for m spacecraft
+        :param names: names of the spacecraft. Defaults to Sat0, Sat1, ...
+        """
+        self.epochs: np.ndarray = np.ascontiguousarray(epochs, dtype=float)
+        states = np.asarray(states, dtype=float)
+        if states.ndim == 2:
+            states = states[np.newaxis]
+        if self.epochs.ndim != 1 or states.ndim != 3 or states.shape[1:] != (len(self.epochs), 6):
+            raise AttributeError(f'Ephemeris states must have shape (n, 6) or (m, n, 6), where n is the number of '
+                                 f'epochs ({len(self.epochs)}). Shape given: {states.shape}')
+        if len(self.epochs) < 2 or np.any(np.diff(self.epochs) < 0):
+            raise AttributeError('Ephemeris epochs must contain at least two values and be in increasing order')
+        self.states: np.ndarray = np.ascontiguousarray(states)
+
+        if names is None:
+            names = [f'Sat{i}' for i in range(self.states.shape[0])]
+        elif len(names) != self.states.shape[0]:
+            raise AttributeError(f'Number of names ({len(names)}) does not match number of spacecraft in states '
+                                 f'({self.states.shape[0]})')
+        self.names: list[str] = list(names)
+        self.interpolator: gpy.interpolation.EphemerisInterpolator | None = None
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def __repr__(self) -> str:
+        return f'Ephemeris with {self.num_sats} spacecraft and {len(self)} epochs'
+
+    def set_interpolation(self, method: str = 'lagrange', order: int = 7, breaks: np.ndarray | list = None):
+        """
+        Use a higher-order EphemerisInterpolator for off-sample states (root-finding in access(), eclipse() and
+        find_events(), and interpolate()), instead of the default two-point cubic Hermite.
+
+        :param method: 'lagrange' or 'hermite'
+        :param order: polynomial degree
+        :param breaks: segment boundaries, e.g. maneuver epochs
+        """
+        self.interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, self.states, method, order, breaks)
+
+    def interpolate(self, epochs: np.ndarray | list | float, return_error: bool = False) -> np.ndarray | tuple:
+        """
+        Get the states of all spacecraft at arbitrary epochs within the ephemeris span.
+
+        :param epochs: A1ModJulian query epochs
+        :param return_error: also return the estimated position error (km) for each query
+        :return: (m, k, 6) array of states, plus (k,) error estimates if return_error
+        """
+        if self.interpolator is None:
+            self.set_interpolation()
+        result = self.interpolator.evaluate(epochs, return_error=return_error)
+        if return_error:
+            return result[0].reshape(self.num_sats, -1, 6), result[1]
+        return result.reshape(self.num_sats, -1, 6)
+
+    @property
+    def num_sats(self) -> int:
+        return self.states.shape[0]
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self.states[..., :3]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self.states[..., 3:]
+
+    def positions_at(self, sat_indexes: np.ndarray, interval_indexes: np.ndarray, epochs: np.ndarray) -> np.ndarray:
+        """
+        Get spacecraft positions at arbitrary epochs by cubic Hermite interpolation within a sample interval.
+
+        :param sat_indexes: index of the spacecraft for each query
+        :param interval_indexes: index i of the sample interval [epochs[i], epochs[i+1]] containing each query epoch
+        :param epochs: A1ModJulian query epochs
+        :return: (k, 3) array of positions in km
+        """
+        if self.interpolator is not None:
+            return self.interpolator.evaluate(epochs, sat_indexes, interval_indexes)[:, :3]
+        t0 = self.epochs[interval_indexes]
+        h = (self.epochs[interval_indexes + 1] - t0) * SECS_PER_DAY
+        # Zero-length intervals (repeated epochs at maneuvers) return the state at their start
+        s = np.divide((epochs - t0) * SECS_PER_DAY, h, out=np.zeros(len(h)), where=h > 0)[:, np.newaxis]
+        s2 = s * s
+        s3 = s2 * s
+        state0 = self.states[sat_indexes, interval_indexes]
+        state1 = self.states[sat_indexes, interval_indexes + 1]
+        return ((2 * s3 - 3 * s2 + 1) * state0[:, :3] + (s3 - 2 * s2 + s) * h[:, np.newaxis] * state0[:, 3:] +
+                (-2 * s3 + 3 * s2) * state1[:, :3] + (s3 - s2) * h[:, np.newaxis] * state1[:, 3:])
+
+    def states_at(self, sat_indexes: np.ndarray, interval_indexes: np.ndarray, epochs: np.ndarray) -> np.ndarray:
+        """
+        Get spacecraft states at arbitrary epochs by cubic Hermite interpolation within a sample interval. Velocities
+        are the derivative of the interpolating polynomial.
+
+        :param sat_indexes: index of the spacecraft for each query
+        :param interval_indexes: index i of the sample interval [epochs[i], epochs[i+1]] containing each query epoch
+        :param epochs: A1ModJulian query epochs
+        :return: (k, 6) array of states in km and km/s
+        """
+        if self.interpolator is not None:
+            return self.interpolator.evaluate(epochs, sat_indexes, interval_indexes)
+        t0 = self.epochs[interval_indexes]
+        h = ((self.epochs[interval_indexes + 1] - t0) * SECS_PER_DAY)[:, np.newaxis]
+        h = np.where(h > 0, h, np.inf)  # zero-length intervals return the state at their start
+        s = ((epochs - t0) * SECS_PER_DAY)[:, np.newaxis] / h
+        s2 = s * s
+        state0 = self.states[sat_indexes, interval_indexes]
+        state1 = self.states[sat_indexes, interval_indexes + 1]
+        velocities = ((6 * s2 - 6 * s) * (state0[:, :3] - state1[:, :3]) / h + (3 * s2 - 4 * s + 1) * state0[:, 3:] +
+                      (3 * s2 - 2 * s) * state1[:, 3:])
+        return np.concatenate((self.positions_at(sat_indexes, interval_indexes, epochs), velocities), axis=1)
+
+
+class StationSet:
+    def __init__(self, latitudes: np.ndarray | list, longitudes: np.ndarray | list,
+                 altitudes: np.ndarray | list = 0.0, min_elevations: np.ndarray | list = 0.0,
+                 names: list[str] = None):
+        """
+        Set of Earth ground stations, each with an elevation mask.
+
+        :param latitudes: geodetic latitudes in degrees
+        :param longitudes: longitudes in degrees
+        :param altitudes: altitudes above the ellipsoid in km
+        :param min_elevations: minimum elevation angles in degrees, below which a spacecraft is not visible
+        :param names: names of the stations. Defaults to Station0, Station1, ...
+        """
+        self.latitudes: np.ndarray = np.atleast_1d(np.asarray(latitudes, dtype=float))
+        num_stations = len(self.latitudes)
+        self.longitudes: np.ndarray = np.broadcast_to(np.asarray(longitudes, dtype=float), (num_stations,)).copy()
+        self.altitudes: np.ndarray = np.broadcast_to(np.asarray(altitudes, dtype=float), (num_stations,)).copy()
+        self.min_elevations: np.ndarray = np.broadcast_to(np.asarray(min_elevations, dtype=float),
+                                                          (num_stations,)).copy()
+
+        if names is None:
+            names = [f'Station{i}' for i in range(num_stations)]
+        elif len(names) != num_stations:
+            raise AttributeError(f'Number of names ({len(names)}) does not match number of stations ({num_stations})')
+        self.names: list[str] = list(names)
+
+        self.ecef: np.ndarray = geodetic_to_ecef(self.latitudes, self.longitudes, self.altitudes)
+        lat = np.radians(self.latitudes)
+        lon = np.radians(self.longitudes)
+        # Local vertical (ellipsoid normal) of each station, in Earth-fixed axes
+        self.up: np.ndarray = np.stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)), axis=1)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f'StationSet with {len(self)} stations'
+
+    @classmethod
+    def from_gmat(cls, names: list[str] = None) -> StationSet:
+        """
+        Build a StationSet from GroundStation objects that already exist in GMAT.
+
+        :param names: names of the GroundStations to use. Defaults to all GroundStations in GMAT
+        :return: StationSet
+        """
+        if names is None:
+            names = gpy.GroundStations()
+
+        lats, lons, alts, min_els = [], [], [], []
+        for name in names:
+            station = gmat.GetObject(name)
+            if station is None:
+                raise gpy.GMATNameError(name)
+            location = [float(station.GetField(f'Location{i}')) for i in range(1, 4)]
+            if station.GetField('StateType') == 'Cartesian':
+                location = list(ecef_to_geodetic(np.array([location]))[0])
+            lats.append(location[0])
+            lons.append(location[1])
+            alts.append(location[2])
+            min_els.append(float(station.GetField('MinimumElevationAngle')))
+
+        return cls(lats, lons, alts, min_els, names)
+
+
+class AccessWindows:
+    def __init__(self, station_indexes: np.ndarray, sat_indexes: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                 station_names: list[str], sat_names: list[str]):
+        """
+        Compact store of access windows. Each window i is the interval [starts[i], ends[i]] (A1ModJulian) during
+        which spacecraft sat_indexes[i] is above the elevation mask of station station_indexes[i].
+        """
+        self.station_indexes: np.ndarray = station_indexes
+        self.sat_indexes: np.ndarray = sat_indexes
+        self.starts: np.ndarray = starts
+        self.ends: np.ndarray = ends
+        self.station_names: list[str] = station_names
+        self.sat_names: list[str] = sat_names
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return (f'AccessWindows: {len(self)} windows over {len(self.station_names)} stations and '
+                f'{len(self.sat_names)} spacecraft')
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Window durations in seconds."""
+        return (self.ends - self.starts) * SECS_PER_DAY
+
+    def for_pair(self, station: int | str, sat: int | str) -> np.ndarray:
+        """
+        Get the windows for one station-spacecraft pair.
+
+        :param station: station index or name
+        :param sat: spacecraft index or name
+        :return: (k, 2) array of [start, end] A1ModJulian epochs
+        """
+        if isinstance(station, str):
+            station = self.station_names.index(station)
+        if isinstance(sat, str):
+            sat = self.sat_names.index(sat)
+        mask = (self.station_indexes == station) & (self.sat_indexes == sat)
+        return np.stack((self.starts[mask], self.ends[mask]), axis=1)
+
+
+def geodetic_to_ecef(latitudes: np.ndarray, longitudes: np.ndarray, altitudes: np.ndarray) -> np.ndarray:
+    """
+    Convert geodetic coordinates to Earth-fixed Cartesian positions.
+
+    :param latitudes: geodetic latitudes in degrees
+    :param longitudes: longitudes in degrees
+    :param altitudes: altitudes above the ellipsoid in km
+    :return: (k, 3) array of positions in km
+    """
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    n = EARTH_EQ_RADIUS / np.sqrt(1 - _EARTH_E2 * np.sin(lat) ** 2)  # prime vertical radius of curvature
+    return np.stack(((n + altitudes) * np.cos(lat) * np.cos(lon),
+                     (n + altitudes) * np.cos(lat) * np.sin(lon),
+                     (n * (1 - _EARTH_E2) + altitudes) * np.sin(lat)), axis=-1)
+
+
+def ecef_to_geodetic(positions: np.ndarray) -> np.ndarray:
+    """
+    Convert Earth-fixed Cartesian positions to geodetic coordinates.
+
+    :param positions: (k, 3) array of positions in km
+    :return: (k, 3) array of [latitude (deg), longitude (deg), altitude (km)]
+    """
+    x, y, z = positions[..., 0], positions[..., 1], positions[..., 2]
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1 - _EARTH_E2))
+    for _ in range(5):  # converges to well below a millimetre for Earth-orbit altitudes
+        n = EARTH_EQ_RADIUS / np.sqrt(1 - _EARTH_E2 * np.sin(lat) ** 2)
+        lat = np.arctan2(z + _EARTH_E2 * n * np.sin(lat), p)
+    n = EARTH_EQ_RADIUS / np.sqrt(1 - _EARTH_E2 * np.sin(lat) ** 2)
+    alt = np.where(np.abs(lat) < np.radians(80), p / np.cos(lat) - n, z / np.sin(lat) - n * (1 - _EARTH_E2))
+    return np.stack((np.degrees(lat), np.degrees(np.arctan2(y, x)), alt), axis=-1)
+
+
+def earth_rotation_angle(epochs: np.ndarray) -> np.ndarray:
+    """
+    Greenwich mean sidereal angle in radians, used to rotate EarthMJ2000Eq vectors into Earth-fixed axes.
+
+    Precession, nutation and polar motion are neglected, and UTC is used in place of UT1 (within 0.9 s), so
+    positions are accurate to a few km in the Earth-fixed frame - fine for visibility, not for precise geolocation.
+
+    :param epochs: A1ModJulian epochs
+    :return: angles in radians
+    """
+    epochs = np.asarray(epochs, dtype=float)
+    bounds = gpy.time.convert(np.array([epochs.min(), epochs.max()]), 'A1ModJulian', 'UTCModJulian')
+    if np.isclose(bounds[1] - bounds[0], epochs.max() - epochs.min(), rtol=0, atol=1e-9):
+        days = epochs + (bounds[0] - epochs.min()) - J2000_MJD  # no leap second in span, so offset is constant
+    else:
+        days = gpy.time.convert(epochs, 'A1ModJulian', 'UTCModJulian') - J2000_MJD
+    return np.radians(np.mod(280.46061837 + 360.98564736629 * days, 360.0))
+
+
+def inertial_to_fixed(vectors: np.ndarray, epochs: np.ndarray) -> np.ndarray:
+    """
+    Rotate EarthMJ2000Eq vectors into Earth-fixed axes.
+
+    :param vectors: (..., 3) array of vectors, with the second-last axis (if any) matching epochs
+    :param epochs: A1ModJulian epochs
+    :return: rotated vectors, same shape as vectors
+    """
+    theta = earth_rotation_angle(epochs)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    fixed = np.empty_like(vectors)
+    fixed[..., 0] = cos_t * vectors[..., 0] + sin_t * vectors[..., 1]
+    fixed[..., 1] = -sin_t * vectors[..., 0] + cos_t * vectors[..., 1]
+    fixed[..., 2] = vectors[..., 2]
+    return fixed
+
+
+def refine_roots(func, lower: np.ndarray, upper: np.ndarray, f_lower: np.ndarray, f_upper: np.ndarray,
+                 tol: float = 1e-3, max_iter: int = 50) -> np.ndarray:
+    """
+    Refine many bracketed roots at once with the Illinois variant of regula falsi.
+
+    :param func: function func(indexes, epochs) returning the event function for the brackets at indexes, evaluated
+    at the given A1ModJulian epochs
+    :param lower: lower bracket epochs
+    :param upper: upper bracket epochs
+    :param f_lower: event function values at lower
+    :param f_upper: event function values at upper
+    :param tol: convergence tolerance in seconds
+    :param max_iter: maximum number of iterations
+    :return: root epochs
+    """
+    a, b = lower.astype(float), upper.astype(float)
+    fa, fb = f_lower.astype(float), f_upper.astype(float)
+    roots = b.copy()
+    active = np.flatnonzero(fa != fb)
+    roots[fa == fb] = 0.5 * (a[fa == fb] + b[fa == fb])
+    tol_days = tol / SECS_PER_DAY
+
+    for _ in range(max_iter):
+        if len(active) == 0:
+            break
+        aa, bb, faa, fbb = a[active], b[active], fa[active], fb[active]
+        c = bb - fbb * (bb - aa) / (fbb - faa)
+        fc = func(active, c)
+
+        # Illinois step: move the retained end's function value halfway to zero if the same end is kept twice
+        crossed = np.sign(fc) != np.sign(fbb)
+        a[active] = np.where(crossed, bb, aa)
+        fa[active] = np.where(crossed, fbb, faa * 0.5)
+        b[active] = c
+        fb[active] = fc
+
+        converged = (np.abs(c - roots[active]) < tol_days) | (fc == 0) | (np.abs(bb - aa) < tol_days)
+        roots[active] = c
+        active = active[~converged]
+
+    return roots
+
+
+def _chunk_sizes(num_stations: int, num_sats: int, num_epochs: int, max_memory: float) -> tuple[int, int]:
+    # Work arrays are (sats, epochs, stations) float64, with a handful of temporaries alive at once
+    bytes_per_pair = num_epochs * 8 * 6
+    pairs = max(1, int(max_memory // bytes_per_pair))
+    station_chunk = min(num_stations, pairs)
+    sat_chunk = min(num_sats, max(1, pairs // station_chunk))
+    return station_chunk, sat_chunk
+
+
+def access(ephemeris: Ephemeris, stations: StationSet, tol: float = 1e-3,
+           max_memory: float = 256e6) -> AccessWindows:
+    """
+    Find every rise and set of every spacecraft in ephemeris over every station in stations.
+
+    Elevations are evaluated at the ephemeris epochs for all station-spacecraft pairs at once, visibility changes
+    are bracketed between samples, then each crossing is refined by root-finding on a Hermite-interpolated state.
+    Stations and spacecraft are processed in chunks so that working memory stays below max_memory. The ephemeris
+    should be sampled finely enough that no pass is shorter than the sample spacing.
+
+    :param ephemeris: Ephemeris of the spacecraft
+    :param stations: StationSet of ground stations
+    :param tol: crossing time tolerance in seconds
+    :param max_memory: approximate working memory budget in bytes
+    :return: AccessWindows
+    """
+    epochs = ephemeris.epochs
+    num_epochs = len(epochs)
+    station_chunk, sat_chunk = _chunk_sizes(len(stations), ephemeris.num_sats, num_epochs, max_memory)
+    sin_masks = np.sin(np.radians(stations.min_elevations))
+    station_up_dots = np.einsum('ij,ij->i', stations.ecef, stations.up)  # station position . local vertical
+    station_sq_norms = np.einsum('ij,ij->i', stations.ecef, stations.ecef)
+
+    def elevation_function(sat_positions_fixed: np.ndarray, st: np.ndarray) -> np.ndarray:
+        # sin(elevation) - sin(mask), positive when visible. Uses dot products against station vectors so no
+        #  (station, sat, epoch, 3) relative position array is needed
+        r_dot_up = sat_positions_fixed @ stations.up[st].T
+        r_dot_st = sat_positions_fixed @ stations.ecef[st].T
+        r_sq = np.einsum('...j,...j->...', sat_positions_fixed, sat_positions_fixed)[..., np.newaxis]
+        rel_norm = np.sqrt(r_sq - 2 * r_dot_st + station_sq_norms[st])
+        return (r_dot_up - station_up_dots[st]) / rel_norm - sin_masks[st]
+
+    station_results, sat_results, start_results, end_results = [], [], [], []
+    for sat_start in range(0, ephemeris.num_sats, sat_chunk):
+        sats = np.arange(sat_start, min(sat_start + sat_chunk, ephemeris.num_sats))
+        positions_fixed = inertial_to_fixed(ephemeris.positions[sats], epochs)  # (m, n, 3)
+
+        for station_start in range(0, len(stations), station_chunk):
+            st = np.arange(station_start, min(station_start + station_chunk, len(stations)))
+            f = elevation_function(positions_fixed, st)  # (m, n, s)
+            visible = f > 0
+
+            # Bracket visibility changes between consecutive samples
+            sat_i, epoch_i, st_i = np.nonzero(visible[:, :-1, :] != visible[:, 1:, :])
+            rising = visible[sat_i, epoch_i + 1, st_i]
+
+            def bracket_function(idx: np.ndarray, t: np.ndarray) -> np.ndarray:
+                pos = ephemeris.positions_at(sats[sat_i[idx]], epoch_i[idx], t)
+                pos_fixed = inertial_to_fixed(pos, t)
+                station = st[st_i[idx]]
+                rel = pos_fixed - stations.ecef[station]
+                sin_el = np.einsum('ij,ij->i', rel, stations.up[station]) / np.linalg.norm(rel, axis=1)
+                return sin_el - sin_masks[station]
+
+            crossings = refine_roots(bracket_function, epochs[epoch_i], epochs[epoch_i + 1],
+                                     f[sat_i, epoch_i, st_i], f[sat_i, epoch_i + 1, st_i], tol)
+
+            # Pairs visible at the first/last sample get windows opened/closed at the ephemeris bounds
+            first_sat, first_st = np.nonzero(visible[:, 0, :])
+            last_sat, last_st = np.nonzero(visible[:, -1, :])
+            event_sats = np.concatenate((sat_i, first_sat, last_sat))
+            event_sts = np.concatenate((st_i, first_st, last_st))
+            event_times = np.concatenate((crossings, np.full(len(first_sat), epochs[0]),
+                                          np.full(len(last_sat), epochs[-1])))
+            event_rising = np.concatenate((rising, np.ones(len(first_sat), dtype=bool),
+                                           np.zeros(len(last_sat), dtype=bool)))
+
+            # Sorted by pair then time, each pair's events alternate rise, set, rise, ...
+            order = np.lexsort((~event_rising, event_times, event_sats, event_sts))
+            event_sats, event_sts = event_sats[order], event_sts[order]
+            event_times, event_rising = event_times[order], event_rising[order]
+
+            station_results.append(st[event_sts[event_rising]].astype(np.int32))
+            sat_results.append(sats[event_sats[event_rising]].astype(np.int32))
+            start_results.append(event_times[event_rising])
+            end_results.append(event_times[~event_rising])
+
+    if station_results:
+        station_indexes = np.concatenate(station_results)
+        sat_indexes = np.concatenate(sat_results)
+        starts = np.concatenate(start_results)
+        ends = np.concatenate(end_results)
+    else:
+        station_indexes = sat_indexes = np.empty(0, dtype=np.int32)
+        starts = ends = np.empty(0)
+
+    order = np.lexsort((starts, sat_indexes, station_indexes))
+    return AccessWindows(station_indexes[order], sat_indexes[order], starts[order], ends[order],
+                         list(stations.names), list(ephemeris.names))
+
+
+class Intervals:
+    def __init__(self, sat_indexes: np.ndarray, starts: np.ndarray, ends: np.ndarray, sat_names: list[str],
+                 body_indexes: np.ndarray = None, body_names: list[str] = None):
+        """
+        Compact store of time intervals per spacecraft, e.g. eclipses. Interval i is [starts[i], ends[i]]
+        (A1ModJulian) for spacecraft sat_indexes[i], optionally caused by body body_indexes[i].
+        """
+        self.sat_indexes: np.ndarray = sat_indexes
+        self.starts: np.ndarray = starts
+        self.ends: np.ndarray = ends
+        self.sat_names: list[str] = sat_names
+        self.body_indexes: np.ndarray = body_indexes
+        self.body_names: list[str] = body_names
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f'Intervals: {len(self)} intervals over {len(self.sat_names)} spacecraft'
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Interval durations in seconds."""
+        return (self.ends - self.starts) * SECS_PER_DAY
+
+    def for_sat(self, sat: int | str) -> np.ndarray:
+        """
+        Get the intervals for one spacecraft.
+
+        :param sat: spacecraft index or name
+        :return: (k, 2) array of [start, end] A1ModJulian epochs
+        """
+        if isinstance(sat, str):
+            sat = self.sat_names.index(sat)
+        mask = self.sat_indexes == sat
+        return np.stack((self.starts[mask], self.ends[mask]), axis=1)
+
+
+class EclipseResults:
+    def __init__(self, umbra: Intervals, penumbra: Intervals, antumbra: Intervals, illumination: np.ndarray,
+                 beta: np.ndarray):
+        """
+        Results of eclipse(): shadow intervals, fraction of the Sun's disk visible (m, n) and beta angle in degrees
+        (m, n).
+        """
+        self.umbra: Intervals = umbra
+        self.penumbra: Intervals = penumbra
+        self.antumbra: Intervals = antumbra
+        self.illumination: np.ndarray = illumination
+        self.beta: np.ndarray = beta
+
+    def __repr__(self) -> str:
+        return (f'EclipseResults: {len(self.umbra)} umbra, {len(self.penumbra)} penumbra and {len(self.antumbra)} '
+                f'antumbra intervals')
+
+
+def sun_position(epochs: np.ndarray) -> np.ndarray:
+    """
+    Low-precision (about 0.01 deg) geocentric Sun position in EarthMJ2000Eq, from the Astronomical Almanac series.
+
+    :param epochs: A1ModJulian epochs
+    :return: (n, 3) array of positions in km
+    """
+    days = np.asarray(epochs, dtype=float) - J2000_MJD
+    mean_long = np.radians(280.460 + 0.9856474 * days)
+    mean_anom = np.radians(357.528 + 0.9856003 * days)
+    ecl_long = mean_long + np.radians(1.915 * np.sin(mean_anom) + 0.020 * np.sin(2 * mean_anom))
+    dist = AU * (1.00014 - 0.01671 * np.cos(mean_anom) - 0.00014 * np.cos(2 * mean_anom))
+    return np.stack((dist * np.cos(ecl_long),
+                     dist * np.cos(_OBLIQUITY_J2000) * np.sin(ecl_long),
+                     dist * np.sin(_OBLIQUITY_J2000) * np.sin(ecl_long)), axis=-1)
+
+
+def moon_position(epochs: np.ndarray) -> np.ndarray:
+    """
+    Low-precision (about 0.1 deg) geocentric Moon position in EarthMJ2000Eq, from the truncated series in
+    Montenbruck & Gill, Satellite Orbits, section 3.3.2.
+
+    :param epochs: A1ModJulian epochs
+    :return: (n, 3) array of positions in km
+    """
+    t = (np.asarray(epochs, dtype=float) - J2000_MJD) / 36525.0  # Julian centuries since J2000
+    l0 = np.radians(218.31617 + 481267.88088 * t - 1.3972 * t)
+    l = np.radians(134.96292 + 477198.86753 * t)  # Moon mean anomaly
+    lp = np.radians(357.52543 + 35999.04944 * t)  # Sun mean anomaly
+    f = np.radians(93.27283 + 483202.01873 * t)  # mean distance from ascending node
+    d = np.radians(297.85027 + 445267.11135 * t)  # mean elongation from Sun
+    arcsec = np.radians(1 / 3600)
+
+    ecl_long = l0 + arcsec * (22640 * np.sin(l) + 769 * np.sin(2 * l) - 4586 * np.sin(l - 2 * d) +
+                              2370 * np.sin(2 * d) - 668 * np.sin(lp) - 412 * np.sin(2 * f) -
+                              212 * np.sin(2 * l - 2 * d) - 206 * np.sin(l + lp - 2 * d) + 192 * np.sin(l + 2 * d) -
+                              165 * np.sin(lp - 2 * d) + 148 * np.sin(l - lp) - 125 * np.sin(d) -
+                              110 * np.sin(l + lp) - 55 * np.sin(2 * f - 2 * d))
+    ecl_lat = arcsec * (18520 * np.sin(f + ecl_long - l0 + arcsec * (412 * np.sin(2 * f) + 541 * np.sin(lp))) -
+                        526 * np.sin(f - 2 * d) + 44 * np.sin(l + f - 2 * d) - 31 * np.sin(-l + f - 2 * d) -
+                        25 * np.sin(-2 * l + f) - 23 * np.sin(lp + f - 2 * d) + 21 * np.sin(-l + f) +
+                        11 * np.sin(-lp + f - 2 * d))
+    dist = (385000 - 20905 * np.cos(l) - 3699 * np.cos(2 * d - l) - 2956 * np.cos(2 * d) - 570 * np.cos(2 * l) +
+            246 * np.cos(2 * l - 2 * d) - 205 * np.cos(lp - 2 * d) - 171 * np.cos(l + 2 * d) -
+            152 * np.cos(l + lp - 2 * d))
+
+    x = dist * np.cos(ecl_long) * np.cos(ecl_lat)
+    y = dist * np.sin(ecl_long) * np.cos(ecl_lat)
+    z = dist * np.sin(ecl_lat)
+    # Rotate from ecliptic to equatorial axes
+    return np.stack((x, np.cos(_OBLIQUITY_J2000) * y - np.sin(_OBLIQUITY_J2000) * z,
+                     np.sin(_OBLIQUITY_J2000) * y + np.cos(_OBLIQUITY_J2000) * z), axis=-1)
+
+
+_analytic_positions = {'Sun': sun_position, 'Luna': moon_position,
+                       'Earth': lambda epochs: np.zeros((len(np.atleast_1d(epochs)), 3))}
+_body_position_cache: dict[tuple, np.ndarray] = {}
+_BODY_POSITION_CACHE_SIZE: int = 16
+
+
+def body_position(body: str, epochs: np.ndarray, source: str = 'analytic') -> np.ndarray:
+    """
+    Geocentric position of the Sun, Earth or Luna in EarthMJ2000Eq. Results are cached per set of epochs, so
+    repeated analyses of the same ephemeris only compute them once.
+
+    :param body: 'Sun', 'Earth' or 'Luna'
+    :param epochs: A1ModJulian epochs
+    :param source: 'analytic' for the built-in low-precision series, or 'gmat' to query GMAT's SolarSystem (uses the
+    planetary ephemeris GMAT is configured with, but is much slower)
+    :return: (n, 3) array of positions in km
+    """
+    epochs = np.ascontiguousarray(epochs, dtype=float)
+    key = (body, source, len(epochs), hash(epochs.tobytes()))
+    positions = _body_position_cache.get(key)
+    if positions is not None:
+        return positions
+
+    if source == 'analytic':
+        try:
+            positions = _analytic_positions[body](epochs)
+        except KeyError:
+            raise AttributeError(f'No analytic position model for body {body}. Valid bodies: '
+                                 f'{list(_analytic_positions)}')
+    elif source == 'gmat':
+        gmat_body = gmat.GetSolarSystem().GetBody(body)
+        earth = gmat.GetSolarSystem().GetBody('Earth')
+        positions = np.empty((len(epochs), 3))
+        for index, epoch in enumerate(epochs):
+            a1_epoch = gmat.A1Mjd(float(epoch))
+            body_pos = gmat_body.GetMJ2000Position(a1_epoch)
+            earth_pos = earth.GetMJ2000Position(a1_epoch)
+            positions[index] = [body_pos[i] - earth_pos[i] for i in range(3)]
+    else:
+        raise AttributeError(f'Invalid source "{source}" - must be "analytic" or "gmat"')
+
+    positions.setflags(write=False)
+    if len(_body_position_cache) >= _BODY_POSITION_CACHE_SIZE:
+        _body_position_cache.pop(next(iter(_body_position_cache)))  # drop oldest entry
+    _body_position_cache[key] = positions
+    return positions
+
+
+def _body_position_interp(body: str, ephemeris: Ephemeris, interval_indexes: np.ndarray, epochs: np.ndarray,
+                          source: str) -> np.ndarray:
+    # Body positions at off-sample epochs: evaluated directly for the analytic series, otherwise linearly
+    #  interpolated between the cached samples (bodies move slowly compared to the sample spacing)
+    if source == 'analytic':
+        return _analytic_positions[body](epochs)
+    samples = body_position(body, ephemeris.epochs, source)
+    t0 = ephemeris.epochs[interval_indexes]
+    span = ephemeris.epochs[interval_indexes + 1] - t0
+    frac = np.divide(epochs - t0, span, out=np.zeros(len(span)), where=span > 0)[:, np.newaxis]
+    return samples[interval_indexes] * (1 - frac) + samples[interval_indexes + 1] * frac
+
+
+def _shadow_functions(sat_pos: np.ndarray, sun_pos: np.ndarray, body_pos: np.ndarray, body_radius: float,
+                      model: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Returns (outer, inner, body_larger, illumination). outer < 0 inside any shadow, inner < 0 inside the umbra
+    #  (body_larger True) or antumbra (body_larger False)
+    if model == 'cylindrical':
+        rel = sat_pos - body_pos
+        sun_dir = sun_pos - body_pos
+        sun_dir = sun_dir / np.linalg.norm(sun_dir, axis=-1, keepdims=True)
+        along = np.einsum('...j,...j->...', rel, sun_dir)
+        perp = np.linalg.norm(rel - along[..., np.newaxis] * sun_dir, axis=-1)
+        outer = np.where(along < 0, perp - body_radius, body_radius)
+        return outer, outer, np.ones(outer.shape, dtype=bool), (outer >= 0).astype(float)
+
+    if model != 'conical':
+        raise AttributeError(f'Invalid shadow model "{model}" - must be "conical" or "cylindrical"')
+
+    to_sun = sun_pos - sat_pos
+    to_body = body_pos - sat_pos
+    sun_dist = np.linalg.norm(to_sun, axis=-1)
+    body_dist = np.linalg.norm(to_body, axis=-1)
+    a = np.arcsin(np.minimum(BODY_RADII['Sun'] / sun_dist, 1))  # apparent radius of the Sun
+    b = np.arcsin(np.minimum(body_radius / body_dist, 1))  # apparent radius of the occulting body
+    c = np.arccos(np.clip(np.einsum('...j,...j->...', to_sun, to_body) / (sun_dist * body_dist), -1, 1))
+
+    outer = c - (a + b)
+    inner = c - np.abs(a - b)
+
+    # Fraction of the Sun's disk visible, from the area of overlap of two circles
+    illumination = np.ones(c.shape)
+    partial = (outer < 0) & (inner >= 0)
+    ap, bp, cp = a[partial], b[partial], c[partial]
+    x = (cp ** 2 + ap ** 2 - bp ** 2) / (2 * cp)
+    y = np.sqrt(np.maximum(ap ** 2 - x ** 2, 0))
+    overlap = (ap ** 2 * np.arccos(np.clip(x / ap, -1, 1)) + bp ** 2 * np.arccos(np.clip((cp - x) / bp, -1, 1)) -
+               cp * y)
+    illumination[partial] = 1 - overlap / (np.pi * ap ** 2)
+    full = inner < 0
+    illumination[full] = np.where(b[full] > a[full], 0.0, 1 - (b[full] / a[full]) ** 2)
+
+    return outer, inner, b > a, illumination
+
+
+def _positive_intervals(epochs: np.ndarray, f: np.ndarray, func, tol: float) -> tuple[np.ndarray, np.ndarray,
+                                                                                     np.ndarray]:
+    # Find all intervals where f > 0, for each row of the (k, n) array f sampled at epochs. Crossings are refined
+    #  with func(rows, interval_indexes, t). Returns (rows, starts, ends), ordered by row then start
+    positive = f > 0
+    rows, epoch_i = np.nonzero(positive[:, :-1] != positive[:, 1:])
+    rising = positive[rows, epoch_i + 1]
+    crossings = refine_roots(lambda idx, t: func(rows[idx], epoch_i[idx], t), epochs[epoch_i], epochs[epoch_i + 1],
+                             f[rows, epoch_i], f[rows, epoch_i + 1], tol)
+
+    first_rows = np.flatnonzero(positive[:, 0])
+    last_rows = np.flatnonzero(positive[:, -1])
+    event_rows = np.concatenate((rows, first_rows, last_rows))
+    event_times = np.concatenate((crossings, np.full(len(first_rows), epochs[0]), np.full(len(last_rows), epochs[-1])))
+    event_rising = np.concatenate((rising, np.ones(len(first_rows), dtype=bool), np.zeros(len(last_rows), dtype=bool)))
+
+    order = np.lexsort((~event_rising, event_times, event_rows))
+    event_rows, event_times, event_rising = event_rows[order], event_times[order], event_rising[order]
+    return event_rows[event_rising], event_times[event_rising], event_times[~event_rising]
+
+
+def _subtract_intervals(rows_a: np.ndarray, starts_a: np.ndarray, ends_a: np.ndarray, rows_b: np.ndarray,
+                        starts_b: np.ndarray, ends_b: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Set difference A - B of interval lists, where every B interval lies within an A interval of the same row
+    times = np.concatenate((starts_a, ends_a, starts_b, ends_b))
+    rows = np.concatenate((rows_a, rows_a, rows_b, rows_b))
+    # +1 entering A or leaving B, -1 leaving A or entering B, so a running total of 1 means inside A but not B
+    steps = np.concatenate((np.ones(len(starts_a)), -np.ones(len(ends_a)), -np.ones(len(starts_b)),
+                            np.ones(len(ends_b))))
+    order = np.lexsort((steps, times, rows))
+    times, rows, steps = times[order], rows[order], steps[order]
+    depth = np.cumsum(steps)
+    starts = np.flatnonzero((depth[:-1] == 1) & (times[1:] > times[:-1]))
+    return rows[starts], times[starts], times[starts + 1]
+
+
+def eclipse(ephemeris: Ephemeris, bodies: list[str] = None, model: str = 'conical', source: str = 'analytic',
+            tol: float = 1e-3, max_memory: float = 256e6) -> EclipseResults:
+    """
+    Find umbra, penumbra and antumbra intervals, illumination fraction and solar beta angle for every spacecraft in
+    an Ephemeris, in one pass over the data.
+
+    Sun and Moon positions are computed once per set of epochs and cached (see body_position()). Shadow boundaries
+    are bracketed between samples then refined by root-finding on Hermite-interpolated states.
+
+    :param ephemeris: Ephemeris of the spacecraft, centred on Earth
+    :param bodies: occulting bodies, from 'Earth' and 'Luna'. Defaults to ['Earth', 'Luna']
+    :param model: 'conical' (umbra, penumbra and antumbra) or 'cylindrical' (umbra only)
+    :param source: source of Sun and Moon positions - 'analytic' or 'gmat' (see body_position())
+    :param tol: boundary time tolerance in seconds
+    :param max_memory: approximate working memory budget in bytes
+    :return: EclipseResults
+    """
+    if bodies is None:
+        bodies = ['Earth', 'Luna']
+    for body in bodies:
+        if body not in BODY_RADII or body == 'Sun':
+            raise AttributeError(f'Invalid occulting body "{body}" - must be one of {["Earth", "Luna"]}')
+
+    epochs = ephemeris.epochs
+    num_sats, num_epochs = ephemeris.num_sats, len(epochs)
+    sun = body_position('Sun', epochs, source)
+    body_positions = [body_position(body, epochs, source) for body in bodies]
+
+    # Beta angle: angle between the orbit plane and the Sun direction
+    sun_dir = sun / np.linalg.norm(sun, axis=1, keepdims=True)
+    ang_mom = np.cross(ephemeris.positions, ephemeris.velocities)
+    ang_mom /= np.linalg.norm(ang_mom, axis=-1, keepdims=True)
+    beta = np.degrees(np.arcsin(np.clip(np.einsum('mnj,nj->mn', ang_mom, sun_dir), -1, 1)))
+
+    illumination = np.ones((num_sats, num_epochs))
+    results = {kind: ([], [], [], []) for kind in ('umbra', 'penumbra', 'antumbra')}
+    sat_chunk = max(1, min(num_sats, int(max_memory // (num_epochs * 8 * 16))))
+
+    for body_index, (body, body_pos) in enumerate(zip(bodies, body_positions)):
+        radius = BODY_RADII[body]
+
+        def boundary_function(which: int):
+            def func(sat_indexes: np.ndarray, interval_indexes: np.ndarray, t: np.ndarray) -> np.ndarray:
+                sat_pos = ephemeris.positions_at(sat_indexes, interval_indexes, t)
+                sun_t = _body_position_interp('Sun', ephemeris, interval_indexes, t, source)
+                body_t = _body_position_interp(body, ephemeris, interval_indexes, t, source)
+                return -_shadow_functions(sat_pos, sun_t, body_t, radius, model)[which]
+            return func
+
+        for sat_start in range(0, num_sats, sat_chunk):
+            sats = np.arange(sat_start, min(sat_start + sat_chunk, num_sats))
+            outer, inner, body_larger, illum = _shadow_functions(ephemeris.positions[sats], sun, body_pos, radius,
+                                                                 model)
+            illumination[sats] *= illum
+
+            def chunk_function(which: int):
+                func = boundary_function(which)
+                return lambda rows, interval_indexes, t: func(sats[rows], interval_indexes, t)
+
+            shadow = _positive_intervals(epochs, -outer, chunk_function(0), tol)
+            full = _positive_intervals(epochs, -inner, chunk_function(1), tol)
+
+            # Classify each full-shadow interval as umbra or antumbra from the geometry at its midpoint
+            mid_rows, mid_starts, mid_ends = full
+            mid = 0.5 * (mid_starts + mid_ends)
+            mid_interval = np.clip(np.searchsorted(epochs, mid) - 1, 0, num_epochs - 2)
+            mid_geom = _shadow_functions(ephemeris.positions_at(sats[mid_rows], mid_interval, mid),
+                                         _body_position_interp('Sun', ephemeris, mid_interval, mid, source),
+                                         _body_position_interp(body, ephemeris, mid_interval, mid, source),
+                                         radius, model)
+            is_umbra = mid_geom[2]
+
+            partial = (_subtract_intervals(*shadow, *full) if model == 'conical'
+                       else (np.empty(0, dtype=int), np.empty(0), np.empty(0)))
+            for kind, (rows, starts, ends) in (('umbra', (mid_rows[is_umbra], mid_starts[is_umbra],
+                                                          mid_ends[is_umbra])),
+                                               ('antumbra', (mid_rows[~is_umbra], mid_starts[~is_umbra],
+                                                             mid_ends[~is_umbra])),
+                                               ('penumbra', partial)):
+                results[kind][0].append(sats[rows].astype(np.int32))
+                results[kind][1].append(np.full(len(rows), body_index, dtype=np.int32))
+                results[kind][2].append(starts)
+                results[kind][3].append(ends)
+
+    intervals = {}
+    for kind, (sat_lists, body_lists, start_lists, end_lists) in results.items():
+        sat_indexes = np.concatenate(sat_lists) if sat_lists else np.empty(0, dtype=np.int32)
+        body_indexes = np.concatenate(body_lists) if body_lists else np.empty(0, dtype=np.int32)
+        starts = np.concatenate(start_lists) if start_lists else np.empty(0)
+        ends = np.concatenate(end_lists) if end_lists else np.empty(0)
+        order = np.lexsort((starts, sat_indexes))
+        intervals[kind] = Intervals(sat_indexes[order], starts[order], ends[order], list(ephemeris.names),
+                                    body_indexes[order], list(bodies))
+
+    return EclipseResults(intervals['umbra'], intervals['penumbra'], intervals['antumbra'], illumination, beta)
+
+
+class Event:
+    def __init__(self, name: str, function, direction: int = 0):
+        """
+        An event to detect in an ephemeris, defined as a zero crossing of an event function.
+
+        :param name: name of the event, used to label results
+        :param function: function(states, epochs) returning the event function value, where states is a (..., 6)
+        array of EarthMJ2000Eq Cartesian states and epochs are the matching A1ModJulian epochs
+        :param direction: 1 to detect only rising (negative to positive) crossings, -1 for only falling crossings, 0
+        for both
+        """
+        if direction not in (-1, 0, 1):
+            raise AttributeError(f'Invalid event direction {direction} - must be -1, 0 or 1')
+        self.name: str = name
+        self.function = function
+        self.direction: int = direction
+
+    def __repr__(self) -> str:
+        return f'Event {self.name}'
+
+    @classmethod
+    def Periapsis(cls) -> Event:
+        return cls('Periapsis', _radial_velocity, 1)
+
+    @classmethod
+    def Apoapsis(cls) -> Event:
+        return cls('Apoapsis', _radial_velocity, -1)
+
+    @classmethod
+    def AscendingNode(cls) -> Event:
+        return cls('AscendingNode', lambda states, epochs: states[..., 2], 1)
+
+    @classmethod
+    def DescendingNode(cls) -> Event:
+        return cls('DescendingNode', lambda states, epochs: states[..., 2], -1)
+
+    @classmethod
+    def Altitude(cls, altitude: float | int, direction: int = 0) -> Event:
+        """
+        :param altitude: geodetic altitude threshold in km
+        :param direction: 1 for ascending through the threshold, -1 for descending, 0 for both
+        """
+        return cls(f'Altitude={altitude}',
+                   lambda states, epochs: ecef_to_geodetic(states[..., :3])[..., 2] - altitude, direction)
+
+    @classmethod
+    def Latitude(cls, latitude: float | int, direction: int = 0) -> Event:
+        """
+        :param latitude: geodetic latitude threshold in degrees
+        :param direction: 1 for crossing northwards, -1 for southwards, 0 for both
+        """
+        return cls(f'Latitude={latitude}',
+                   lambda states, epochs: ecef_to_geodetic(states[..., :3])[..., 0] - latitude, direction)
+
+
+def _radial_velocity(states: np.ndarray, epochs: np.ndarray) -> np.ndarray:
+    # r . v, which crosses zero at periapsis (rising) and apoapsis (falling)
+    return np.einsum('...j,...j->...', states[..., :3], states[..., 3:])
+
+
+class EventResults:
+    def __init__(self, sat_indexes: np.ndarray, event_indexes: np.ndarray, epochs: np.ndarray, states: np.ndarray,
+                 sat_names: list[str], event_names: list[str]):
+        """
+        All detected events, ordered by epoch. Event i is event_names[event_indexes[i]] for spacecraft
+        sat_indexes[i], at A1ModJulian epoch epochs[i] with Cartesian state states[i].
+        """
+        self.sat_indexes: np.ndarray = sat_indexes
+        self.event_indexes: np.ndarray = event_indexes
+        self.epochs: np.ndarray = epochs
+        self.states: np.ndarray = states
+        self.sat_names: list[str] = sat_names
+        self.event_names: list[str] = event_names
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def __repr__(self) -> str:
+        return f'EventResults: {len(self)} events of {len(self.event_names)} types'
+
+    def select(self, event: int | str = None, sat: int | str = None) -> EventResults:
+        """
+        Get the subset of events of one type and/or for one spacecraft.
+
+        :param event: event index or name
+        :param sat: spacecraft index or name
+        :return: EventResults
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if event is not None:
+            if isinstance(event, str):
+                event = self.event_names.index(event)
+            mask &= self.event_indexes == event
+        if sat is not None:
+            if isinstance(sat, str):
+                sat = self.sat_names.index(sat)
+            mask &= self.sat_indexes == sat
+        return EventResults(self.sat_indexes[mask], self.event_indexes[mask], self.epochs[mask], self.states[mask],
+                            self.sat_names, self.event_names)
+
+    @staticmethod
+    def concatenate(results: list[EventResults]) -> EventResults:
+        """
+        Join several EventResults with the same spacecraft and events, e.g. from successive EventFinder updates.
+        """
+        return EventResults(np.concatenate([res.sat_indexes for res in results]),
+                            np.concatenate([res.event_indexes for res in results]),
+                            np.concatenate([res.epochs for res in results]),
+                            np.concatenate([res.states for res in results]).reshape(-1, 6),
+                            results[0].sat_names, results[0].event_names)
+
+
+def find_events(ephemeris: Ephemeris, events: list[Event], tol: float = 1e-3) -> EventResults:
+    """
+    Detect many events over every spacecraft in an Ephemeris in a single pass, instead of a separate Propagate with
+    a StopCondition per event.
+
+    Each event function is evaluated at all samples at once, sign changes are bracketed between samples (filtered by
+    each Event's direction), then all crossings are refined together by root-finding on Hermite-interpolated states.
+
+    :param ephemeris: Ephemeris of the spacecraft
+    :param events: list of Event objects, e.g. [Event.Periapsis(), Event.AscendingNode(), Event.Altitude(400)]
+    :param tol: event time tolerance in seconds
+    :return: EventResults
+    """
+    epochs = ephemeris.epochs
+    sat_lists, event_lists, epoch_lists = [], [], []
+    interval_lists = []
+
+    for event_index, event in enumerate(events):
+        values = event.function(ephemeris.states, epochs)  # (m, n)
+        sign = values > 0
+        change = sign[:, :-1] != sign[:, 1:]
+        if event.direction == 1:
+            change &= sign[:, 1:]
+        elif event.direction == -1:
+            change &= ~sign[:, 1:]
+        sat_i, epoch_i = np.nonzero(change)
+
+        def func(idx: np.ndarray, t: np.ndarray) -> np.ndarray:
+            states = ephemeris.states_at(sat_i[idx], epoch_i[idx], t)
+            return event.function(states, t)
+
+        roots = refine_roots(func, epochs[epoch_i], epochs[epoch_i + 1], values[sat_i, epoch_i],
+                             values[sat_i, epoch_i + 1], tol)
+        sat_lists.append(sat_i.astype(np.int32))
+        event_lists.append(np.full(len(sat_i), event_index, dtype=np.int32))
+        epoch_lists.append(roots)
+        interval_lists.append(epoch_i)
+
+    sat_indexes = np.concatenate(sat_lists) if sat_lists else np.empty(0, dtype=np.int32)
+    event_indexes = np.concatenate(event_lists) if event_lists else np.empty(0, dtype=np.int32)
+    event_epochs = np.concatenate(epoch_lists) if epoch_lists else np.empty(0)
+    interval_indexes = np.concatenate(interval_lists) if interval_lists else np.empty(0, dtype=int)
+
+    order = np.lexsort((event_indexes, sat_indexes, event_epochs))
+    sat_indexes, event_indexes = sat_indexes[order], event_indexes[order]
+    event_epochs, interval_indexes = event_epochs[order], interval_indexes[order]
+    states = ephemeris.states_at(sat_indexes, interval_indexes, event_epochs)
+
+    return EventResults(sat_indexes, event_indexes, event_epochs, states, list(ephemeris.names),
+                        [event.name for event in events])
+
+
+class EventFinder:
+    def __init__(self, events: list[Event], names: list[str] = None, tol: float = 1e-3):
+        """
+        Streaming version of find_events(), for use while a propagation is running. Feed it successive blocks of
+        samples with update(); each call returns the events found since the previous one, including any crossing
+        between the end of the previous block and the start of the new one.
+
+        :param events: list of Event objects
+        :param names: names of the spacecraft
+        :param tol: event time tolerance in seconds
+        """
+        self.events: list[Event] = events
+        self.names: list[str] = names
+        self.tol: float = tol
+        self._last_epoch: np.ndarray | None = None
+        self._last_states: np.ndarray | None = None
+        self._found: list[EventResults] = []
+
+    def update(self, epochs: np.ndarray | list | float, states: np.ndarray | list) -> EventResults:
+        """
+        Process a new block of samples.
+
+        :param epochs: A1ModJulian epochs of the new samples (a single epoch or a 1D array)
+        :param states: states of the new samples, shape (6,), (n, 6) or (m, n, 6)
+        :return: EventResults for events found in this block
+        """
+        epochs = np.atleast_1d(np.asarray(epochs, dtype=float))
+        states = np.asarray(states, dtype=float)
+        if states.ndim == 1:
+            states = states[np.newaxis]
+        if states.ndim == 2:
+            states = states[np.newaxis] if len(epochs) == states.shape[0] else states[:, np.newaxis]
+
+        if self._last_epoch is not None:
+            epochs = np.concatenate((self._last_epoch, epochs))
+            states = np.concatenate((self._last_states, states), axis=1)
+        self._last_epoch = epochs[-1:]
+        self._last_states = states[:, -1:]
+
+        if len(epochs) < 2:
+            return EventResults(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0),
+                                np.empty((0, 6)), self.names or [], [event.name for event in self.events])
+
+        ephemeris = Ephemeris(epochs, states, self.names)
+        self.names = ephemeris.names
+        found = find_events(ephemeris, self.events, self.tol)
+        self._found.append(found)
+        return found
+
+    @property
+    def results(self) -> EventResults:
+        """All events found so far."""
+        if not self._found:
+            return EventResults(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0),
+                                np.empty((0, 6)), self.names or [], [event.name for event in self.events])
+        return EventResults.concatenate(self._found)
@@ -58,6 +58,7 @@ def GetObject(obj: gpy.GmatObject | str):
 
 
 def Initialize() -> bool:
+    gpy.flush(initialize=False)  # GMAT initializes every object itself
     try:
         return gmat.Initialize()
     except Exception as ex:
@@ -73,6 +74,22 @@ def LoadScript(script_path: str) -> bool:
     return gmat.LoadScript(script_path)
 
 
+def RemoveObject(obj: gpy.GmatObject | str, only_if_unused: bool = True) -> bool:
+    """
+    Remove a configured object from GMAT via the Moderator, freeing it.
+
+    :param obj: object or name of the object to remove
+    :param only_if_unused: if True, leave the object in place if another configured object or command refers to it
+    :return: True if the object was removed, False if it was not found or is still in use
+    """
+    name = obj if isinstance(obj, str) else obj.name
+    mod = gmat.Moderator.Instance()
+    gmat_obj = mod.GetConfiguredObject(name)
+    if gmat_obj is None:
+        return False
+    return bool(mod.RemoveObject(gmat_obj.GetType(), name, only_if_unused))
+
+
 def RunScript() -> bool:
     return gmat.RunScript()
 
@@ -31,6 +31,10 @@ class GmatObject:
         return gpy.extract_gmat_obj(self).GetBooleanParameter(param)
 
     def GetEpoch(self, as_datetime: bool = False) -> str | datetime:
+        if as_datetime and isinstance(self, gpy.Spacecraft):
+            # Use the numeric epoch rather than switching DateFormat to UTCGregorian and parsing the string
+            return gpy.time.to_datetime64(self.epoch_mjd('UTC')).item()
+
         if isinstance(self, gpy.Spacecraft):
             self.gmat_obj.TakeAction('UpdateEpoch')
         up_to_date_obj = self.GetObject()
@@ -51,14 +55,14 @@ class GmatObject:
         :param field:
         :return:
         """
-        return self.gmat_obj.GetField(field)
+        return gpy.extract_gmat_obj(self).GetField(field)
 
     def GetGeneratingString(self) -> str:
         """
         Return the GMAT script commands to form an object
         :return:
         """
-        return self.gmat_obj.GetGeneratingString()
+        return gpy.extract_gmat_obj(self).GetGeneratingString()
 
     def GetIntegerParameter(self, param: str | int) -> int:
         if isinstance(param, str):
@@ -153,7 +157,7 @@ class GmatObject:
         :param val:
         :return:
         """
-        self.gmat_obj.SetField(field, val)
+        gpy.extract_gmat_obj(self).SetField(field, val)
 
     def SetFields(self, fields_to_set: dict):
         """
@@ -174,7 +178,7 @@ class GmatObject:
 
     def SetOnOffParameter(self, field: str, on_off: str):
         if (on_off == 'On') or (on_off == 'Off'):
-            self.gmat_obj.SetOnOffParameter(field, on_off)
+            gpy.extract_gmat_obj(self).SetOnOffParameter(field, on_off)
         else:
             raise SyntaxError(f'Invalid argument OnOff - {on_off} - must be "On" or "Off"')
 
@@ -225,7 +229,7 @@ class GmatObject:
 
     def Validate(self) -> bool:
         try:
-            return self.gmat_obj.Validate()
+            return gpy.extract_gmat_obj(self).Validate()
         except Exception as ex:
             raise RuntimeError(
                 f'{type(self).__name__} named "{self.name}" failed to Validate - see GMAT exception above') \
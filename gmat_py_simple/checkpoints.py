@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+class _Checkpoint:
+    def __init__(self, result: gpy.MissionResult, burn_elements: dict[str, list[float]]):
+        # Values of every spacecraft, tank, burn and solver after a prefix of a mission's top-level commands
+        self.result: gpy.MissionResult = result
+        self.burn_elements: dict[str, list[float]] = burn_elements
+
+
+class MissionCheckpoints:
+    def __init__(self, max_checkpoints: int = 256):
+        """
+        Checkpoints for incremental re-runs of a mission, for design sessions that repeatedly tweak the end of a long
+        mission command sequence:
+
+            checkpoints = gpy.MissionCheckpoints()
+            gpy.RunMission(mcs, checkpoints=checkpoints)  # runs everything, checkpointing each top-level command
+            mcs[-1] = gpy.Propagate('Prop to periapsis', ...)  # or change a late Maneuver's burn
+            gpy.RunMission(mcs, checkpoints=checkpoints)  # resumes after the last unchanged command
+
+        With checkpoints, the mission is run in stages of one top-level command each (or several, while a finite
+        burn is active, as a new Sandbox starts with the thrusters off). After each stage the spacecraft epochs,
+        states and masses, tank fuel masses, ImpulsiveBurn elements (e.g. values found by a Target) and solver
+        statuses are stored under a hash of the commands so far and of every configured object they refer to
+        (directly, or through other objects), plus the GMAT version and data files. On a re-run, the longest prefix
+        whose hash is unchanged is skipped: its checkpoint is applied to the configured objects and the run continues
+        from the next command. The configured objects are restored to their original values after the run.
+
+        The last stage is always run, so GMAT's runtime objects hold the final values as after a normal run. If
+        spacecraft in the mission have tanks with the same name, the mission is run as one stage. Variables, Arrays
+        and subscribers such as ReportFiles are not checkpointed, so resumed runs only write output for the commands
+        actually run.
+
+        :param max_checkpoints: maximum number of checkpoints to keep, least recently used being dropped first
+        """
+        if int(max_checkpoints) < 1:
+            raise AttributeError(f'max_checkpoints must be a positive integer - given value: {max_checkpoints}')
+        self.max_checkpoints: int = int(max_checkpoints)
+        self._checkpoints: OrderedDict[str, _Checkpoint] = OrderedDict()
+        self.commands_skipped: int = 0  # top-level commands skipped in the last run
+
+    def __repr__(self):
+        return f'MissionCheckpoints with {len(self)} checkpoints'
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    def invalidate(self):
+        """
+        Remove all checkpoints.
+        """
+        self._checkpoints.clear()
+
+    @staticmethod
+    def prefix_keys(mission_command_sequence: list[gpy.GmatCommand | gmat.GmatCommand]) -> list[str]:
+        """
+        Get the checkpoint key of each prefix of a mission's top-level commands, in their current configuration.
+
+        :param mission_command_sequence: the mission command sequence, starting with BeginMissionSequence
+        :return: hex digests, the first for the sequence up to and including the first command after
+        BeginMissionSequence
+        """
+        gpy.flush(initialize=False)
+        generating_strings = {name: gmat.GetObject(name).GetGeneratingString()
+                              for name in gmat.ConfigManager.Instance().GetListOfAllItems()}
+        digest = hashlib.sha256(gpy.mission_cache._environment_key(list(generating_strings.values())).encode())
+        included: set[str] = set()
+
+        def add(text: str):
+            digest.update(text.encode())
+            digest.update(b'\0')
+            # Add the configured objects the text refers to, and those they refer to in turn
+            pending = [text]
+            while pending:
+                for name in sorted(set(_IDENTIFIER.findall(pending.pop())) & generating_strings.keys() - included):
+                    included.add(name)
+                    digest.update(generating_strings[name].encode())
+                    digest.update(b'\0')
+                    pending.append(generating_strings[name])
+
+        keys = []
+        for command in mission_command_sequence[1:]:
+            for sub_command in gpy.results._walk_commands([command]):
+                add(gpy.extract_gmat_obj(sub_command).GetGeneratingString())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def run(self, mission_command_sequence: list[gpy.GmatCommand | gmat.GmatCommand],
+            progress: Callable[[gpy.MissionProgress], None] = None) -> gpy.MissionResult:
+        """
+        Run a mission from its last unchanged checkpoint, checkpointing each top-level command that is run. Usually
+        called through gpy.RunMission(mcs, checkpoints=checkpoints).
+
+        :param mission_command_sequence: the mission command sequence, starting with BeginMissionSequence
+        :param progress: optional function called with a gpy.MissionProgress event, as for gpy.RunMission()
+        :return: MissionResult of the whole mission
+        """
+        bms, commands = mission_command_sequence[0], mission_command_sequence[1:]
+        if not commands:
+            raise AttributeError('mission_command_sequence must contain at least one command after '
+                                 'BeginMissionSequence')
+        keys = self.prefix_keys(mission_command_sequence)
+        sat_names, tank_names, burn_names = _involved(mission_command_sequence)
+        boundaries = _stage_ends(commands, tank_names)
+
+        # Resume after the longest checkpointed prefix, always leaving at least the last stage to run
+        start = 0
+        for end in reversed(boundaries[:-1]):
+            if keys[end - 1] in self._checkpoints:
+                start = end
+                self._checkpoints.move_to_end(keys[end - 1])
+                break
+        self.commands_skipped = start
+
+        def stage_progress(event: gpy.MissionProgress):
+            if event.run_state != 'IDLE':  # only the end of the last stage is the end of the run
+                progress(event)
+
+        originals = gpy.snapshot_objects(sat_names, tank_names, burn_names)
+        try:
+            if start:
+                _apply(self._checkpoints[keys[start - 1]])
+                _mark_run(commands[:start])
+
+            for end in [end for end in boundaries if end > start]:
+                _run_stage([bms] + commands[start:end], stage_progress if progress is not None else None)
+                checkpoint = _capture(mission_command_sequence)
+                if end < len(commands):
+                    self._store(keys[end - 1], checkpoint)
+                    _apply(checkpoint)  # the next stage starts from this stage's final values
+                start = end
+        finally:
+            gpy.restore_objects(originals)
+
+        if progress is not None:
+            progress(gpy.MissionProgress('IDLE', commands[-1].GetName() or commands[-1].GetTypeName()))
+        return checkpoint.result
+
+    def _store(self, key: str, checkpoint: _Checkpoint):
+        self._checkpoints[key] = checkpoint
+        self._checkpoints.move_to_end(key)
+        while len(self._checkpoints) > self.max_checkpoints:
+            self._checkpoints.popitem(last=False)
+
+
+def _involved(mission_command_sequence: list) -> tuple[list[str], list[str], list[str]]:
+    # Names of the spacecraft, tanks (one entry per spacecraft and tank pair) and burns used by a mission
+    sat_names, tank_names, burn_names = [], [], []
+    for command in gpy.results._walk_commands(mission_command_sequence):
+        if isinstance(command, gpy.Propagate | gpy.Maneuver):
+            sat = command.sat if isinstance(command, gpy.Propagate) else command.spacecraft
+            if sat.GetName() not in sat_names:
+                sat_names.append(sat.GetName())
+                tank_names.extend(tank.name for tank in (getattr(sat, 'chem_tanks', None) or []) +
+                                  (getattr(sat, 'elec_tanks', None) or []))
+        if isinstance(command, gpy.Maneuver) and command.burn.name not in burn_names:
+            burn_names.append(command.burn.name)
+    return sat_names, tank_names, burn_names
+
+
+def _stage_ends(commands: list, tank_names: list[str]) -> list[int]:
+    # Indices after which the mission can be split into separately run stages: not while a finite burn is active,
+    #  as a new Sandbox starts with its thrusters off. Each spacecraft clones its tanks from the configured tank of
+    #  the same name, so if spacecraft share a tank name their masses can't be carried between stages at all
+    if len(set(tank_names)) < len(tank_names):
+        return [len(commands)]
+    ends, finite_burns_active = [], 0
+    for index, command in enumerate(commands):
+        for sub_command in gpy.results._walk_commands([command]):
+            type_name = gpy.extract_gmat_obj(sub_command).GetTypeName()
+            finite_burns_active += (type_name == 'BeginFiniteBurn') - (type_name == 'EndFiniteBurn')
+        if not finite_burns_active or index == len(commands) - 1:
+            ends.append(index + 1)
+    return ends
+
+
+def _run_stage(stage: list, progress):
+    # Run a stage's commands, then detach them (without deleting them) from the Moderator's sequence so the next
+    #  stage starts from an empty sequence
+    try:
+        gpy.RunMission(stage, progress=progress)
+    finally:
+        first = gmat.Moderator.Instance().GetFirstCommand()
+        for stage_command in stage:
+            first.Remove(gpy.extract_gmat_obj(stage_command))
+
+
+def _mark_run(commands: list):
+    # Update wrapper objects as gpy.RunMission() does after a run, for commands skipped by resuming
+    for command in gpy.results._walk_commands(commands):
+        if isinstance(command, gpy.Propagate):
+            command.sat.was_propagated = True
+        elif isinstance(command, gpy.Maneuver):
+            command.burn.was_propagated = True
+            command.burn.has_fired = True
+        elif isinstance(command, gpy.Target):
+            command.solver.was_propagated = True
+
+
+def _capture(mission_command_sequence: list) -> _Checkpoint:
+    result = gpy.MissionResult.capture(mission_command_sequence)
+    burn_elements = {name: [gpy.results._runtime_object(name).GetRealParameter(element)
+                            for element in gpy.results._BURN_ELEMENTS]
+                     for name, delta_mass in zip(result.burn_names, result.delta_tank_masses)
+                     if not np.isnan(delta_mass)}  # ImpulsiveBurns only
+    return _Checkpoint(result, burn_elements)
+
+
+def _apply(checkpoint: _Checkpoint):
+    # Set the configured objects to a checkpoint's values, so the next Sandbox run starts from them
+    result = checkpoint.result
+    for sat_name, epoch, state in zip(result.sat_names, result.epochs, result.states):
+        sat = gmat.GetObject(sat_name)
+        sat.SetField('DateFormat', 'A1ModJulian')
+        sat.SetField('Epoch', repr(float(epoch)))
+        gpy.results._set_cartesian(sat, state)
+    for tank_name, fuel_mass in zip(result.tank_names, result.fuel_masses):
+        gmat.GetObject(tank_name).SetField('FuelMass', repr(float(fuel_mass)))
+    for burn_name, elements in checkpoint.burn_elements.items():
+        burn = gmat.GetObject(burn_name)
+        for element, value in zip(gpy.results._BURN_ELEMENTS, elements):
+            burn.SetField(element, repr(float(value)))
@@ -4,6 +4,7 @@ from math import pi
 from gmat_py_simple import gmat
 
 import gmat_py_simple as gpy
+from gmat_py_simple.fields import GmatField
 from gmat_py_simple.utils import *
 
 
@@ -39,10 +40,10 @@ class GmatCommand:
 
     def GetGeneratingString(self, mode: int = gmat.NO_COMMENTS, prefix: str = '', use_name: str = 'self.name') -> str:
         use_name = self.name
-        return self.gmat_obj.GetGeneratingString(mode, prefix, use_name)
+        return gpy.extract_gmat_obj(self).GetGeneratingString(mode, prefix, use_name)
 
     def GetField(self, field: str) -> str:
-        return self.gmat_obj.GetField(field)
+        return gpy.extract_gmat_obj(self).GetField(field)
 
     def GetMissionSummary(self):
         return self.gmat_obj.GetStringParameter('MissionSummary')
@@ -106,7 +107,7 @@ class GmatCommand:
         return gpy.extract_gmat_obj(self).SetBooleanParameter(param, value)
 
     def SetField(self, field: str, value) -> bool:
-        return self.gmat_obj.SetField(field, value)
+        return gpy.extract_gmat_obj(self).SetField(field, value)
 
     def SetGlobalObjectMap(self, gom: gmat.ObjectMap) -> bool:
         return extract_gmat_obj(self).SetGlobalObjectMap(gom)
@@ -136,7 +137,7 @@ class GmatCommand:
 
     def Validate(self) -> bool:
         try:
-            return self.gmat_obj.Validate()
+            return gpy.extract_gmat_obj(self).Validate()
         except Exception as ex:
             raise RuntimeError(f'{type(self).__name__} named "{self.name}" failed to Validate') from ex
 
@@ -742,6 +743,16 @@ class Target(SolverBranchCommand):
 
 
 class Vary(SolverSequenceCommand):
+    # GMAT takes these as strings, so they may also be e.g. the names of Variables
+    variable = GmatField('Variable', 'SetStringParameter', reinitialize=True)
+    initial_value = GmatField('InitialValue', 'SetStringParameter', str, reinitialize=True)
+    perturbation = GmatField('Perturbation', 'SetStringParameter', str, reinitialize=True)
+    lower = GmatField('Lower', 'SetStringParameter', str, reinitialize=True)
+    upper = GmatField('Upper', 'SetStringParameter', str, reinitialize=True)
+    max_step = GmatField('MaxStep', 'SetStringParameter', str, reinitialize=True)
+    additive_scale_factor = GmatField('AdditiveScaleFactor', 'SetStringParameter', str, reinitialize=True)
+    multiplicative_scale_factor = GmatField('MultiplicativeScaleFactor', 'SetStringParameter', str, reinitialize=True)
+
     def __init__(self, name: str, solver: gpy.DifferentialCorrector | gmat.DifferentialCorrector, variable: str,
                  initial_value: float | int = 1, perturbation: float | int = 0.0001, lower: float | int = 0.0,
                  upper: float | int = pi, max_step: float | int = 0.5, additive_scale_factor: float | int = 0.0,
@@ -764,8 +775,8 @@ class Vary(SolverSequenceCommand):
         self.SetRefObject(self.solver, gmat.SOLVER, self.solver.GetName())
         self.SetStringParameter('SolverName', self.solver.GetName())
 
+        # Written to GMAT in one batch before the command is initialized below - see GmatField
         self.variable = variable
-        self.SetStringParameter('Variable', self.variable)
 
         if initial_value < lower:
             raise RuntimeError('initial_value is less than lower (minimum value) in Vary.__init__().'
@@ -777,25 +788,12 @@ class Vary(SolverSequenceCommand):
                                f'\n- upper:\t\t\t{upper}')
 
         self.initial_value = initial_value
-        self.SetStringParameter('InitialValue', str(self.initial_value))
-
         self.perturbation = perturbation
-        self.SetStringParameter('Perturbation', str(self.perturbation))
-
         self.lower = lower
-        self.SetStringParameter('Lower', str(self.lower))
-
         self.upper = upper
-        self.SetStringParameter('Upper', str(self.upper))
-
         self.max_step = max_step
-        self.SetStringParameter('MaxStep', str(self.max_step))
-
         self.additive_scale_factor = additive_scale_factor
-        self.SetStringParameter('AdditiveScaleFactor', str(self.additive_scale_factor))
-
         self.multiplicative_scale_factor = multiplicative_scale_factor
-        self.SetStringParameter('MultiplicativeScaleFactor', str(self.multiplicative_scale_factor))
 
         self.SetSolarSystem()
         self.SetObjectMap(gpy.Moderator().GetConfiguredObjectMap())
@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+import numpy as np
+
+# Bodies whose gravity files have their own path in GMAT's startup file (e.g. EARTH_POT_PATH)
+_POT_PATH_BODIES: list[str] = ['Earth', 'Luna', 'Venus', 'Mars']
+
+_gravity_cache: dict[str, GravityCoefficients] = {}
+
+
+def cache_dir() -> str:
+    """
+    Get the directory used for cached data files, creating it if needed. Set the GMAT_PY_SIMPLE_CACHE environment
+    variable to override the default of ~/.cache/gmat_py_simple.
+
+    :return: path to the cache directory
+    """
+    path = os.environ.get('GMAT_PY_SIMPLE_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'gmat_py_simple'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _file_key(path: str, *extra) -> str:
+    # Key for a source file version: path, modification time and size, plus any extra values such as degree/order
+    stat = os.stat(path)
+    key = '|'.join([os.path.abspath(path), str(stat.st_mtime_ns), str(stat.st_size)] + [str(val) for val in extra])
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def _atomic_write(path: str, write):
+    # Write via a temporary file in the same directory then rename, so concurrent processes never see a partial file
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def resolve_potential_file(body: str, filename: str) -> str:
+    """
+    Find the full path of a gravity potential file, as GMAT would for a GravityField's PotentialFile.
+
+    :param body: central body of the GravityField, e.g. 'Earth'
+    :param filename: file name (e.g. 'JGM2.cof') or path
+    :return: full path to the file
+    """
+    if os.path.isfile(filename):
+        return os.path.abspath(filename)
+
+    directories = []
+    path_type = f'{body.upper()}_POT_PATH' if body in _POT_PATH_BODIES else 'OTHER_POT_PATH'
+    try:
+        directories.append(gmat.FileManager.Instance().GetPathname(path_type))
+    except Exception:  # FileManager not available or path type not set
+        pass
+    directories.append(os.path.join(gpy.gmat_path, 'data', 'gravity', body.lower()))
+
+    for directory in directories:
+        path = os.path.join(directory, os.path.basename(filename))
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+    raise FileNotFoundError(f'Gravity potential file "{filename}" not found for body {body}. Searched: {directories}')
+
+
+class GravityCoefficients:
+    def __init__(self, path: str, degree: int, order: int, mu: float, radius: float, c: np.ndarray, s: np.ndarray):
+        """
+        Spherical harmonic coefficients read from a gravity potential file, up to a degree and order. C and S are
+        indexed [n, m] and, when loaded from the cache, are read-only memory maps shared between processes.
+        """
+        self.path: str = path
+        self.degree: int = degree
+        self.order: int = order
+        self.mu: float = mu
+        self.radius: float = radius
+        self.C: np.ndarray = c
+        self.S: np.ndarray = s
+
+    def __repr__(self) -> str:
+        return f'GravityCoefficients from {os.path.basename(self.path)}, degree {self.degree}, order {self.order}'
+
+
+# Real numbers in .cof files, which may run into each other or use a D exponent
+_COF_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[EeDd][-+]?\d+)?'
+
+
+def _parse_cof_coefficient(line: str) -> tuple[int, int, float, float]:
+    # RECOEF lines hold degree, order, C and S. Degree and order are 3-character columns that can run together for
+    #  high degree fields (e.g. 'RECOEF 100100'), so split them by width if they aren't separated
+    rest = line[6:]
+    match = re.match(r'\s*(\d+)\s+(\d+)\s*(' + _COF_NUMBER + r')\s*(' + _COF_NUMBER + r')?', rest)
+    if match is None:
+        match = re.match(r'\s*(\d{1,3})(\d{3})\s*(' + _COF_NUMBER + r')\s*(' + _COF_NUMBER + r')?', rest)
+    if match is None:
+        raise RuntimeError(f'Could not parse gravity coefficient line: "{line.rstrip()}"')
+    n, m, c, s = match.groups()
+    return int(n), int(m), _cof_float(c), _cof_float(s or '0')
+
+
+def _cof_float(text: str) -> float:
+    return float(text.replace('D', 'E').replace('d', 'e'))
+
+
+def _parse_cof(path: str, degree: int | None, order: int | None) -> tuple[int, int, float, float, np.ndarray,
+                                                                           np.ndarray]:
+    mu, radius, file_degree, file_order = None, None, None, None
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            key = line[:8].strip().upper()
+            if key == 'POTFIELD':
+                values = line[8:].split()
+                file_degree, file_order = int(values[0]), int(values[1])
+                mu, radius = _cof_float(values[3]), _cof_float(values[4])
+            elif key == 'RECOEF':
+                rows.append(_parse_cof_coefficient(line))
+            elif key == 'END':
+                break
+
+    if mu is None:
+        raise RuntimeError(f'No POTFIELD header found in gravity file {path}')
+    degree = file_degree if degree is None else min(degree, file_degree)
+    order = file_order if order is None else min(order, file_order, degree)
+
+    c = np.zeros((degree + 1, order + 1))
+    s = np.zeros((degree + 1, order + 1))
+    if rows:
+        n, m, c_vals, s_vals = (np.array(col) for col in zip(*rows))
+        keep = (n <= degree) & (m <= order)
+        c[n[keep], m[keep]] = c_vals[keep]
+        s[n[keep], m[keep]] = s_vals[keep]
+    return degree, order, mu, radius, c, s
+
+
+def gravity_coefficients(path: str, degree: int = None, order: int = None) -> GravityCoefficients:
+    """
+    Get the coefficients of a .cof gravity potential file up to a degree and order.
+
+    The first call for a file version (path, modification time and size) and degree/order parses the text and saves
+    the coefficients as a .npy file in cache_dir(). Later calls, from this or any other process, memory-map that file
+    read-only instead of parsing again. Within a process, the same GravityCoefficients object is shared by every
+    caller.
+
+    :param path: path to the .cof file (see resolve_potential_file())
+    :param degree: maximum degree. Defaults to the file's
+    :param order: maximum order. Defaults to the file's
+    :return: GravityCoefficients
+    """
+    key = _file_key(path, 'cof', degree, order)
+    cached = _gravity_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    npy_path = os.path.join(cache_dir(), f'{stem}_{degree}x{order}_{key}.npy')
+    meta_path = npy_path[:-4] + '.json'
+
+    if not (os.path.isfile(npy_path) and os.path.isfile(meta_path)):
+        file_degree, file_order, mu, radius, c, s = _parse_cof(path, degree, order)
+        _atomic_write(npy_path, lambda f: np.save(f, np.stack((c, s))))
+        meta = {'source': os.path.abspath(path), 'degree': file_degree, 'order': file_order, 'mu': mu,
+                'radius': radius}
+        _atomic_write(meta_path, lambda f: f.write(json.dumps(meta).encode()))
+
+    with open(meta_path, 'r') as f:
+        meta = json.load(f)
+    coefs = np.load(npy_path, mmap_mode='r')
+    result = GravityCoefficients(path, meta['degree'], meta['order'], meta['mu'], meta['radius'], coefs[0], coefs[1])
+    _gravity_cache[key] = result
+    return result
+
+
+def truncated_potential_file(path: str, degree: int, order: int) -> str:
+    """
+    Get a copy of a .cof gravity file containing only the coefficients up to degree and order, so GMAT parses just
+    what a GravityField uses. The copy is written once to cache_dir() and shared by every force model and process
+    using the same file version and degree/order. Lines are copied unchanged, so GMAT reads them as it would the
+    original.
+
+    :param path: path to the original .cof file
+    :param degree: maximum degree
+    :param order: maximum order
+    :return: path to the truncated file
+    """
+    key = _file_key(path, 'truncated', degree, order)
+    stem, ext = os.path.splitext(os.path.basename(path))
+    out_path = os.path.join(cache_dir(), f'{stem}_{degree}x{order}_{key}{ext}')
+    if os.path.isfile(out_path):
+        return out_path
+
+    def write(f):
+        with open(path, 'r') as source:
+            for line in source:
+                if line[:8].strip().upper() == 'RECOEF':
+                    n, m, _, _ = _parse_cof_coefficient(line)
+                    if n > degree or m > order:
+                        continue
+                f.write(line.encode())
+
+    _atomic_write(out_path, write)
+    return out_path
+
+
+# Bump when a table parser changes, so older binary caches are rebuilt
+_TABLE_FORMAT_VERSION: int = 1
+
+
+class DataTable:
+    def __init__(self, kind: str, columns: dict[str, np.ndarray], source: str, content_hash: str):
+        """
+        A parsed data file (space weather, Schatten prediction, EOP or leap seconds) as named NumPy columns. Row
+        epochs, where present, are in column 'mjd' as UTC GMAT ModJulian dates.
+        """
+        self.kind: str = kind
+        self.columns: dict[str, np.ndarray] = columns
+        self.source: str = source
+        self.content_hash: str = content_hash
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __repr__(self) -> str:
+        return f'DataTable ({self.kind}) with {len(self)} rows from {self.source}'
+
+    def at(self, column: str, mjd: np.ndarray | float) -> np.ndarray:
+        """
+        Get a column's value at each epoch, from the last row at or before it (e.g. daily space weather values).
+
+        :param column: column name
+        :param mjd: UTC GMAT ModJulian epochs
+        :return: array of values
+        """
+        index = np.clip(np.searchsorted(self.columns['mjd'], mjd, 'right') - 1, 0, len(self) - 1)
+        return self.columns[column][index]
+
+
+def _gmat_mjd(years, months, days) -> np.ndarray:
+    # UTC GMAT ModJulian at 0h of each date
+    dates = np.array([f'{int(y):04d}-{int(m):02d}-{int(d):02d}' for y, m, d in zip(years, months, days)],
+                     dtype='datetime64[D]')
+    return dates.astype(np.int64) + 40587 - 29999.5  # days since 1970 -> standard MJD -> GMAT ModJulian
+
+
+def _parse_space_weather(path: str) -> dict[str, np.ndarray]:
+    # CSSI space weather file (e.g. SpaceWeather-All-v1.2.txt). Rows are parsed from the BEGIN/END blocks; monthly
+    #  predicted rows have no Kp/Ap, which are left as NaN
+    rows, predicted = [], []
+    section = None
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('BEGIN'):
+                section = line.split()[1]
+                continue
+            if line.startswith('END'):
+                section = None
+                continue
+            tokens = line.split()
+            if section is None or len(tokens) < 9:
+                continue
+            row = np.full(33, np.nan)
+            if len(tokens) >= 33:
+                row[:] = [float(tok) for tok in tokens[:33]]
+            else:  # date then flux columns only
+                row[:3] = [float(tok) for tok in tokens[:3]]
+                row[26:] = [float(tok) for tok in tokens[-7:]]
+            rows.append(row)
+            predicted.append(section != 'OBSERVED')
+
+    data = np.array(rows).reshape(-1, 33)
+    return {'mjd': _gmat_mjd(data[:, 0], data[:, 1], data[:, 2]),
+            'kp': data[:, 5:13] / 10,  # file holds Kp x 10
+            'ap': data[:, 14:22],
+            'ap_avg': data[:, 22],
+            'f107_adj': data[:, 26],
+            'ctr81_adj': data[:, 28],
+            'lst81_adj': data[:, 29],
+            'f107_obs': data[:, 30],
+            'ctr81_obs': data[:, 31],
+            'lst81_obs': data[:, 32],
+            'predicted': np.array(predicted, dtype=bool)}
+
+
+def _parse_schatten(path: str) -> dict[str, np.ndarray]:
+    # Schatten predict file: rows of month, year then F10.7 and Ap columns (kept in file order)
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            tokens = line.split()
+            try:
+                values = [float(tok) for tok in tokens]
+            except ValueError:
+                continue
+            if len(values) >= 3 and 1 <= values[0] <= 12 and values[1] > 1900:
+                rows.append(values)
+    width = min(len(row) for row in rows) if rows else 2
+    data = np.array([row[:width] for row in rows]).reshape(-1, width)
+    return {'mjd': _gmat_mjd(data[:, 1], data[:, 0], np.ones(len(data))), 'values': data[:, 2:]}
+
+
+def _parse_eop(path: str) -> dict[str, np.ndarray]:
+    # IERS C04 EOP file (e.g. eopc04_08.62-now): year, month, day, MJD, x, y, UT1-UTC, LOD, dX, dY, ...
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            tokens = line.split()
+            if len(tokens) < 10 or not (tokens[0].isdigit() and len(tokens[0]) == 4 and tokens[3].isdigit()):
+                continue
+            rows.append([float(tok) for tok in tokens[3:10]])
+    data = np.array(rows).reshape(-1, 7)
+    return {'mjd': data[:, 0] - 29999.5, 'x': data[:, 1], 'y': data[:, 2], 'ut1_utc': data[:, 3], 'lod': data[:, 4],
+            'dx': data[:, 5], 'dy': data[:, 6]}
+
+
+def _parse_leap_seconds(path: str) -> dict[str, np.ndarray]:
+    # tai-utc.dat: ' 1972 JAN  1 =JD 2441317.5  TAI-UTC=  10.0       S + (MJD - 41317.) X 0.0      S'
+    pattern = re.compile(r'=\s*JD\s*([\d.]+)\s*TAI-UTC=\s*([\d.]+)\s*S\s*\+\s*\(MJD\s*-\s*([\d.]+)\s*\)\s*X\s*'
+                         r'([\d.]+)')
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            match = pattern.search(line)
+            if match:
+                rows.append([float(val) for val in match.groups()])
+    if not rows:
+        raise RuntimeError(f'No TAI-UTC entries found in leap second file {path}')
+    data = np.array(rows)
+    return {'mjd': data[:, 0] - 2430000.0, 'offset': data[:, 1], 'ref_mjd': data[:, 2], 'rate': data[:, 3]}
+
+
+# kind: (parser, GMAT FileManager file type, default location relative to the GMAT root)
+_TABLE_KINDS: dict[str, tuple] = {
+    'space_weather': (_parse_space_weather, 'CSSI_FLUX_FILE',
+                      os.path.join('data', 'atmosphere', 'earth', 'SpaceWeather-All-v1.2.txt')),
+    'schatten': (_parse_schatten, 'SCHATTEN_FILE', os.path.join('data', 'atmosphere', 'earth', 'SchattenPredict.txt')),
+    'eop': (_parse_eop, 'EOP_FILE', os.path.join('data', 'planetary_coeff', 'eopc04_08.62-now')),
+    'leap_seconds': (_parse_leap_seconds, 'LEAP_SECS_FILE', os.path.join('data', 'time', 'tai-utc.dat')),
+}
+
+_table_cache: dict[tuple, DataTable] = {}
+
+
+def data_file(kind: str, filename: str = None) -> str | None:
+    """
+    Find the data file for a table kind, as GMAT would.
+
+    :param kind: 'space_weather', 'schatten', 'eop' or 'leap_seconds'
+    :param filename: file name or path to look for instead of GMAT's configured file (e.g. an AtmosphereModel's
+    CSSISpaceWeatherFile)
+    :return: full path, or None if the file can't be found
+    """
+    try:
+        _, file_type, default = _TABLE_KINDS[kind]
+    except KeyError:
+        raise AttributeError(f'Invalid data table kind "{kind}" - must be one of {list(_TABLE_KINDS)}')
+
+    if filename is not None and os.path.isfile(filename):
+        return os.path.abspath(filename)
+
+    candidates = []
+    try:
+        configured = gmat.FileManager.Instance().GetFullPathname(file_type)
+        candidates.append(configured if filename is None else
+                          os.path.join(os.path.dirname(configured), os.path.basename(filename)))
+    except Exception:  # FileManager not available or file type not set
+        pass
+    default_path = os.path.join(gpy.gmat_path, default)
+    candidates.append(default_path if filename is None else
+                      os.path.join(os.path.dirname(default_path), os.path.basename(filename)))
+
+    for path in candidates:
+        if path and os.path.isfile(path):
+            return os.path.abspath(path)
+    return None
+
+
+def _content_hash(path: str) -> str:
+    # sha256 of the file contents. The hash is remembered in a small sidecar keyed by path/mtime/size, so unchanged
+    #  files are only hashed once across all processes
+    sidecar = os.path.join(cache_dir(), f'hash_{_file_key(path)}.txt')
+    try:
+        with open(sidecar, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        pass
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    content_hash = digest.hexdigest()
+    _atomic_write(sidecar, lambda f: f.write(content_hash.encode()))
+    return content_hash
+
+
+def table(kind: str, path: str = None) -> DataTable:
+    """
+    Get a parsed data table, from a validated binary cache keyed by the file's content hash.
+
+    The first process to need a file version parses the text and saves the columns as a .npz file in cache_dir().
+    Every later load, in any process, reads the binary file instead, after checking its recorded content hash and
+    format version (a corrupt or stale cache file is rebuilt). Within a process, each table is only loaded once.
+
+    :param kind: 'space_weather', 'schatten', 'eop' or 'leap_seconds'
+    :param path: path to the data file. Defaults to the file GMAT is configured to use (see data_file())
+    :return: DataTable
+    """
+    if path is None:
+        path = data_file(kind)
+        if path is None:
+            raise FileNotFoundError(f'No {kind} data file found in GMAT\'s data directory')
+    parser = _TABLE_KINDS[kind][0]
+
+    stat = os.stat(path)
+    memory_key = (kind, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    cached = _table_cache.get(memory_key)
+    if cached is not None:
+        return cached
+
+    content_hash = _content_hash(path)
+    npz_path = os.path.join(cache_dir(), f'{kind}_{content_hash[:24]}.npz')
+    columns = None
+    if os.path.isfile(npz_path):
+        try:
+            with np.load(npz_path) as data:
+                if (str(data['_hash']) == content_hash and
+                        int(data['_format']) == _TABLE_FORMAT_VERSION):
+                    columns = {name: data[name] for name in data.files if not name.startswith('_')}
+        except Exception:  # corrupt cache file - rebuild below
+            columns = None
+
+    if columns is None:
+        columns = parser(path)
+        _atomic_write(npz_path, lambda f: np.savez(f, _hash=np.array(content_hash),
+                                                   _format=np.array(_TABLE_FORMAT_VERSION), **columns))
+
+    result = DataTable(kind, columns, os.path.abspath(path), content_hash)
+    _table_cache[memory_key] = result
+    return result
+
+
+def space_weather(path: str = None) -> DataTable:
+    """CSSI space weather table (see table())."""
+    return table('space_weather', path)
+
+
+def schatten(path: str = None) -> DataTable:
+    """Schatten solar flux and geomagnetic prediction table (see table())."""
+    return table('schatten', path)
+
+
+def eop(path: str = None) -> DataTable:
+    """Earth orientation parameter table (see table())."""
+    return table('eop', path)
+
+
+def clear(pattern: str = '*'):
+    """
+    Delete cached data files, and forget cached objects in this process.
+
+    :param pattern: glob pattern of cache files to delete, e.g. 'JGM2_*'
+    """
+    for path in glob.glob(os.path.join(cache_dir(), pattern)):
+        os.remove(path)
+    _gravity_cache.clear()
+    _table_cache.clear()
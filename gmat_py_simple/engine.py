@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+import traceback
+from concurrent.futures import Executor, Future
+from typing import AsyncIterator, Callable
+
+# How often a process worker's queue is checked for whether the worker has died without reporting (s)
+_POLL_INTERVAL: float = 0.5
+
+
+class EngineActor(Executor):
+    def __init__(self, name: str = 'gmat-engine'):
+        """
+        Owner of all GMAT engine calls in a multithreaded program. GMAT's Moderator, Sandbox and configured objects
+        are process-wide singletons that are not thread-safe, so instead of each thread calling GMAT directly (or
+        holding a global lock for a whole request), threads submit calls to the actor, which runs them one at a time
+        on its own thread and returns futures.
+
+        As a concurrent.futures.Executor it can also be given to loop.run_in_executor(). Calls submitted from the
+        engine thread itself (e.g. by a call that is already running) run immediately, so they can't deadlock. Use
+        engine_actor() to get the process-wide actor.
+
+        Example::
+
+            engine = gpy.engine_actor().proxy()
+            future = engine.CoordSystems()  # returns at once
+            coord_systems = future.result()
+
+        :param name: name of the engine thread
+        """
+        self.name: str = name
+        self.calls: int = 0  # calls run so far
+        self.batches: int = 0  # queue items (single calls or batches) run so far
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._shutdown: bool = False
+        self._shutdown_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        return f'EngineActor "{self.name}" ({self.calls} calls in {self.batches} batches)'
+
+    def _serve(self):
+        while True:
+            batch = self._requests.get()
+            if batch is None:
+                return
+            self.batches += 1
+            for future, fn, args, kwargs in batch:
+                self._run(future, fn, args, kwargs)
+
+    def _run(self, future: Future, fn: Callable, args: tuple, kwargs: dict):
+        if not future.set_running_or_notify_cancel():
+            return  # cancelled while queued
+        self.calls += 1
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as ex:
+            future.set_exception(ex)
+        else:
+            future.set_result(result)
+
+    def on_engine_thread(self) -> bool:
+        """
+        Check whether the calling thread is the engine thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Queue a call to run on the engine thread.
+
+        :param fn: function to call
+        :param args: positional arguments for fn
+        :param kwargs: keyword arguments for fn
+        :return: Future of fn's result
+        """
+        return self.submit_batch([(fn, args, kwargs)])[0]
+
+    def submit_batch(self, calls: list[tuple]) -> list[Future]:
+        """
+        Queue several calls to run back to back on the engine thread, with no other thread's calls in between, e.g.
+        all the GMAT calls needed by one web request.
+
+        :param calls: tuples of (function, args) or (function, args, kwargs)
+        :return: a Future of each call's result, in order
+        """
+        items = []
+        for call in calls:
+            fn, args, kwargs = (tuple(call) + ((), {}))[:3]
+            items.append((Future(), fn, tuple(args), dict(kwargs)))
+
+        if self.on_engine_thread():
+            for item in items:
+                self._run(*item)
+        else:
+            with self._shutdown_lock:
+                if self._shutdown:
+                    raise RuntimeError(f'EngineActor "{self.name}" has been shut down')
+                self._requests.put(items)
+        return [item[0] for item in items]
+
+    def call(self, fn: Callable, /, *args, **kwargs):
+        """
+        Run a call on the engine thread and wait for its result.
+
+        :param fn: function to call
+        :param args: positional arguments for fn
+        :param kwargs: keyword arguments for fn
+        :return: fn's result
+        """
+        return self.submit(fn, *args, **kwargs).result()
+
+    def proxy(self, target=gpy) -> _EngineProxy:
+        """
+        Get a facade whose methods submit the same-named methods of target to the engine thread and return futures.
+
+        :param target: object or module to wrap - gmat_py_simple by default, or e.g. gmat or a GMAT object
+        :return: proxy of target
+        """
+        return _EngineProxy(self, target)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop accepting calls, and stop the engine thread once the calls already queued have run.
+
+        :param wait: if True, wait for the engine thread to finish
+        :param cancel_futures: if True, cancel calls that haven't started yet
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                try:
+                    while True:
+                        batch = self._requests.get_nowait()
+                        for future, *_ in batch or []:
+                            future.cancel()
+                except queue.Empty:
+                    pass
+            self._requests.put(None)
+        if wait and not self.on_engine_thread():
+            self._thread.join()
+
+
+class _EngineProxy:
+    # Facade of an object whose method calls run on an EngineActor's thread
+    def __init__(self, actor: EngineActor, target):
+        self._actor: EngineActor = actor
+        self._target = target
+
+    def __repr__(self):
+        return f'Engine proxy of {self._target!r}'
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def submit(*args, **kwargs) -> Future:
+            return self._actor.submit(attr, *args, **kwargs)
+
+        submit.__name__ = name
+        submit.__doc__ = getattr(attr, '__doc__', None)
+        return submit
+
+
+_engine_actor: EngineActor | None = None
+_engine_actor_lock = threading.Lock()
+
+
+def engine_actor() -> EngineActor:
+    """
+    Get the process-wide EngineActor, which runs GMAT engine calls for this process's threads on one dedicated thread.
+
+    :return: EngineActor
+    """
+    global _engine_actor
+    with _engine_actor_lock:
+        if _engine_actor is None:
+            _engine_actor = EngineActor()
+        return _engine_actor
+
+
+class MissionProgress:
+    def __init__(self, run_state: str, command: str = None, elapsed_secs: float = None, solver_status: str = None,
+                 wall_secs: float = 0.0):
+        """
+        A progress event of a mission run (see run_mission_async()).
+
+        :param run_state: 'QUEUED', 'INITIALIZING' (a command is being validated and initialized), 'RUNNING' (the
+        engine is running the sequence), 'SOLVED' (the final status of a Target's solver, read once GMAT's run has
+        returned - one per Target, just before 'IDLE'), 'IDLE' (the run is complete), 'FAILED' or 'CANCELLED'
+        :param command: name (or type, if unnamed) of the command the event relates to
+        :param elapsed_secs: simulated time elapsed since the start of the mission (s), when known
+        :param solver_status: status string of a Target's solver, e.g. 'Converged'
+        :param wall_secs: wall-clock time since the run started (s)
+        """
+        self.run_state: str = run_state
+        self.command: str | None = command
+        self.elapsed_secs: float | None = elapsed_secs
+        self.solver_status: str | None = solver_status
+        self.wall_secs: float = wall_secs
+
+    def __repr__(self):
+        details = [f'command={self.command!r}'] if self.command is not None else []
+        if self.elapsed_secs is not None:
+            details.append(f'elapsed_secs={self.elapsed_secs:.3f}')
+        if self.solver_status is not None:
+            details.append(f'solver_status={self.solver_status!r}')
+        return f'MissionProgress({self.run_state}, {", ".join(details + [f"wall_secs={self.wall_secs:.3f}"])})'
+
+
+class MissionRun:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Handle to a mission running in the background, as returned by run_mission_async(). Await it for the result,
+        and iterate over it (async for) for progress events.
+
+        :param loop: event loop the run reports to
+        """
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._future: asyncio.Future = loop.create_future()
+        self._changed: asyncio.Event = asyncio.Event()  # replaced after each new event, so waiters wake once
+        self._process: multiprocessing.Process | None = None
+        self.events: list[MissionProgress] = []  # all events so far
+        self._post(MissionProgress('QUEUED'))
+
+    def __repr__(self):
+        state = self.events[-1].run_state if self.events else 'QUEUED'
+        return f'MissionRun ({state})'
+
+    def __await__(self):
+        return self._future.__await__()
+
+    def __aiter__(self) -> AsyncIterator[MissionProgress]:
+        return self.progress()
+
+    def _post(self, event: MissionProgress):
+        # Record an event - only called from the event loop's thread
+        self.events.append(event)
+        self._notify()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _post_threadsafe(self, event: MissionProgress):
+        self._loop.call_soon_threadsafe(self._post, event)
+
+    def _finish(self, result=None, error: BaseException = None):
+        # Set the outcome and end the progress stream - only called from the event loop's thread
+        if self._future.done():
+            return
+        if error is not None:
+            state = 'CANCELLED' if isinstance(error, asyncio.CancelledError) else 'FAILED'
+            self._post(MissionProgress(state, wall_secs=self.events[-1].wall_secs))
+            self._future.set_exception(error)
+        else:
+            self._future.set_result(result)
+        self._notify()
+
+    async def progress(self) -> AsyncIterator[MissionProgress]:
+        """
+        Iterate over progress events until the run finishes. Events that occurred before iteration started are
+        yielded first, so any number of iterators each see every event.
+        """
+        index = 0
+        while True:
+            changed = self._changed
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self._future.done():
+                return
+            await changed.wait()
+
+    def done(self) -> bool:
+        """
+        Check whether the run has finished.
+        """
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """
+        Stop the run. Only runs in a worker process can be stopped - GMAT has no way to interrupt a run in this
+        process from Python.
+
+        :return: True if the run was stopped
+        """
+        if self._process is None or self.done():
+            return False
+        self._process.terminate()
+        self._finish(error=asyncio.CancelledError('Mission run was cancelled'))
+        return True
+
+
+def _process_main(build: Callable, args: tuple, return_result: bool, messages: multiprocessing.Queue):
+    # Entry point of a mission worker process: build the mission in this process's GMAT and run it, reporting
+    #  progress events and the outcome through messages
+    try:
+        mcs = build(*args)
+        result = gpy.RunMission(mcs, return_result, progress=lambda event: messages.put(('progress', event)))
+        messages.put(('result', result))
+    except BaseException as ex:
+        # The exception itself may not be picklable (e.g. if it holds engine objects), so send its text
+        messages.put(('error', f'{type(ex).__name__}: {ex}\n\nWorker traceback:\n{traceback.format_exc()}'))
+
+
+def _forward_messages(run: MissionRun, messages: multiprocessing.Queue):
+    # Pass a worker process's messages to the event loop, until it reports an outcome or dies
+    while True:
+        try:
+            kind, payload = messages.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            if not run._process.is_alive() and messages.empty():
+                error = RuntimeError(f'Mission worker process exited with code {run._process.exitcode} without '
+                                     f'reporting a result')
+                run._loop.call_soon_threadsafe(run._finish, None, error)
+                return
+            continue
+        if kind == 'progress':
+            run._post_threadsafe(payload)
+        elif kind == 'result':
+            run._loop.call_soon_threadsafe(run._finish, payload)
+            break
+        else:
+            run._loop.call_soon_threadsafe(run._finish, None, RuntimeError(payload))
+            break
+    run._process.join()
+
+
+def run_mission_async(mission: list[gpy.GmatCommand] | Callable[..., list[gpy.GmatCommand]], args: tuple = (),
+                      return_result: bool = True) -> MissionRun:
+    """
+    Run a mission in the background, so an asyncio event loop (e.g. a planning service) keeps running meanwhile.
+
+    The mission can be given in two ways:
+
+    - As a function that creates all the mission's objects and returns its mission command sequence. The mission is
+      then built and run in a new worker process with its own GMAT engine, so any number can run in parallel and the
+      event loop is never blocked. The function and args must be picklable (e.g. a module-level function), and as
+      with multiprocessing, the calling script's main code must be guarded by if __name__ == '__main__'.
+    - As a mission command sequence built in this process. It is run in this process's engine thread (see
+      engine_actor()), and its objects are updated after the run as by gpy.RunMission(). GMAT's bindings do not
+      release the GIL, so the event loop is paused during each engine call - use a function for long missions.
+
+    GMAT cannot report progress from within a run, so progress events mark the steps around it: each command being
+    initialized, the run starting, each Target's solver finishing and the run completing (with the simulated time
+    elapsed). Example::
+
+        run = gpy.run_mission_async(build_mission)
+        async for event in run:
+            print(event)
+        result = await run
+
+    :param mission: function that builds the mission and returns its command sequence, or the command sequence itself
+    :param args: arguments for the function
+    :param return_result: if True, the run's result is a gpy.MissionResult, otherwise 1
+    :return: MissionRun, to await for the result and iterate over for progress events
+    """
+    loop = asyncio.get_running_loop()
+    run = MissionRun(loop)
+
+    if callable(mission):
+        messages = multiprocessing.get_context('spawn').Queue()
+        run._process = multiprocessing.get_context('spawn').Process(
+            target=_process_main, args=(mission, tuple(args), return_result, messages), daemon=True)
+        run._process.start()
+        threading.Thread(target=_forward_messages, args=(run, messages), daemon=True).start()
+
+    elif isinstance(mission, list):
+        def run_in_engine():
+            return gpy.RunMission(mission, return_result, progress=run._post_threadsafe)
+
+        def finish(future: asyncio.Future):
+            error = future.exception()
+            run._finish(None if error else future.result(), error)
+
+        loop.run_in_executor(engine_actor(), run_in_engine).add_done_callback(finish)
+
+    else:
+        raise TypeError('mission must be a list of GmatCommand objects, or a function that returns one')
+
+    return run
@@ -3,10 +3,111 @@ from __future__ import annotations
 import gmat_py_simple as gpy
 from gmat_py_simple import gmat
 
+from time import perf_counter
+from typing import Callable
 
-def RunMission(mcs: list[gpy.GmatCommand]) -> int:
+
+def RunMission(mcs: list[gpy.GmatCommand], return_result: bool = False,
+               progress: Callable[[gpy.MissionProgress], None] = None,
+               cache: gpy.MissionCache = None,
+               checkpoints: gpy.MissionCheckpoints = None) -> int | gpy.MissionResult:
     # Shortcut for running missions
-    return gpy.Moderator().RunMission(mcs)
+    return gpy.Moderator().RunMission(mcs, return_result, progress, cache, checkpoints)
+
+
+class MissionScope:
+    # Totals across all scopes in this process, for monitoring long-running services
+    total_created: int = 0
+    total_leaked: int = 0
+
+    def __init__(self, clear_sandbox: bool = True):
+        """
+        Context manager that removes every configured object (including Parameters) and mission command created
+        within it when it exits, leaving objects that existed beforehand alone:
+
+            with gpy.MissionScope() as scope:
+                sat = gpy.Spacecraft('Sat')
+                ...
+                gpy.RunMission(mcs)
+            print(scope.report())
+
+        Objects are removed through Moderator::RemoveObject, in as many passes as needed for objects that refer to
+        each other. Any that are still in use by an object created outside the scope are left in place and reported
+        in leaked.
+
+        :param clear_sandbox: also clear the Sandbox's runtime copies of objects after a mission was run in the scope
+        """
+        self.clear_sandbox: bool = clear_sandbox
+        self.created: list[str] = []
+        self.removed: list[str] = []
+        self.leaked: list[str] = []
+        self.commands_removed: int = 0
+        self._names_before: set[str] = set()
+        self._num_commands_before: int = 0
+
+    def __enter__(self) -> MissionScope:
+        self._names_before = set(self._configured_names())
+        self._num_commands_before = len(self._command_sequence())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False  # never suppress exceptions from within the scope
+
+    @staticmethod
+    def _configured_names() -> list[str]:
+        return list(gmat.ConfigManager.Instance().GetListOfAllItems())
+
+    @staticmethod
+    def _command_sequence() -> list[gmat.GmatCommand]:
+        commands = []
+        command = gmat.Moderator.Instance().GetFirstCommand()
+        while command is not None:
+            commands.append(command)
+            command = command.GetNext()
+        return commands
+
+    def close(self):
+        """
+        Remove the commands and objects created since the scope was entered. Called automatically on exit.
+        """
+        mod = gmat.Moderator.Instance()
+
+        # Commands first, so they no longer refer to the objects being removed
+        commands = self._command_sequence()
+        new_commands = commands[max(self._num_commands_before, 1):]  # the first command is GMAT's own NoOp
+        if new_commands:
+            if self._num_commands_before <= 1:
+                mod.ClearCommandSeq(True, True)
+            else:
+                for command in reversed(new_commands):
+                    mod.DeleteCommand(command)
+            self.commands_removed = len(new_commands)
+            if self.clear_sandbox:
+                mod.ClearAllSandboxes()
+
+        self.created = [name for name in self._configured_names() if name not in self._names_before]
+        remaining = list(self.created)
+        while remaining:  # repeat while progress is made, as removing one object can free others it referred to
+            still_used = [name for name in remaining if not gpy.RemoveObject(name, only_if_unused=True)
+                          and mod.GetConfiguredObject(name) is not None]
+            self.removed.extend(name for name in remaining if name not in still_used)
+            if len(still_used) == len(remaining):
+                break
+            remaining = still_used
+        self.leaked = remaining
+
+        MissionScope.total_created += len(self.created)
+        MissionScope.total_leaked += len(self.leaked)
+
+    def report(self) -> dict[str, int]:
+        """
+        Summarize what the scope cleaned up.
+
+        :return: dict of counts of objects created, removed and leaked, and of commands removed
+        """
+        return {'created': len(self.created), 'removed': len(self.removed), 'leaked': len(self.leaked),
+                'commands_removed': self.commands_removed}
 
 
 class Moderator:
@@ -202,15 +303,48 @@ class Moderator:
     def RemoveObject(self, obj_type: int, name: str, del_only_if_not_used: bool = True) -> bool:
         return self.gmat_obj.RemoveObject(obj_type, name, del_only_if_not_used)
 
-    def RunMission(self, mission_command_sequence: list[gpy.GmatCommand]) -> int:
+    def RunMission(self, mission_command_sequence: list[gpy.GmatCommand], return_result: bool = False,
+                   progress: Callable[[gpy.MissionProgress], None] = None,
+                   cache: gpy.MissionCache = None,
+                   checkpoints: gpy.MissionCheckpoints = None) -> int | gpy.MissionResult:
         """
         Run the mission command sequence
 
-        IMPORTANT: this method has different behaviour and an extra argument relative to the native GMAT method.
+        IMPORTANT: this method has different behaviour and extra arguments relative to the native GMAT method.
 
         :param mission_command_sequence:
-        :return:
+        :param return_result: if True, return a gpy.MissionResult holding the final values of all spacecraft, tanks
+        and burns used by the mission, read from GMAT in one pass
+        :param progress: optional function called with a gpy.MissionProgress event as each command is initialized,
+        when the engine starts running, and once GMAT's run returns: a 'SOLVED' event with the final status of each
+        Target's solver, then 'IDLE'. GMAT reports nothing while the sequence runs
+        :param cache: optional gpy.MissionCache, only allowed with return_result=True. If it holds a result for this
+        mission and configuration, that result is returned without running GMAT (so wrapper objects are not updated,
+        e.g. burns are not marked as fired); otherwise the result of the run is stored in it
+        :param checkpoints: optional gpy.MissionCheckpoints. The mission is run in stages, resuming after the last
+        checkpointed prefix of top-level commands that is unchanged since an earlier run
+        :return: 1 (or a MissionResult if return_result is True) if the mission ran successfully
         """
+        start_time = perf_counter()
+
+        def report(run_state: str, command=None, elapsed_secs: float = None, solver_status: str = None):
+            if progress is not None:
+                command_name = None
+                if command is not None:
+                    command_name = command.GetName() or command.GetTypeName()
+                progress(gpy.MissionProgress(run_state, command_name, elapsed_secs, solver_status,
+                                             perf_counter() - start_time))
+
+        def elapsed_secs(command_sequence: list) -> float | None:
+            # Longest simulated time any spacecraft was propagated for: runtime epoch minus configured (initial) epoch
+            elapsed = None
+            for com in gpy.results._walk_commands(command_sequence):
+                if isinstance(com, gpy.Propagate):
+                    sat_name = com.sat.GetName()
+                    rt_epoch = gpy.results._runtime_object(sat_name).GetRealParameter('A1Epoch')
+                    start_epoch = gmat.GetObject(sat_name).GetRealParameter('A1Epoch')
+                    elapsed = max(elapsed or 0.0, (rt_epoch - start_epoch) * 86400)
+            return elapsed
 
         def update_command_objs_post_run(command_sequence: list[gpy.GmatCommand | gmat.GmatCommand]):
             propagate_commands: list[gpy.Propagate] = []  # start a list of Propagates so their sats can be updated
@@ -223,13 +357,13 @@ class Moderator:
                     propagate_commands.append(com)
 
                 # add any Maneuver commands to their list so their Burns can have has_fired set to True
-                if isinstance(command, gpy.Maneuver):
-                    maneuver_commands.append(command)
+                if isinstance(com, gpy.Maneuver):
+                    maneuver_commands.append(com)
 
                 if isinstance(com, gpy.BranchCommand | gmat.BranchCommand):
                     # add any Target commands to their list so their convergence can be checked
-                    if isinstance(command, gpy.Target):
-                        target_commands.append(command)
+                    if isinstance(com, gpy.Target):
+                        target_commands.append(com)
 
                     # Check for any Propagate or Maneuver sub-commands, which need updating too
                     for sub in com.command_sequence:
@@ -248,6 +382,7 @@ class Moderator:
                 solver.was_propagated = True
                 solver.gmat_obj = gpy.GmatObject.GetObject(solver)
                 solver_status = solver.GetIntegerParameter('IntegerSolverStatus')
+                report('SOLVED', t, solver_status=gmat.GmatGlobal.Instance().GetSolverStatusString(solver.GetName()))
                 if solver_status != 0:  # solver failed
                     raise RuntimeError(f'{solver.gmat_obj.GetTypeName()} "{solver.GetName()}" failed to converge. '
                                        f'Returned code {solver_status}: '
@@ -267,12 +402,33 @@ class Moderator:
         if not mission_command_sequence or not isinstance(mission_command_sequence[0], gpy.BeginMissionSequence):
             mission_command_sequence.insert(0, gmat.BeginMissionSequence())
 
+        if cache is not None and not return_result:
+            raise AttributeError('cache can only be used with return_result=True, as a cache hit does not run GMAT - '
+                                 'use the returned MissionResult for the final values')
+
+        gpy.flush(initialize=False)  # so cache keys and checkpoints see every pending field change
+
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(mission_command_sequence)
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                report('IDLE', mission_command_sequence[-1])
+                return cached_result
+
+        if checkpoints is not None:
+            result = checkpoints.run(mission_command_sequence, progress)
+            if cache is not None:
+                cache.put(cache_key, result)
+            return result if return_result else 1
+
         gpy.Initialize()
 
         mod = gpy.Moderator()
 
         # configure each command in the mission sequence
         for command in mission_command_sequence:
+            report('INITIALIZING', command)
             command.SetObjectMap(mod.GetConfiguredObjectMap())
             command.SetGlobalObjectMap(gmat.Sandbox().GetGlobalObjectMap())
             command.SetSolarSystem(gmat.GetSolarSystem())
@@ -282,11 +438,20 @@ class Moderator:
             mod.AppendCommand(command)
 
         print('\nRunning mission...')
+        report('RUNNING', mission_command_sequence[0])
         run_mission_return = gpy.extract_gmat_obj(self).RunMission()
         if run_mission_return == 1:  # Mission run complete
             # TODO uncomment (inhibited for debugging)
             update_command_objs_post_run(mission_command_sequence)
+            if progress is not None:
+                report('IDLE', mission_command_sequence[-1], elapsed_secs(mission_command_sequence))
             print(f'Mission run complete!\n')
+            if return_result or cache is not None:
+                result = gpy.MissionResult.capture(mission_command_sequence)
+                if cache is not None:
+                    cache.put(cache_key, result)
+                if return_result:
+                    return result
             return run_mission_return
 
         elif run_mission_return == -1:
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+
+# Wrappers with pending field writes, by id. Guarded by _lock, as jobs may build objects on worker threads
+_dirty_objects: dict[int, object] = {}
+_lock = threading.Lock()
+
+
+class GmatField:
+    def __init__(self, field: str | int, setter: str = 'SetField', convert: type | None = None,
+                 reinitialize: bool = False):
+        """
+        Wrapper attribute mirroring a field of the wrapped GMAT object. Assigning to it records a pending write rather
+        than calling GMAT at once, and pending writes are sent in one batch by the next gpy.Initialize(),
+        gpy.RunMission() or gpy.flush(), or as soon as the wrapped GMAT object is used (via gpy.extract_gmat_obj()).
+        Assigning the value last written to GMAT drops the pending write, and only the last of several assignments
+        made between flushes is written:
+
+            class ChemicalTank(Tank):
+                pressure = GmatField('Pressure', 'SetRealParameter', float, reinitialize=True)
+
+        Until a value is assigned, reading the attribute gets the field's value from GMAT, once.
+
+        :param field: GMAT field name or parameter ID
+        :param setter: wrapper method that writes the field, e.g. 'SetRealParameter'. Its Get counterpart reads it
+        :param convert: conversion applied to the value when writing, e.g. str for fields GMAT takes as strings
+        :param reinitialize: whether the object must be initialized again after the field changes. gpy.flush()
+        initializes each such object once, after all of its writes. Writes made as the GMAT object is used (via
+        gpy.extract_gmat_obj()) do not initialize it, as its other references may not be set yet - the object stays
+        marked until the next gpy.flush(). gpy.Initialize() and gpy.RunMission() initialize everything anyway
+        """
+        self.field: str | int = field
+        self.setter: str = setter
+        self.getter: str = f'Get{setter[len("Set"):]}'
+        self.convert: type | None = convert
+        self.reinitialize: bool = reinitialize
+        self.attr: str = ''
+
+    def __set_name__(self, owner, attr: str):
+        self.attr = attr
+
+    def __repr__(self):
+        return f'GmatField for {self.field} set with {self.setter}'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.attr]
+        except KeyError:  # never assigned, so read GMAT's value
+            value = getattr(obj, self.getter)(self.field)
+            obj.__dict__[self.attr] = value
+            obj.__dict__.setdefault('_written_fields', {})[self.attr] = value
+            return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+        pending: dict[str, GmatField] = obj.__dict__.setdefault('_pending_fields', {})
+        written: dict = obj.__dict__.get('_written_fields', {})
+        if self.attr in written and _same(written[self.attr], value):
+            pending.pop(self.attr, None)  # GMAT already has this value
+            return
+        pending[self.attr] = self
+        with _lock:
+            _dirty_objects[id(obj)] = obj
+
+    def write(self, obj, value):
+        try:
+            getattr(obj, self.setter)(self.field, self.convert(value) if self.convert is not None else value)
+        except Exception as ex:
+            raise RuntimeError(f'Could not set {self.field} of {type(obj).__name__} "{obj.GetName()}" to {value!r} - '
+                               f'see exception below:\n\t{ex}') from ex
+
+
+def _same(a, b) -> bool:
+    # Whether two field values are equal, without treating 1 and True as the same value
+    return isinstance(a, bool) == isinstance(b, bool) and a == b
+
+
+def _flush_object(obj, initialize: bool = False) -> int:
+    # Write an object's pending fields in the order they were first assigned, then initialize it once if needed. If
+    #  initialize is False, an object needing initialization stays marked (and dirty) until a flush that initializes
+    pending: dict[str, GmatField] = obj.__dict__.get('_pending_fields') or {}
+    if not pending and not obj.__dict__.get('_needs_initialize'):
+        return 0
+    items = list(pending.items())
+    pending.clear()  # before writing, as the setters extract the GMAT object, which flushes again
+    written: dict = obj.__dict__.setdefault('_written_fields', {})
+    for index, (attr, gmat_field) in enumerate(items):
+        value = obj.__dict__[attr]
+        try:
+            gmat_field.write(obj, value)
+        except RuntimeError:
+            pending.update(items[index + 1:])  # keep the writes not yet attempted
+            if pending:
+                with _lock:
+                    _dirty_objects[id(obj)] = obj
+            raise
+        written[attr] = value
+        if gmat_field.reinitialize:
+            obj.__dict__['_needs_initialize'] = True
+    if obj.__dict__.get('_needs_initialize'):
+        if initialize:
+            obj.Initialize()
+            obj.__dict__['_needs_initialize'] = False
+        else:
+            with _lock:
+                _dirty_objects[id(obj)] = obj
+    return len(items)
+
+
+def flush(initialize: bool = True) -> int:
+    """
+    Write every pending GmatField change to GMAT, in one batch. Called by gpy.Initialize() and gpy.RunMission(), so
+    only needed to make GMAT see changes earlier, e.g. before reading fields straight from GMAT objects.
+
+    :param initialize: initialize each object that had a change needing it, once per object
+    :return: number of fields written
+    """
+    with _lock:
+        objects = list(_dirty_objects.values())
+        _dirty_objects.clear()
+    count = 0
+    for index, obj in enumerate(objects):
+        try:
+            count += _flush_object(obj, initialize)
+        except RuntimeError:
+            with _lock:  # keep the objects not yet flushed
+                for other in objects[index + 1:]:
+                    _dirty_objects.setdefault(id(other), other)
+            raise
+    return count
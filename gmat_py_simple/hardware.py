@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from math import pi, atan2, asin
-from typing import Union
+from typing import Iterator, Union
 
 import numpy as np
 
@@ -444,49 +444,79 @@ class Imager(GmatObject):
                 f'Imager boresight argument has an invalid number of elements ({len(new_boresight)}) - must'
                 f' be 3 to represent a 3D direction vector for the Imager\'s boresight')
 
-        if not isinstance(new_boresight, np.ndarray):
-            new_boresight = np.array(new_boresight)
+        # second_vec is rotated along with the boresight within set_pointing()
+        self.set_pointing(new_boresight)
 
-        if not all([1 >= ele >= -1 for ele in new_boresight]):
-            raise AttributeError('All boresight elements must be between -1 and 1 inclusive.')
+    def apply_pointing_schedule(self, boresights: np.ndarray | list, second_vecs: np.ndarray | list) -> Iterator[int]:
+        """
+        Get an iterator that steps the Imager through a schedule of pointings, applying the next one each time it is
+        advanced and yielding its index, so other work (e.g. propagating) can be done at each pointing:
 
-        # Assume that the transformation being applied between the old and new boresights will also apply to the
-        #  second_vec, so update that too. That will prevent the new boresight having a problematic cross product with
-        #  the old second_vec
-        # If self.boresight not yet set, self.boresight will set it from GMAT obj (likely default value)
-        old_boresight = self.boresight
+            for index in imager.apply_pointing_schedule(boresights, second_vecs):
+                ...
 
-        # Find quaternion for shortest path rotation from old_boresight to new_boresight
-        quat = gpy.quat_between_vecs(old_boresight, new_boresight)
+        Nothing is written to GMAT until the iterator is advanced. All boresights, second_vecs and rotation matrices
+        are validated and calculated at once when this method is called, in one vectorized pass, so invalid samples
+        raise here rather than part way through the schedule. Each sample is then written with a single Initialize().
 
-        # Assume second_vec will be rotated same as boresight, so apply quat to old_second_vec to get new_second_vec
-        old_second_vec = self.second_vec
-        new_second_vec = gpy.transform_vec_quat(old_second_vec, quat)
+        :param boresights: Nx3 array of boresight vectors, in the spacecraft body frame
+        :param second_vecs: Nx3 array of second_vec vectors, in the spacecraft body frame
+        :return: iterator yielding the index of each pointing sample once it has been applied
+        """
+        all_boresights, all_second_vecs, all_rot_mats = self.compute_pointing(boresights, second_vecs)
 
-        # Check new_boresight and new_second_vec are orthogonal (dot product = 0) as required
-        if not gpy.vectors_orthogonal(new_boresight, new_second_vec):
-            raise AttributeError(f'new_boresight and new_second_vec are not orthogonal.'
-                                 f'\n-\tnew_boresight:\t{new_boresight}'
-                                 f'\n-\tnew_second_vec:\t{new_second_vec}')
+        def apply_each() -> Iterator[int]:
+            for index in range(len(all_boresights)):
+                self._write_pointing(all_boresights[index], all_second_vecs[index], all_rot_mats[index])
+                self.Initialize()
+                yield index
 
-        self._boresight = new_boresight
-        self.SetRealParameter('DirectionX', float(new_boresight[0]))
-        self.SetRealParameter('DirectionY', float(new_boresight[1]))
-        self.SetRealParameter('DirectionZ', float(new_boresight[2]))
+        return apply_each()
 
-        # Also update boresight in attached FOV object (if there is one)
-        if getattr(self, 'fov', None) is not None:
-            self.fov.boresight = new_boresight
+    # Line below disables false positive "This code is unreachable" warning with np.cross()
+    # noinspection PyUnreachableCode
+    @staticmethod
+    def compute_pointing(boresights: np.ndarray | list,
+                         second_vecs: np.ndarray | list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Validate one or more boresight/second_vec pairs and calculate the matching rotation matrices.
 
-        self._second_vec = new_second_vec  # underscore version to avoid changing boresight again
-        self.SetRealParameter('SecondDirectionX', float(new_second_vec[0]))
-        self.SetRealParameter('SecondDirectionY', float(new_second_vec[1]))
-        self.SetRealParameter('SecondDirectionZ', float(new_second_vec[2]))
+        Uses the same process as update_rotation_matrix (see remarks on page 406 of GMAT R2022a User Guide), but on
+        arrays of vectors at once.
 
-        self.Initialize()
+        :param boresights: 3-element vector or Nx3 array of boresight vectors
+        :param second_vecs: 3-element vector or Nx3 array of second_vec vectors
+        :return: Nx3 boresights, Nx3 second_vecs and Nx3x3 rotation matrices
+        """
+        z = np.atleast_2d(np.asarray(boresights, dtype=float))
+        sv = np.atleast_2d(np.asarray(second_vecs, dtype=float))
+        if z.shape[1:] != (3,) or sv.shape != z.shape:
+            raise AttributeError(f'boresights and second_vecs must be 3-element vectors or Nx3 arrays of the same '
+                                 f'shape. Shapes given: {z.shape}, {sv.shape}')
 
-        # rotation_matrix is calculated based on boresight, so needs updating
-        self.update_rotation_matrix()
+        if np.any(np.abs(z) > 1):
+            raise AttributeError('All boresight elements must be between -1 and 1 inclusive.')
+        if np.any(np.abs(sv) > 1):
+            raise AttributeError('All second_vec elements must be between -1 and 1 inclusive.')
+
+        # Check boresights and second_vecs are orthogonal (dot product = 0) as required
+        dots = np.einsum('ij,ij->i', z, sv)
+        if not np.allclose(dots, 0, atol=1e-9):
+            bad = int(np.argmax(np.abs(dots)))
+            raise AttributeError(f'new_boresight and new_second_vec are not orthogonal.'
+                                 f'\n-\tnew_boresight:\t{z[bad]}'
+                                 f'\n-\tnew_second_vec:\t{sv[bad]}')
+
+        n = np.cross(z, sv)  # normals to boresights and second_vecs
+        m = np.linalg.norm(n, axis=1)  # magnitudes of n
+        if np.any(np.isclose(m, 0)):
+            raise RuntimeError('magnitude of cross product of boresight and second_vec vectors is 0 or close to 0 '
+                               f'(magnitude is {m.min()}), which would cause major problems for GMAT.')
+        x = n / m[:, np.newaxis]
+        y = np.cross(z, x)
+        rot_mats = np.stack((x, y, z), axis=1)  # rows of each matrix are x, y, z
+
+        return z, sv, rot_mats
 
     @staticmethod
     def from_dict(imager_dict: dict[str, Union[str, int, float]]):
@@ -605,48 +635,68 @@ class Imager(GmatObject):
         old_boresight = self.boresight
         new_boresight = gpy.transform_vec_quat(old_boresight, quat)
 
-        # Check new_second_vec and new_boresight are orthogonal (dot product = 0) as required
-        if not gpy.vectors_orthogonal(new_second_vec, new_boresight):
-            raise AttributeError(f'new_second_vec and new_boresight are not orthogonal.'
-                                 f'\n-\told_second_vec:\t{old_sv}'
-                                 f'\n-\told_boresight:\t{old_boresight}'
-                                 f'\n-\tnew_second_vec:\t{new_second_vec}'
-                                 f'\n-\tnew_boresight:\t{new_boresight}')
+        # Orthogonality of new_second_vec and new_boresight is checked in set_pointing()
+        self.set_pointing(new_boresight, new_second_vec)
 
-        self._second_vec = new_second_vec
-        self.SetRealParameter('SecondDirectionX', float(new_second_vec[0]))
-        self.SetRealParameter('SecondDirectionY', float(new_second_vec[1]))
-        self.SetRealParameter('SecondDirectionZ', float(new_second_vec[2]))
-
-        # Also update second_vec in attached FOV object (if there is one)
-        if getattr(self, 'fov', None) is not None:
-            self.fov.second_vec = new_second_vec
+    def set_pointing(self, boresight: np.ndarray | list, second_vec: np.ndarray | list = None):
+        """
+        Set the Imager's boresight, second_vec and rotation_matrix together, with a single Initialize().
 
-        self._boresight = new_boresight
-        self.SetRealParameter('DirectionX', float(new_boresight[0]))
-        self.SetRealParameter('DirectionY', float(new_boresight[1]))
-        self.SetRealParameter('DirectionZ', float(new_boresight[2]))
+        The rotation matrix is calculated in NumPy rather than by setting each vector then re-initializing, so a
+        pointing update costs one pass of parameter writes instead of several SetRealParameter/Initialize round trips.
 
+        :param boresight: 3-element vector for the new boresight, in the spacecraft body frame
+        :param second_vec: 3-element vector for the new second_vec. If None, the current second_vec is rotated by the
+        same shortest-path rotation as the boresight.
+        """
+        boresight = np.asarray(boresight, dtype=float)
+        if second_vec is None:
+            # Assume second_vec is rotated the same way as the boresight (as in the boresight setter)
+            quat = gpy.quat_between_vecs(self.boresight, boresight)
+            second_vec = gpy.transform_vec_quat(self.second_vec, quat)
+
+        boresights, second_vecs, rot_mats = self.compute_pointing(boresight, second_vec)
+        self._write_pointing(boresights[0], second_vecs[0], rot_mats[0])
         self.Initialize()
 
-        # rotation_matrix is calculated based on boresight, so needs updating
-        self.update_rotation_matrix()
-
     def update_rotation_matrix(self):
         # At Imager initialization (within GMAT), rotation_matrix is based on boresight and second_vec, so needs
         #  updating if either one changes. Process given in remarks on page 406 (PDF pg 415) of GMAT R2022a User Guide
-        z = self.boresight
-        n: np.ndarray = np.cross(z, self._second_vec)  # normal to boresight and second_vec
-        m: float = np.linalg.norm(n)  # magnitude of n
-        if np.isclose(m, 0):
-            raise RuntimeError('magnitude of cross product of boresight and second_vec vectors is 0 or close to 0 '
-                               f'(magnitude is {m}), which would cause major problems for GMAT.')
-        x = n / m
-        y = np.cross(z, x)
-        self.rotation_matrix = np.array([x, y, z])
+        _, _, rot_mats = self.compute_pointing(self.boresight, self.second_vec)
+        self.rotation_matrix = rot_mats[0]
 
         self.Initialize()
 
+    def _pointing_param_ids(self) -> list[int]:
+        # Parameter IDs for DirectionX-Z, SecondDirectionX-Z and R_SB11-33, looked up once then reused
+        ids = getattr(self, '_pointing_ids', None)
+        if ids is None:
+            fields = ['DirectionX', 'DirectionY', 'DirectionZ',
+                      'SecondDirectionX', 'SecondDirectionY', 'SecondDirectionZ'] + self.rot_mat_fields
+            ids = [self.GetParameterID(field) for field in fields]
+            self._pointing_ids = ids
+        return ids
+
+    def _write_pointing(self, boresight: np.ndarray, second_vec: np.ndarray, rot_mat: np.ndarray):
+        # Write all 15 pointing values in one pass, by parameter ID. Does not Initialize()
+        values = np.concatenate((boresight, second_vec, rot_mat.reshape(-1)))
+        gmat_obj = gpy.extract_gmat_obj(self)
+        # gmat_obj.SetRealParameter returns the value set if set successfully, not bool (see GmatObject)
+        set_vals = [gmat_obj.SetRealParameter(param_id, value)
+                    for param_id, value in zip(self._pointing_param_ids(), values.tolist())]
+        if set_vals != values.tolist():
+            raise RuntimeError(f'Not all pointing values were successfully set for Imager "{self.GetName()}" '
+                               f'(boresight, second_vec and rotation matrix elements)')
+
+        self._boresight = boresight
+        self._second_vec = second_vec
+        self._rotation_matrix = rot_mat
+
+        # Also update pointing in attached FOV object (if there is one)
+        if getattr(self, 'fov', None) is not None:
+            self.fov.boresight = boresight
+            self.fov.second_vec = second_vec
+
 
 class NuclearPowerSystem(GmatObject):
     def __init__(self, name: str):
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import numpy as np
+
+SECS_PER_DAY: float = 86400.0
+
+
+class EphemerisInterpolator:
+    def __init__(self, epochs: np.ndarray | list, states: np.ndarray | list, method: str = 'lagrange',
+                 order: int = 7, breaks: np.ndarray | list = None, chunk_size: int = 16384):
+        """
+        Polynomial interpolator over a stored ephemeris, for evaluating states at arbitrary epochs between the
+        propagation output points.
+
+        The polynomial for every sample interval is fitted once when the interpolator is created and its coefficients
+        are cached, so evaluation is an interval lookup plus a Horner evaluation, vectorized over all query epochs.
+        Polynomials never span a segment boundary, which is placed at repeated epochs (as GMAT writes either side of
+        an impulsive maneuver) and at any epochs given in breaks.
+
+        :param epochs: 1D array of A1ModJulian epochs, in increasing order
+        :param states: Cartesian states in km and km/s, shape (n, 6) for one spacecraft or (m, n, 6) for m spacecraft
+        :param method: 'lagrange' (positions and velocities interpolated separately) or 'hermite' (positions
+        interpolated using velocities as derivatives, velocities from the derivative of the position polynomial)
+        :param order: polynomial degree. For 'lagrange' this uses order + 1 samples; for 'hermite' it must be odd and
+        uses (order + 1) / 2 samples
+        :param breaks: extra segment boundaries, as A1ModJulian epochs (e.g. maneuver epochs). Samples at or after a
+        break belong to the next segment
+        :param chunk_size: number of query epochs evaluated per vectorized block, bounding working memory
+        """
+        self.epochs: np.ndarray = np.ascontiguousarray(epochs, dtype=float)
+        states = np.asarray(states, dtype=float)
+        self.single_sat: bool = states.ndim == 2
+        if self.single_sat:
+            states = states[np.newaxis]
+        if self.epochs.ndim != 1 or states.ndim != 3 or states.shape[1:] != (len(self.epochs), 6):
+            raise AttributeError(f'states must have shape (n, 6) or (m, n, 6), where n is the number of epochs '
+                                 f'({len(self.epochs)}). Shape given: {states.shape}')
+        if len(self.epochs) < 2 or np.any(np.diff(self.epochs) < 0):
+            raise AttributeError('epochs must contain at least two values and be in increasing order')
+
+        method = method.lower()
+        if method == 'lagrange':
+            if order < 1:
+                raise AttributeError(f'Lagrange order must be at least 1 - {order} given')
+            self.num_nodes: int = order + 1
+        elif method == 'hermite':
+            if order < 3 or order % 2 == 0:
+                raise AttributeError(f'Hermite order must be odd and at least 3 - {order} given')
+            self.num_nodes: int = (order + 1) // 2
+        else:
+            raise AttributeError(f'Invalid interpolation method "{method}" - must be "lagrange" or "hermite"')
+        self.method: str = method
+        self.order: int = order
+        self.chunk_size: int = chunk_size
+        self.num_sats: int = states.shape[0]
+
+        self.segment_starts: np.ndarray = self._find_segments(breaks)
+        self._build(states)
+
+        # Uniformly spaced samples (the usual case for GMAT output) allow interval lookup without a search
+        steps = np.diff(self.epochs)
+        uniform = len(self.segment_starts) == 1 and steps[0] > 0 and np.allclose(steps, steps[0], rtol=1e-9, atol=0)
+        self._uniform_step: float | None = float(steps[0]) if uniform else None
+
+    def __repr__(self) -> str:
+        return (f'EphemerisInterpolator ({self.method}, order {self.order}) over {len(self.epochs)} epochs in '
+                f'{len(self.segment_starts)} segments')
+
+    @property
+    def start_epoch(self) -> float:
+        return float(self.epochs[0])
+
+    @property
+    def end_epoch(self) -> float:
+        return float(self.epochs[-1])
+
+    def _find_segments(self, breaks: np.ndarray | list | None) -> np.ndarray:
+        # Indexes of the first sample in each segment
+        starts = [np.zeros(1, dtype=int), np.flatnonzero(np.diff(self.epochs) == 0) + 1]
+        if breaks is not None:
+            starts.append(np.searchsorted(self.epochs, np.atleast_1d(np.asarray(breaks, dtype=float)), 'left'))
+        starts = np.unique(np.concatenate(starts))
+        return starts[(starts >= 0) & (starts < len(self.epochs))]
+
+    def _build(self, states: np.ndarray):
+        num_intervals = len(self.epochs) - 1
+        degree = self.order
+        num_cols = self.num_sats * 6
+
+        # Segment bounds for the left sample of each interval. An interval that crosses a boundary is fitted from
+        #  the segment on its left
+        seg_index = np.searchsorted(self.segment_starts, np.arange(num_intervals), 'right') - 1
+        seg_first = self.segment_starts[seg_index]
+        seg_last = np.append(self.segment_starts[1:] - 1, len(self.epochs) - 1)[seg_index]
+        nodes = np.minimum(self.num_nodes, seg_last - seg_first + 1)
+
+        # Window of samples centred on each interval, clipped to its segment
+        window_start = np.arange(num_intervals) - (nodes - 1) // 2
+        window_start = np.clip(window_start, seg_first, np.maximum(seg_last - nodes + 1, seg_first))
+
+        t0, t1 = self.epochs[:-1], self.epochs[1:]
+        self.centres: np.ndarray = 0.5 * (t0 + t1)
+        # Stored as (power, column, interval) so each Horner step gathers long contiguous rows
+        self.coefficients: np.ndarray = np.zeros((degree + 1, num_cols, num_intervals))
+        self.error_estimates: np.ndarray = np.zeros(num_intervals)
+
+        flat_states = np.ascontiguousarray(states.transpose(1, 0, 2)).reshape(len(self.epochs), num_cols)
+        self.scales: np.ndarray = np.ones(num_intervals)
+
+        for num in np.unique(nodes):
+            group = np.flatnonzero(nodes == num)
+            idx = window_start[group, np.newaxis] + np.arange(num)  # (g, num) sample indexes
+            node_epochs = self.epochs[idx]
+            scale = 0.5 * (node_epochs[:, -1] - node_epochs[:, 0])
+            scale[scale == 0] = 1.0
+            self.scales[group] = scale
+            u = (node_epochs - self.centres[group, np.newaxis]) / scale[:, np.newaxis]
+            values = flat_states[idx]  # (g, num, m*6)
+
+            coefs, error = self._fit(u, values, scale)
+            self.coefficients[:coefs.shape[0], :, group] = coefs.transpose(0, 2, 1)
+            self.error_estimates[group] = error
+
+    def _fit(self, u: np.ndarray, values: np.ndarray, scale: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Fit polynomials in normalized time u for a group of intervals with the same number of nodes. Returns
+        #  coefficients (degree + 1, g, m*6) and an error estimate per interval, from the position difference at the
+        #  interval centre between this fit and one using a node fewer (dropping the node furthest from the centre)
+        num_nodes = u.shape[1]
+        cols = values.shape[2]
+        pos_cols = (np.arange(cols) % 6) < 3
+
+        if self.method == 'lagrange':
+            coefs = _solve_vandermonde(u, values)
+            if num_nodes > 1:
+                reduced = _reduced_centre_values(u, values, lambda uu, vv: _solve_vandermonde(uu, vv)[0])
+            else:
+                reduced = coefs[0]
+        else:
+            dt_du = scale * SECS_PER_DAY  # seconds per unit of u
+            positions = values[:, :, pos_cols]
+            derivatives = values[:, :, ~pos_cols] * dt_du[:, np.newaxis, np.newaxis]
+            pos_coefs = _solve_hermite(u, positions, derivatives)
+            # Velocity polynomial is the derivative of the position polynomial
+            powers = np.arange(1, pos_coefs.shape[0])[:, np.newaxis, np.newaxis]
+            vel_coefs = powers * pos_coefs[1:] / dt_du[np.newaxis, :, np.newaxis]
+            coefs = np.zeros((pos_coefs.shape[0], u.shape[0], cols))
+            coefs[:, :, pos_cols] = pos_coefs
+            coefs[:-1, :, ~pos_cols] = vel_coefs
+            if num_nodes > 1:
+                reduced_pos = _reduced_centre_values(
+                    u, np.concatenate((positions, derivatives), axis=2),
+                    lambda uu, vv: _solve_hermite(uu, vv[:, :, :vv.shape[2] // 2], vv[:, :, vv.shape[2] // 2:])[0])
+                reduced = np.zeros((u.shape[0], cols))
+                reduced[:, pos_cols] = reduced_pos
+            else:
+                reduced = coefs[0]
+
+        diff = (coefs[0] - reduced)[:, pos_cols].reshape(u.shape[0], -1, 3)
+        error = np.linalg.norm(diff, axis=2).max(axis=1)
+        return coefs, error
+
+    def interval_indexes(self, epochs: np.ndarray) -> np.ndarray:
+        """
+        Get the index of the sample interval containing each epoch. At a repeated epoch the later interval (after the
+        discontinuity) is used.
+
+        :param epochs: A1ModJulian epochs
+        :return: interval indexes
+        """
+        epochs = np.asarray(epochs, dtype=float)
+        if np.any(epochs < self.epochs[0]) or np.any(epochs > self.epochs[-1]):
+            raise AttributeError(f'Query epochs must be within the ephemeris span [{self.epochs[0]}, '
+                                 f'{self.epochs[-1]}]')
+        if self._uniform_step is not None:
+            indexes = ((epochs - self.epochs[0]) / self._uniform_step).astype(np.intp)
+        else:
+            indexes = np.searchsorted(self.epochs, epochs, 'right') - 1
+        return np.clip(indexes, 0, len(self.epochs) - 2)
+
+    def evaluate(self, epochs: np.ndarray | list | float, sat_indexes: np.ndarray = None,
+                 interval_indexes: np.ndarray = None, return_error: bool = False) -> np.ndarray | tuple:
+        """
+        Evaluate states at arbitrary epochs.
+
+        :param epochs: A1ModJulian query epochs
+        :param sat_indexes: optional spacecraft index for each query epoch. If given, one state is returned per query;
+        otherwise states are returned for every spacecraft at every query epoch
+        :param interval_indexes: optional precomputed interval index for each query (see interval_indexes())
+        :param return_error: also return the estimated position error (km) for each query
+        :return: states, shape (k, 6) if sat_indexes is given or the interpolator has one spacecraft, otherwise
+        (m, k, 6). If return_error, also the (k,) error estimates
+        """
+        epochs = np.atleast_1d(np.asarray(epochs, dtype=float))
+        if interval_indexes is None:
+            interval_indexes = self.interval_indexes(epochs)
+
+        num = len(epochs)
+        if sat_indexes is not None:
+            sat_indexes = np.asarray(sat_indexes)
+            out = np.empty((6, num))
+        else:
+            out = np.empty((self.num_sats * 6, num))
+
+        for start in range(0, num, self.chunk_size):
+            chunk = slice(start, min(start + self.chunk_size, num))
+            idx = interval_indexes[chunk]
+            u = (epochs[chunk] - self.centres[idx]) / self.scales[idx]
+            if sat_indexes is None:
+                self._horner(idx, u, out[:, chunk])
+            else:
+                cols = sat_indexes[np.newaxis, chunk] * 6 + np.arange(6)[:, np.newaxis]
+                self._horner_cols(idx, cols, u, out[:, chunk])
+
+        if sat_indexes is None:
+            out = out.reshape(self.num_sats, 6, num).transpose(0, 2, 1)
+            out = out[0] if self.single_sat else out
+        else:
+            out = out.T
+
+        if return_error:
+            return out, self.error_estimates[interval_indexes]
+        return out
+
+    def _horner(self, idx: np.ndarray, u: np.ndarray, result: np.ndarray):
+        # Evaluate all columns into result (cols, k)
+        coefs = self.coefficients
+        np.take(coefs[-1], idx, axis=1, out=result)
+        for power in range(coefs.shape[0] - 2, -1, -1):
+            result *= u
+            result += coefs[power].take(idx, axis=1)
+
+    def _horner_cols(self, idx: np.ndarray, cols: np.ndarray, u: np.ndarray, result: np.ndarray):
+        # Evaluate the given (6, k) columns into result (6, k)
+        coefs = self.coefficients
+        result[:] = coefs[-1][cols, idx]
+        for power in range(coefs.shape[0] - 2, -1, -1):
+            result *= u
+            result += coefs[power][cols, idx]
+
+
+def _solve_vandermonde(u: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # Coefficients (p, g, cols) of the polynomial through (u, values) for each of g node sets
+    num_nodes = u.shape[1]
+    vandermonde = u[:, :, np.newaxis] ** np.arange(num_nodes)
+    return np.linalg.solve(vandermonde, values).transpose(1, 0, 2)
+
+
+def _solve_hermite(u: np.ndarray, values: np.ndarray, derivatives: np.ndarray) -> np.ndarray:
+    # Coefficients (2p, g, cols) of the polynomial matching values and first derivatives at u
+    num_nodes = u.shape[1]
+    powers = np.arange(2 * num_nodes)
+    value_rows = u[:, :, np.newaxis] ** powers
+    deriv_rows = powers * u[:, :, np.newaxis] ** np.maximum(powers - 1, 0)
+    matrix = np.concatenate((value_rows, deriv_rows), axis=1)
+    rhs = np.concatenate((values, derivatives), axis=1)
+    return np.linalg.solve(matrix, rhs).transpose(1, 0, 2)
+
+
+def _reduced_centre_values(u: np.ndarray, values: np.ndarray, centre_value) -> np.ndarray:
+    # Value at u = 0 of the fit with the node furthest from the centre removed
+    drop_first = np.abs(u[:, 0]) > np.abs(u[:, -1])
+    first = centre_value(u[:, 1:], values[:, 1:])
+    last = centre_value(u[:, :-1], values[:, :-1])
+    return np.where(drop_first[:, np.newaxis], first, last)
@@ -0,0 +1,990 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+
+import json
+import os
+from datetime import datetime, timezone
+from fractions import Fraction
+from typing import Iterator
+
+import numpy as np
+
+# Rows between entries of a sidecar index, and the index file format version
+_INDEX_STRIDE: int = 4096
+_INDEX_VERSION: int = 1
+
+# Default amount of text read per chunk
+CHUNK_BYTES: int = 1 << 24
+
+
+class _SidecarIndex:
+    def __init__(self, offsets: np.ndarray, epochs: np.ndarray, segments: np.ndarray, meta: dict):
+        # Byte offset, epoch and (for OEMs) segment number of every _INDEX_STRIDE-th data row of a file
+        self.offsets: np.ndarray = np.asarray(offsets, dtype=np.int64)
+        self.epochs: np.ndarray = np.asarray(epochs, dtype=float)
+        self.segments: np.ndarray = np.asarray(segments, dtype=np.int64)
+        self.meta: dict = meta
+
+    @staticmethod
+    def path_for(path: str) -> str:
+        return f'{path}.gpyidx.npz'
+
+    @staticmethod
+    def _stamp(path: str) -> np.ndarray:
+        stat = os.stat(path)
+        return np.array([stat.st_size, stat.st_mtime_ns, _INDEX_VERSION], dtype=np.int64)
+
+    @classmethod
+    def load(cls, path: str) -> _SidecarIndex | None:
+        # Index for path, or None if there isn't one or it's stale or unreadable
+        try:
+            with np.load(cls.path_for(path)) as data:
+                if not np.array_equal(data['stamp'], cls._stamp(path)):
+                    return None
+                return cls(data['offsets'], data['epochs'], data['segments'], json.loads(str(data['meta'])))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, path: str):
+        try:
+            with open(self.path_for(path), 'wb') as f:
+                np.savez(f, stamp=self._stamp(path), offsets=self.offsets, epochs=self.epochs,
+                         segments=self.segments, meta=np.array(json.dumps(self.meta)))
+        except OSError:  # e.g. read-only directory - the index is only an optimization
+            pass
+
+    def seek(self, start: float) -> int | None:
+        # Position of the last indexed row at or before start (epochs are assumed to be non-decreasing)
+        position = np.searchsorted(np.maximum.accumulate(self.epochs), start, 'right') - 1
+        return int(position) if position >= 0 else None
+
+
+class _IndexBuilder:
+    def __init__(self):
+        self.offsets, self.epochs, self.segments = [], [], []
+        self.rows: int = 0
+
+    def add(self, offsets: np.ndarray, epochs: np.ndarray, segment: int = 0):
+        # Record every _INDEX_STRIDE-th row of a block of rows
+        first = (-self.rows) % _INDEX_STRIDE
+        self.offsets.extend(offsets[first::_INDEX_STRIDE])
+        self.epochs.extend(epochs[first::_INDEX_STRIDE])
+        self.segments.extend([segment] * len(offsets[first::_INDEX_STRIDE]))
+        self.rows += len(offsets)
+
+    def build(self, meta: dict) -> _SidecarIndex:
+        return _SidecarIndex(np.array(self.offsets), np.array(self.epochs), np.array(self.segments), meta)
+
+
+def _line_offsets(lines: list[bytes], position: int) -> np.ndarray:
+    # Byte offset of the start of each line, given the offset of the first
+    lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    return position + np.concatenate(([0], np.cumsum(lengths[:-1])))
+
+
+def _tokens(lines: list[bytes], tokens_per_row: int) -> np.ndarray:
+    # Split whole lines into a (rows, tokens_per_row) array of byte strings in one go
+    tokens = np.array(b' '.join(lines).split())
+    if tokens.size != len(lines) * tokens_per_row:
+        raise RuntimeError(f'Expected {tokens_per_row} values per row but found rows with a different number of '
+                           f'values')
+    return tokens.reshape(len(lines), tokens_per_row)
+
+
+def _select(block: dict[str, np.ndarray], epochs: np.ndarray, start: float | None, stop: float | None) -> dict:
+    # Rows of a block within [start, stop]
+    if start is None and stop is None:
+        return block
+    mask = np.ones(len(epochs), dtype=bool)
+    if start is not None:
+        mask &= epochs >= start
+    if stop is not None:
+        mask &= epochs <= stop
+    return {key: (value[mask] if isinstance(value, np.ndarray) and len(value) == len(mask) else value)
+            for key, value in block.items()}
+
+
+class ReportReader:
+    def __init__(self, path: str, columns: list[str] = None, chunk_bytes: int = CHUNK_BYTES):
+        """
+        Streaming reader for a GMAT ReportFile. Rows are parsed a chunk at a time, converting whole chunks of text to
+        NumPy arrays at once, so memory use is bounded by chunk_bytes however large the file.
+
+        Gregorian epoch columns (e.g. 'Sat.UTCGregorian') are converted to ModJulian floats in the same time system.
+        The first ModJulian or Gregorian column gives each row's epoch, used by blocks()/read() to select a time
+        range. Time ranges are found via a sidecar index file (path + '.gpyidx.npz') that is built on the first full
+        pass through the file.
+
+        :param path: path to the report
+        :param columns: column names, for reports written without headers (WriteHeaders = false)
+        :param chunk_bytes: approximate amount of text to parse at once
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'Report file {path} does not exist')
+        self.path: str = path
+        self.chunk_bytes: int = int(chunk_bytes)
+
+        with open(path, 'rb') as f:
+            first_line = f.readline()
+        if columns is None:
+            columns = first_line.decode().split()
+            if not columns or columns[0][:1].isdigit() or columns[0][:1] in '+-.':
+                raise AttributeError(f'Report file {path} has no header row, so its column names must be given '
+                                     f'in columns')
+            self._data_offset: int = len(first_line)
+        else:
+            self._data_offset: int = 0
+        self.columns: list[str] = list(columns)
+
+        # Gregorian values are written as four whitespace-separated tokens, e.g. '01 Jan 2000 11:59:28.000'
+        self._widths: list[int] = [4 if name.endswith('Gregorian') else 1 for name in self.columns]
+        self.epoch_column: str | None = next((name for name in self.columns
+                                              if name.endswith('ModJulian') or name.endswith('Gregorian')), None)
+
+    def __repr__(self):
+        return f'ReportReader for {self.path} with columns {self.columns}'
+
+    def __iter__(self) -> Iterator[dict[str, np.ndarray]]:
+        return self.blocks()
+
+    def _parse(self, lines: list[bytes]) -> dict[str, np.ndarray]:
+        # Fast path: NumPy's C text parser converts all numeric columns (and the tokens of any Gregorian columns) at
+        #  once. Reports with text columns fall back to splitting the lines in Python
+        starts = np.cumsum([0] + self._widths[:-1])
+        numeric_cols = [int(start) for start, width in zip(starts, self._widths) if width == 1]
+        gregorian_cols = [int(start) + part for start, width in zip(starts, self._widths) if width > 1
+                          for part in range(width)]
+        try:
+            numeric = np.loadtxt(lines, usecols=numeric_cols, ndmin=2) if numeric_cols else None
+            gregorian = np.loadtxt(lines, usecols=gregorian_cols, dtype='S16', ndmin=2) if gregorian_cols else None
+        except ValueError:
+            return self._parse_tokens(lines)
+        num_rows = len(numeric) if numeric is not None else len(gregorian)
+        if num_rows != len(lines):
+            raise RuntimeError('Report chunk contains blank lines')
+
+        block = {}
+        numeric_index = gregorian_index = 0
+        for name, width in zip(self.columns, self._widths):
+            if width == 1:
+                block[name] = numeric[:, numeric_index]
+                numeric_index += 1
+            else:
+                block[name] = self._gregorian(gregorian[:, gregorian_index:gregorian_index + width])
+                gregorian_index += width
+        return block
+
+    @staticmethod
+    def _gregorian(tokens: np.ndarray) -> np.ndarray:
+        # Join the day, month, year and time tokens of a Gregorian column and convert them to ModJulian
+        tokens = np.ascontiguousarray(tokens.astype('S12'))
+        raw = tokens.view(np.uint8).reshape(len(tokens), 4, 12)
+        lengths = (raw != 0).sum(axis=2)
+        if np.all(lengths == [2, 3, 4, 12]):  # GMAT's usual 'DD Mon YYYY HH:MM:SS.mmm' - assemble the bytes directly
+            joined = np.full((len(tokens), 24), ord(' '), dtype=np.uint8)
+            joined[:, 0:2] = raw[:, 0, :2]
+            joined[:, 3:6] = raw[:, 1, :3]
+            joined[:, 7:11] = raw[:, 2, :4]
+            joined[:, 12:24] = raw[:, 3, :12]
+            return gpy.time.parse_gregorian(joined.view('S24').ravel())
+
+        strings = tokens[:, 0]
+        for part in range(1, tokens.shape[1]):
+            strings = np.char.add(np.char.add(strings, b' '), tokens[:, part])
+        return gpy.time.parse_gregorian(strings)
+
+    def _parse_tokens(self, lines: list[bytes]) -> dict[str, np.ndarray]:
+        tokens = _tokens(lines, sum(self._widths))
+        block = {}
+        col = 0
+        for name, width in zip(self.columns, self._widths):
+            if width == 1:
+                try:
+                    block[name] = tokens[:, col].astype(float)
+                except ValueError:  # non-numeric column, e.g. a coordinate system name
+                    block[name] = tokens[:, col].astype(str)
+            else:
+                block[name] = self._gregorian(tokens[:, col:col + width])
+            col += width
+        return block
+
+    def blocks(self, start: float = None, stop: float = None) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Iterate over the report in blocks of rows.
+
+        :param start: if given, skip rows before this epoch (a ModJulian in the epoch column's time system)
+        :param stop: if given, stop after this epoch
+        :return: iterator of dicts of column name to array
+        """
+        if (start is not None or stop is not None) and self.epoch_column is None:
+            raise AttributeError('start and stop can only be used for reports with a ModJulian or Gregorian column')
+
+        position = self._data_offset
+        index = _SidecarIndex.load(self.path) if start is not None else None
+        if index is not None:
+            entry = index.seek(start)
+            if entry is not None:
+                position = int(index.offsets[entry])
+        builder = _IndexBuilder() if position == self._data_offset and self.epoch_column is not None else None
+
+        # After seeking, start with small chunks so short time ranges don't parse a whole chunk
+        chunk_bytes = self.chunk_bytes if builder is not None else min(self.chunk_bytes, 1 << 16)
+        with open(self.path, 'rb') as f:
+            f.seek(position)
+            while True:
+                lines = f.readlines(chunk_bytes)
+                chunk_bytes = min(2 * chunk_bytes, self.chunk_bytes)
+                if not lines:
+                    break
+                offsets = _line_offsets(lines, position)
+                position += sum(map(len, lines))
+                try:
+                    block = self._parse(lines)
+                except RuntimeError:  # rows didn't split evenly - drop any blank lines and try again
+                    non_blank = np.array([bool(line.strip()) for line in lines])
+                    lines = [line for line, keep in zip(lines, non_blank) if keep]
+                    offsets = offsets[non_blank]
+                    if not lines:
+                        continue
+                    block = self._parse(lines)
+                if self.epoch_column is None:
+                    yield block
+                    continue
+
+                epochs = block[self.epoch_column]
+                if builder is not None:
+                    builder.add(offsets, epochs)
+                selected = _select(block, epochs, start, stop)
+                if len(selected[self.epoch_column]):
+                    yield selected
+                if stop is not None and epochs[-1] > stop:
+                    return  # rest of the file is after stop
+
+        if builder is not None and builder.rows > _INDEX_STRIDE:
+            builder.build({'columns': self.columns}).save(self.path)
+
+    def read(self, start: float = None, stop: float = None) -> dict[str, np.ndarray]:
+        """
+        Read the whole report (or the rows between start and stop) into arrays.
+
+        :param start: if given, skip rows before this epoch
+        :param stop: if given, skip rows after this epoch
+        :return: dict of column name to array
+        """
+        blocks = list(self.blocks(start, stop))
+        if not blocks:
+            return {name: np.empty(0) for name in self.columns}
+        return {name: np.concatenate([block[name] for block in blocks]) for name in self.columns}
+
+    def build_index(self):
+        """
+        Scan the whole file to write its sidecar index, so later reads of a time range can seek straight to it.
+        """
+        for _ in self.blocks():
+            pass
+
+
+class OemReader:
+    def __init__(self, path: str, chunk_bytes: int = CHUNK_BYTES):
+        """
+        Streaming reader for a CCSDS Orbit Ephemeris Message in KVN form, as written by a GMAT EphemerisFile with
+        FileFormat CCSDS-OEM. Ephemeris rows are parsed a chunk at a time into NumPy arrays.
+
+        Each block yielded by blocks() holds rows of one segment: 'segment' (its index in segments), 'epochs' (GMAT
+        ModJulian in the segment's TIME_SYSTEM), 'states' (n, 6) and, if present in the file, 'accelerations' (n, 3).
+        Covariance data is skipped. As for ReportReader, time ranges are found via a sidecar index.
+
+        Converting the values' text to floats dominates the read time, so a whole-file read is only about twice as
+        fast as splitting each line in Python. The larger gains are from reading time ranges, which seek via the
+        index instead of parsing the file up to them - for repeated whole-file reads, keep the arrays in a binary
+        form (e.g. np.save) instead.
+
+        :param path: path to the OEM
+        :param chunk_bytes: approximate amount of text to parse at once
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'OEM file {path} does not exist')
+        self.path: str = path
+        self.chunk_bytes: int = int(chunk_bytes)
+        self.header: dict[str, str] = {}
+        self.segments: list[dict[str, str]] = []  # metadata of each segment, filled in as the file is read
+
+    def __repr__(self):
+        return f'OemReader for {self.path}'
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.blocks()
+
+    @staticmethod
+    def _parse(lines: list[bytes], segment: int) -> dict:
+        # One pass of NumPy's C text parser over the rows, splitting each into its epoch token and its values
+        num_cols = len(lines[0].split())
+        rows = np.loadtxt(lines, dtype=[('epoch', 'S40'), ('values', float, (num_cols - 1,))], ndmin=1)
+        values = rows['values']
+        block = {'segment': segment, 'epochs': gpy.time.parse_iso(rows['epoch']), 'states': values[:, :6]}
+        if values.shape[1] >= 9:
+            block['accelerations'] = values[:, 6:9]
+        return block
+
+    def blocks(self, start: float = None, stop: float = None) -> Iterator[dict]:
+        """
+        Iterate over the ephemeris in blocks of rows.
+
+        :param start: if given, skip rows before this epoch (a ModJulian in the file's time system)
+        :param stop: if given, stop after this epoch
+        :return: iterator of dicts (see class docstring)
+        """
+        position = 0
+        state = 'header'
+        segment = -1
+        index = _SidecarIndex.load(self.path) if start is not None else None
+        if index is not None:
+            entry = index.seek(start)
+            if entry is not None:
+                position = int(index.offsets[entry])
+                state = 'data'
+                segment = int(index.segments[entry])
+                self.header = index.meta['header']
+                self.segments = index.meta['segments']
+        builder = _IndexBuilder() if position == 0 else None
+        if position == 0:
+            self.header, self.segments = {}, []
+
+        def parse_run(run_lines: list[bytes], run_offsets: np.ndarray) -> dict:
+            # Parse a run of consecutive ephemeris rows within one segment
+            block = self._parse(run_lines, segment)
+            if builder is not None:
+                builder.add(run_offsets, block['epochs'], segment)
+            return block
+
+        # After seeking, start with small chunks so short time ranges don't parse a whole chunk
+        chunk_bytes = self.chunk_bytes if builder is not None else min(self.chunk_bytes, 1 << 16)
+        with open(self.path, 'rb') as f:
+            f.seek(position)
+            while True:
+                lines = f.readlines(chunk_bytes)
+                chunk_bytes = min(2 * chunk_bytes, self.chunk_bytes)
+                if not lines:
+                    break
+                offsets = _line_offsets(lines, position)
+                position += sum(map(len, lines))
+
+                # Classify lines by their first character: keywords start with a letter, and blank lines with a line
+                #  break. Only keyword lines are handled individually
+                for i in np.flatnonzero(np.frombuffer(b''.join([line[:1] for line in lines]), np.uint8) <= 32):
+                    lines[i] = lines[i].lstrip() or b'\n'  # indented or whitespace-only lines
+                firsts = np.frombuffer(b''.join([line[:1] for line in lines]), np.uint8)
+                is_keyword = ((firsts | 32) >= ord('a')) & ((firsts | 32) <= ord('z'))
+                is_row = ~is_keyword & (firsts != ord('\n')) & (firsts != ord('\r'))
+                boundaries = np.concatenate((np.flatnonzero(is_keyword), [len(lines)]))
+
+                blocks = []
+                run_start = 0
+                for boundary in boundaries:
+                    if state == 'data' and boundary > run_start:
+                        rows = run_start + np.flatnonzero(is_row[run_start:boundary])
+                        if len(rows):
+                            blocks.append(parse_run([lines[row] for row in rows], offsets[rows]))
+                    if boundary == len(lines):
+                        break
+                    run_start = boundary + 1
+
+                    text = lines[boundary].strip().decode()
+                    if text == 'META_START':
+                        state = 'meta'
+                        self.segments.append({})
+                        segment = len(self.segments) - 1
+                    elif text == 'META_STOP':
+                        state = 'data'
+                    elif text == 'COVARIANCE_START':
+                        state = 'covariance'  # covariance rows are skipped
+                    elif text == 'COVARIANCE_STOP':
+                        state = 'data'
+                    elif '=' in text and not text.startswith('COMMENT'):
+                        key, value = (part.strip() for part in text.split('=', 1))
+                        if state == 'header':
+                            self.header[key] = value
+                        elif state == 'meta':
+                            self.segments[segment][key] = value
+
+                for block in blocks:
+                    selected = _select(block, block['epochs'], start, stop)
+                    if len(selected['epochs']):
+                        yield selected
+                    if stop is not None and block['epochs'][-1] > stop:
+                        return
+
+        if builder is not None and builder.rows > _INDEX_STRIDE:
+            builder.build({'header': self.header, 'segments': self.segments}).save(self.path)
+
+    def read(self, start: float = None, stop: float = None) -> list[dict]:
+        """
+        Read the whole ephemeris (or the rows between start and stop), joining blocks of the same segment.
+
+        :param start: if given, skip rows before this epoch
+        :param stop: if given, skip rows after this epoch
+        :return: list with a dict per segment: 'meta' (the segment's metadata), 'epochs', 'states' and optionally
+        'accelerations'
+        """
+        by_segment: dict[int, list[dict]] = {}
+        for block in self.blocks(start, stop):
+            by_segment.setdefault(block['segment'], []).append(block)
+
+        segments = []
+        for segment, blocks in by_segment.items():
+            joined = {'meta': self.segments[segment]}
+            for key in ('epochs', 'states', 'accelerations'):
+                if key in blocks[0]:
+                    joined[key] = np.concatenate([block[key] for block in blocks])
+            segments.append(joined)
+        return segments
+
+    def build_index(self):
+        """
+        Scan the whole file to write its sidecar index, so later reads of a time range can seek straight to it.
+        """
+        for _ in self.blocks():
+            pass
+
+
+def open_ephemeris(path: str, chunk_bytes: int = CHUNK_BYTES) -> OemReader:
+    """
+    Open an ephemeris file written by a GMAT EphemerisFile, checking its format.
+
+    Only CCSDS-OEM files are supported. SPK and Code-500 files are binary formats that need SPICE or GMAT's own
+    readers - write the ephemeris with FileFormat = CCSDS-OEM to read it here.
+
+    :param path: path to the ephemeris file
+    :param chunk_bytes: approximate amount of text to parse at once
+    :return: OemReader
+    """
+    with open(path, 'rb') as f:
+        start = f.read(64)
+    if start.lstrip().startswith(b'CCSDS_OEM_VERS'):
+        return OemReader(path, chunk_bytes)
+    elif start.startswith(b'DAF/SPK') or start.startswith(b'NAIF/DAF'):
+        raise AttributeError(f'{path} is a SPICE SPK file, which cannot be read here. Read it with SPICE, or write '
+                             f'the ephemeris with FileFormat = CCSDS-OEM')
+    raise AttributeError(f'{path} is not a CCSDS OEM in KVN form. Code-500 and other binary ephemeris formats cannot '
+                         f'be read here - write the ephemeris with FileFormat = CCSDS-OEM')
+
+
+# Rows formatted at once by the writers, bounding the memory used for text
+_WRITE_CHUNK_ROWS: int = 1 << 16
+
+# Separator written before each value of a data line
+_FIELD_SEPARATOR: bytes = b'   '
+
+# CCSDS names of the state vector components, in order
+_STATE_KEYWORDS: list[str] = ['X', 'Y', 'Z', 'X_DOT', 'Y_DOT', 'Z_DOT']
+
+
+def _format_fields(values: np.ndarray, digits: int = 16) -> np.ndarray:
+    # Format a (rows, columns) float array in scientific notation with the given number of significant digits (like
+    #  '%.15e' for 16), as a uint8 character matrix with one fixed-width field per value, each preceded by
+    #  _FIELD_SEPARATOR and a sign character. Digits are exactly rounded, as by printf
+    values = np.asarray(values, dtype=float)
+    if not np.isfinite(values).all():
+        raise AttributeError('Values written to a CCSDS message must be finite - found NaN or infinite values')
+    num_rows, num_cols = values.shape
+    magnitudes = np.abs(values)
+    nonzero = magnitudes > 0
+
+    exponents = np.zeros(values.shape, dtype=np.int64)
+    exponents[nonzero] = np.floor(np.log10(magnitudes[nonzero]))
+
+    # Correct exponents where log10 was off by one near a power of ten, comparing with the exact powers of ten. Values
+    #  beyond 1e+/-300 are out of _EXACT_SCALING_RANGE, so they're formatted by printf below
+    exponents_in_range = np.clip(exponents, -300, 300)
+    power, remainder = _powers_of_ten(exponents_in_range)
+    exponents[nonzero & ((magnitudes < power) | ((magnitudes == power) & (remainder > 0)))] -= 1
+    power, remainder = _powers_of_ten(exponents_in_range + 1)
+    exponents[(magnitudes > power) | ((magnitudes == power) & (remainder <= 0))] += 1
+
+    mantissa, ambiguous = _scaled_mantissas(magnitudes, digits - 1 - exponents)
+    high = mantissa >= 10 ** digits  # rounding carried into another digit
+    if high.any():
+        exponents[high] += 1
+        mantissa, ambiguous = _scaled_mantissas(magnitudes, digits - 1 - exponents)
+
+    # Values too close to halfway between two mantissas to round in double-double precision, or outside its range,
+    #  are formatted by printf
+    for index in zip(*np.nonzero(ambiguous)):
+        mantissa_text, exponent_text = ('%.*e' % (digits - 1, magnitudes[index])).split('e')
+        mantissa[index] = int(mantissa_text.replace('.', ''))
+        exponents[index] = int(exponent_text)
+
+    exp_digits = 3 if np.abs(exponents).max(initial=0) >= 100 else 2
+    sep = len(_FIELD_SEPARATOR)
+    width = sep + 1 + digits + 1 + 2 + exp_digits  # separator, sign, digits, '.', 'e', exponent sign, exponent
+    out = np.empty((num_rows, num_cols, width), dtype=np.uint8)
+    out[:, :, :sep] = np.frombuffer(_FIELD_SEPARATOR, dtype=np.uint8)
+    out[:, :, sep] = np.where(np.signbit(values), ord('-'), ord(' '))
+
+    # Digits from last to first; the decimal point goes after the first
+    for col in range(sep + digits + 1, sep + 2, -1):
+        out[:, :, col] = 48 + mantissa % 10
+        mantissa //= 10
+    out[:, :, sep + 1] = 48 + mantissa
+    out[:, :, sep + 2] = ord('.')
+
+    col = sep + digits + 2
+    out[:, :, col] = ord('e')
+    out[:, :, col + 1] = np.where(exponents < 0, ord('-'), ord('+'))
+    exponents = np.abs(exponents)
+    for exp_col in range(width - 1, col + 1, -1):
+        out[:, :, exp_col] = 48 + exponents % 10
+        exponents //= 10
+    return out.reshape(num_rows, num_cols * width)
+
+
+# Range of magnitudes whose scaled products _scaled_mantissas() finds without overflow or underflow
+_EXACT_SCALING_RANGE: tuple[float, float] = (1e-280, 1e280)
+
+# Power of ten -> (nearest double, double nearest the remainder), filled in as needed
+_POWERS_OF_TEN: dict[int, tuple[float, float]] = {}
+
+
+def _powers_of_ten(scales: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # The doubles nearest 10^scale, and the doubles nearest their remainders
+    unique_scales, inverse = np.unique(scales, return_inverse=True)
+    for scale in unique_scales.tolist():
+        if scale not in _POWERS_OF_TEN:
+            exact = Fraction(10) ** scale
+            nearest = float(exact)
+            _POWERS_OF_TEN[scale] = (nearest, float(exact - Fraction(nearest)))
+    table = np.array([_POWERS_OF_TEN[scale] for scale in unique_scales.tolist()]).reshape(-1, 2)
+    return table[inverse.ravel(), 0].reshape(scales.shape), table[inverse.ravel(), 1].reshape(scales.shape)
+
+
+def _split(a: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Veltkamp's split of doubles into high and low halves of 26 significant bits each
+    c = 134217729.0 * a  # 2^27 + 1
+    high = c - (c - a)
+    return high, a - high
+
+
+def _scaled_mantissas(magnitudes: np.ndarray, scales: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # magnitude * 10^scale rounded to the nearest integer, and where that rounding is ambiguous. The product is found
+    #  as an unevaluated sum hi + lo: Dekker's exact product of the magnitude and the double nearest 10^scale, plus the
+    #  magnitude times that double's remainder. Its error is below 2^-100 of the product, so only values within that
+    #  of halfway between two integers (including exact ties) and values outside _EXACT_SCALING_RANGE are ambiguous
+    in_range = (magnitudes == 0) | ((magnitudes >= _EXACT_SCALING_RANGE[0]) & (magnitudes <= _EXACT_SCALING_RANGE[1]))
+    magnitudes = np.where(in_range, magnitudes, 0.0)
+    power, remainder = _powers_of_ten(np.where(in_range, scales, 0))
+
+    hi = magnitudes * power
+    (a_high, a_low), (b_high, b_low) = _split(magnitudes), _split(power)
+    with np.errstate(under='ignore'):
+        lo = ((a_high * b_high - hi) + a_high * b_low + a_low * b_high) + a_low * b_low + magnitudes * remainder
+
+    # Above 2^53, hi is an even integer and lo may exceed 1, so move the integer part of lo into the mantissa first
+    rounded, carry = np.rint(hi), np.rint(lo)
+    lo -= carry
+    # hi - rounded and lo are now exact and within +/-0.5, so the thresholds for lo to carry the rounding either way
+    #  are exact too
+    up_threshold = 0.5 - (hi - rounded)
+    down_threshold = -0.5 - (hi - rounded)
+    mantissa = rounded.astype(np.int64) + carry.astype(np.int64) + (lo > up_threshold).astype(np.int64) - \
+        (lo < down_threshold).astype(np.int64)
+    error_bound = 2.0 ** -100 * hi
+    ambiguous = ~in_range | (np.abs(lo - up_threshold) <= error_bound) | (np.abs(lo - down_threshold) <= error_bound)
+    return mantissa, ambiguous
+
+def _format_value(value: float, digits: int = 16) -> str:
+    # A single value, formatted as by _format_fields
+    return _format_fields(np.array([[value]]), digits).tobytes().decode().strip()
+
+
+def _kvn(key: str, value) -> bytes:
+    return f'{key} = {value}\n'.encode()
+
+
+def _data_lines(epochs: np.ndarray, values: np.ndarray, decimals: int, digits: int) -> bytes:
+    # Lines of an epoch followed by values, formatted in one go
+    epoch_chars = gpy.time.format_iso(epochs, decimals).view(np.uint8).reshape(len(epochs), -1)
+    value_chars = _format_fields(values, digits)
+    lines = np.empty((len(epochs), epoch_chars.shape[1] + value_chars.shape[1] + 1), dtype=np.uint8)
+    lines[:, :epoch_chars.shape[1]] = epoch_chars
+    lines[:, epoch_chars.shape[1]:-1] = value_chars
+    lines[:, -1] = ord('\n')
+    return lines.tobytes()
+
+
+def _covariance_lines(matrices: np.ndarray, digits: int) -> list[bytes]:
+    # Lower triangles of 6x6 covariance matrices, one line per matrix row, as in an OEM covariance section
+    rows, cols = np.tril_indices(6)
+    fields = _format_fields(matrices[:, rows, cols].reshape(-1, 1), digits).reshape(len(matrices), len(rows), -1)
+    sep = len(_FIELD_SEPARATOR)
+    lines = []
+    for matrix_fields in fields:
+        for row in range(6):
+            row_fields = matrix_fields[row * (row + 1) // 2:(row + 1) * (row + 2) // 2]
+            lines.append(row_fields.tobytes()[sep:] + b'\n')
+    return lines
+
+
+def _header(message: str, version: str, header: dict | None) -> bytes:
+    header = {key.upper(): value for key, value in (header or {}).items()}
+    text = _kvn(f'CCSDS_{message}_VERS', header.pop(f'CCSDS_{message}_VERS', version))
+    for comment in np.atleast_1d(header.pop('COMMENT', [])):
+        text += f'COMMENT {comment}\n'.encode()
+    creation_date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    text += _kvn('CREATION_DATE', header.pop('CREATION_DATE', creation_date))
+    text += _kvn('ORIGINATOR', header.pop('ORIGINATOR', 'GMAT'))
+    for key, value in header.items():
+        text += _kvn(key, value)
+    return text + b'\n'
+
+
+class _EphemerisWriter:
+    # Shared streaming logic of the OEM and AEM writers: a header, then segments of metadata followed by data lines
+    _message: str = ''
+    _version: str = '1.0'
+    _required_meta: tuple[str, ...] = ()
+    _default_meta: dict[str, str] = {}
+    _meta_order: tuple[str, ...] = ()
+
+    def __init__(self, path: str, header: dict = None, decimals: int = 3, digits: int = 16, version: str = None):
+        if not 2 <= digits <= 17:
+            raise AttributeError(f'digits must be between 2 and 17 - given value: {digits}')
+        self.path: str = path
+        self.decimals: int = decimals
+        self.digits: int = digits
+        self.num_segments: int = 0
+        self.rows: int = 0  # data lines written in total
+        self._file = open(path, 'wb')
+        self._file.write(_header(self._message, version or self._version, header))
+        self._segment_rows: int = 0
+        self._first_epoch: float | None = None
+        self._last_epoch: float | None = None
+        self._time_offsets: dict[str, int] = {}  # file offsets of START_TIME/STOP_TIME values to fill in later
+
+    def __repr__(self):
+        return f'{type(self).__name__} for {self.path}'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()  # leave the partial file as it is, without masking the error
+
+    def segment(self, meta: dict):
+        """
+        Start a new segment. Its START_TIME and STOP_TIME are filled in from the data written, unless given in meta.
+
+        :param meta: segment metadata, by CCSDS keyword
+        """
+        self._end_segment()
+        meta = {key.upper(): value for key, value in meta.items()}
+        if 'OBJECT_NAME' in meta:
+            meta.setdefault('OBJECT_ID', meta['OBJECT_NAME'])
+        for key, value in self._default_meta.items():
+            meta.setdefault(key, value)
+        missing = [key for key in self._required_meta if key not in meta]
+        if missing:
+            raise AttributeError(f'Missing required {self._message} metadata: {missing}')
+
+        # Placeholders for the times, which are the same width as the epochs that will replace them
+        placeholder = ' ' * len(gpy.time.format_iso(0.0, self.decimals)[0])
+        meta.setdefault('START_TIME', None)
+        meta.setdefault('STOP_TIME', None)
+        ordered = ([key for key in self._meta_order if key in meta]
+                   + [key for key in meta if key not in self._meta_order])
+        self._file.write(b'META_START\n')
+        for key in ordered:
+            if key == 'COMMENT':
+                for comment in np.atleast_1d(meta[key]):
+                    self._file.write(f'COMMENT {comment}\n'.encode())
+                continue
+            if meta[key] is None:
+                self._time_offsets[key] = self._file.tell() + len(key) + 3
+                self._file.write(_kvn(key, placeholder))
+            else:
+                self._file.write(_kvn(key, meta[key]))
+        self._file.write(b'META_STOP\n\n')
+        self.num_segments += 1
+        self._segment_rows = 0
+        self._first_epoch = self._last_epoch = None
+
+    def _write_rows(self, epochs: np.ndarray, values: np.ndarray, num_values: tuple[int, ...]):
+        if not self.num_segments:
+            raise RuntimeError(f'Start a segment with segment() before writing {self._message} data')
+        epochs = np.atleast_1d(np.asarray(epochs, dtype=float))
+        if values.ndim != 2 or len(values) != len(epochs) or values.shape[1] not in num_values:
+            raise AttributeError(f'Expected {len(epochs)} rows of {" or ".join(map(str, num_values))} values - given '
+                                 f'array of shape {values.shape}')
+        if not len(epochs):
+            return
+        if np.any(np.diff(epochs) <= 0) or (self._last_epoch is not None and epochs[0] <= self._last_epoch):
+            raise AttributeError('Epochs must be strictly increasing within a segment')
+
+        # Format and write a slice at a time, so arrays larger than memory (e.g. np.memmap) are streamed
+        for start in range(0, len(epochs), _WRITE_CHUNK_ROWS):
+            stop = start + _WRITE_CHUNK_ROWS
+            self._file.write(_data_lines(epochs[start:stop], np.asarray(values[start:stop], dtype=float),
+                                         self.decimals, self.digits))
+        if self._first_epoch is None:
+            self._first_epoch = float(epochs[0])
+        self._last_epoch = float(epochs[-1])
+        self._segment_rows += len(epochs)
+        self.rows += len(epochs)
+
+    def _end_segment(self):
+        # Fill in the START_TIME and STOP_TIME placeholders of the current segment
+        if not self.num_segments:
+            return
+        if self._time_offsets and not self._segment_rows:
+            raise RuntimeError(f'Segment {self.num_segments - 1} has no data, so its START_TIME and STOP_TIME are '
+                               f'unknown')
+        end = self._file.tell()
+        for key, offset in self._time_offsets.items():
+            self._file.seek(offset)
+            self._file.write(gpy.time.format_iso(self._first_epoch if key == 'START_TIME' else self._last_epoch,
+                                                 self.decimals)[0])
+        self._file.seek(end)
+        self._time_offsets = {}
+
+    def close(self):
+        """
+        Finish the last segment and close the file.
+        """
+        if self._file.closed:
+            return
+        try:
+            self._end_segment()
+        finally:
+            self._file.close()
+
+
+class OemWriter(_EphemerisWriter):
+    """
+    Streaming writer for a CCSDS Orbit Ephemeris Message in KVN form. Ephemeris lines are formatted a block at a time
+    with NumPy rather than line by line, and written as they are formatted, so ephemerides of any length can be
+    written by calling write() repeatedly (e.g. with the blocks of an OemReader) or by passing memory-mapped arrays.
+
+    Epochs are GMAT ModJulian floats in the segment's TIME_SYSTEM, and states are Cartesian (km, km/s). The default
+    metadata matches the OEMs GMAT writes itself, so the files can be read back by GMAT's CCSDS-OEM propagator.
+
+    :param path: path of the file to write
+    :param header: extra header keywords, e.g. {'ORIGINATOR': 'My team', 'COMMENT': ['Predicted ephemeris']}
+    :param decimals: decimal places of seconds in epochs
+    :param digits: significant digits of state values
+    :param version: CCSDS_OEM_VERS to write - '2.0' is needed for accelerations and covariance
+    """
+    _message = 'OEM'
+    _version = '1.0'
+    _required_meta = ('OBJECT_NAME', 'OBJECT_ID', 'CENTER_NAME', 'REF_FRAME', 'TIME_SYSTEM')
+    _default_meta = {'CENTER_NAME': 'Earth', 'REF_FRAME': 'EME2000', 'TIME_SYSTEM': 'UTC',
+                     'INTERPOLATION': 'LAGRANGE', 'INTERPOLATION_DEGREE': 7}
+    _meta_order = ('COMMENT', 'OBJECT_NAME', 'OBJECT_ID', 'CENTER_NAME', 'REF_FRAME', 'REF_FRAME_EPOCH', 'TIME_SYSTEM',
+                   'START_TIME', 'USEABLE_START_TIME', 'USEABLE_STOP_TIME', 'STOP_TIME', 'INTERPOLATION',
+                   'INTERPOLATION_DEGREE')
+    _covariance_written: bool = False
+
+    def write(self, epochs: np.ndarray, states: np.ndarray, accelerations: np.ndarray = None):
+        """
+        Append ephemeris lines to the current segment.
+
+        :param epochs: epochs of the rows, strictly increasing
+        :param states: Cartesian states, shape (rows, 6)
+        :param accelerations: optional accelerations (km/s^2), shape (rows, 3)
+        """
+        if self._covariance_written:
+            raise RuntimeError('Ephemeris lines cannot follow the covariance section of a segment - start a new '
+                               'segment')
+        states = np.asarray(states)
+        if accelerations is not None:
+            states = np.hstack((states, np.asarray(accelerations)))
+        self._write_rows(epochs, states.reshape(len(states), -1), (6, 9))
+
+    def segment(self, meta: dict):
+        super().segment(meta)
+        self._covariance_written = False
+
+    def write_covariance(self, epochs: np.ndarray, matrices: np.ndarray, ref_frame: str = None):
+        """
+        Write a covariance section at the end of the current segment.
+
+        :param epochs: epoch of each matrix
+        :param matrices: 6x6 position/velocity covariance matrices, shape (num_epochs, 6, 6) (km^2, km^2/s, km^2/s^2)
+        :param ref_frame: COV_REF_FRAME, if different from the segment's REF_FRAME
+        """
+        epochs = np.atleast_1d(np.asarray(epochs, dtype=float))
+        matrices = np.asarray(matrices, dtype=float).reshape(-1, 6, 6)
+        if len(matrices) != len(epochs):
+            raise AttributeError(f'Expected {len(epochs)} covariance matrices - given {len(matrices)}')
+        if not self.num_segments:
+            raise RuntimeError('Start a segment with segment() before writing covariance data')
+
+        epoch_strings = gpy.time.format_iso(epochs, self.decimals)
+        lines = _covariance_lines(matrices, self.digits)
+        text = [b'\nCOVARIANCE_START\n']
+        for index, epoch in enumerate(epoch_strings):
+            text.append(b'EPOCH = ' + epoch + b'\n')
+            if ref_frame is not None:
+                text.append(_kvn('COV_REF_FRAME', ref_frame))
+            text.extend(lines[6 * index:6 * index + 6])
+        text.append(b'COVARIANCE_STOP\n\n')
+        self._file.write(b''.join(text))
+        self._covariance_written = True
+
+
+class AemWriter(_EphemerisWriter):
+    """
+    Streaming writer for a CCSDS Attitude Ephemeris Message in KVN form, e.g. for GMAT's PrecomputedAttitude (CCSDS-AEM)
+    attitude type. Works as OemWriter, with attitude data lines instead of states.
+
+    Quaternions are written as given, in the order set by the QUATERNION_TYPE metadata ('LAST' by default, i.e.
+    [q1, q2, q3, qc]). For ATTITUDE_TYPE EULER_ANGLE, give three angles (deg) per row and EULER_ROT_SEQ in the metadata.
+
+    :param path: path of the file to write
+    :param header: extra header keywords
+    :param decimals: decimal places of seconds in epochs
+    :param digits: significant digits of attitude values
+    :param version: CCSDS_AEM_VERS to write
+    """
+    _message = 'AEM'
+    _version = '1.0'
+    _required_meta = ('OBJECT_NAME', 'OBJECT_ID', 'REF_FRAME_A', 'REF_FRAME_B', 'ATTITUDE_DIR', 'TIME_SYSTEM',
+                      'ATTITUDE_TYPE')
+    _default_meta = {'CENTER_NAME': 'Earth', 'REF_FRAME_A': 'EME2000', 'REF_FRAME_B': 'SC_BODY_1',
+                     'ATTITUDE_DIR': 'A2B', 'TIME_SYSTEM': 'UTC', 'ATTITUDE_TYPE': 'QUATERNION',
+                     'INTERPOLATION_METHOD': 'LINEAR', 'INTERPOLATION_DEGREE': 1}
+    _meta_order = ('COMMENT', 'OBJECT_NAME', 'OBJECT_ID', 'CENTER_NAME', 'REF_FRAME_A', 'REF_FRAME_B', 'ATTITUDE_DIR',
+                   'TIME_SYSTEM', 'START_TIME', 'USEABLE_START_TIME', 'USEABLE_STOP_TIME', 'STOP_TIME',
+                   'ATTITUDE_TYPE', 'QUATERNION_TYPE', 'EULER_ROT_SEQ', 'RATE_FRAME', 'INTERPOLATION_METHOD',
+                   'INTERPOLATION_DEGREE')
+
+    def segment(self, meta: dict):
+        meta = {key.upper(): value for key, value in meta.items()}
+        attitude_type = meta.get('ATTITUDE_TYPE', self._default_meta['ATTITUDE_TYPE'])
+        if attitude_type == 'QUATERNION':
+            meta.setdefault('QUATERNION_TYPE', 'LAST')
+        elif attitude_type == 'EULER_ANGLE' and 'EULER_ROT_SEQ' not in meta:
+            raise AttributeError('EULER_ROT_SEQ (e.g. 321) is required in the metadata for ATTITUDE_TYPE EULER_ANGLE')
+        super().segment(meta)
+
+    def write(self, epochs: np.ndarray, attitudes: np.ndarray):
+        """
+        Append attitude lines to the current segment.
+
+        :param epochs: epochs of the rows, strictly increasing
+        :param attitudes: quaternions, shape (rows, 4), or Euler angles (deg), shape (rows, 3)
+        """
+        attitudes = np.asarray(attitudes)
+        self._write_rows(epochs, attitudes.reshape(len(attitudes), -1), (3, 4))
+
+
+def write_oem(path: str, epochs: np.ndarray, states: np.ndarray, meta: dict, covariance: np.ndarray = None,
+              covariance_epochs: np.ndarray = None, accelerations: np.ndarray = None, header: dict = None,
+              decimals: int = 3, digits: int = 16):
+    """
+    Write a single-segment CCSDS OEM from NumPy arrays. Use OemWriter directly for several segments, or to write the
+    ephemeris a block at a time.
+
+    :param path: path of the file to write
+    :param epochs: GMAT ModJulian epochs in meta's TIME_SYSTEM (UTC by default), strictly increasing
+    :param states: Cartesian states (km, km/s), shape (rows, 6)
+    :param meta: segment metadata by CCSDS keyword - at least OBJECT_NAME. CENTER_NAME (Earth), REF_FRAME (EME2000),
+    TIME_SYSTEM (UTC) and interpolation settings have defaults, and START_TIME and STOP_TIME are taken from epochs
+    :param covariance: optional 6x6 covariance matrices, shape (num_covariance_epochs, 6, 6)
+    :param covariance_epochs: epochs of the covariance matrices - by default, the same as epochs
+    :param accelerations: optional accelerations (km/s^2), shape (rows, 3)
+    :param header: extra header keywords, e.g. ORIGINATOR or COMMENT
+    :param decimals: decimal places of seconds in epochs
+    :param digits: significant digits of values
+    """
+    version = '2.0' if covariance is not None or accelerations is not None else '1.0'
+    with OemWriter(path, header, decimals, digits, version) as writer:
+        writer.segment(meta)
+        writer.write(epochs, states, accelerations)
+        if covariance is not None:
+            writer.write_covariance(epochs if covariance_epochs is None else covariance_epochs, covariance)
+
+
+def write_aem(path: str, epochs: np.ndarray, attitudes: np.ndarray, meta: dict, header: dict = None,
+              decimals: int = 3, digits: int = 16):
+    """
+    Write a single-segment CCSDS AEM from NumPy arrays. Use AemWriter directly for several segments, or to write the
+    attitude a block at a time.
+
+    :param path: path of the file to write
+    :param epochs: GMAT ModJulian epochs in meta's TIME_SYSTEM (UTC by default), strictly increasing
+    :param attitudes: quaternions, shape (rows, 4), or Euler angles (deg), shape (rows, 3)
+    :param meta: segment metadata by CCSDS keyword - at least OBJECT_NAME (see AemWriter for defaults)
+    :param header: extra header keywords, e.g. ORIGINATOR or COMMENT
+    :param decimals: decimal places of seconds in epochs
+    :param digits: significant digits of values
+    """
+    with AemWriter(path, header, decimals, digits) as writer:
+        writer.segment(meta)
+        writer.write(epochs, attitudes)
+
+
+def write_opm(path: str, epoch: float, state: np.ndarray, meta: dict, covariance: np.ndarray = None,
+              spacecraft: dict = None, maneuvers: list[dict] = None, header: dict = None, decimals: int = 3,
+              digits: int = 16):
+    """
+    Write a CCSDS Orbit Parameter Message (a single state) in KVN form.
+
+    :param path: path of the file to write
+    :param epoch: GMAT ModJulian epoch of the state, in meta's TIME_SYSTEM (UTC by default)
+    :param state: Cartesian state [X, Y, Z, VX, VY, VZ] (km, km/s)
+    :param meta: metadata by CCSDS keyword - at least OBJECT_NAME. CENTER_NAME (Earth), REF_FRAME (EME2000) and
+    TIME_SYSTEM (UTC) have defaults
+    :param covariance: optional 6x6 covariance matrix of the state
+    :param spacecraft: optional spacecraft parameters by CCSDS keyword, e.g. {'MASS': 1000, 'DRAG_AREA': 4}
+    :param maneuvers: optional list of maneuvers, each a dict by CCSDS keyword, e.g. {'MAN_EPOCH_IGNITION': 21545.5,
+    'MAN_DURATION': 0, 'MAN_DELTA_MASS': -1, 'MAN_REF_FRAME': 'RSW', 'MAN_DV_1': 0.01, 'MAN_DV_2': 0, 'MAN_DV_3': 0}.
+    MAN_EPOCH_IGNITION is a ModJulian epoch like epoch
+    :param header: extra header keywords, e.g. ORIGINATOR or COMMENT
+    :param decimals: decimal places of seconds in epochs
+    :param digits: significant digits of values
+    """
+    state = np.asarray(state, dtype=float).ravel()
+    if state.size != 6:
+        raise AttributeError(f'state must have 6 elements - given {state.size}')
+    meta = {key.upper(): value for key, value in meta.items()}
+    if 'OBJECT_NAME' not in meta:
+        raise AttributeError('Missing required OPM metadata: OBJECT_NAME')
+    meta.setdefault('OBJECT_ID', meta['OBJECT_NAME'])
+    for key, value in (('CENTER_NAME', 'Earth'), ('REF_FRAME', 'EME2000'), ('TIME_SYSTEM', 'UTC')):
+        meta.setdefault(key, value)
+
+    def iso(mjd: float) -> str:
+        return gpy.time.format_iso(mjd, decimals)[0].decode()
+
+    text = [_header('OPM', '2.0' if covariance is not None or maneuvers else '1.0', header)]
+    text.extend(_kvn(key, value) for key, value in meta.items())
+    text.append(b'\n' + _kvn('EPOCH', iso(epoch)))
+    text.extend(_kvn(key, _format_value(value, digits)) for key, value in zip(_STATE_KEYWORDS, state))
+
+    if spacecraft:
+        text.append(b'\n')
+        text.extend(_kvn(key.upper(), _format_value(value, digits)) for key, value in spacecraft.items())
+
+    if covariance is not None:
+        covariance = np.asarray(covariance, dtype=float).reshape(6, 6)
+        text.append(b'\n')
+        for row in range(6):
+            for col in range(row + 1):
+                text.append(_kvn(f'C{_STATE_KEYWORDS[row]}_{_STATE_KEYWORDS[col]}',
+                                 _format_value(covariance[row, col], digits)))
+
+    for maneuver in maneuvers or []:
+        text.append(b'\n')
+        for key, value in maneuver.items():
+            key = key.upper()
+            if key == 'MAN_EPOCH_IGNITION':
+                value = iso(value)
+            elif not isinstance(value, str):
+                value = _format_value(value, digits)
+            text.append(_kvn(key, value))
+
+    with open(path, 'wb') as f:
+        f.write(b''.join(text))
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import hashlib
+import os
+import re
+import zipfile
+
+# Potential file of each GravityField in a ForceModel's generating string, e.g.
+#  GMAT Prop_ForceModel.GravityField.Earth.PotentialFile = 'JGM2.cof';
+_POTENTIAL_FILE_RE = re.compile(r"GravityField\.(\w+)\.PotentialFile\s*=\s*'?([^';\r\n]+?)'?\s*;")
+
+# SolarSystem fields naming the planetary ephemeris files GMAT reads
+_EPHEMERIS_FIELDS: list[str] = ['EphemerisSource', 'DEFilename', 'SPKFilename', 'LSKFilename']
+
+
+class MissionCache:
+    def __init__(self, directory: str = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Opt-in on-disk cache of mission results, so re-running an unchanged mission returns at once:
+
+            cache = gpy.MissionCache()
+            result = gpy.RunMission(mcs, return_result=True, cache=cache)
+
+        Entries are keyed by a hash of the generating strings of every configured object and every mission command,
+        the GMAT version and the contents of GMAT's space weather, EOP and leap second files and of the gravity
+        potential and planetary ephemeris files the configuration uses, so any change to the mission or its inputs
+        gives a new key. Each entry is a MissionResult saved as an .npz file. Once the entries
+        exceed max_bytes, the least recently used are removed.
+
+        On a hit, GMAT is not run at all, so GMAT's runtime objects (and any wrapper methods that read them) still
+        hold the values of the previous run, if any. For this reason gpy.RunMission() only takes a cache along with
+        return_result=True - use the returned MissionResult for the final values.
+
+        :param directory: directory for cache entries. Defaults to a 'missions' folder in gpy.data_cache.cache_dir()
+        :param max_bytes: maximum total size of the entries (bytes)
+        """
+        if max_bytes <= 0:
+            raise AttributeError(f'max_bytes must be a positive number of bytes - given value: {max_bytes}')
+        self.directory: str = directory or os.path.join(gpy.data_cache.cache_dir(), 'missions')
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes: int = int(max_bytes)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __repr__(self):
+        return f'MissionCache in {self.directory} with {len(self)} entries ({self.hits} hits, {self.misses} misses)'
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str | list) -> bool:
+        return os.path.isfile(self._path(key))
+
+    def _path(self, key: str | list) -> str:
+        return os.path.join(self.directory, f'{key if isinstance(key, str) else self.key(key)}.npz')
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory) if entry.is_file() and entry.name.endswith('.npz')]
+
+    @staticmethod
+    def key(mission_command_sequence: list[gpy.GmatCommand | gmat.GmatCommand]) -> str:
+        """
+        Get the cache key of a mission in its current configuration.
+
+        All configured objects are included rather than only those the commands refer to, so objects used
+        indirectly (e.g. coordinate systems, force models, tanks) are always covered.
+
+        :param mission_command_sequence: the mission command sequence to be run
+        :return: hex digest
+        """
+        gpy.flush(initialize=False)
+        digest = hashlib.sha256()
+
+        def add(text: str):
+            digest.update(text.encode())
+            digest.update(b'\0')
+
+        generating_strings = [gmat.GetObject(name).GetGeneratingString()
+                              for name in sorted(gmat.ConfigManager.Instance().GetListOfAllItems())]
+        add(_environment_key(generating_strings))
+        for generating_string in generating_strings:
+            add(generating_string)
+        for command in gpy.results._walk_commands(mission_command_sequence):
+            add(gpy.extract_gmat_obj(command).GetGeneratingString())
+        return digest.hexdigest()
+
+    def get(self, key: str | list) -> gpy.MissionResult | None:
+        """
+        Get a cached result.
+
+        :param key: key from key(), or a mission command sequence
+        :return: MissionResult, or None if there is no entry
+        """
+        path = self._path(key)
+        try:
+            result = gpy.MissionResult.load(path)
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):  # no entry, or a damaged file
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return result
+
+    def put(self, key: str | list, result: gpy.MissionResult):
+        """
+        Store a result, then evict the least recently used entries until the cache fits in max_bytes.
+
+        :param key: key from key(), or a mission command sequence
+        :param result: MissionResult to store
+        """
+        gpy.data_cache._atomic_write(self._path(key), result.save)
+        self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime_ns)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries[:-1]:  # always keep the newest entry, even if it alone exceeds max_bytes
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:  # already removed by another process
+                pass
+
+    def invalidate(self, key: str | list = None) -> int:
+        """
+        Remove one entry, or every entry.
+
+        :param key: key from key(), or a mission command sequence. If None, clear the whole cache
+        :return: number of entries removed
+        """
+        paths = [entry.path for entry in self._entries()] if key is None else [self._path(key)]
+        removed = 0
+        for path in paths:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def run(self, mission_command_sequence: list[gpy.GmatCommand | gmat.GmatCommand]) -> gpy.MissionResult:
+        """
+        Get a mission's result from the cache, or run the mission and cache its result.
+
+        :param mission_command_sequence: the mission command sequence to run
+        :return: MissionResult
+        """
+        return gpy.RunMission(mission_command_sequence, return_result=True, cache=self)
+
+
+def _environment_key(generating_strings: list[str]) -> str:
+    # Everything outside the mission itself that affects its results: the GMAT version and the contents of GMAT's
+    #  space weather, EOP and leap second files, the gravity potential files named in the configured objects'
+    #  generating strings and the SolarSystem's planetary ephemeris files
+    parts = [gmat.GmatGlobal.Instance().GetGmatVersion()]
+    for kind in gpy.data_cache._TABLE_KINDS:
+        path = gpy.data_cache.data_file(kind)
+        parts.append(gpy.data_cache._content_hash(path) if path is not None else '')
+
+    potential_files = set()
+    for generating_string in generating_strings:
+        potential_files.update(_POTENTIAL_FILE_RE.findall(generating_string))
+    for body, filename in sorted(potential_files):
+        try:
+            parts.append(gpy.data_cache._content_hash(gpy.data_cache.resolve_potential_file(body, filename)))
+        except FileNotFoundError:  # GMAT will fail to load it too - key on the name alone
+            parts.append(filename)
+
+    solar_system = gmat.GetSolarSystem()
+    for field in _EPHEMERIS_FIELDS:
+        try:
+            value = solar_system.GetStringParameter(field)
+        except Exception:  # field not in this GMAT version
+            continue
+        # GMAT's relative paths are relative to its bin directory
+        path = value if os.path.isabs(value) else os.path.join(gpy.gmat_path, 'bin', value)
+        parts.append(gpy.data_cache._content_hash(path) if os.path.isfile(path) else value)
+    return '|'.join(parts)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 from gmat_py_simple.basics import GmatObject
+from gmat_py_simple.fields import GmatField
 from gmat_py_simple.utils import *
 
+import hashlib
+import weakref
+from typing import NamedTuple
+
 
 class AtmosphereModel(GmatObject):
     def __init__(self, name: str = 'AtmoModel', atmo_model: str = 'JacchiaRoberts', f107: int = 150,
@@ -70,6 +75,28 @@ class AtmosphereModel(GmatObject):
         # self.schatten_timing_model = schatten_timing_model
         # self.SetField('SchattenTimingModel', self.schatten_timing_model)
 
+    def space_weather_data(self) -> gpy.data_cache.DataTable:
+        """
+        Get this model's CSSI space weather file as a parsed table, loaded from the binary data cache.
+
+        :return: DataTable with columns mjd, kp, ap, ap_avg, f107_adj/obs, ctr81_adj/obs, lst81_adj/obs and predicted
+        """
+        path = gpy.data_cache.data_file('space_weather', self.cssi_space_weather_file)
+        if path is None:
+            raise FileNotFoundError(f'Could not find CSSI space weather file {self.cssi_space_weather_file}')
+        return gpy.data_cache.table('space_weather', path)
+
+    def schatten_data(self) -> gpy.data_cache.DataTable:
+        """
+        Get this model's Schatten prediction file as a parsed table, loaded from the binary data cache.
+
+        :return: DataTable with columns mjd and values
+        """
+        path = gpy.data_cache.data_file('schatten', self.schatten_file)
+        if path is None:
+            raise FileNotFoundError(f'Could not find Schatten file {self.schatten_file}')
+        return gpy.data_cache.table('schatten', path)
+
 
 # class ExponentialAtmosphere(AtmosphereModel):
 #     def __init__(self):
@@ -117,6 +144,13 @@ class ForceModel(GmatObject):
                 return [point_masses]
 
             # point_masses is a list (presumably of celestial body strings)
+            elif isinstance(point_masses, list) and point_masses and all(
+                    isinstance(f, ForceModel.PointMassForce) for f in point_masses):
+                if self.gravity and any(self.central_body in f.primary_body for f in point_masses):
+                    raise SyntaxError(f'Point mass for {self.central_body} cannot be used because a GravityField '
+                                      f'containing {self.central_body} is already set')
+                return point_masses
+
             elif isinstance(point_masses, list):
                 if not all(isinstance(f, str) for f in point_masses):
                     raise TypeError('If point_masses is a list, its items must be strings of celestial body names')
@@ -137,7 +171,8 @@ class ForceModel(GmatObject):
                 return pmf_list
 
             else:  # point_masses is not of a valid type
-                raise SyntaxError('point_masses must be a single string, list of strings, or a single PointMassForce')
+                raise SyntaxError('point_masses must be a single string, list of strings, or one or more '
+                                  'PointMassForces')
 
         # TODO define allowed values (different to defaults)
         self._allowed_values = {'arg': 'value'}
@@ -251,6 +286,27 @@ class ForceModel(GmatObject):
     def __repr__(self):
         return f'ForceModel with name {self.name}'
 
+    def __setstate__(self, state: dict):
+        # Unpickled by gpy.session.load(), once the GMAT objects exist again. An interned one is interned again
+        self.__dict__.update(state)
+        if '_intern' in state:
+            key, owned_names = state['_intern']
+            _register_interned(key, self, owned_names)
+
+    @classmethod
+    def from_spec(cls, spec: ForceModelSpec) -> ForceModel:
+        """
+        Get the ForceModel for a ForceModelSpec, reusing the existing one if an identical spec is already in use.
+
+        Interned force models and their child forces have names derived from the spec's content (see
+        ForceModelSpec.key()). They are removed from GMAT once no Python references to them remain.
+
+        :param spec: ForceModelSpec describing the force model
+        :return: ForceModel
+        """
+        spec = spec._replace(point_masses=tuple(sorted(set(spec.point_masses))))
+        return _intern(spec, lambda: _build_force_model(spec))
+
     def AddForce(self, force: PhysicalModel):
         # Nothing returned from GMAT so no return from this method
         gpy.extract_gmat_obj(self).AddForce(gpy.extract_gmat_obj(force))
@@ -349,15 +405,27 @@ class ForceModel(GmatObject):
 
     class GravityField(PhysicalModel):
         # TODO change parent class back to HarmonicField if appropriate
+        body = GmatField(3, 'SetStringParameter')  # 3 for BODY_NAME
+        degree = GmatField('Degree', 'SetIntegerParameter', int)
+        order = GmatField('Order', 'SetIntegerParameter', int)
+        stm_limit = GmatField('StmLimit', 'SetIntegerParameter', int)
+        potential_file = GmatField('PotentialFile', 'SetStringParameter')  # file GMAT actually reads
+        tide_file = GmatField('TideFile', 'SetStringParameter')
+        _tide_model = GmatField('TideModel', 'SetStringParameter')
+
         def __init__(self, name: str = None, body: str = 'Earth', model: str = 'JGM-2', degree: int = 4,
                      order: int = 4, stm_limit: int = 100, gravity_file: str = 'JGM2.cof', tide_file: str = None,
-                     tide_model: str = None):
+                     tide_model: str = None, use_cache: bool = False):
+            """
+            :param use_cache: point GMAT at a cached copy of a .cof gravity_file truncated to degree and order (see
+            gpy.data_cache.truncated_potential_file()), shared by all force models and processes using it
+            """
             if name is None:
                 name = f'GravField_{body}_{model}_{degree}_{order}'
             super().__init__('GravityField', name)
 
+            # GmatField attributes are written to GMAT in one batch when next needed
             self.body = body
-            self.SetStringParameter(3, self.body)  # 3 for BODY_NAME
 
             allowed_models = {'Sun': [None, 'Other'], 'Venus': [None, 'MGNP-180U', 'Other'],
                               'Earth': [None, 'JGM-2', 'JGM-3', 'EGM-96', 'Other'], 'Mars': [None, 'Mars-50C', 'Other'],
@@ -374,30 +442,35 @@ class ForceModel(GmatObject):
                                          f'Valid models for that body are:\n\t{allowed_models[self.body]}')
 
             self.degree = degree
-            self.SetIntegerParameter('Degree', int(self.degree))
-
             self.order = order
-            self.SetIntegerParameter('Order', self.order)
 
             # self.gmat_obj = gmat.GravityField(self.name, self.body, self.degree, self.order)
             # self.gpy_obj = gpy.GmatObject.from_gmat_obj(self.gmat_obj)
 
             self.stm_limit = stm_limit
-            self.SetIntegerParameter('StmLimit', self.stm_limit)
 
             self.gravity_file = gravity_file
-            self.SetStringParameter('PotentialFile', self.gravity_file)
+            self.potential_file = self.gravity_file
+            if use_cache and self.gravity_file.lower().endswith('.cof'):
+                source = gpy.data_cache.resolve_potential_file(self.body, self.gravity_file)
+                self.potential_file = gpy.data_cache.truncated_potential_file(source, self.degree, self.order)
 
-            self.tide_file = tide_file
-            if self.tide_file:
-                self.SetStringParameter('TideFile', self.tide_file)
+            if tide_file:
+                self.tide_file = tide_file
 
             if tide_model:
                 if tide_model not in [None, 'Solid', 'SolidAndPole']:
                     raise SyntaxError('Invalid tide_model given - must be None, "Solid" or "SolidAndPole"')
                 else:
                     self._tide_model = tide_model
-                    self.SetStringParameter('TideModel', self._tide_model)
+
+        @property
+        def coefficients(self) -> gpy.data_cache.GravityCoefficients:
+            """
+            Spherical harmonic coefficients up to this field's degree and order, from the shared gravity cache.
+            """
+            source = gpy.data_cache.resolve_potential_file(self.body, self.gravity_file)
+            return gpy.data_cache.gravity_coefficients(source, self.degree, self.order)
 
     class ODEModel(PhysicalModel):
         def __init__(self, name: str):
@@ -465,6 +538,13 @@ class PropSetup(GmatObject):  # variable called prop in GMAT Python examples
             gpy.Initialize()
             # self.Initialize()
 
+    initial_step_size = GmatField('InitialStepSize', 'SetRealParameter', float, reinitialize=True)
+    accuracy = GmatField('Accuracy', 'SetRealParameter', float, reinitialize=True)
+    min_step = GmatField('MinStep', 'SetRealParameter', float, reinitialize=True)
+    max_step = GmatField('MaxStep', 'SetRealParameter', float, reinitialize=True)
+    max_step_attempts = GmatField('MaxStepAttempts', 'SetIntegerParameter', int, reinitialize=True)
+    stop_if_accuracy_violated = GmatField('StopIfAccuracyIsViolated', 'SetBooleanParameter', reinitialize=True)
+
     def __init__(self, name: str, fm: ForceModel = None, gator: PropSetup.Propagator = None,
                  initial_step_size: int = 60, accuracy: int | float = 1e-12, min_step: int = 0, max_step: int = 2700,
                  max_step_attempts: int = 50, stop_if_accuracy_violated: bool = True):
@@ -476,29 +556,12 @@ class PropSetup(GmatObject):  # variable called prop in GMAT Python examples
         self.gator = gator if gator else PropSetup.Propagator()
         self.SetReference(self.gator)
 
-        if initial_step_size is not None:
-            self.initial_step_size = initial_step_size
-            self.SetRealParameter('InitialStepSize', self.initial_step_size)
-
-        if accuracy is not None:
-            self.accuracy = accuracy
-            self.SetRealParameter('Accuracy', self.accuracy)
-
-        if min_step is not None:
-            self.min_step = min_step
-            self.SetRealParameter('MinStep', self.min_step)
-
-        if max_step is not None:
-            self.max_step = max_step
-            self.SetRealParameter('MaxStep', self.max_step)
-
-        if max_step_attempts is not None:
-            self.max_step_attempts = max_step_attempts
-            self.SetIntegerParameter('MaxStepAttempts', self.max_step_attempts)
-
-        if stop_if_accuracy_violated is not None:
-            self.stop_if_accuracy_violated = stop_if_accuracy_violated
-            self.SetBooleanParameter('StopIfAccuracyIsViolated', self.stop_if_accuracy_violated)
+        # Fields given as None keep GMAT's values. The others are written to GMAT in one batch - see GmatField
+        for attr, value in (('initial_step_size', initial_step_size), ('accuracy', accuracy), ('min_step', min_step),
+                            ('max_step', max_step), ('max_step_attempts', max_step_attempts),
+                            ('stop_if_accuracy_violated', stop_if_accuracy_violated)):
+            if value is not None:
+                setattr(self, attr, value)
 
         self.SetReference(self.force_model)
         self.psm = self.GetPropStateManager()
@@ -506,24 +569,193 @@ class PropSetup(GmatObject):  # variable called prop in GMAT Python examples
         gpy.Initialize()
         self.Initialize()
 
+    @classmethod
+    def from_spec(cls, spec: PropSetupSpec) -> PropSetup:
+        """
+        Get the PropSetup for a PropSetupSpec, reusing the existing one if an identical spec is already in use. Its
+        ForceModel is interned too, so PropSetups differing only in integrator settings share one force model.
+
+        :param spec: PropSetupSpec describing the propagator
+        :return: PropSetup
+        """
+        spec = spec._replace(force_model=spec.force_model._replace(
+            point_masses=tuple(sorted(set(spec.force_model.point_masses)))))
+        return _intern(spec, lambda: _build_prop_setup(spec))
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop('psm', None)  # not a GmatBase, so it can't be re-bound by name - got again by __setstate__
+        return state
+
+    def __setstate__(self, state: dict):
+        # Unpickled by gpy.session.load(), once the GMAT objects exist again. An interned one is interned again
+        self.__dict__.update(state)
+        self.psm = self.GetPropStateManager()
+        if '_intern' in state:
+            key, owned_names = state['_intern']
+            _register_interned(key, self, owned_names)
+
     def AddPropObject(self, sc: gpy.Spacecraft):
         obj = gpy.extract_gmat_obj(sc)
-        self.gmat_obj.AddPropObject(obj)  # GMAT function does not give a return value
+        gpy.extract_gmat_obj(self).AddPropObject(obj)  # GMAT function does not give a return value
 
     def PrepareInternals(self):
-        self.gmat_obj.PrepareInternals()
+        gpy.extract_gmat_obj(self).PrepareInternals()
 
     def GetPropagator(self):
-        return self.gmat_obj.GetPropagator()
+        return gpy.extract_gmat_obj(self).GetPropagator()
 
     def GetState(self):
-        return self.gator.gmat_obj.GetState()
+        return gpy.extract_gmat_obj(self.gator).GetState()
 
     def GetPropStateManager(self):
-        return self.gmat_obj.GetPropStateManager()
+        return gpy.extract_gmat_obj(self).GetPropStateManager()
 
     def SetObject(self, sc):
-        self.psm.SetObject(sc.gmat_obj)
+        self.psm.SetObject(gpy.extract_gmat_obj(sc))
+
+
+class GravitySpec(NamedTuple):
+    """Immutable description of a ForceModel.GravityField, for use in a ForceModelSpec."""
+    body: str = 'Earth'
+    model: str = 'JGM-2'
+    degree: int = 4
+    order: int = 4
+    stm_limit: int = 100
+    gravity_file: str = 'JGM2.cof'
+    use_cache: bool = False
+
+
+class ForceModelSpec(NamedTuple):
+    """
+    Immutable, hashable description of a ForceModel. Equal specs give the same interned ForceModel (see
+    ForceModel.from_spec()).
+
+    drag is the name of the atmosphere model for a default DragForce (e.g. 'JacchiaRoberts'), or None for no drag.
+    """
+    central_body: str = 'Earth'
+    gravity: GravitySpec | None = GravitySpec()
+    point_masses: tuple[str, ...] = ()
+    drag: str | None = None
+    srp: bool = False
+    relativistic_correction: bool = False
+    error_control: str | None = None
+
+    def key(self) -> str:
+        """Short content hash used to name the interned GMAT objects."""
+        return hashlib.sha1(repr(self).encode()).hexdigest()[:10]
+
+
+class PropSetupSpec(NamedTuple):
+    """
+    Immutable, hashable description of a PropSetup and its Propagator. Equal specs give the same interned PropSetup
+    (see PropSetup.from_spec()).
+    """
+    force_model: ForceModelSpec = ForceModelSpec()
+    integrator: str = 'PrinceDormand78'
+    initial_step_size: int | float = 60
+    accuracy: int | float = 1e-12
+    min_step: int | float = 0
+    max_step: int | float = 2700
+    max_step_attempts: int = 50
+    stop_if_accuracy_violated: bool = True
+
+    def key(self) -> str:
+        """Short content hash used to name the interned GMAT objects."""
+        return hashlib.sha1(repr(self).encode()).hexdigest()[:10]
+
+
+# Interned objects, keyed by (spec type, spec). Entries disappear when the last Python reference to an object goes
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_finalizers: dict[tuple, weakref.finalize] = {}  # finalizer of each interned object, by the same key
+
+
+def _intern(spec: ForceModelSpec | PropSetupSpec, build) -> ForceModel | PropSetup:
+    key = (type(spec).__name__, spec)
+    obj = _interned.get(key)
+    if obj is not None and gmat.Moderator.Instance().GetConfiguredObject(obj.name) is not None:
+        return obj
+
+    # Not interned yet, or removed from GMAT since (e.g. by gmat.Clear())
+    obj, owned_names = build()
+    _register_interned(key, obj, owned_names)
+    return obj
+
+
+def _register_interned(key: tuple, obj: ForceModel | PropSetup, owned_names: tuple[str, ...]):
+    # Make obj the interned object for key, removing its GMAT objects once it is no longer referenced. Also used for
+    #  wrappers loaded by gpy.session.load(), which hold key and owned_names in their pickled attributes
+    old_finalizer = _finalizers.pop(key, None)
+    if old_finalizer is not None:
+        old_finalizer.detach()  # the previous object's GMAT objects were replaced by ones with the same names
+    _interned[key] = obj
+    obj.__dict__['_intern'] = (key, owned_names)
+    finalizer = weakref.finalize(obj, _release_configured, key, owned_names)
+    finalizer.atexit = False  # GMAT may already be torn down at interpreter exit
+    _finalizers[key] = finalizer
+
+
+def _release_configured(key: tuple, names: tuple[str, ...]):
+    # Remove objects in order (parents first), leaving any that are still referenced by other objects or commands
+    _finalizers.pop(key, None)
+    for name in names:
+        try:
+            gpy.RemoveObject(name, only_if_unused=True)
+        except Exception:  # called from a finalizer - never raise
+            pass
+
+
+def interned_count() -> int:
+    """
+    Get the number of interned ForceModels and PropSetups currently alive.
+
+    :return: number of objects
+    """
+    return len(_interned)
+
+
+def _build_force_model(spec: ForceModelSpec) -> tuple[ForceModel, tuple[str, ...]]:
+    key = spec.key()
+    names = [f'ForceModel_{key}']
+
+    gravity = None
+    if spec.gravity is not None:
+        gravity = ForceModel.GravityField(name=f'GravField_{key}', **spec.gravity._asdict())
+        names.append(gravity.name)
+
+    point_masses = None
+    if spec.point_masses:
+        point_masses = [ForceModel.PointMassForce(name=f'PointMassForce_{body}_{key}', body=body)
+                        for body in spec.point_masses]
+        names.extend(pmf.name for pmf in point_masses)
+
+    drag = False
+    if spec.drag is not None:
+        drag = ForceModel.DragForce(name=f'DragForce_{key}', atmo_model=spec.drag)
+        names.append(drag.name)
+
+    srp = False
+    if spec.srp:
+        srp = ForceModel.SolarRadiationPressure(name=f'SRP_{key}')
+        names.append(srp.name)
+
+    fm = ForceModel(name=names[0], central_body=spec.central_body,
+                    primary_body=spec.gravity.body if spec.gravity is not None else spec.central_body,
+                    gravity_field=gravity, point_masses=point_masses, drag=drag, srp=srp,
+                    relativistic_correction=spec.relativistic_correction,
+                    error_control=[spec.error_control] if spec.error_control else None)
+    return fm, tuple(names)
+
+
+def _build_prop_setup(spec: PropSetupSpec) -> tuple[PropSetup, tuple[str, ...]]:
+    key = spec.key()
+    fm = ForceModel.from_spec(spec.force_model)
+    gator = PropSetup.Propagator(spec.integrator, name=f'Prop_{spec.integrator}_{key}')
+    prop = PropSetup(f'PropSetup_{key}', fm=fm, gator=gator, initial_step_size=spec.initial_step_size,
+                     accuracy=spec.accuracy, min_step=spec.min_step, max_step=spec.max_step,
+                     max_step_attempts=spec.max_step_attempts,
+                     stop_if_accuracy_violated=spec.stop_if_accuracy_violated)
+    return prop, (prop.name, gator.name)
 
 
 class OrbitState:
@@ -667,29 +899,33 @@ class OrbitState:
         def Help(self):
             return GmatObject.Help(self.gmat_obj)
 
+    # State elements of each DisplayStateType
+    STATE_ELEMENTS: dict[str, set[str]] = {
+        'Cartesian': {'X', 'Y', 'Z', 'VX', 'VY', 'VZ'},
+        'Keplerian': {'SMA', 'ECC', 'INC', 'RAAN', 'AOP', 'TA'},
+        'ModifiedKeplerian': {'RadApo', 'RadPer', 'INC', 'RAAN', 'AOP', 'TA'},
+        'SphericalAZFPA': {'RMAG', 'RA', 'DEC', 'VMAG', 'AZI', 'FPA'},
+        'SphericalRADEC': {'RMAG', 'RA', 'DEC', 'VMAG', 'RAV', 'DECV'},
+        'Equinoctial': {'SMA', 'EquinoctialH', 'EquinoctialK',
+                        'EquinoctialP', 'EquinoctialQ', 'MLONG'},
+        'ModifiedEquinoctial': {'SemilatusRectum', 'ModEquinoctialF', 'ModEquinoctialG',
+                                'ModEquinoctialH', 'ModEquinoctialH', 'TLONG'},
+        'AlternativeEquinoctial': {'SMA', 'EquinoctialH', 'EquinoctialK',
+                                   'AltEquinoctialP', 'AltEquinoctialQ', 'MLONG'},
+        'Delaunay': {'Delaunayl', 'Delaunayg', 'Delaunayh', 'DelaunayL', 'DelaunayG', 'DelaunayH'},
+        'OutgoingAsymptote': {'OutgoingRadPer', 'OutgoingC3Energy', 'OutgoingRHA',
+                              'OutgoingDHA', 'OutgoingBVAZI', 'TA'},
+        'IncomingAsymptote': {'IncomingRadPer', 'IncomingC3Energy', 'IncomingRHA',
+                              'IncomingDHA', 'IncomingBVAZI', 'TA'},
+        'BrouwerMeanShort': {'BrouwerShortSMA', 'BrouwerShortECC', 'BrouwerShortINC',
+                             'BrouwerShortRAAN', 'BrouwerShortAOP', 'BrouwerShortMA'},
+        'BrouwerMeanLong': {'BrouwerLongSMA', 'BrouwerLongECC', 'BrouwerLongINC',
+                            'BrouwerLongRAAN', 'BrouwerLongAOP', 'BrouwerLongMA'}
+    }
+
     def __init__(self, **kwargs):
-        self.allowed_state_elements = {
-            'Cartesian': {'X', 'Y', 'Z', 'VX', 'VY', 'VZ'},
-            'Keplerian': {'SMA', 'ECC', 'INC', 'RAAN', 'AOP', 'TA'},
-            'ModifiedKeplerian': {'RadApo', 'RadPer', 'INC', 'RAAN', 'AOP', 'TA'},
-            'SphericalAZFPA': {'RMAG', 'RA', 'DEC', 'VMAG', 'AZI', 'FPA'},
-            'SphericalRADEC': {'RMAG', 'RA', 'DEC', 'VMAG', 'RAV', 'DECV'},
-            'Equinoctial': {'SMA', 'EquinoctialH', 'EquinoctialK',
-                            'EquinoctialP', 'EquinoctialQ', 'MLONG'},
-            'ModifiedEquinoctial': {'SemilatusRectum', 'ModEquinoctialF', 'ModEquinoctialG',
-                                    'ModEquinoctialH', 'ModEquinoctialH', 'TLONG'},
-            'AlternativeEquinoctial': {'SMA', 'EquinoctialH', 'EquinoctialK',
-                                       'AltEquinoctialP', 'AltEquinoctialQ', 'MLONG'},
-            'Delaunay': {'Delaunayl', 'Delaunayg', 'Delaunayh', 'DelaunayL', 'DelaunayG', 'DelaunayH'},
-            'OutgoingAsymptote': {'OutgoingRadPer', 'OutgoingC3Energy', 'OutgoingRHA',
-                                  'OutgoingDHA', 'OutgoingBVAZI', 'TA'},
-            'IncomingAsymptote': {'IncomingRadPer', 'IncomingC3Energy', 'IncomingRHA',
-                                  'IncomingDHA', 'IncomingBVAZI', 'TA'},
-            'BrouwerMeanShort': {'BrouwerShortSMA', 'BrouwerShortECC', 'BrouwerShortINC',
-                                 'BrouwerShortRAAN', 'BrouwerShortAOP', 'BrouwerShortMA'},
-            'BrouwerMeanLong': {'BrouwerLongSMA', 'BrouwerLongECC', 'BrouwerLongINC',
-                                'BrouwerLongRAAN', 'BrouwerLongAOP', 'BrouwerLongMA'}
-        }
+        self.allowed_state_elements = {state_type: set(elements)
+                                       for state_type, elements in OrbitState.STATE_ELEMENTS.items()}
         # TODO complete self._allowed_values - see pg 599 of GMAT User Guide (currently missing Planetodetic)
         self._allowed_values = {'display_state_type': list(self.allowed_state_elements.keys()),
                                 # TODO: get names of any other user-defined coordinate systems and add to allowlist
@@ -743,45 +979,44 @@ class OrbitState:
 
     def apply_to_spacecraft(self, sc: gpy.Spacecraft):
         """
-        Apply the properties of this OrbitState to a spacecraft.
-
-        :param sc:
-        :return:
-        """
-
-        attrs_to_set = []
-        # Find out which class attributes are set and apply all of them to the spacecraft
-        instance_attrs = self.__dict__.copy()  # get a copy of the instance's current attributes
+        Apply the properties of this OrbitState to a spacecraft: the epoch, coordinate system and DisplayStateType
+        first, then the state elements, then any other fields. Attributes set to None are skipped.
 
-        # remove attributes that are just for internal class use and shouldn't be applied to a spacecraft
-        for attr in ('allowed_state_elements', '_allowed_values', '_gmat_fields', '_key_param_defaults', '_sc'):
-            instance_attrs.pop(attr)
+        The attributes are validated and turned into typed Set calls once for each combination of attribute names
+        and DisplayStateType, so applying many OrbitStates (e.g. dispersion samples) is one GMAT call per value.
 
-        attrs_to_set.extend(list(instance_attrs))
-
-        # extend attrs_to_set with the elements corresponding to the current state_type
-        try:  # state_type is recognized
-            elements_for_given_state_type = self.allowed_state_elements[self._display_state_type]
-            attrs_to_set.extend(elements_for_given_state_type)
-        except KeyError:  # state_type attribute invalid
+        :param sc: Spacecraft to apply the properties to
+        """
+        sc_obj = gpy.extract_gmat_obj(sc)
+        for attr, method, field in self._apply_plan():
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            if method == 'SetStringParameter':
+                value = str(value)
+            elif method == 'SetRealParameter':
+                value = float(value)
+            getattr(sc_obj, method)(field, value)
+
+    def _apply_plan(self) -> list[tuple[str, str, str]]:
+        # (attribute, setter, GMAT field) for each attribute to apply, cached by attribute names and DisplayStateType
+        attrs = tuple(attr for attr in self.__dict__ if attr not in _INTERNAL_ATTRS)
+        key = (self._display_state_type, attrs)
+        plan = _apply_plans.get(key)
+        if plan is not None:
+            return plan
+
+        if self._display_state_type not in OrbitState.STATE_ELEMENTS:
             raise AttributeError(f'Invalid state_type set as attribute: {self._display_state_type}')
 
-        for attr in attrs_to_set:
-            try:
-                # TODO bugfix: setting element e.g. ECC to 'Cartesian'
-                # TODO bugfix: setting DisplayStateType to 'Cartesian'
-                gmat_attr = py_str_to_gmat_str(attr)
-                val = getattr(self, attr)
-                if gmat_attr == 'CoordSys':
-                    gmat_attr = 'CoordinateSystem'
-                if val is not None:
-                    if (gmat_attr == 'Epoch') and (not isinstance(val, str)):
-                        val = str(val)
-                    sc.SetField(gmat_attr, val)
-                raise AttributeError
-            except AttributeError:
-                # print(f'No value set for attr {attr} - skipping')
-                pass
+        # Epoch settings and the representation must be set before the elements, which GMAT converts from it.
+        #  Elements are set by label, as Spacecraft handles element labels of any representation
+        settings = [(attr, 'SetStringParameter', field) for attr, field in _SETTING_FIELDS.items() if attr in attrs]
+        elements = [(attr, 'SetRealParameter', _ELEMENT_FIELDS[attr]) for attr in attrs if attr in _ELEMENT_FIELDS]
+        others = [(attr, 'SetField', py_str_to_gmat_str(attr)) for attr in attrs
+                  if attr not in _SETTING_FIELDS and attr not in _ELEMENT_FIELDS]
+        plan = _apply_plans[key] = settings + elements + others
+        return plan
 
     @classmethod
     def from_dict(cls, orbit_dict: dict, sc: gpy.Spacecraft = None) -> OrbitState:
@@ -807,3 +1042,19 @@ class OrbitState:
             setattr(o_s, gmat_str_to_py_str(attr, True), orbit_dict[attr])
 
         return o_s
+
+
+# OrbitState attributes used only by the class itself, which are not applied to a Spacecraft
+_INTERNAL_ATTRS: set[str] = {'allowed_state_elements', '_allowed_values', '_gmat_fields', '_key_param_defaults', '_sc'}
+
+# OrbitState attributes that configure how the state is given, in the order they must be applied, and their fields
+_SETTING_FIELDS: dict[str, str] = {'_date_format': 'DateFormat', '_epoch': 'Epoch', '_coord_sys': 'CoordinateSystem',
+                                   '_coordinate_system': 'CoordinateSystem',
+                                   '_display_state_type': 'DisplayStateType'}
+
+# OrbitState attribute of each state element (as set by from_dict()), and the element's field
+_ELEMENT_FIELDS: dict[str, str] = {gmat_str_to_py_str(element, True): element
+                                   for elements in OrbitState.STATE_ELEMENTS.values() for element in elements}
+
+# Plans made by OrbitState._apply_plan(), by DisplayStateType and attribute names
+_apply_plans: dict[tuple, list[tuple[str, str, str]]] = {}
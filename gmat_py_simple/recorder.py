@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import numpy as np
+
+
+class ParameterRecorder:
+    def __init__(self, params: list[str], decimation: int = 1, cadence: int | float = None, capacity: int = 1024,
+                 ring: bool = False):
+        """
+        Record GMAT Parameters (e.g. 'Sat.Earth.RMAG', 'Sat.TotalMass', 'Sat.BdotT') in memory at each propagation
+        step, without writing a ReportFile to disk and parsing it back.
+
+        GMAT's Subscriber class cannot be extended from Python, so the recorder drives propagation itself by stepping
+        the PropSetup's Propagator (see propagate() and propagate_command()) and evaluates each Parameter after every
+        step. Values are stored in preallocated NumPy column buffers, which double in size when full, or which
+        overwrite the oldest rows in ring mode.
+
+        The recorder does not run inside gpy.RunMission(): a mission run is executed by GMAT's Sandbox, which never
+        calls back into Python, so nothing is recorded while it runs. To record a mission's Propagate command, pass
+        it to propagate_command() instead. The recorded Spacecraft is restored afterwards (see propagate()), so it
+        does not change the initial conditions of a later gpy.RunMission().
+
+        :param params: Parameter descriptions to record, as they would be written in a GMAT script
+        :param decimation: record only every nth integrator step (the final step is always recorded)
+        :param cadence: if given, step at this fixed interval (s) instead of the integrator's own step sizes
+        :param capacity: initial number of rows to allocate, or the number of rows kept in ring mode
+        :param ring: keep only the most recent capacity rows, so memory use is bounded however long the propagation
+        """
+        if not params:
+            raise AttributeError('params must contain at least one Parameter description, e.g. "Sat.Earth.RMAG"')
+        if int(decimation) < 1:
+            raise AttributeError(f'decimation must be a positive integer - given value: {decimation}')
+        if cadence is not None and cadence <= 0:
+            raise AttributeError(f'cadence must be a positive number of seconds - given value: {cadence}')
+        if int(capacity) < 1:
+            raise AttributeError(f'capacity must be a positive integer - given value: {capacity}')
+
+        self.params: list[str] = list(params)
+        self.decimation: int = int(decimation)
+        self.cadence: float | None = cadence
+        self.ring: bool = ring
+        self.capacity: int = int(capacity)
+
+        # Column 0 holds the A1 ModJulian epoch, then one column per Parameter
+        self._buffer: np.ndarray = np.empty((self.capacity, len(self.params) + 1))
+        self.count: int = 0  # rows recorded in total, including any overwritten in ring mode
+        self._wrappers: list = []
+        self._prop_objects: set[tuple[str, str]] = set()  # (PropSetup, Spacecraft) names added to a PropSetup
+
+    def __repr__(self):
+        return f'ParameterRecorder of {self.params} with {len(self)} rows'
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity) if self.ring else self.count
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        Recorded rows in time order, as an array of shape (rows, 1 + number of params). Column 0 is the A1 ModJulian
+        epoch.
+        """
+        if not self.ring or self.count <= self.capacity:
+            return self._buffer[:len(self)]
+        start = self.count % self.capacity
+        return np.concatenate((self._buffer[start:], self._buffer[:start]))
+
+    @property
+    def epochs(self) -> np.ndarray:
+        """A1 ModJulian epochs of the recorded rows."""
+        return self.data[:, 0]
+
+    def __getitem__(self, param: str) -> np.ndarray:
+        """
+        Get the recorded values of one Parameter, e.g. recorder['Sat.Earth.RMAG'].
+        """
+        try:
+            column = self.params.index(param) + 1
+        except ValueError:
+            raise AttributeError(f'Parameter "{param}" is not being recorded. Recorded Parameters: {self.params}')
+        return self.data[:, column]
+
+    def clear(self):
+        """
+        Discard all recorded rows, keeping the allocated buffer.
+        """
+        self.count = 0
+
+    def _append(self, row: list[float]):
+        if self.ring:
+            self._buffer[self.count % self.capacity] = row
+        else:
+            if self.count == len(self._buffer):  # full - grow geometrically so appends stay amortized O(1)
+                self._buffer = np.concatenate((self._buffer, np.empty_like(self._buffer)))
+            self._buffer[self.count] = row
+        self.count += 1
+
+    def _prepare_wrappers(self):
+        self._wrappers = [_element_wrapper(desc) for desc in self.params]
+
+    def record(self, sat: gpy.Spacecraft | gmat.Spacecraft):
+        """
+        Evaluate all Parameters now and append a row, e.g. between manual Propagator steps.
+
+        :param sat: the Spacecraft whose epoch labels the row
+        """
+        if not self._wrappers:
+            self._prepare_wrappers()
+        epoch = gpy.extract_gmat_obj(sat).GetRealParameter('A1Epoch')
+        self._append([epoch] + [wrapper.EvaluateReal() for wrapper in self._wrappers])
+
+    def propagate(self, prop: gpy.PropSetup, sat: gpy.Spacecraft, duration: int | float) -> np.ndarray:
+        """
+        Propagate a Spacecraft for a duration, recording the Parameters at the start and after each step.
+
+        The configured Spacecraft is stepped so that Parameters referring to it can be evaluated, then its epoch and
+        state are restored, so later mission runs start from the same initial conditions.
+
+        :param prop: PropSetup to propagate with
+        :param sat: Spacecraft to propagate
+        :param duration: time to propagate for (s)
+        :return: the recorded rows (see data)
+        """
+        return self._propagate(prop, sat, duration)
+
+    def propagate_command(self, command: gpy.Propagate, duration: int | float = None) -> np.ndarray:
+        """
+        Propagate the Spacecraft of a Propagate command with its PropSetup until the command's stop condition is met,
+        recording the Parameters (see propagate()). As in GMAT, the final step is shortened to end where the stop
+        condition is met.
+
+        :param command: Propagate command whose Spacecraft, PropSetup and stop condition should be used
+        :param duration: maximum time to propagate for (s). Required unless the stop condition is on ElapsedSecs or
+        ElapsedDays
+        :return: the recorded rows (see data)
+        """
+        stop_cond = gpy.extract_gmat_obj(command.stop_cond)
+        stop_var = stop_cond.GetStringParameter('StopVar')
+        goal = stop_cond.GetStringParameter('Goal')
+        try:
+            goal = float(goal)
+        except ValueError:  # goalless stop condition, e.g. Sat.Earth.Periapsis, met where R.V crosses zero
+            direction = -1 if stop_var.endswith('Apoapsis') else 1
+            goal = 0.0
+        else:
+            direction = 0
+
+        parameter = stop_var.split('.')[-1]
+        if parameter in ('ElapsedSecs', 'ElapsedDays'):
+            stop_secs = goal * 86400 if parameter == 'ElapsedDays' else goal
+            if duration is not None:
+                stop_secs = min(stop_secs, duration)
+            return self._propagate(command.prop, command.sat, stop_secs)
+        if duration is None:
+            raise AttributeError(f'duration must be given for the stop condition "{stop_var}", as a limit in case it is'
+                                 f' never met')
+        return self._propagate(command.prop, command.sat, duration, (_element_wrapper(stop_var), goal, direction))
+
+    def _propagate(self, prop: gpy.PropSetup, sat: gpy.Spacecraft, duration: int | float,
+                   stop: tuple = None) -> np.ndarray:
+        # Step the Spacecraft for up to duration seconds. stop is an optional (element wrapper, goal, direction) to
+        #  finish early where the wrapper's value crosses the goal, upwards (1), downwards (-1) or either way (0)
+        if duration <= 0:
+            raise AttributeError(f'duration must be a positive number of seconds - given value: {duration}')
+
+        originals = gpy.snapshot_objects([sat.GetName()])
+        try:
+            key = (prop.GetName(), sat.GetName())
+            if key not in self._prop_objects:  # the PropSetup keeps its objects, so only add each one once
+                prop.AddPropObject(sat)
+                self._prop_objects.add(key)
+            prop.PrepareInternals()
+            gator = prop.GetPropagator()
+            max_step = self.cadence if self.cadence is not None else getattr(prop, 'max_step', None)
+
+            self.record(sat)
+            if stop is not None:
+                stop_wrapper, goal, direction = stop
+                stop_value = stop_wrapper.EvaluateReal() - goal
+            elapsed = 0.0
+            step = 0
+            while elapsed < duration:
+                remaining = duration - elapsed
+                if self.cadence is not None or (max_step and remaining <= max_step):
+                    gator.Step(min(max_step, remaining))  # fixed-size step, landing on the cadence or the end time
+                else:
+                    gator.Step()  # integrator's own adaptive step
+                dt = gator.GetStepTaken()
+                gator.UpdateSpaceObject()
+                elapsed += dt
+                step += 1
+
+                if stop is not None:
+                    new_stop_value = stop_wrapper.EvaluateReal() - goal
+                    if _crossed(stop_value, new_stop_value, direction):
+                        elapsed += _step_to_crossing(gator, stop_wrapper, goal, stop_value, new_stop_value, dt)
+                        self.record(sat)
+                        break
+                    stop_value = new_stop_value
+
+                if step % self.decimation == 0 or elapsed >= duration:
+                    self.record(sat)
+        finally:
+            gpy.restore_objects(originals)
+
+        return self.data
+
+
+# Convergence limits for finding where a stop condition is met within a step
+_STOP_TIME_TOLERANCE = 1e-6  # s
+_STOP_MAX_ITERATIONS = 50
+
+
+def _element_wrapper(desc: str) -> gmat.ElementWrapper:
+    # Wrap a Parameter description so it can be evaluated, creating the Parameter in GMAT if necessary, and link it
+    #  to the configured objects it depends on
+    mod = gmat.Moderator.Instance()
+    solar_system = gmat.GetSolarSystem()
+    vdator = gmat.Validator.Instance()
+    vdator.SetSolarSystem(solar_system)
+    vdator.SetObjectMap(mod.GetConfiguredObjectMap())
+
+    def find(name: str):
+        obj = mod.GetConfiguredObject(name)
+        return obj if obj is not None else solar_system.GetBody(name)
+
+    wrapper = vdator.CreateElementWrapper(desc)
+    if wrapper is None:
+        raise AttributeError(f'GMAT could not create a Parameter from the description "{desc}"')
+    for ref_name in wrapper.GetRefObjectNames():
+        param = find(ref_name)
+        if param is None:
+            raise RuntimeError(f'Object "{ref_name}" needed to evaluate "{desc}" was not found')
+        for dep_name in param.GetRefObjectNameArray(gmat.UNKNOWN_OBJECT):
+            dep = find(dep_name)
+            if dep is not None:
+                param.SetRefObject(dep, dep.GetType(), dep_name)
+        param.SetSolarSystem(solar_system)
+        param.Initialize()
+        wrapper.SetRefObject(param)
+    return wrapper
+
+
+def _crossed(before: float, after: float, direction: int) -> bool:
+    # Whether a value minus its goal crossed zero in the given direction (1 up, -1 down, 0 either)
+    if direction > 0:
+        return before < 0 <= after
+    if direction < 0:
+        return before > 0 >= after
+    return before != after and (before <= 0 <= after or before >= 0 >= after)
+
+
+def _step_to_crossing(gator, wrapper, goal: float, before: float, after: float, dt: float) -> float:
+    # The last step of dt took wrapper's value minus goal from before to after, across zero. Step the propagator
+    #  back to the crossing, found by regula falsi (Illinois variant) on the bracket, and return the time moved (s)
+    a, fa, b, fb = -dt, before, 0.0, after  # times relative to the end of the step
+    position = 0.0
+    for _ in range(_STOP_MAX_ITERATIONS):
+        if fb == fa:
+            break
+        t = b - fb * (b - a) / (fb - fa)
+        gator.Step(t - position)
+        gator.UpdateSpaceObject()
+        position += gator.GetStepTaken()
+        f = wrapper.EvaluateReal() - goal
+        if f == 0 or min(abs(t - a), abs(b - t)) < _STOP_TIME_TOLERANCE:
+            break
+        if (f > 0) == (fb > 0):
+            b, fb = t, f
+            fa /= 2
+        else:
+            a, fa = t, f
+            fb /= 2
+    return position
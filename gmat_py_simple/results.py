@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import numpy as np
+
+_CARTESIAN_ELEMENTS: list[str] = ['X', 'Y', 'Z', 'VX', 'VY', 'VZ']
+_BURN_ELEMENTS: list[str] = ['Element1', 'Element2', 'Element3']
+_HISTORY_PREFIX: str = 'history__'  # prefix of recorded history arrays in saved .npz files
+# Arrays every saved .npz file holds, besides histories
+_SAVED_FIELDS: list[str] = ['sat_names', 'epochs', 'states', 'coord_systems', 'total_masses', 'tank_names',
+                            'tank_sats', 'fuel_masses', 'burn_names', 'delta_tank_masses', 'burns_fired',
+                            'solver_names', 'solver_statuses']
+
+
+class MissionResult:
+    def __init__(self, sat_names: list[str], epochs: np.ndarray, states: np.ndarray, coord_systems: list[str],
+                 total_masses: np.ndarray, tank_names: list[str], tank_sats: list[str], fuel_masses: np.ndarray,
+                 burn_names: list[str], delta_tank_masses: np.ndarray, burns_fired: np.ndarray,
+                 solver_names: list[str] = (), solver_statuses: list[str] = (),
+                 histories: dict[str, np.ndarray] = None):
+        """
+        Final values of every spacecraft, tank and burn involved in a mission run, held as NumPy arrays so that
+        post-run analysis needs no further calls into GMAT. Usually created by gpy.RunMission(mcs, return_result=True).
+
+        :param sat_names: names of the spacecraft
+        :param epochs: final A1 ModJulian epoch of each spacecraft
+        :param states: final Cartesian state [X, Y, Z, VX, VY, VZ] of each spacecraft, shape (num_sats, 6)
+        :param coord_systems: coordinate system of each spacecraft's state
+        :param total_masses: final total mass of each spacecraft (kg)
+        :param tank_names: names of the tanks, one entry per (spacecraft, tank) pair
+        :param tank_sats: name of the spacecraft each tank entry belongs to
+        :param fuel_masses: final fuel mass of each tank entry (kg)
+        :param burn_names: names of the burns
+        :param delta_tank_masses: DeltaTankMass of each burn (kg)
+        :param burns_fired: whether each burn has fired
+        :param solver_names: names of the solvers used by Target commands
+        :param solver_statuses: final status string of each solver, e.g. 'Converged'
+        :param histories: optional recorded histories to keep with the result, e.g. {'rmag': recorder.data} from a
+        gpy.ParameterRecorder
+        """
+        self.sat_names: np.ndarray = np.asarray(sat_names, dtype=str)
+        self.epochs: np.ndarray = np.asarray(epochs, dtype=float)
+        self.states: np.ndarray = np.asarray(states, dtype=float).reshape(-1, 6)
+        self.coord_systems: np.ndarray = np.asarray(coord_systems, dtype=str)
+        self.total_masses: np.ndarray = np.asarray(total_masses, dtype=float)
+        self.tank_names: np.ndarray = np.asarray(tank_names, dtype=str)
+        self.tank_sats: np.ndarray = np.asarray(tank_sats, dtype=str)
+        self.fuel_masses: np.ndarray = np.asarray(fuel_masses, dtype=float)
+        self.burn_names: np.ndarray = np.asarray(burn_names, dtype=str)
+        self.delta_tank_masses: np.ndarray = np.asarray(delta_tank_masses, dtype=float)
+        self.burns_fired: np.ndarray = np.asarray(burns_fired, dtype=bool)
+        self.solver_names: np.ndarray = np.asarray(solver_names, dtype=str)
+        self.solver_statuses: np.ndarray = np.asarray(solver_statuses, dtype=str)
+        self.histories: dict[str, np.ndarray] = {name: np.asarray(values, dtype=float)
+                                                 for name, values in (histories or {}).items()}
+
+    def __repr__(self):
+        return (f'MissionResult with {len(self.sat_names)} spacecraft, {len(self.tank_names)} tanks and '
+                f'{len(self.burn_names)} burns')
+
+    @classmethod
+    def capture(cls, mission_command_sequence: list[gpy.GmatCommand | gmat.GmatCommand]) -> MissionResult:
+        """
+        Read the final values of all spacecraft, tanks and burns used by a mission's commands (including those
+        nested in branch commands such as Target) from GMAT's runtime objects, in one pass.
+
+        :param mission_command_sequence: the mission command sequence that has just been run
+        :return: MissionResult
+        """
+        sats: dict[str, gpy.Spacecraft | gmat.Spacecraft] = {}
+        burns: dict[str, gpy.Burn] = {}
+        solver_names: list[str] = []
+        for command in _walk_commands(mission_command_sequence):
+            if isinstance(command, gpy.Target):
+                if command.solver.GetName() not in solver_names:
+                    solver_names.append(command.solver.GetName())
+            elif isinstance(command, gpy.Propagate):
+                sats.setdefault(command.sat.GetName(), command.sat)
+            elif isinstance(command, gpy.Maneuver):
+                sats.setdefault(command.spacecraft.name, command.spacecraft)
+                burns.setdefault(command.burn.name, command.burn)
+
+        num_sats = len(sats)
+        epochs = np.empty(num_sats)
+        states = np.empty((num_sats, 6))
+        total_masses = np.empty(num_sats)
+        coord_systems = []
+        tank_names, tank_sats, fuel_masses = [], [], []
+        for index, (sat_name, sat) in enumerate(sats.items()):
+            rt_sat = _runtime_object(sat_name)
+            epochs[index] = rt_sat.GetRealParameter('A1Epoch')
+            states[index] = [rt_sat.GetRealParameter(element) for element in _CARTESIAN_ELEMENTS]
+            total_masses[index] = rt_sat.GetRealParameter('TotalMass')
+            coord_systems.append(rt_sat.GetStringParameter('CoordinateSystem'))
+
+            # Tanks are owned (cloned) by each Spacecraft at runtime, so read them through the runtime Spacecraft
+            for tank in (getattr(sat, 'chem_tanks', None) or []) + (getattr(sat, 'elec_tanks', None) or []):
+                rt_tank = rt_sat.GetRefObject(gmat.FUEL_TANK, tank.name) or _runtime_object(tank.name)
+                tank_names.append(tank.name)
+                tank_sats.append(sat_name)
+                fuel_masses.append(rt_tank.GetRealParameter('FuelMass'))
+
+        burn_names = list(burns)
+        delta_tank_masses = np.empty(len(burn_names))
+        burns_fired = np.empty(len(burn_names), dtype=bool)
+        for index, burn_name in enumerate(burn_names):
+            rt_burn = _runtime_object(burn_name)
+            delta_tank_masses[index] = (rt_burn.GetRealParameter('DeltaTankMass')
+                                        if isinstance(burns[burn_name], gpy.ImpulsiveBurn) else np.nan)
+            burns_fired[index] = burns[burn_name].has_fired
+
+        solver_statuses = [gmat.GmatGlobal.Instance().GetSolverStatusString(name) for name in solver_names]
+
+        return cls(list(sats), epochs, states, coord_systems, total_masses, tank_names, tank_sats, fuel_masses,
+                   burn_names, delta_tank_masses, burns_fired, solver_names, solver_statuses)
+
+    def _sat_index(self, sat: gpy.Spacecraft | str) -> int:
+        name = sat if isinstance(sat, str) else sat.GetName()
+        matches = np.flatnonzero(self.sat_names == name)
+        if not matches.size:
+            raise AttributeError(f'Spacecraft "{name}" is not in this MissionResult. '
+                                 f'Spacecraft: {list(self.sat_names)}')
+        return int(matches[0])
+
+    def epoch(self, sat: gpy.Spacecraft | str, system: str = 'A1') -> float:
+        """
+        Get a spacecraft's final epoch.
+
+        :param sat: Spacecraft or its name
+        :param system: time system of the result - 'A1', 'TAI', 'UTC', 'TDB' or 'TT'
+        :return: epoch as a ModJulian float
+        """
+        a1_epoch = self.epochs[self._sat_index(sat)]
+        if system == 'A1':
+            return float(a1_epoch)
+        return float(gpy.time.convert(a1_epoch, 'A1ModJulian', f'{system}ModJulian'))
+
+    def state(self, sat: gpy.Spacecraft | str) -> np.ndarray:
+        """
+        Get a spacecraft's final Cartesian state, in its coordinate system.
+
+        :param sat: Spacecraft or its name
+        :return: array [X, Y, Z, VX, VY, VZ] (km, km/s)
+        """
+        return self.states[self._sat_index(sat)]
+
+    def total_mass(self, sat: gpy.Spacecraft | str) -> float:
+        """
+        Get a spacecraft's final total mass.
+
+        :param sat: Spacecraft or its name
+        :return: mass (kg)
+        """
+        return float(self.total_masses[self._sat_index(sat)])
+
+    def fuel_mass(self, tank: gpy.Tank | str, sat: gpy.Spacecraft | str = None) -> float:
+        """
+        Get a tank's final fuel mass.
+
+        :param tank: Tank or its name
+        :param sat: Spacecraft or name, needed if tanks with the same name are attached to several spacecraft
+        :return: fuel mass (kg)
+        """
+        tank_name = tank if isinstance(tank, str) else tank.name
+        mask = self.tank_names == tank_name
+        if sat is not None:
+            mask &= self.tank_sats == (sat if isinstance(sat, str) else sat.GetName())
+        matches = np.flatnonzero(mask)
+        if not matches.size:
+            raise AttributeError(f'Tank "{tank_name}" is not in this MissionResult. Tanks: {list(self.tank_names)}')
+        return float(self.fuel_masses[matches[0]])
+
+    def delta_tank_mass(self, burn: gpy.Burn | str) -> float:
+        """
+        Get the mass of fuel used by an ImpulsiveBurn.
+
+        :param burn: Burn or its name
+        :return: DeltaTankMass (kg), or NaN for a FiniteBurn
+        """
+        burn_name = burn if isinstance(burn, str) else burn.name
+        matches = np.flatnonzero(self.burn_names == burn_name)
+        if not matches.size:
+            raise AttributeError(f'Burn "{burn_name}" is not in this MissionResult. Burns: {list(self.burn_names)}')
+        return float(self.delta_tank_masses[matches[0]])
+
+    def solver_status(self, solver: gpy.Solver | str) -> str:
+        """
+        Get the final status of a Target command's solver.
+
+        :param solver: DifferentialCorrector (or other Solver) or its name
+        :return: status string, e.g. 'Converged'
+        """
+        solver_name = solver if isinstance(solver, str) else solver.GetName()
+        matches = np.flatnonzero(self.solver_names == solver_name)
+        if not matches.size:
+            raise AttributeError(f'Solver "{solver_name}" is not in this MissionResult. '
+                                 f'Solvers: {list(self.solver_names)}')
+        return str(self.solver_statuses[matches[0]])
+
+    def to_dict(self) -> dict[str, list]:
+        """
+        Get the result as a dict of plain lists, e.g. for sending as JSON. MissionResult(**result.to_dict()) gives an
+        equal MissionResult.
+
+        :return: dict of constructor argument name to list
+        """
+        result = {name: value.tolist() for name, value in vars(self).items() if name != 'histories'}
+        result['histories'] = {name: values.tolist() for name, values in self.histories.items()}
+        return result
+
+    def save(self, path):
+        """
+        Save the result to a NumPy .npz file.
+
+        :param path: path of the file to write, or a binary file object
+        """
+        arrays = {name: getattr(self, name) for name in _SAVED_FIELDS}
+        arrays.update({f'{_HISTORY_PREFIX}{name}': values for name, values in self.histories.items()})
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> MissionResult:
+        """
+        Load a result saved with save().
+
+        :param path: path of the .npz file
+        :return: MissionResult
+        """
+        with np.load(path) as data:
+            histories = {name[len(_HISTORY_PREFIX):]: data[name] for name in data.files
+                         if name.startswith(_HISTORY_PREFIX)}
+            return cls(**{name: data[name] for name in _SAVED_FIELDS}, histories=histories)
+
+
+def snapshot_objects(sat_names: list[str], tank_names: list[str] = (), burn_names: list[str] = ()) -> dict[str, list]:
+    """
+    Record the current epoch and state of configured Spacecraft, fuel mass of Tanks and elements of ImpulsiveBurns,
+    so that code which changes them (e.g. stepping a Spacecraft outside a mission run) can put them back afterwards
+    with restore_objects().
+
+    The epoch is kept as the user's own string and the state as exact Cartesian values, so restoring them leaves
+    each object's generating string unchanged.
+
+    :param sat_names: names of configured Spacecraft
+    :param tank_names: names of configured fuel tanks
+    :param burn_names: names of configured burns - only ImpulsiveBurns are recorded
+    :return: snapshot to pass to restore_objects()
+    """
+    snapshot = {'sats': [], 'tanks': [], 'burns': []}
+    for sat_name in sat_names:
+        sat = gmat.GetObject(sat_name)
+        snapshot['sats'].append((sat, sat.GetField('DateFormat'), sat.GetField('Epoch'),
+                                 sat.GetField('DisplayStateType'),
+                                 [sat.GetRealParameter(element) for element in _CARTESIAN_ELEMENTS]))
+    for tank_name in dict.fromkeys(tank_names):
+        tank = gmat.GetObject(tank_name)
+        snapshot['tanks'].append((tank, tank.GetRealParameter('FuelMass')))
+    for burn_name in burn_names:
+        burn = gmat.GetObject(burn_name)
+        if burn.GetTypeName() == 'ImpulsiveBurn':
+            snapshot['burns'].append((burn, [burn.GetRealParameter(element) for element in _BURN_ELEMENTS]))
+    return snapshot
+
+
+def restore_objects(snapshot: dict[str, list]):
+    """
+    Set configured objects back to the values recorded by snapshot_objects().
+
+    :param snapshot: snapshot returned by snapshot_objects()
+    """
+    for sat, date_format, epoch, display_state_type, state in snapshot['sats']:
+        sat.SetField('DateFormat', date_format)
+        sat.SetField('Epoch', epoch)
+        _set_cartesian(sat, state)
+        sat.SetField('DisplayStateType', display_state_type)
+    for tank, fuel_mass in snapshot['tanks']:
+        tank.SetField('FuelMass', repr(fuel_mass))
+    for burn, elements in snapshot['burns']:
+        for element, value in zip(_BURN_ELEMENTS, elements):
+            burn.SetField(element, repr(value))
+
+
+def _set_cartesian(sat: gmat.Spacecraft, state):
+    sat.SetField('DisplayStateType', 'Cartesian')
+    for element, value in zip(_CARTESIAN_ELEMENTS, state):
+        sat.SetField(element, repr(float(value)))
+
+
+def _walk_commands(commands: list) -> list:
+    # Flatten a command sequence, including the sub-sequences of branch commands (e.g. Target)
+    flat = []
+    for command in commands:
+        flat.append(command)
+        sub_commands = getattr(command, 'command_sequence', None)
+        if sub_commands:
+            flat.extend(_walk_commands(sub_commands))
+    return flat
+
+
+def _runtime_object(name: str):
+    # Runtime (Sandbox) copy of an object after a run, or the configured object if it wasn't used in the run
+    obj = gmat.GetRuntimeObject(name)
+    return obj if obj is not None else gmat.GetObject(name)
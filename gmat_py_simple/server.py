@@ -0,0 +1,692 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import argparse
+import bisect
+import heapq
+import importlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection, wait
+from urllib.parse import parse_qs, urlparse
+
+# Kinds of mission definition a job can hold
+JOB_KINDS: tuple[str, ...] = ('script', 'builder', 'spec')
+
+# Job states - the last four are final
+JOB_STATES: tuple[str, ...] = ('queued', 'running', 'done', 'failed', 'cancelled', 'timeout')
+
+# How often the dispatcher checks running jobs against their timeouts (s)
+_TICK: float = 0.25
+
+# Window over which throughput is measured (s)
+_THROUGHPUT_WINDOW: float = 60.0
+
+
+class Job:
+    def __init__(self, job_id: int, definition: dict, priority: int = 0, timeout: float = None):
+        """
+        A mission submitted to a JobServer.
+
+        :param job_id: server-assigned ID
+        :param definition: mission definition (see JobServer)
+        :param priority: jobs with higher priority run first; equal priorities run in submission order
+        :param timeout: wall-clock time allowed for the run (s), or None for no limit
+        """
+        self.id: int = job_id
+        self.definition: dict = definition
+        self.priority: int = priority
+        self.timeout: float | None = timeout
+        self.state: str = 'queued'
+        self.submitted: float = time.time()
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.worker: int | None = None
+        self.result: dict | None = None
+        self.error: str | None = None
+        self.log: list[str] = []
+        self.log_ends: list[int] = []  # log_size after each chunk of self.log, to find a chunk by offset
+        self.log_size: int = 0  # characters of log text so far
+        self.finished_event = threading.Event()
+
+    def __repr__(self):
+        return f'Job {self.id} ({self.definition.get("kind")}, {self.state})'
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in JOB_STATES[2:]
+
+    def log_text(self, offset: int = 0) -> str:
+        """
+        Get the job's log output from a character offset onwards.
+
+        :param offset: number of characters to skip
+        :return: log text
+        """
+        # Join only the chunks from the one containing offset, so following a long log isn't quadratic. A chunk may
+        #  be appended meanwhile, so log_ends (appended after log) is the one that can be shorter
+        index = bisect.bisect_right(self.log_ends, offset)
+        start = self.log_ends[index - 1] if index else 0
+        return ''.join(self.log[index:])[offset - start:]
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        summary = {'id': self.id, 'kind': self.definition.get('kind'), 'state': self.state, 'priority': self.priority,
+                   'timeout': self.timeout, 'submitted': self.submitted, 'started': self.started,
+                   'finished': self.finished, 'worker': self.worker, 'log_size': self.log_size}
+        if include_result:
+            summary['result'] = self.result
+            summary['error'] = self.error
+        return summary
+
+
+class _Worker:
+    # Server-side handle of a warm worker process
+    def __init__(self, worker_id: int, process: multiprocessing.Process, conn: Connection):
+        self.id: int = worker_id
+        self.process: multiprocessing.Process = process
+        self.conn: Connection = conn
+        self.ready: bool = False  # GMAT loaded and waiting for a job
+        self.job: Job | None = None
+        self.busy_secs: float = 0.0  # time spent on finished jobs
+
+
+class JobServer:
+    def __init__(self, num_workers: int = 2, default_timeout: float = None):
+        """
+        Queue of mission jobs run by a pool of warm GMAT worker processes. Each worker loads GMAT once and runs one
+        job at a time, releasing the job's objects afterwards (see gpy.MissionScope), so jobs don't see each
+        other's configuration. Cancelling or timing out a running job terminates its worker, which is replaced.
+
+        A job's definition is a dict with a 'kind':
+
+        - 'script': {'kind': 'script', 'script': '<GMAT script text>'} - run with GMAT's script interpreter. The result
+          holds the final state of every Spacecraft
+        - 'builder': {'kind': 'builder', 'builder': 'package.module:function', 'args': [...], 'kwargs': {...}} - a
+          function importable by the workers that builds a mission with gmat_py_simple and returns its command
+          sequence. The result is the MissionResult as a dict (see gpy.MissionResult.to_dict())
+        - 'spec': JSON in the style of gpy.Spacecraft.from_dict() - see _build_spec_mission()
+
+        Use serve() (or python -m gmat_py_simple.server) to expose the server over HTTP.
+
+        :param num_workers: number of worker processes
+        :param default_timeout: timeout for jobs submitted without one (s), or None for no limit
+        """
+        if int(num_workers) < 1:
+            raise AttributeError(f'num_workers must be a positive integer - given value: {num_workers}')
+        self.num_workers: int = int(num_workers)
+        self.default_timeout: float | None = default_timeout
+        self.started: float = time.time()
+
+        self._lock = threading.Condition()
+        self._queue: list[tuple[int, int, Job]] = []  # heap of (-priority, job ID, job)
+        self._jobs: dict[int, Job] = {}
+        self._workers: dict[int, _Worker] = {}
+        self._job_ids = itertools.count(1)
+        self._worker_ids = itertools.count(1)
+        self._finish_times: deque[float] = deque()  # completion times within the throughput window
+        self._retired_busy_secs: float = 0.0  # busy time of workers that have been replaced
+        self._running: bool = False
+        self._threads: list[threading.Thread] = []
+
+    def __repr__(self):
+        return f'JobServer with {self.num_workers} workers and {len(self._queue)} queued jobs'
+
+    def __enter__(self) -> JobServer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def start(self):
+        """
+        Start the worker processes and the threads that dispatch jobs to them.
+        """
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for _ in range(self.num_workers):
+                self._spawn_worker()
+        self._threads = [threading.Thread(target=self._dispatch, name='gpy-dispatch', daemon=True),
+                         threading.Thread(target=self._receive, name='gpy-receive', daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def shutdown(self):
+        """
+        Cancel all unfinished jobs and stop the workers.
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            for job in self._jobs.values():
+                if not job.is_finished:
+                    self._finish(job, 'cancelled', error='Server shut down')
+            for worker in self._workers.values():
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+            self._lock.notify_all()
+        for worker in list(self._workers.values()):
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for thread in self._threads:
+            thread.join()
+
+    def _spawn_worker(self):
+        # Start a new worker process - called with the lock held
+        parent_conn, child_conn = multiprocessing.Pipe()
+        worker_id = next(self._worker_ids)
+        process = multiprocessing.get_context('spawn').Process(target=_worker_main, args=(worker_id, child_conn),
+                                                               name=f'gpy-worker-{worker_id}', daemon=True)
+        process.start()
+        child_conn.close()
+        self._workers[worker_id] = _Worker(worker_id, process, parent_conn)
+
+    def _retire_worker(self, worker: _Worker):
+        # Stop a worker (e.g. to abandon its job) and start a replacement - called with the lock held
+        worker.process.terminate()
+        worker.conn.close()
+        self._retired_busy_secs += worker.busy_secs
+        del self._workers[worker.id]
+        if self._running:
+            self._spawn_worker()
+
+    def _finish(self, job: Job, state: str, result: dict = None, error: str = None):
+        # Record a job's outcome - called with the lock held
+        job.state = state
+        job.result = result
+        job.error = error
+        job.finished = time.time()
+        if state == 'done':
+            self._finish_times.append(job.finished)
+        worker = self._workers.get(job.worker) if job.worker is not None else None
+        if worker is not None and worker.job is job:
+            worker.busy_secs += job.finished - job.started
+            worker.job = None
+        job.finished_event.set()
+        self._lock.notify_all()
+
+    def submit(self, definition: dict, priority: int = 0, timeout: float = None) -> Job:
+        """
+        Queue a mission.
+
+        :param definition: mission definition (see class docstring)
+        :param priority: jobs with higher priority run first
+        :param timeout: wall-clock time allowed for the run (s), or None for the server's default
+        :return: Job
+        """
+        _check_definition(definition)
+        timeout = self.default_timeout if timeout is None else float(timeout)
+        with self._lock:
+            if not self._running:
+                raise RuntimeError('JobServer is not running - call start() first')
+            job = Job(next(self._job_ids), definition, int(priority), timeout)
+            self._jobs[job.id] = job
+            heapq.heappush(self._queue, (-job.priority, job.id, job))
+            self._lock.notify_all()
+        return job
+
+    def get(self, job_id: int) -> Job:
+        """
+        Get a job by ID.
+
+        :param job_id: ID of the job
+        :return: Job
+        """
+        try:
+            return self._jobs[int(job_id)]
+        except (KeyError, ValueError):
+            raise KeyError(f'No job with ID {job_id}')
+
+    def jobs(self) -> list[Job]:
+        """
+        Get all jobs, in submission order.
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a queued or running job. A running job's worker is terminated and replaced.
+
+        :param job_id: ID of the job
+        :return: True if the job was cancelled, False if it had already finished
+        """
+        job = self.get(job_id)
+        with self._lock:
+            if job.is_finished:
+                return False
+            if job.state == 'running':
+                worker = self._workers[job.worker]
+                self._finish(job, 'cancelled', error='Cancelled while running')
+                self._retire_worker(worker)
+            else:
+                self._finish(job, 'cancelled', error='Cancelled while queued')
+            return True
+
+    def metrics(self) -> dict:
+        """
+        Get server metrics: queue depth, jobs by state, throughput and worker utilization.
+
+        :return: dict of metric name to value
+        """
+        with self._lock:
+            now = time.time()
+            while self._finish_times and self._finish_times[0] < now - _THROUGHPUT_WINDOW:
+                self._finish_times.popleft()
+            counts = {state: 0 for state in JOB_STATES}
+            for job in self._jobs.values():
+                counts[job.state] += 1
+            workers = list(self._workers.values())
+            busy_secs = self._retired_busy_secs + sum(worker.busy_secs + (now - worker.job.started if worker.job else 0)
+                                                      for worker in workers)
+            uptime = now - self.started
+            finished = [job for job in self._jobs.values() if job.state == 'done']
+            return {
+                'queue_depth': counts['queued'],
+                'jobs': counts,
+                'throughput_per_min': len(self._finish_times) * 60 / min(_THROUGHPUT_WINDOW, max(uptime, 1e-9)),
+                'mean_run_secs': (sum(job.finished - job.started for job in finished) / len(finished)
+                                  if finished else None),
+                'mean_wait_secs': (sum(job.started - job.submitted for job in finished) / len(finished)
+                                   if finished else None),
+                'workers': len(workers),
+                'workers_busy': sum(worker.job is not None for worker in workers),
+                'workers_starting': sum(not worker.ready for worker in workers),
+                'worker_utilization': busy_secs / (self.num_workers * uptime) if uptime > 0 else 0.0,
+                'uptime_secs': uptime,
+            }
+
+    def _dispatch(self):
+        # Give queued jobs to idle workers, and stop running jobs that exceed their timeouts
+        with self._lock:
+            while self._running:
+                now = time.time()
+                for worker in list(self._workers.values()):
+                    job = worker.job
+                    if job is not None and job.timeout is not None and now - job.started > job.timeout:
+                        self._finish(job, 'timeout', error=f'Timed out after {job.timeout} s')
+                        self._retire_worker(worker)
+
+                idle = [worker for worker in self._workers.values() if worker.ready and worker.job is None]
+                while idle and self._queue:
+                    *_, job = heapq.heappop(self._queue)
+                    if job.state != 'queued':
+                        continue  # cancelled while queued
+                    worker = idle.pop(0)
+                    job.state, job.started, job.worker = 'running', time.time(), worker.id
+                    worker.job = job
+                    try:
+                        worker.conn.send((job.id, job.definition))
+                    except OSError:
+                        self._finish(job, 'failed', error='Worker process exited before the job could be sent')
+                        self._retire_worker(worker)
+                self._lock.wait(_TICK)
+
+    def _receive(self):
+        # Handle messages from the workers: readiness, log output and job outcomes
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+                conns = {worker.conn: worker for worker in self._workers.values()}
+            try:
+                ready = wait(list(conns), timeout=_TICK)
+            except (OSError, ValueError):
+                continue  # a connection was closed by _retire_worker() meanwhile
+            for conn in ready:
+                worker = conns[conn]
+                try:
+                    kind, job_id, payload = conn.recv()
+                except (EOFError, OSError):
+                    with self._lock:
+                        if self._workers.get(worker.id) is worker:  # died rather than being retired
+                            if worker.job is not None:
+                                self._finish(worker.job, 'failed', error=f'Worker process exited with code '
+                                                                         f'{worker.process.exitcode}')
+                            self._retire_worker(worker)
+                    continue
+
+                with self._lock:
+                    job = self._jobs.get(job_id)
+                    if kind == 'ready':
+                        worker.ready = True
+                        self._lock.notify_all()
+                    elif job is None or worker.job is not job:
+                        continue  # message about a job that has since been cancelled or timed out
+                    elif kind == 'log':
+                        job.log.append(payload)
+                        job.log_size += len(payload)
+                        job.log_ends.append(job.log_size)
+                        self._lock.notify_all()
+                    elif kind == 'result':
+                        self._finish(job, 'done', result=payload)
+                    elif kind == 'error':
+                        self._finish(job, 'failed', error=payload)
+
+    def wait_for_log(self, job: Job, offset: int, timeout: float) -> bool:
+        """
+        Wait until a job has more log output than offset characters, or has finished.
+
+        :param job: the job
+        :param offset: characters of log already seen
+        :param timeout: maximum time to wait (s)
+        :return: True if there is more output or the job has finished
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: job.log_size > offset or job.is_finished, timeout)
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        """
+        Serve the job API over HTTP until interrupted. Requests and responses are JSON:
+
+        - POST /jobs with a definition, plus optional 'priority' and 'timeout' - returns the new job
+        - GET /jobs - all jobs, without results
+        - GET /jobs/<id>[?wait=<s>] - a job with its result, optionally waiting up to wait seconds for it to finish
+        - GET /jobs/<id>/log[?offset=<n>][&follow=1] - log text, streamed until the job finishes if follow is set
+        - DELETE /jobs/<id> - cancel a job
+        - GET /metrics - see metrics()
+
+        The server only binds to localhost by default, as it runs whatever missions it is sent.
+
+        :param host: interface to bind to
+        :param port: port to listen on
+        """
+        self.start()
+        httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        httpd.daemon_threads = True
+        print(f'gmat_py_simple job server listening on http://{host}:{httpd.server_port} with {self.num_workers} '
+              f'workers')
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+            self.shutdown()
+
+
+def _check_definition(definition: dict):
+    # Reject malformed definitions at submission, rather than in a worker
+    if not isinstance(definition, dict):
+        raise AttributeError('A job definition must be a JSON object')
+    kind = definition.get('kind')
+    if kind not in JOB_KINDS:
+        raise AttributeError(f'Job kind must be one of {list(JOB_KINDS)} - given value: {kind!r}')
+    if kind == 'script' and not isinstance(definition.get('script'), str):
+        raise AttributeError('A script job needs the GMAT script text as "script"')
+    if kind == 'builder' and ':' not in str(definition.get('builder', '')):
+        raise AttributeError('A builder job needs "builder" in the form "package.module:function"')
+    if kind == 'spec' and not definition.get('spacecraft'):
+        raise AttributeError('A spec job needs a list of Spacecraft dicts as "spacecraft"')
+
+
+def _make_handler(server: JobServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass  # keep the console for worker output
+
+        def _send_json(self, status: int, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _route(self) -> tuple[list[str], dict]:
+            url = urlparse(self.path)
+            return [part for part in url.path.split('/') if part], parse_qs(url.query)
+
+        def _job(self, job_id: str) -> Job | None:
+            try:
+                return server.get(job_id)
+            except KeyError as ex:
+                self._send_json(404, {'error': str(ex)})
+                return None
+
+        def do_POST(self):
+            parts, _ = self._route()
+            if parts != ['jobs']:
+                return self._send_json(404, {'error': f'Unknown path {self.path}'})
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                if not isinstance(body, dict):
+                    raise ValueError('The request body must be a JSON object')
+                priority = body.pop('priority', 0)
+                timeout = body.pop('timeout', None)
+                job = server.submit(body, priority, timeout)
+            except (ValueError, AttributeError) as ex:
+                return self._send_json(400, {'error': str(ex)})
+            self._send_json(202, job.to_dict(include_result=False))
+
+        def do_DELETE(self):
+            parts, _ = self._route()
+            if len(parts) != 2 or parts[0] != 'jobs':
+                return self._send_json(404, {'error': f'Unknown path {self.path}'})
+            job = self._job(parts[1])
+            if job is not None:
+                cancelled = server.cancel(job.id)
+                self._send_json(200 if cancelled else 409, job.to_dict(include_result=False))
+
+        def do_GET(self):
+            parts, query = self._route()
+            if parts == ['metrics']:
+                return self._send_json(200, server.metrics())
+            if parts == ['jobs']:
+                return self._send_json(200, [job.to_dict(include_result=False) for job in server.jobs()])
+            if len(parts) < 2 or parts[0] != 'jobs' or len(parts) > 3 or (len(parts) == 3 and parts[2] != 'log'):
+                return self._send_json(404, {'error': f'Unknown path {self.path}'})
+            job = self._job(parts[1])
+            if job is None:
+                return
+            try:
+                wait_secs = float(query['wait'][0]) if 'wait' in query else None
+                offset = int(query.get('offset', ['0'])[0])
+                if wait_secs is not None and not (math.isfinite(wait_secs) and wait_secs >= 0):
+                    raise ValueError(f'wait must be a non-negative number of seconds, not {wait_secs}')
+                if offset < 0:
+                    raise ValueError(f'offset must be a non-negative number of characters, not {offset}')
+            except ValueError as ex:
+                return self._send_json(400, {'error': str(ex)})
+            if len(parts) == 2:
+                if wait_secs is not None:
+                    job.finished_event.wait(wait_secs)
+                return self._send_json(200, job.to_dict())
+
+            if query.get('follow', ['0'])[0] not in ('1', 'true'):
+                text = job.log_text(offset).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                self.send_header('Content-Length', str(len(text)))
+                self.end_headers()
+                self.wfile.write(text)
+                return
+
+            # Stream the log as it is written, until the job finishes
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            while True:
+                server.wait_for_log(job, offset, timeout=5)
+                finished = job.is_finished
+                text = job.log_text(offset)
+                offset += len(text)
+                data = text.encode()
+                if data:
+                    self.wfile.write(f'{len(data):x}\r\n'.encode() + data + b'\r\n')
+                    self.wfile.flush()
+                if finished:
+                    break
+            self.wfile.write(b'0\r\n\r\n')
+
+    return Handler
+
+
+class _LogStream:
+    # Worker stdout: forwards printed text (GMAT's messages included) to the server as the current job's log
+    def __init__(self, conn: Connection):
+        self.conn: Connection = conn
+        self.job_id: int | None = None
+
+    def write(self, text: str) -> int:
+        if text:
+            self.conn.send(('log', self.job_id, text))
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _worker_main(worker_id: int, conn: Connection):
+    # Entry point of a worker process: GMAT has been loaded by importing gmat_py_simple, so report ready and run jobs
+    #  one at a time until told to stop
+    stream = _LogStream(conn)
+    sys.stdout = stream
+    conn.send(('ready', None, worker_id))
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        job_id, definition = message
+        stream.job_id = job_id
+        try:
+            with gpy.MissionScope():
+                result = _run_definition(definition)
+            conn.send(('result', job_id, result))
+        except BaseException as ex:
+            conn.send(('error', job_id, f'{type(ex).__name__}: {ex}\n\n{traceback.format_exc()}'))
+        stream.job_id = None
+
+
+def _run_definition(definition: dict) -> dict:
+    # Run a job's mission in this process's GMAT and return its result as plain data
+    kind = definition['kind']
+    if kind == 'script':
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_path = os.path.join(temp_dir, 'mission.script')
+            with open(script_path, 'w') as f:
+                f.write(definition['script'])
+            if not gpy.LoadScript(script_path):
+                raise RuntimeError('GMAT could not load the script - see the log for details')
+            if not gpy.RunScript():
+                raise RuntimeError('GMAT could not run the script - see the log for details')
+        return _spacecraft_result()
+
+    if kind == 'builder':
+        module_name, func_name = definition['builder'].split(':', 1)
+        build = getattr(importlib.import_module(module_name), func_name)
+        mcs = build(*definition.get('args', []), **definition.get('kwargs', {}))
+    else:
+        mcs = _build_spec_mission(definition)
+    return gpy.RunMission(mcs, return_result=True).to_dict()
+
+
+def _spacecraft_result() -> dict:
+    # Final values of every Spacecraft after a script run, as a MissionResult dict
+    names = list(gmat.Moderator.Instance().GetListOfObjects(gmat.SPACECRAFT))
+    epochs, states, coord_systems, masses = [], [], [], []
+    for name in names:
+        sat = gpy.results._runtime_object(name)
+        epochs.append(sat.GetRealParameter('A1Epoch'))
+        states.append([sat.GetRealParameter(element) for element in gpy.results._CARTESIAN_ELEMENTS])
+        coord_systems.append(sat.GetStringParameter('CoordinateSystem'))
+        masses.append(sat.GetRealParameter('TotalMass'))
+    return gpy.MissionResult(names, epochs, states, coord_systems, masses, [], [], [], [], [], []).to_dict()
+
+
+def _build_spec_mission(spec: dict) -> list[gpy.GmatCommand]:
+    """
+    Build a mission from JSON-style dicts:
+
+    - 'spacecraft': list of dicts for gpy.Spacecraft.from_dict()
+    - 'propagators': optional dict of name to PropSetupSpec fields, with 'force_model' a dict of ForceModelSpec fields
+      and its 'gravity' a dict of GravitySpec fields (or null for none). A propagator named 'default' with default
+      settings is always available
+    - 'burns': optional list of {'Name', 'CoordSys', 'DeltaV'} dicts for impulsive burns
+    - 'sequence': list of commands, each a dict with one key: {'Propagate': {'Name', 'Spacecraft', 'Propagator',
+      'StopCondition'}} (StopCondition as for gpy.Propagate, e.g. ['Sat.ElapsedDays', 1]) or {'Maneuver': {'Name',
+      'Burn', 'Spacecraft'}}
+
+    :param spec: the mission spec
+    :return: mission command sequence
+    """
+    sats = {sat.GetName(): sat for sat in (gpy.Spacecraft.from_dict(specs) for specs in spec['spacecraft'])}
+
+    props = {'default': gpy.PropSetup.from_spec(gpy.PropSetupSpec())}
+    for name, prop_spec in spec.get('propagators', {}).items():
+        prop_spec = dict(prop_spec)
+        fm_spec = dict(prop_spec.pop('force_model', {}))
+        if 'gravity' in fm_spec:
+            fm_spec['gravity'] = gpy.GravitySpec(**fm_spec['gravity']) if fm_spec['gravity'] is not None else None
+        fm_spec['point_masses'] = tuple(fm_spec.get('point_masses', ()))
+        props[name] = gpy.PropSetup.from_spec(gpy.PropSetupSpec(gpy.ForceModelSpec(**fm_spec), **prop_spec))
+
+    burns = {burn['Name']: gpy.ImpulsiveBurn(burn['Name'], burn.get('CoordSys'), burn.get('DeltaV'))
+             for burn in spec.get('burns', [])}
+
+    def lookup(objects: dict, name: str, kind: str):
+        try:
+            return objects[name]
+        except KeyError:
+            raise AttributeError(f'{kind} "{name}" used in the sequence is not defined. Defined: {list(objects)}')
+
+    mcs = []
+    for index, command in enumerate(spec.get('sequence', [])):
+        (command_type, params), = command.items()
+        name = params.get('Name', f'{command_type}{index + 1}')
+        if command_type == 'Propagate':
+            stop_cond = params.get('StopCondition')
+            mcs.append(gpy.Propagate(name, lookup(sats, params['Spacecraft'], 'Spacecraft'),
+                                     lookup(props, params.get('Propagator', 'default'), 'Propagator'),
+                                     tuple(stop_cond) if isinstance(stop_cond, list) else stop_cond))
+        elif command_type == 'Maneuver':
+            mcs.append(gpy.Maneuver(name, lookup(burns, params['Burn'], 'Burn'),
+                                    lookup(sats, params['Spacecraft'], 'Spacecraft')))
+        else:
+            raise AttributeError(f'Unsupported command type in spec sequence: "{command_type}". Use Propagate or '
+                                 f'Maneuver, or a builder job for other commands')
+    return mcs
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m gmat_py_simple.server',
+                                     description='Run a local HTTP server that queues GMAT missions and runs them '
+                                                 'in a pool of worker processes.')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind to (default: localhost only)')
+    parser.add_argument('--port', type=int, default=8765, help='port to listen on (default: 8765)')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='number of GMAT worker processes (default: half the CPUs)')
+    parser.add_argument('--timeout', type=float, default=None, help='default per-job timeout in seconds')
+    args = parser.parse_args(argv)
+
+    # Use this module by its importable name, so workers can unpickle _worker_main when run with python -m
+    from gmat_py_simple.server import JobServer as ImportableJobServer
+    ImportableJobServer(args.workers, args.timeout).serve(args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+from gmat_py_simple import gmat
+
+import io
+import os
+import pickle
+import tempfile
+import zlib
+
+_MAGIC: bytes = b'GPYSESS1'  # file signature and format version
+
+# Coordinate systems GMAT creates itself, which a script must not create again
+_DEFAULT_OBJECTS: set[str] = {'EarthMJ2000Eq', 'EarthMJ2000Ec', 'EarthFixed', 'EarthICRF'}
+
+
+class _SessionPickler(pickle.Pickler):
+    # Pickle wrappers' own attributes, storing GMAT objects they hold by name so they can be re-bound on load, and
+    #  GMAT vectors and matrices as lists
+    def persistent_id(self, obj):
+        if 'gmat_py.' not in str(type(obj)):
+            return None
+        if hasattr(obj, 'GetName'):  # a GmatBase
+            return 'object', obj.GetName()
+        if hasattr(obj, 'GetNumRows'):  # a Rmatrix
+            return 'value', [[obj.GetElement(row, col) for col in range(obj.GetNumColumns())]
+                             for row in range(obj.GetNumRows())]
+        if hasattr(obj, 'GetSize'):  # a Rvector
+            return 'value', [obj.GetElement(index) for index in range(obj.GetSize())]
+        raise pickle.PicklingError(f'Cannot save a GMAT {type(obj).__name__} held by a wrapper, as it is neither a '
+                                   f'named GMAT object nor a vector or matrix')
+
+
+class _SessionUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        kind, value = pid
+        if kind == 'object':
+            obj = gmat.GetObject(value)
+            if obj is None:
+                raise RuntimeError(f'A saved wrapper refers to GMAT object "{value}", which was not rebuilt')
+            return obj
+        return value
+
+
+def _configured_names() -> list[str]:
+    # Named resources, leaving out GMAT's default objects and system Parameters such as 'Sat.Earth.RMAG', which are
+    #  created again by the commands that use them
+    return [name for name in gmat.ConfigManager.Instance().GetListOfAllItems()
+            if name not in _DEFAULT_OBJECTS and '.' not in name]
+
+
+def _runtime_states() -> dict[str, tuple]:
+    # A1 epoch, Cartesian state and tank fuel masses of each Spacecraft that has a runtime copy from a mission run
+    states = {}
+    for name in _configured_names():
+        rt_sat = gmat.GetRuntimeObject(name)
+        if rt_sat is None or rt_sat.GetTypeName() != 'Spacecraft':
+            continue
+        fuel_masses = {tank_name: rt_sat.GetRefObject(gmat.FUEL_TANK, tank_name).GetRealParameter('FuelMass')
+                       for tank_name in rt_sat.GetStringArrayParameter('Tanks')}
+        states[name] = (rt_sat.GetRealParameter('A1Epoch'),
+                        [rt_sat.GetRealParameter(element) for element in gpy.results._CARTESIAN_ELEMENTS],
+                        fuel_masses)
+    return states
+
+
+def save(path: str, wrappers: dict | list = None) -> int:
+    """
+    Save the whole GMAT configuration to one compressed file, so it can be rebuilt with load() instead of
+    re-running the Python code that created it:
+
+        gpy.session.save('tut04.gpys', vars())  # e.g. after building Tut04's objects, or after a run
+
+    The file holds the generating string of every configured object, the Python-side attributes of the given wrapper
+    objects (e.g. gpy.Spacecraft, gpy.PropSetup), and the runtime state of each Spacecraft that has been propagated.
+    GMAT objects held by the wrappers are stored by name, and GMAT vectors and matrices as lists. Mission commands are
+    not saved.
+
+    :param path: path of the file to write
+    :param wrappers: wrapper objects to save, as a list or a dict such as vars(). Anything that isn't a
+    gpy.GmatObject or gpy.Parameter is ignored
+    :return: size of the file written (bytes)
+    """
+    gpy.flush(initialize=False)
+    items = wrappers.items() if isinstance(wrappers, dict) else enumerate(wrappers or [])
+    wrappers = {key: value for key, value in items if isinstance(value, gpy.GmatObject | gpy.Parameter)}
+
+    buffer = io.BytesIO()
+    _SessionPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(wrappers)
+    session = {
+        'gmat_version': gmat.GmatGlobal.Instance().GetGmatVersion(),
+        'script': '\n'.join(gmat.GetObject(name).GetGeneratingString() for name in _configured_names()),
+        'runtime_states': _runtime_states(),
+        'wrappers': buffer.getvalue(),  # unpickled only once the GMAT objects they refer to exist again
+    }
+    data = _MAGIC + zlib.compress(pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL), 6)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def load(path: str, runtime: bool = False) -> dict:
+    """
+    Rebuild a configuration saved with save(). The saved objects replace the current configuration and mission
+    command sequence, as when loading a script, and are all initialized in a single pass. Wrappers created before
+    loading no longer refer to valid GMAT objects - use the returned ones instead:
+
+        wrappers = gpy.session.load('tut04.gpys')
+        sat = wrappers['sat']
+
+    Interned ForceModels and PropSetups (see ForceModel.from_spec()) among the wrappers are interned again, so
+    from_spec() returns the loaded ones. A file saved with a different GMAT version is rejected, as that version may
+    interpret the saved objects differently.
+
+    :param path: path of the file written by save()
+    :param runtime: if True, each Spacecraft that had been propagated starts from its saved runtime state (the end
+    of the last run), rather than its configured initial state
+    :return: the saved wrappers, as a dict with the same keys (list indices if a list was saved)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(_MAGIC):
+        raise AttributeError(f'{path} is not a session file written by gpy.session.save()')
+    session = pickle.loads(zlib.decompress(data[len(_MAGIC):]))
+    gmat_version = gmat.GmatGlobal.Instance().GetGmatVersion()
+    if session['gmat_version'] != gmat_version:
+        raise AttributeError(f'{path} was saved with GMAT version {session["gmat_version"]}, which may interpret its '
+                             f'objects differently from the version in use ({gmat_version})')
+
+    # Interpreting the generating strings as one script creates and configures every object in one pass
+    fd, script_path = tempfile.mkstemp(suffix='.script', prefix='gpy_session_')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(session['script'])
+        if not gpy.LoadScript(script_path):
+            raise RuntimeError(f'GMAT could not rebuild the objects saved in {path}. See GMAT log for details')
+    finally:
+        os.remove(script_path)
+
+    if runtime:
+        for sat_name, (epoch, state, fuel_masses) in session['runtime_states'].items():
+            sat = gmat.GetObject(sat_name)
+            sat.SetField('DateFormat', 'A1ModJulian')
+            sat.SetField('Epoch', repr(float(epoch)))
+            gpy.results._set_cartesian(sat, state)
+            for tank_name, fuel_mass in fuel_masses.items():
+                gmat.GetObject(tank_name).SetField('FuelMass', repr(float(fuel_mass)))
+
+    gpy.Initialize()
+
+    wrappers = _SessionUnpickler(io.BytesIO(session['wrappers'])).load()
+    for wrapper in wrappers.values():
+        wrapper.was_propagated = False  # there are no runtime objects until the next run
+    return wrappers
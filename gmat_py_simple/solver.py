@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gmat_py_simple as gpy
+from gmat_py_simple.fields import GmatField
 
 
 class Solver(gpy.GmatObject):
@@ -26,6 +27,13 @@ class Solver(gpy.GmatObject):
 
 
 class DifferentialCorrector(Solver):
+    algorithm = GmatField('Algorithm', 'SetStringParameter')
+    max_iter = GmatField('MaximumIterations', 'SetIntegerParameter', int)
+    derivative_method = GmatField('DerivativeMethod', 'SetStringParameter')
+    show_progress = GmatField('ShowProgress', 'SetBooleanParameter')
+    report_style = GmatField('ReportStyle', 'SetStringParameter')  # Enum type
+    report_file = GmatField('ReportFile', 'SetStringParameter')  # Filename type
+
     def __init__(self, name: str, algorithm: str = 'NewtonRaphson', max_iter: int = 25,
                  derivative_method: str = 'ForwardDifference', show_progress: bool = True, report_style: str = 'Normal',
                  report_file: str = 'DifferentialCorrectorDC1.data'):
@@ -42,23 +50,13 @@ class DifferentialCorrector(Solver):
 
         super().__init__('DifferentialCorrector', name)
 
+        # Written to GMAT in one batch when next needed - see GmatField
         self.algorithm = algorithm
-        self.SetStringParameter('Algorithm', self.algorithm)
-
         self.max_iter = max_iter
-        self.SetIntegerParameter('MaximumIterations', self.max_iter)
-
         self.derivative_method = derivative_method
-        self.SetStringParameter('DerivativeMethod', self.derivative_method)
-
         self.show_progress = show_progress
-        self.SetBooleanParameter('ShowProgress', self.show_progress)
-
         self.report_style = report_style
-        self.SetStringParameter('ReportStyle', self.report_style)  # Enum type
-
         self.report_file = report_file
-        self.SetStringParameter('ReportFile', self.report_file)  # Filename type
 
         # Variables are set later by Vary and Achieve commands
 
@@ -72,10 +70,10 @@ class DifferentialCorrector(Solver):
         return self.gmat_obj.Help()
 
     def Initialize(self):
-        return self.gmat_obj.Initialize()
+        return gpy.extract_gmat_obj(self).Initialize()
 
     def SetField(self, field: str, value: str | int | float | bool) -> bool:
-        return self.gmat_obj.SetField(field, value)
+        return gpy.extract_gmat_obj(self).SetField(field, value)
 
     def SetSolverVariables(self, var_data: list[float | int], var_name: str) -> bool:
         return gpy.extract_gmat_obj(self).SetSolverVariables(var_data, var_name)
@@ -4,6 +4,7 @@ import gmat_py_simple as gpy
 from gmat_py_simple import gmat
 
 from gmat_py_simple.basics import GmatObject
+from gmat_py_simple.fields import GmatField
 from gmat_py_simple.orbit import OrbitState
 from gmat_py_simple.utils import (gmat_str_to_py_str, gmat_field_string_to_list,
                                   list_to_gmat_field_string, rvector6_to_list)
@@ -277,6 +278,57 @@ class Spacecraft(GmatObject):
         sc.Validate()  # validate the completed Spacecraft object
         return sc
 
+    @classmethod
+    def compile_spec(cls, spec: dict) -> SpacecraftBuilder:
+        """
+        Compile a Spacecraft.from_dict() style dict into a SpacecraftBuilder, which builds Spacecraft from any dicts
+        with the same keys much faster than from_dict(). See SpacecraftBuilder.
+
+        :param spec: dict to take the schema (keys, hardware layout and DisplayStateType) from
+        :return: SpacecraftBuilder
+        """
+        return SpacecraftBuilder(spec)
+
+    @classmethod
+    def from_dicts(cls, specs: list[dict]) -> list[Spacecraft]:
+        """
+        Build many Spacecraft from from_dict() style dicts, e.g. loaded in bulk from JSON or YAML. Each distinct schema
+        is compiled once (see SpacecraftBuilder), then all objects are built with a single GMAT initialization.
+
+        :param specs: list of dicts
+        :return: list of Spacecraft, in the same order as specs
+        """
+        batches: dict[tuple, list[int]] = {}
+        for index, spec in enumerate(specs):
+            batches.setdefault(_spec_signature(spec), []).append(index)
+
+        sats: list[Spacecraft | None] = [None] * len(specs)
+        builders = []
+        for signature, indices in batches.items():
+            builder = _compiled_builders.get(signature)
+            if builder is None:
+                builder = _compiled_builders[signature] = SpacecraftBuilder(specs[indices[0]])
+            builders.append((builder, indices))
+
+        # Build every batch before the one initialization, so each object is only initialized once
+        built = [(builder._construct([specs[index] for index in indices]), indices) for builder, indices in builders]
+        gpy.Initialize()
+        for objects, indices in built:
+            for index, sat in zip(indices, SpacecraftBuilder._wrap_all(objects)):
+                sats[index] = sat
+        return sats
+
+    def clone(self, name: str, overrides: dict = None) -> Spacecraft:
+        """
+        Create a copy of this Spacecraft, with copies of its hardware, using GMAT's Copy(). To create many variants,
+        use a SpacecraftTemplate, which plans the overrides once and initializes GMAT once for all of them.
+
+        :param name: name of the new Spacecraft
+        :param overrides: fields to change in the copy, see SpacecraftTemplate
+        :return: Spacecraft
+        """
+        return SpacecraftTemplate(self).create(name, overrides)
+
     def update_from_runtime_object(self):
         self.gmat_obj = gmat.GetRuntimeObject(self._name)
         self.was_propagated = True
@@ -346,6 +398,21 @@ class Spacecraft(GmatObject):
 
         return state
 
+    def epoch_mjd(self, system: str = 'A1') -> float:
+        """
+        Get the Spacecraft's current epoch as a float ModJulian date, read straight from GMAT's numeric A1 epoch.
+
+        Unlike GetEpoch(), this doesn't call TakeAction('UpdateEpoch'), change the user-visible DateFormat or parse a
+        formatted string.
+
+        :param system: time system of the result - 'A1', 'TAI', 'UTC', 'TDB' or 'TT'
+        :return: epoch as a ModJulian float
+        """
+        a1_epoch: float = self.GetObject().GetRealParameter('A1Epoch')
+        if system == 'A1':
+            return a1_epoch
+        return float(gpy.time.convert(a1_epoch, 'A1ModJulian', f'{system}ModJulian'))
+
     def GetKeplerianState(self):
         return rvector6_to_list(self.gmat_obj.GetKeplerianState())
 
@@ -444,13 +511,14 @@ class Spacecraft(GmatObject):
 
 
 class Tank(GmatObject):
+    fuel_mass = GmatField('FuelMass', 'SetRealParameter', float, reinitialize=True)  # kg
+
     def __init__(self, tank_type: str, name: str):
         super().__init__(tank_type, name)
         self.tank_type = tank_type  # 'ChemicalTank' or 'ElectricTank'
         self.name = name
 
         self.spacecraft = None
-        self.fuel_mass = self.GetField('FuelMass')
 
         self.Initialize()
 
@@ -487,61 +555,32 @@ class Tank(GmatObject):
 
 
 class ChemicalTank(Tank):
+    allow_negative_fuel_mass = GmatField('AllowNegativeFuelMass', 'SetBooleanParameter', reinitialize=True)
+    pressure = GmatField('Pressure', 'SetRealParameter', float, reinitialize=True)  # kPa
+    temperature = GmatField('Temperature', 'SetRealParameter', float, reinitialize=True)  # Celsius
+    ref_temp = GmatField('RefTemperature', 'SetRealParameter', float, reinitialize=True)  # Celsius
+    volume = GmatField('Volume', 'SetRealParameter', float, reinitialize=True)  # m^3
+    fuel_density = GmatField('FuelDensity', 'SetRealParameter', float, reinitialize=True)  # kg/m^3
+    pressure_model = GmatField('PressureModel', 'SetStringParameter', reinitialize=True)
+
     def __init__(self, name: str, fuel_mass: int | float = 756, allow_negative_fuel_mass: bool = False,
                  pressure: int | float = 1500, temperature: int | float = 20, ref_temp: int | float = 20,
                  volume: int | float = 0.75, fuel_density: int | float = 1260,
                  pressure_model: str = 'PressureRegulated'):
         super().__init__('ChemicalTank', name)
 
-        self.fuel_mass = self.GetRealParameter('FuelMass')  # kg
-        if fuel_mass is not None:
-            self.fuel_mass = fuel_mass
-            self.SetRealParameter('FuelMass', self.fuel_mass)
-
-        self.allow_negative_fuel_mass = self.GetBooleanParameter('AllowNegativeFuelMass')  # Boolean
-        if allow_negative_fuel_mass is not None:
-            self.allow_negative_fuel_mass = allow_negative_fuel_mass
-            self.SetBooleanParameter('AllowNegativeFuelMass', self.allow_negative_fuel_mass)
-
-        self.pressure = self.GetRealParameter('Pressure')  # kPa
-        if pressure is not None:
-            self.pressure = pressure
-            self.SetRealParameter('Pressure', self.pressure)
-
-        self.temperature = self.GetRealParameter('Temperature')  # Celsius
-        if temperature is not None:
-            self.temperature = temperature
-            self.SetRealParameter('Temperature', self.temperature)
-
-        self.ref_temp = self.GetRealParameter('RefTemperature')  # Celsius
-        if ref_temp is not None:
-            self.ref_temp = ref_temp
-            self.SetRealParameter('RefTemperature', self.ref_temp)
-
-        # Volume
-        self.volume = self.GetRealParameter('Volume')  # m^3
-        if volume is not None:
-            self.volume = volume
-            self.SetRealParameter('Volume', self.volume)
-
-        # Fuel density
-        self.fuel_density = self.GetRealParameter('FuelDensity')  # kg/m^3
-        if fuel_density is not None:
-            self.fuel_density = fuel_density
-            self.SetRealParameter('FuelDensity', self.fuel_density)
-
-        # Pressure Model
-        self.pressure_model = self.GetStringParameter('PressureModel')  # string
+        # Fields given as None keep GMAT's values. The others are written to GMAT in one batch - see GmatField
         allowed_pressure_models = ['PressureRegulated', 'BlowDown']
-        if pressure_model is not None:
-            if pressure_model not in allowed_pressure_models:
-                raise AttributeError(
-                    f'Invalid pressure model specified for {self.GetTypeName()} {self.name}. Must be one of: '
-                    f'{allowed_pressure_models}')
-            self.pressure_model = pressure_model
-            self.SetStringParameter('PressureModel', self.pressure_model)
+        if pressure_model is not None and pressure_model not in allowed_pressure_models:
+            raise AttributeError(
+                f'Invalid pressure model specified for {self.GetTypeName()} {self.name}. Must be one of: '
+                f'{allowed_pressure_models}')
 
-            self.Initialize()
+        for attr, value in (('fuel_mass', fuel_mass), ('allow_negative_fuel_mass', allow_negative_fuel_mass),
+                            ('pressure', pressure), ('temperature', temperature), ('ref_temp', ref_temp),
+                            ('volume', volume), ('fuel_density', fuel_density), ('pressure_model', pressure_model)):
+            if value is not None:
+                setattr(self, attr, value)
 
     @classmethod
     def from_dict(cls, cp_tank_dict: dict) -> gpy.ChemicalTank | None:
@@ -723,3 +762,403 @@ class ElectricThruster(Thruster):
     #                 self._mix_ratio = mix_ratio
     #     else:
     #         raise SyntaxError('All elements of mix_ratio must be of type int')
+
+
+class SpacecraftBuilder:
+    def __init__(self, spec: dict):
+        """
+        Builder compiled from the schema of a Spacecraft.from_dict() style dict: its keys, hardware layout and
+        DisplayStateType. The schema is validated once, and the GMAT parameter ID, type and setter of every field are
+        resolved once, so building each Spacecraft is just a batch of typed Set calls with no exceptions, dict copies
+        or CoordinateSystem lookups, and a whole batch needs only one GMAT initialization:
+
+            builder = gpy.Spacecraft.compile_spec(specs[0])
+            sats = builder.build_many(specs)  # or gpy.Spacecraft.from_dicts(specs) for mixed schemas
+
+        Orbit fields may be given in an 'Orbit' dict or at the top level, and Hardware may hold 'ChemicalTanks',
+        'ElectricTanks', 'ChemicalThrusters', 'ElectricThrusters' (lists of dicts), 'SolarPowerSystem' and
+        'NuclearPowerSystem' (dicts). Built Spacecraft have orbit set to None, as no OrbitState wrapper is created.
+
+        :param spec: dict to take the schema from
+        """
+        if 'Name' not in spec:
+            raise AttributeError('Spacecraft name required - spec has no "Name" key')
+        self.signature: tuple = _spec_signature(spec)
+
+        orbit: dict = spec.get('Orbit') or {}
+        top_level = [key for key in spec if key not in ('Name', 'Orbit', 'Hardware')]
+        duplicated = set(orbit) & set(top_level)
+        if duplicated:
+            raise AttributeError(f'Fields {sorted(duplicated)} are given both in Orbit and at the top level')
+
+        # (in Orbit dict, dict key, GMAT field) for each field
+        keys = [(True, key, _FIELD_ALIASES.get(key, key)) for key in orbit] + [(False, key, key) for key in top_level]
+        fields = [field for _, _, field in keys]
+        display_state_type = (orbit if 'DisplayStateType' in orbit else spec).get('DisplayStateType', 'Cartesian')
+        if display_state_type not in OrbitState.STATE_ELEMENTS:
+            raise AttributeError(f'Invalid DisplayStateType "{display_state_type}". Valid values are: '
+                                 f'{list(OrbitState.STATE_ELEMENTS)}')
+        invalid = [field for field in fields
+                   if field in _ALL_ELEMENTS and field not in OrbitState.STATE_ELEMENTS[display_state_type]]
+        if invalid:
+            raise AttributeError(f'State elements {invalid} do not match DisplayStateType "{display_state_type}", '
+                                 f'which has elements {sorted(OrbitState.STATE_ELEMENTS[display_state_type])}')
+
+        self._sat_plans: list[tuple] = _spacecraft_plans(keys)
+
+        hardware: dict = spec.get('Hardware') or {}
+        unknown = [kind for kind in hardware if kind not in _HARDWARE_TYPES]
+        if unknown:
+            raise AttributeError(f'Invalid Hardware keys {unknown}. Valid keys are: {list(_HARDWARE_TYPES)}')
+        self._hardware_plans: list[tuple[str, str, int | None, list[tuple]]] = []
+        for kind, items in hardware.items():
+            obj_type = _HARDWARE_TYPES[kind]
+            for index, item in ([(None, items)] if isinstance(items, dict) else enumerate(items)):
+                if not item:  # empty placeholder, as accepted by from_dict()
+                    continue
+                if 'Name' not in item:
+                    raise AttributeError(f'Hardware item {index} of {kind} has no "Name" key')
+                item_fields = [field for field in item if field != 'Name' and
+                               not (field == 'Tanks' and obj_type.endswith('Thruster'))]
+                self._hardware_plans.append((kind, obj_type, index, _resolve_fields(obj_type, item_fields)))
+
+    def __repr__(self):
+        return (f'SpacecraftBuilder setting {len(self._sat_plans)} Spacecraft fields and building '
+                f'{len(self._hardware_plans)} hardware objects')
+
+    def build(self, spec: dict) -> Spacecraft:
+        """
+        Build one Spacecraft.
+
+        :param spec: dict with the compiled schema
+        :return: Spacecraft
+        """
+        return self.build_many([spec])[0]
+
+    def build_many(self, specs: list[dict]) -> list[Spacecraft]:
+        """
+        Build Spacecraft from dicts with the compiled schema, with a single GMAT initialization for all of them.
+
+        :param specs: list of dicts
+        :return: list of Spacecraft
+        """
+        built = self._construct(specs)
+        gpy.Initialize()
+        return self._wrap_all(built)
+
+    def _construct(self, specs: list[dict]) -> list[tuple]:
+        # Create and configure the GMAT objects of each spec, without initializing them
+        built = []
+        for spec in specs:
+            if _spec_signature(spec) != self.signature:
+                raise AttributeError(f'Spec of Spacecraft "{spec.get("Name")}" does not match the compiled schema - '
+                                     f'use gpy.Spacecraft.from_dicts() for specs with different schemas')
+            hardware = spec.get('Hardware') or {}
+            parts = []
+            for kind, obj_type, index, plans in self._hardware_plans:
+                item = hardware[kind] if index is None else hardware[kind][index]
+                obj = gpy.Construct(obj_type, item['Name'])
+                _apply_plans(obj, plans, item)
+                if obj_type.endswith('Thruster') and item.get('Tanks') is not None:
+                    obj.SetField('Tank', item['Tanks'])
+                parts.append((obj_type, obj, item))
+
+            sat = gpy.Construct('Spacecraft', spec['Name'])
+            orbit = spec.get('Orbit') or {}
+            for in_orbit, key, method, param, convert in self._sat_plans:
+                value = (orbit if in_orbit else spec)[key]
+                getattr(sat, method)(param, convert(value) if convert is not None else value)
+
+            tank_names = [obj.GetName() for obj_type, obj, _ in parts if obj_type.endswith('Tank')]
+            thruster_names = [obj.GetName() for obj_type, obj, _ in parts if obj_type.endswith('Thruster')]
+            power_names = [obj.GetName() for obj_type, obj, _ in parts if obj_type.endswith('PowerSystem')]
+            if tank_names:
+                sat.SetField('Tanks', list_to_gmat_field_string(tank_names))
+            if thruster_names:
+                sat.SetField('Thrusters', list_to_gmat_field_string(thruster_names))
+            if power_names:
+                sat.SetField('PowerSystem', power_names[0])
+            built.append((sat, parts))
+        return built
+
+    @staticmethod
+    def _wrap_all(built: list[tuple]) -> list[Spacecraft]:
+        # Wrapper objects for initialized GMAT objects, with the attributes their constructors would have set
+        sats = []
+        for sat_obj, parts in built:
+            sat_obj.Validate()
+            sat = _wrap(Spacecraft, sat_obj, orbit=None, dry_mass=sat_obj.GetField('DryMass'))
+            wrappers: dict[str, list] = {obj_type: [] for obj_type in _HARDWARE_TYPES.values()}
+            for obj_type, obj, item in parts:
+                wrappers[obj_type].append(_wrap_hardware(obj_type, obj, item, sat))
+
+            sat.hardware = Spacecraft.SpacecraftHardware(
+                chem_tanks=wrappers['ChemicalTank'], elec_tanks=wrappers['ElectricTank'],
+                chem_thrusters=wrappers['ChemicalThruster'], elec_thrusters=wrappers['ElectricThruster'],
+                solar_power_system=(wrappers['SolarPowerSystem'] or [None])[0],
+                nuclear_power_system=(wrappers['NuclearPowerSystem'] or [None])[0])
+            sat.chem_tanks = wrappers['ChemicalTank'] or None
+            sat.elec_tanks = wrappers['ElectricTank'] or None
+            sat.chem_thrusters = wrappers['ChemicalThruster'] or None
+            sat.elec_thrusters = wrappers['ElectricThruster'] or None
+            sat.solar_power_system = sat.hardware.solar_power_system
+            sat.nuclear_power_system = sat.hardware.nuclear_power_system
+            sat.imagers = None
+            sats.append(sat)
+        return sats
+
+
+class SpacecraftTemplate:
+    def __init__(self, sat: Spacecraft):
+        """
+        Template for making variants of a configured Spacecraft, e.g. for trade studies. Each variant is made with
+        GMAT's Copy() of the Spacecraft and of each of its tanks, thrusters and power systems, so the whole
+        configuration is duplicated in one call per object rather than rebuilt field by field. Overrides are applied
+        to each copy as a batch of typed Set calls, planned once for each set of override keys, and a batch of
+        variants needs only one GMAT initialization:
+
+            template = gpy.SpacecraftTemplate(sat)
+            variants = template.create_many({f'Sat{i}': {'DryMass': dry_mass, 'ChemTank1': {'FuelMass': fuel_mass}}
+                                             for i, (dry_mass, fuel_mass) in enumerate(trades)})
+
+        Overrides are Spacecraft fields (including orbit fields and state elements, optionally grouped in an 'Orbit'
+        dict as in Spacecraft.from_dict()), and dicts of fields for hardware, keyed by the name of the template's
+        hardware object. A variant's hardware is named '<variant name>_<template hardware name>'.
+
+        :param sat: Spacecraft to copy. Its field values are copied when each variant is created, but its list of
+        hardware is read now
+        """
+        self.sat: Spacecraft = sat
+        sat_obj = gmat.GetObject(sat.name)  # the configured object, even if sat has been propagated
+
+        # GMAT type of each hardware object, by name
+        self._hardware: dict[str, str] = {}
+        for hw_name in (list(sat_obj.GetStringArrayParameter('Tanks')) +
+                        list(sat_obj.GetStringArrayParameter('Thrusters')) +
+                        [sat_obj.GetStringParameter('PowerSystem')]):
+            if hw_name:
+                self._hardware[hw_name] = gmat.GetObject(hw_name).GetTypeName()
+
+        self._mix_ratios: dict[str, list] = {thruster.name: thruster.mix_ratio for thruster in
+                                             (getattr(sat, 'chem_thrusters', None) or []) +
+                                             (getattr(sat, 'elec_thrusters', None) or [])}
+        self._plans: dict[tuple, tuple[list[tuple], dict[str, list[tuple]]]] = {}
+
+    def __repr__(self):
+        return f'SpacecraftTemplate of Spacecraft "{self.sat.name}" with hardware {list(self._hardware)}'
+
+    def create(self, name: str, overrides: dict = None) -> Spacecraft:
+        """
+        Create one variant.
+
+        :param name: name of the new Spacecraft
+        :param overrides: fields to change from the template, see SpacecraftTemplate
+        :return: Spacecraft
+        """
+        return self.create_many({name: overrides})[0]
+
+    def create_many(self, variants: dict[str, dict | None] | list[str]) -> list[Spacecraft]:
+        """
+        Create variants, with a single GMAT initialization for all of them.
+
+        :param variants: dict of new Spacecraft name to overrides (or None), or a list of names for plain copies
+        :return: list of Spacecraft, in the same order as variants
+        """
+        gpy.flush(initialize=False)  # the copies are made from GMAT's objects
+        items = variants.items() if isinstance(variants, dict) else [(name, None) for name in variants]
+        built = [self._copy(name, overrides or {}) for name, overrides in items]
+        gpy.Initialize()
+        return SpacecraftBuilder._wrap_all(built)
+
+    def _plans_for(self, overrides: dict) -> tuple[list[tuple], dict[str, list[tuple]]]:
+        # Spacecraft plans and hardware plans for overrides, validated and resolved once per set of override keys
+        signature = _spec_signature(overrides)
+        plans = self._plans.get(signature)
+        if plans is not None:
+            return plans
+
+        orbit: dict = overrides.get('Orbit') or {}
+        hardware = {key: value for key, value in overrides.items() if key != 'Orbit' and isinstance(value, dict)}
+        top_level = [key for key in overrides if key != 'Orbit' and key not in hardware]
+        unknown = [key for key in hardware if key not in self._hardware]
+        if unknown:
+            raise AttributeError(f'Overrides given for hardware {unknown}, which Spacecraft "{self.sat.name}" does '
+                                 f'not have. Its hardware is: {list(self._hardware)}')
+        duplicated = set(orbit) & set(top_level)
+        if duplicated:
+            raise AttributeError(f'Fields {sorted(duplicated)} are given both in Orbit and at the top level')
+
+        keys = ([(True, key, _FIELD_ALIASES.get(key, key)) for key in orbit] +
+                [(False, key, _FIELD_ALIASES.get(key, key)) for key in top_level])
+        plans = self._plans[signature] = (_spacecraft_plans(keys),
+                                          {hw_name: _resolve_fields(self._hardware[hw_name], list(fields))
+                                           for hw_name, fields in hardware.items()})
+        return plans
+
+    def _copy(self, name: str, overrides: dict) -> tuple:
+        # Copy the template's GMAT objects and apply overrides, without initializing them
+        sat_plans, hardware_plans = self._plans_for(overrides)
+        new_names = {hw_name: f'{name}_{hw_name}' for hw_name in self._hardware}
+
+        parts = []
+        for hw_name, obj_type in self._hardware.items():
+            obj = gmat.Copy(gmat.GetObject(hw_name), new_names[hw_name])
+            item = {}
+            if obj_type.endswith('Thruster'):
+                # Point the copy at the copied tanks, replacing each tank name in place
+                tank_id = obj.GetParameterID('Tank')
+                tanks = [new_names.get(tank, tank) for tank in obj.GetStringArrayParameter(tank_id)]
+                for index, tank in enumerate(tanks):
+                    obj.SetStringParameter(tank_id, tank, index)
+                item = {'Tanks': tanks[0] if len(tanks) == 1 else tanks, 'MixRatio': self._mix_ratios.get(hw_name)}
+            if hw_name in hardware_plans:
+                _apply_plans(obj, hardware_plans[hw_name], overrides[hw_name])
+            parts.append((obj_type, obj, item))
+
+        sat = gmat.Copy(gmat.GetObject(self.sat.name), name)
+        tank_names = [new_names[hw_name] for hw_name, obj_type in self._hardware.items() if obj_type.endswith('Tank')]
+        thruster_names = [new_names[hw_name] for hw_name, obj_type in self._hardware.items()
+                          if obj_type.endswith('Thruster')]
+        power_names = [new_names[hw_name] for hw_name, obj_type in self._hardware.items()
+                       if obj_type.endswith('PowerSystem')]
+        if tank_names:
+            sat.TakeAction('RemoveTank', '')  # an empty name removes all of the copied references
+            sat.SetField('Tanks', list_to_gmat_field_string(tank_names))
+        if thruster_names:
+            sat.TakeAction('RemoveThruster', '')
+            sat.SetField('Thrusters', list_to_gmat_field_string(thruster_names))
+        if power_names:
+            sat.SetField('PowerSystem', power_names[0])
+
+        orbit = overrides.get('Orbit') or {}
+        for in_orbit, key, method, param, convert in sat_plans:
+            value = (orbit if in_orbit else overrides)[key]
+            getattr(sat, method)(param, convert(value) if convert is not None else value)
+        return sat, parts
+
+
+# Hardware keys of a Spacecraft.from_dict() Hardware dict, and the GMAT type of their items
+_HARDWARE_TYPES: dict[str, str] = {'ChemicalTanks': 'ChemicalTank', 'ElectricTanks': 'ElectricTank',
+                                   'ChemicalThrusters': 'ChemicalThruster', 'ElectricThrusters': 'ElectricThruster',
+                                   'SolarPowerSystem': 'SolarPowerSystem', 'NuclearPowerSystem': 'NuclearPowerSystem'}
+
+# Spacecraft fields that must be set before the state elements, in order
+_ORBIT_SETTINGS: list[str] = ['DateFormat', 'Epoch', 'CoordinateSystem', 'DisplayStateType']
+
+_FIELD_ALIASES: dict[str, str] = {'CoordSys': 'CoordinateSystem'}
+
+# State elements of every DisplayStateType
+_ALL_ELEMENTS: set[str] = set().union(*OrbitState.STATE_ELEMENTS.values())
+
+def _to_bool(value) -> bool:
+    # Booleans may come from JSON/YAML as true/false or as GMAT's 'true'/'false' strings
+    return value.lower() == 'true' if isinstance(value, str) else bool(value)
+
+
+# Setter and value conversion for each GMAT parameter type. Other types (e.g. arrays) are set with SetField
+_SETTERS: dict[int, tuple[str, type | None]] = {
+    gmat.REAL_TYPE: ('SetRealParameter', float),
+    gmat.INTEGER_TYPE: ('SetIntegerParameter', int),
+    gmat.UNSIGNED_INT_TYPE: ('SetIntegerParameter', int),
+    gmat.BOOLEAN_TYPE: ('SetBooleanParameter', _to_bool),
+    gmat.STRING_TYPE: ('SetStringParameter', str),
+    gmat.ENUMERATION_TYPE: ('SetStringParameter', str),
+    gmat.FILENAME_TYPE: ('SetStringParameter', str),
+    gmat.OBJECT_TYPE: ('SetStringParameter', str),
+    gmat.ON_OFF_TYPE: ('SetOnOffParameter', str),
+}
+
+# (GMAT type, field) to (setter, parameter ID or field name, conversion), shared by all builders
+_field_plans: dict[tuple[str, str], tuple[str, int | str, type | None]] = {}
+
+# Builders compiled by Spacecraft.from_dicts(), by schema signature
+_compiled_builders: dict[tuple, SpacecraftBuilder] = {}
+
+
+def _spec_signature(value) -> tuple | None:
+    # Structure of a spec - its keys and the layout of its hardware lists, but not its values - plus the
+    #  DisplayStateType, which decides which state elements are valid
+    if isinstance(value, dict):
+        signature = tuple((key, _spec_signature(item)) for key, item in value.items())
+        if 'DisplayStateType' in value:
+            signature += (('DisplayStateType', value['DisplayStateType']),)
+        return signature
+    if isinstance(value, list | tuple) and value and all(isinstance(item, dict) for item in value):
+        return tuple(_spec_signature(item) for item in value)
+    return None
+
+
+def _spacecraft_plans(keys: list[tuple[bool, str, str]]) -> list[tuple]:
+    # Plans for setting Spacecraft fields given as (in Orbit dict, dict key, GMAT field), ordered as a script would set
+    #  them: epoch and state settings first, then the state elements, then the rest. Elements are set by label, so GMAT
+    #  converts them from the DisplayStateType
+    def order(key: tuple) -> int:
+        field = key[2]
+        if field in _ORBIT_SETTINGS:
+            return _ORBIT_SETTINGS.index(field)
+        return len(_ORBIT_SETTINGS) + (field not in _ALL_ELEMENTS)
+
+    keys = sorted(keys, key=order)
+    other_plans = iter(_resolve_fields('Spacecraft', [field for _, _, field in keys if field not in _ALL_ELEMENTS]))
+    plans = []
+    for in_orbit, key, field in keys:
+        plan = ('SetRealParameter', field, float) if field in _ALL_ELEMENTS else next(other_plans)[1:]
+        plans.append((in_orbit, key) + plan)
+    return plans
+
+
+def _resolve_fields(obj_type: str, fields: list[str]) -> list[tuple]:
+    # Plans for setting fields of a GMAT type. Fields not seen before are looked up on a temporary prototype object
+    missing = [field for field in dict.fromkeys(fields) if (obj_type, field) not in _field_plans]
+    if missing:
+        name = f'__gpy_prototype_{obj_type}'
+        prototype = gpy.Construct(obj_type, name)
+        try:
+            for field in missing:
+                try:
+                    param_id = prototype.GetParameterID(field)
+                except Exception:  # GMAT raises for unknown fields
+                    raise AttributeError(f'"{field}" is not a field of {obj_type}') from None
+                if prototype.IsParameterReadOnly(param_id):
+                    raise AttributeError(f'Field "{field}" of {obj_type} is read-only')
+                method, convert = _SETTERS.get(prototype.GetParameterType(param_id), ('SetField', None))
+                _field_plans[(obj_type, field)] = (method, field if method == 'SetField' else param_id, convert)
+        finally:
+            gpy.RemoveObject(name, only_if_unused=False)
+    return [(field,) + _field_plans[(obj_type, field)] for field in fields]
+
+
+def _apply_plans(obj, plans: list[tuple], values: dict):
+    for field, method, param, convert in plans:
+        value = values[field]
+        getattr(obj, method)(param, convert(value) if convert is not None else value)
+
+
+def _wrap(cls, gmat_obj, **attrs):
+    # Wrapper around an already built GMAT object, bypassing the constructor, which would build it again
+    obj = cls.__new__(cls)
+    obj.obj_type = gmat_obj.GetTypeName()
+    obj._name = gmat_obj.GetName()
+    obj.gmat_obj = gmat_obj
+    obj.was_propagated = False
+    obj.__dict__.update(attrs)
+    return obj
+
+
+def _wrap_hardware(obj_type: str, obj, item: dict, sat: Spacecraft):
+    if obj_type.endswith('Tank'):
+        # Fuel mass and other GmatField attributes are read from GMAT when first used
+        return _wrap(ChemicalTank if obj_type == 'ChemicalTank' else ElectricTank, obj, tank_type=obj_type,
+                     spacecraft=sat)
+
+    if obj_type.endswith('Thruster'):
+        fuel_type = obj_type[:-len('Thruster')]
+        tanks = item.get('Tanks')
+        mix_ratio = item.get('MixRatio')
+        return _wrap(ChemicalThruster if fuel_type == 'Chemical' else ElectricThruster, obj,
+                     fuel_type=fuel_type, thruster_type=obj_type, spacecraft=sat, tanks=tanks,
+                     mix_ratio=[1] if isinstance(tanks, str) else mix_ratio,
+                     _decrement_mass=obj.GetBooleanParameter('DecrementMass'))
+
+    return _wrap(gpy.SolarPowerSystem if obj_type == 'SolarPowerSystem' else gpy.NuclearPowerSystem, obj,
+                 spacecraft=sat)
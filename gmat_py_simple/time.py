@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import gmat_py_simple as gpy
+
+from datetime import datetime
+
+import numpy as np
+
+SECS_PER_DAY: float = 86400.0
+
+# Offsets between GMAT's ModJulian (JD - 2430000.0) and the standard MJD (JD - 2400000.5)
+GMAT_MJD_OFFSET: float = 29999.5
+A1_MINUS_TAI: float = 0.0343817  # s
+TT_MINUS_TAI: float = 32.184  # s
+
+TIME_SYSTEMS: tuple[str, ...] = ('A1', 'TAI', 'UTC', 'TDB', 'TT')
+EPOCH_FORMATS: tuple[str, ...] = tuple(f'{system}{kind}' for kind in ('ModJulian', 'Gregorian')
+                                       for system in TIME_SYSTEMS)
+
+_MONTHS: list[str] = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+_GREGORIAN_WIDTH: int = 24  # 'DD Mon YYYY HH:MM:SS.mmm', as GMAT writes it
+
+# TAI-UTC since 1972, used if GMAT's tai-utc.dat can't be found: (UTC start as standard MJD, TAI-UTC in s)
+_FALLBACK_LEAP_SECONDS: list[tuple[int, float]] = [
+    (41317, 10), (41499, 11), (41683, 12), (42048, 13), (42413, 14), (42778, 15), (43144, 16), (43509, 17),
+    (43874, 18), (44239, 19), (44786, 20), (45151, 21), (45516, 22), (46247, 23), (47161, 24), (47892, 25),
+    (48257, 26), (48804, 27), (49169, 28), (49534, 29), (50083, 30), (50630, 31), (51179, 32), (53736, 33),
+    (54832, 34), (56109, 35), (57204, 36), (57754, 37)]
+
+
+class LeapSecondTable:
+    def __init__(self, starts: np.ndarray, offsets: np.ndarray, ref_mjds: np.ndarray = None,
+                 rates: np.ndarray = None, source: str = 'built-in'):
+        """
+        TAI-UTC table, in the form of GMAT's tai-utc.dat. From UTC epoch starts[i] (GMAT ModJulian),
+        TAI-UTC = offsets[i] + (MJD - ref_mjds[i]) * rates[i] seconds, where MJD is the standard modified Julian date.
+
+        :param starts: UTC start epochs of each entry, GMAT ModJulian
+        :param offsets: constant part of TAI-UTC in seconds
+        :param ref_mjds: reference standard MJDs for the drift terms used before 1972
+        :param rates: drift rates in seconds per day, used before 1972
+        :param source: path of the file the table was read from
+        """
+        self.starts: np.ndarray = np.asarray(starts, dtype=float)
+        self.offsets: np.ndarray = np.asarray(offsets, dtype=float)
+        self.ref_mjds: np.ndarray = np.zeros(len(self.starts)) if ref_mjds is None else np.asarray(ref_mjds, float)
+        self.rates: np.ndarray = np.zeros(len(self.starts)) if rates is None else np.asarray(rates, dtype=float)
+        self.source: str = source
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f'LeapSecondTable with {len(self)} entries from {self.source}'
+
+    @classmethod
+    def from_file(cls, path: str) -> LeapSecondTable:
+        """
+        Read a tai-utc.dat file, as distributed with GMAT in data/time. The parsed table is kept in the binary data
+        cache (see gpy.data_cache.table()), so the text is only parsed once per file version.
+
+        :param path: path to the file
+        :return: LeapSecondTable
+        """
+        data = gpy.data_cache.table('leap_seconds', path)
+        return cls(data['mjd'], data['offset'], data['ref_mjd'], data['rate'], source=path)
+
+    @classmethod
+    def fallback(cls) -> LeapSecondTable:
+        starts, offsets = np.array(_FALLBACK_LEAP_SECONDS, dtype=float).T
+        return cls(starts - GMAT_MJD_OFFSET, offsets)
+
+    def tai_minus_utc(self, utc_mjd: np.ndarray) -> np.ndarray:
+        """
+        Get TAI-UTC at UTC epochs.
+
+        :param utc_mjd: UTC GMAT ModJulian epochs
+        :return: TAI-UTC in seconds (0 before the first entry)
+        """
+        utc_mjd = np.asarray(utc_mjd, dtype=float)
+        index = np.searchsorted(self.starts, utc_mjd, 'right') - 1
+        valid = index >= 0
+        index = np.maximum(index, 0)
+        std_mjd = utc_mjd + GMAT_MJD_OFFSET
+        return np.where(valid, self.offsets[index] + (std_mjd - self.ref_mjds[index]) * self.rates[index], 0.0)
+
+
+_leap_second_table: LeapSecondTable | None = None
+
+
+def leap_second_file() -> str | None:
+    """
+    Find GMAT's leap second file (LEAP_SECS_FILE in the startup file, normally data/time/tai-utc.dat).
+
+    :return: path to the file, or None if it can't be found
+    """
+    return gpy.data_cache.data_file('leap_seconds')
+
+
+def leap_seconds(path: str = None, reload: bool = False) -> LeapSecondTable:
+    """
+    Get the leap second table, reading it from GMAT's data directory the first time it is needed.
+
+    :param path: path to a tai-utc.dat file to use instead of GMAT's
+    :param reload: re-read the file even if a table is already loaded
+    :return: LeapSecondTable
+    """
+    global _leap_second_table
+    if _leap_second_table is not None and path is None and not reload:
+        return _leap_second_table
+
+    if path is None:
+        path = leap_second_file()
+    _leap_second_table = LeapSecondTable.from_file(path) if path is not None else LeapSecondTable.fallback()
+    return _leap_second_table
+
+
+def _tdb_minus_tt(tt_mjd: np.ndarray) -> np.ndarray:
+    # Periodic TDB-TT terms in seconds, as used by GMAT's TimeSystemConverter
+    g = np.radians(357.53 + 0.98560028 * (tt_mjd - 21545.0))
+    return 0.001657 * np.sin(g) + 0.00001385 * np.sin(2 * g)
+
+
+def to_tai(mjd: np.ndarray, system: str) -> np.ndarray:
+    """
+    Convert GMAT ModJulian epochs in a time system to TAI.
+
+    :param mjd: GMAT ModJulian epochs
+    :param system: 'A1', 'TAI', 'UTC', 'TDB' or 'TT'
+    :return: TAI GMAT ModJulian epochs
+    """
+    mjd = np.asarray(mjd, dtype=float)
+    if system == 'TAI':
+        return mjd.copy()
+    if system == 'A1':
+        return mjd - A1_MINUS_TAI / SECS_PER_DAY
+    if system == 'TT':
+        return mjd - TT_MINUS_TAI / SECS_PER_DAY
+    if system == 'TDB':
+        tt = mjd - _tdb_minus_tt(mjd) / SECS_PER_DAY
+        tt = mjd - _tdb_minus_tt(tt) / SECS_PER_DAY
+        return tt - TT_MINUS_TAI / SECS_PER_DAY
+    if system == 'UTC':
+        return mjd + leap_seconds().tai_minus_utc(mjd) / SECS_PER_DAY
+    raise AttributeError(f'Invalid time system "{system}" - must be one of {list(TIME_SYSTEMS)}')
+
+
+def from_tai(tai_mjd: np.ndarray, system: str) -> np.ndarray:
+    """
+    Convert TAI GMAT ModJulian epochs to another time system.
+
+    :param tai_mjd: TAI GMAT ModJulian epochs
+    :param system: 'A1', 'TAI', 'UTC', 'TDB' or 'TT'
+    :return: GMAT ModJulian epochs in system
+    """
+    tai_mjd = np.asarray(tai_mjd, dtype=float)
+    if system == 'TAI':
+        return tai_mjd.copy()
+    if system == 'A1':
+        return tai_mjd + A1_MINUS_TAI / SECS_PER_DAY
+    if system == 'TT':
+        return tai_mjd + TT_MINUS_TAI / SECS_PER_DAY
+    if system == 'TDB':
+        tt = tai_mjd + TT_MINUS_TAI / SECS_PER_DAY
+        return tt + _tdb_minus_tt(tt) / SECS_PER_DAY
+    if system == 'UTC':
+        table = leap_seconds()
+        utc = tai_mjd - table.tai_minus_utc(tai_mjd) / SECS_PER_DAY
+        return tai_mjd - table.tai_minus_utc(utc) / SECS_PER_DAY
+    raise AttributeError(f'Invalid time system "{system}" - must be one of {list(TIME_SYSTEMS)}')
+
+
+def _split_format(epoch_format: str) -> tuple[str, str]:
+    if epoch_format not in EPOCH_FORMATS:
+        raise AttributeError(f'Invalid epoch format "{epoch_format}" - must be one of {list(EPOCH_FORMATS)}')
+    kind = 'ModJulian' if epoch_format.endswith('ModJulian') else 'Gregorian'
+    return epoch_format[:-len(kind)], kind
+
+
+def convert(epochs, from_format: str, to_format: str) -> np.ndarray:
+    """
+    Convert epochs between any of GMAT's epoch formats (A1/TAI/UTC/TDB/TT, ModJulian or Gregorian).
+
+    :param epochs: a single epoch or array of epochs - floats for ModJulian formats, strings such as
+    '01 Jan 2000 11:59:28.000' for Gregorian formats
+    :param from_format: format of epochs, e.g. 'UTCGregorian'
+    :param to_format: format to convert to, e.g. 'A1ModJulian'
+    :return: array of floats (ModJulian) or strings (Gregorian)
+    """
+    from_system, from_kind = _split_format(from_format)
+    to_system, to_kind = _split_format(to_format)
+
+    mjd = parse_gregorian(epochs) if from_kind == 'Gregorian' else np.asarray(epochs, dtype=float)
+    if from_system != to_system:
+        mjd = from_tai(to_tai(mjd, from_system), to_system)
+    return format_gregorian(mjd) if to_kind == 'Gregorian' else mjd
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    # Days since 1970-01-01 for proleptic Gregorian dates (H. Hinnant's algorithm)
+    year = year - (month <= 2)
+    era = np.floor_divide(year, 400)
+    yoe = year - era * 400
+    doy = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(days: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Inverse of _days_from_civil
+    days = days + 719468
+    era = np.floor_divide(days, 146097)
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + np.where(mp < 10, 3, -9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+# Standard MJD of 1970-01-01, for converting _days_from_civil() output
+_UNIX_EPOCH_MJD: int = 40587
+
+
+def parse_gregorian(epochs) -> np.ndarray:
+    """
+    Parse GMAT Gregorian epoch strings (e.g. '01 Jan 2000 11:59:28.000') in bulk.
+
+    Strings in GMAT's fixed-width form are decoded directly from their bytes; any others fall back to datetime
+    parsing.
+
+    :param epochs: a single string or array of strings
+    :return: GMAT ModJulian epochs, in the same time system as the strings
+    """
+    strings = np.atleast_1d(np.asarray(epochs))
+    if strings.dtype.kind not in 'SU':
+        strings = strings.astype(str)
+    if strings.size == 0:
+        return np.empty(strings.shape)
+    # Arrays already of 24-character strings (e.g. from format_gregorian() or a file column) skip stripping
+    stripped = (strings if strings.dtype in (np.dtype(f'<U{_GREGORIAN_WIDTH}'), np.dtype(f'S{_GREGORIAN_WIDTH}'))
+                else np.char.strip(strings))
+    fits = (stripped.dtype.itemsize // 4 <= _GREGORIAN_WIDTH or
+            np.all(np.char.str_len(stripped) <= _GREGORIAN_WIDTH))
+    raw = np.ascontiguousarray(stripped.astype(f'S{_GREGORIAN_WIDTH}')).view(np.uint8).reshape(-1, _GREGORIAN_WIDTH)
+    if fits and np.all(raw[:, -1] != 0):  # every string exactly 24 characters
+        raw = raw.astype(np.int64)
+
+        def digits(start: int, stop: int) -> np.ndarray:
+            value = np.zeros(len(raw), dtype=np.int64)
+            for col in range(start, stop):
+                value = value * 10 + (raw[:, col] - 48)
+            return value
+
+        # Months are identified by their three letters packed into one integer
+        month_keys = np.array([ord(m[0]) << 16 | ord(m[1]) << 8 | ord(m[2]) for m in _MONTHS])
+        keys = raw[:, 3] << 16 | raw[:, 4] << 8 | raw[:, 5]
+        month_order = np.argsort(month_keys)
+        found = np.searchsorted(month_keys[month_order], keys)
+        month = month_order[np.minimum(found, 11)] + 1
+        if np.all(month_keys[month - 1] == keys):
+            days = _days_from_civil(digits(7, 11), month, digits(0, 2))
+            secs = digits(12, 14) * 3600 + digits(15, 17) * 60 + digits(18, 20) + digits(21, 24) / 1000
+            mjd = days + _UNIX_EPOCH_MJD - GMAT_MJD_OFFSET + secs / SECS_PER_DAY
+            return mjd.reshape(strings.shape)
+
+    # Slow path for strings not in GMAT's fixed-width form
+    mjd = np.empty(stripped.size)
+    for index, string in enumerate(stripped.ravel()):
+        dt = datetime.strptime(string.decode() if isinstance(string, bytes) else string, '%d %b %Y %H:%M:%S.%f')
+        days = _days_from_civil(np.int64(dt.year), np.int64(dt.month), np.int64(dt.day))
+        secs = dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond / 1e6
+        mjd[index] = days + _UNIX_EPOCH_MJD - GMAT_MJD_OFFSET + secs / SECS_PER_DAY
+    return mjd.reshape(strings.shape)
+
+
+def format_gregorian(mjd) -> np.ndarray:
+    """
+    Format GMAT ModJulian epochs as GMAT Gregorian strings (e.g. '01 Jan 2000 11:59:28.000'), to the nearest
+    millisecond.
+
+    :param mjd: a single epoch or array of epochs
+    :return: array of strings
+    """
+    mjd = np.atleast_1d(np.asarray(mjd, dtype=float))
+    std_mjd = mjd.ravel() + GMAT_MJD_OFFSET
+    days = np.floor(std_mjd).astype(np.int64)
+    millis = np.round((std_mjd - days) * SECS_PER_DAY * 1000).astype(np.int64)
+    days += millis // 86400000  # carry rounding up to midnight into the next day
+    millis %= 86400000
+    year, month, day = _civil_from_days(days - _UNIX_EPOCH_MJD)
+
+    out = np.full((len(days), _GREGORIAN_WIDTH), ord(' '), dtype=np.uint8)
+
+    def put(start: int, width: int, value: np.ndarray):
+        for col in range(start + width - 1, start - 1, -1):
+            out[:, col] = 48 + value % 10
+            value = value // 10
+
+    month_bytes = np.array([list(m.encode()) for m in _MONTHS], dtype=np.uint8)
+    put(0, 2, day)
+    out[:, 3:6] = month_bytes[month - 1]
+    put(7, 4, year)
+    put(12, 2, millis // 3600000)
+    out[:, 14] = ord(':')
+    put(15, 2, millis // 60000 % 60)
+    out[:, 17] = ord(':')
+    put(18, 2, millis // 1000 % 60)
+    out[:, 20] = ord('.')
+    put(21, 3, millis % 1000)
+
+    return out.view(f'S{_GREGORIAN_WIDTH}').ravel().astype(str).reshape(mjd.shape)
+
+
+def _digits(raw: np.ndarray, start: int, width: int) -> np.ndarray:
+    # Integer value of the fixed-width ASCII digits at a column of a uint8 character matrix
+    value = np.zeros(len(raw), dtype=np.int64)
+    for col in range(start, start + width):
+        value = value * 10 + (raw[:, col].astype(np.int64) - 48)
+    return value
+
+
+def _parse_iso_rows(raw: np.ndarray, day_of_year: bool) -> np.ndarray:
+    # Parse rows of a character matrix that all share the same ISO form
+    year = _digits(raw, 0, 4)
+    if day_of_year:
+        days = _days_from_civil(year, np.ones_like(year), np.ones_like(year)) + _digits(raw, 5, 3) - 1
+        time_start = 9  # first character after the 'T'
+    else:
+        days = _days_from_civil(year, _digits(raw, 5, 2), _digits(raw, 8, 2))
+        time_start = 11
+    secs = (_digits(raw, time_start, 2) * 3600 + _digits(raw, time_start + 3, 2) * 60
+            + _digits(raw, time_start + 6, 2)).astype(float)
+
+    # Fractional seconds: digits after the '.', up to the first non-digit
+    frac_start = time_start + 9
+    if raw.shape[1] > frac_start:
+        frac = raw[:, frac_start:].astype(np.int64) - 48
+        is_digit = np.cumprod((frac >= 0) & (frac <= 9), axis=1).astype(bool)
+        is_digit &= (raw[:, frac_start - 1] == ord('.'))[:, None]
+        secs += np.where(is_digit, frac, 0) @ (10.0 ** -np.arange(1, frac.shape[1] + 1))
+
+    return days + _UNIX_EPOCH_MJD - GMAT_MJD_OFFSET + secs / SECS_PER_DAY
+
+
+def parse_iso(epochs) -> np.ndarray:
+    """
+    Parse ISO 8601 / CCSDS epoch strings in bulk, in either calendar (e.g. '2000-01-01T11:59:28.000') or day-of-year
+    (e.g. '2000-001T11:59:28.000') form, with any number of decimal places and an optional trailing 'Z'. Byte
+    strings, such as tokens read straight from a file, are accepted without decoding.
+
+    :param epochs: a single string or array of strings
+    :return: GMAT ModJulian epochs, in the same time system as the strings
+    """
+    strings = np.atleast_1d(np.asarray(epochs))
+    if strings.dtype.kind != 'S':
+        strings = np.char.encode(strings.astype(str), 'ascii')
+    if strings.size == 0:
+        return np.empty(strings.shape)
+    width = strings.dtype.itemsize + 1  # always leave a NUL column after the last character
+    raw = np.ascontiguousarray(strings.ravel().astype(f'S{width}')).view(np.uint8).reshape(-1, width)
+
+    day_of_year = raw[:, 7] != ord('-')
+    if not day_of_year.any():
+        mjd = _parse_iso_rows(raw, False)
+    elif day_of_year.all():
+        mjd = _parse_iso_rows(raw, True)
+    else:
+        mjd = np.empty(len(raw))
+        mjd[~day_of_year] = _parse_iso_rows(raw[~day_of_year], False)
+        mjd[day_of_year] = _parse_iso_rows(raw[day_of_year], True)
+    return mjd.reshape(strings.shape)
+
+
+def format_iso(mjd, decimals: int = 3) -> np.ndarray:
+    """
+    Format GMAT ModJulian epochs as ISO 8601 / CCSDS calendar strings (e.g. '2000-01-01T11:59:28.000').
+
+    :param mjd: a single epoch or array of epochs
+    :param decimals: number of decimal places of seconds, from 0 to 9
+    :return: array of byte strings, ready to be written to a file
+    """
+    if not 0 <= decimals <= 9:
+        raise AttributeError(f'decimals must be between 0 and 9 - given value: {decimals}')
+    mjd = np.atleast_1d(np.asarray(mjd, dtype=float))
+    std_mjd = mjd.ravel() + GMAT_MJD_OFFSET
+    days = np.floor(std_mjd).astype(np.int64)
+    units_per_sec = 10 ** decimals
+    units_per_day = 86400 * units_per_sec
+    units = np.round((std_mjd - days) * units_per_day).astype(np.int64)
+    days += units // units_per_day  # carry rounding up to midnight into the next day
+    units %= units_per_day
+    year, month, day = _civil_from_days(days - _UNIX_EPOCH_MJD)
+    secs, frac = np.divmod(units, units_per_sec)
+
+    width = 19 + (decimals + 1 if decimals else 0)
+    out = np.empty((len(days), width), dtype=np.uint8)
+
+    def put(start: int, num_digits: int, value: np.ndarray):
+        for col in range(start + num_digits - 1, start - 1, -1):
+            out[:, col] = 48 + value % 10
+            value = value // 10
+
+    put(0, 4, year)
+    out[:, 4] = out[:, 7] = ord('-')
+    put(5, 2, month)
+    put(8, 2, day)
+    out[:, 10] = ord('T')
+    put(11, 2, secs // 3600)
+    out[:, 13] = out[:, 16] = ord(':')
+    put(14, 2, secs // 60 % 60)
+    put(17, 2, secs % 60)
+    if decimals:
+        out[:, 19] = ord('.')
+        put(20, decimals, frac)
+
+    return out.view(f'S{width}').reshape(mjd.shape)
+
+
+def to_datetime64(mjd, system: str = 'UTC', to_system: str = 'UTC') -> np.ndarray:
+    """
+    Convert GMAT ModJulian epochs to NumPy datetime64[us] values, e.g. for plotting.
+
+    :param mjd: GMAT ModJulian epochs
+    :param system: time system of mjd
+    :param to_system: time system the datetimes should represent
+    :return: array of datetime64[us]
+    """
+    mjd = np.asarray(mjd, dtype=float)
+    if system != to_system:
+        mjd = from_tai(to_tai(mjd, system), to_system)
+    micros = np.round((mjd + GMAT_MJD_OFFSET - _UNIX_EPOCH_MJD) * SECS_PER_DAY * 1e6).astype(np.int64)
+    return micros.astype('datetime64[us]')
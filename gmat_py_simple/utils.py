@@ -4,10 +4,14 @@ import gmat_py_simple as gpy
 from gmat_py_simple import gmat
 
 import sys
+import threading
 from io import StringIO
 import logging
 import numpy as np
 
+# Held while stdout is redirected, so concurrent captures can't restore each other's streams
+_stdout_lock = threading.RLock()
+
 
 class APIException(Exception):
     pass
@@ -48,6 +52,46 @@ def Construct(obj_type: str, name: str, *args):
             raise attr  # other AttributeErrors are not handled, so raise instead
 
 
+class _StdoutRouter:
+    # Stand-in for sys.stdout during a capture: writes from the capturing thread go to a buffer, and writes from any
+    #  other thread go on to the real stream, so output printed elsewhere meanwhile is neither lost nor captured
+    def __init__(self, stream):
+        self.stream = stream
+        self.thread_id: int = threading.get_ident()
+        self.buffer: StringIO = StringIO()
+
+    def write(self, text: str) -> int:
+        if threading.get_ident() == self.thread_id:
+            return self.buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)
+
+
+def capture_stdout(func, *args, **kwargs) -> str:
+    """
+    Call a function and return what it printed to stdout (e.g. gmat.ShowObjects()). Safe to use from several
+    threads: captures are serialized, stdout is always restored, and other threads' output is passed through.
+
+    :param func: function to call
+    :param args: positional arguments for func
+    :param kwargs: keyword arguments for func
+    :return: the text func printed
+    """
+    with _stdout_lock:
+        router = _StdoutRouter(sys.stdout)
+        sys.stdout = router
+        try:
+            func(*args, **kwargs)
+        finally:
+            sys.stdout = router.stream
+    return router.buffer.getvalue()
+
+
 def CoordSystems() -> list[str]:
     """
     Return GMAT's list of currently defined CoordinateSystems
@@ -92,6 +136,22 @@ def CustomHelp(obj):
             print(f'\t{exc}\n')
 
 
+def epochs(sats: list[gpy.Spacecraft | str], system: str = 'A1') -> np.ndarray:
+    """
+    Get the current epochs of several Spacecraft as float ModJulian dates, without changing their DateFormat.
+
+    :param sats: Spacecraft wrapper objects or names of Spacecraft in GMAT
+    :param system: time system of the results - 'A1', 'TAI', 'UTC', 'TDB' or 'TT'
+    :return: array of epochs, in the same order as sats
+    """
+    a1_epochs = np.empty(len(sats))
+    for index, sat in enumerate(sats):
+        a1_epochs[index] = gpy.GetObject(sat).GetRealParameter('A1Epoch')
+    if system == 'A1':
+        return a1_epochs
+    return gpy.time.convert(a1_epochs, 'A1ModJulian', f'{system}ModJulian')
+
+
 def extract_gmat_obj(obj):
     obj_type = str(type(obj))
     if obj is None:
@@ -103,6 +163,8 @@ def extract_gmat_obj(obj):
     if 'gmat_py_simple' in obj_type:  # wrapper object
         if 'Parameter' in obj_type:
             return obj.gmat_base
+        if getattr(obj, '_pending_fields', None):  # GMAT must see GmatField values assigned since the last flush
+            gpy.fields._flush_object(obj)
         return obj.gmat_obj
     elif 'gmat_py' in obj_type:  # native GMAT object
         return obj
@@ -136,23 +198,15 @@ def fields_for_gmat_base_gmat_command():
     print(f'constructible_objects: {[o.__name__ for o in constructible_objects]}')
 
     for o in constructible_objects:
-        # Intercept stdout as that's where gmat_obj.Help() goes to
-        old_stdout = sys.stdout  # take snapshot of current (normal) stdout
-        # create a StringIO object, assign it to obj_help_stringio and set this as the target for stdout
-
         oName_string = o.__name__
         print(f'oName_string: {oName_string}')
         temp = gmat.Construct(oName_string, '')
         print(f'Created object {temp.__name__} of type {type(temp)}')
 
-        sys.stdout = obj_help_stringio = StringIO()
         # raise NotImplementedError('Currently assuming a GMAT object rather than GMAT class')
 
-        gmat.Clear(temp.GetName())
-
-        sys.stdout = old_stdout  # revert back to normal handling of stdout
-
-        obj_help = obj_help_stringio.getvalue()  # Help() table text as a string
+        # Intercept stdout as that's where gmat_obj.Help() goes to
+        obj_help = capture_stdout(gmat.Clear, temp.GetName())  # Help() table text as a string
 
         rows = obj_help.split('\n')  # split the Help() text into rows for easier parsing
         data_rows = rows[6:]  # first six rows are always headers etc. so remove them
@@ -208,13 +262,7 @@ def get_gmat_classes():
     :return:
     """
     # Intercept stdout as that's where gmat.ShowClasses goes to
-    old_stdout = sys.stdout  # take snapshot of current (normal) stdout
-    # create a StringIO object, assign it to obj_help_stringio and set as the target for stdout
-    sys.stdout = classes_stringio = StringIO()
-    gmat.ShowClasses()
-    classes_str = classes_stringio.getvalue()  # Help() table text as a string
-
-    sys.stdout = old_stdout  # revert back to normal handling of stdout
+    classes_str = capture_stdout(gmat.ShowClasses)  # Help() table text as a string
 
     rows: list = classes_str.split('\n')  # split the Help() text into rows for easier parsing
     classes = [None] * len(rows)  # create a list to store the fields
@@ -232,14 +280,8 @@ def get_gmat_objects_of_type(obj_type: str) -> list[str]:
     :param obj_type:
     :return:
     """
-    # Intercept stdout as that's where gmat.Showcoord_syses goes to
-    old_stdout = sys.stdout  # take snapshot of current (normal) stdout
-    # create a StringIO object, assign it to objs_stringio and set as the target for stdout
-    sys.stdout = objs_stringio = StringIO()
-    gmat.ShowObjects(obj_type)
-    objs_str: str = objs_stringio.getvalue()  # ShowObjects() table text as a string
-
-    sys.stdout = old_stdout  # revert back to normal handling of stdout
+    # Intercept stdout as that's where gmat.ShowObjects goes to
+    objs_str: str = capture_stdout(gmat.ShowObjects, obj_type)  # ShowObjects() table text as a string
 
     rows: list[str] = objs_str.split('\n')  # split the returned text into rows for easier parsing
     data_rows: list[str] = rows[2:]  # first two rows are always title and blank so remove them
@@ -0,0 +1,136 @@
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+MU = 398600.4415  # km^3/s^2, Earth gravitational parameter as in GMAT's default Earth
+START_MJD = 21545.0
+
+
+def kepler_states(sma: float, ecc: float, inc: float, secs: np.ndarray) -> np.ndarray:
+    # Two-body Cartesian states (km, km/s) at times secs after periapsis, with RAAN and AOP of zero
+    n = np.sqrt(MU / sma ** 3)
+    mean_anomaly = n * secs
+    ecc_anomaly = mean_anomaly.copy()
+    for _ in range(30):
+        ecc_anomaly -= (ecc_anomaly - ecc * np.sin(ecc_anomaly) - mean_anomaly) / (1 - ecc * np.cos(ecc_anomaly))
+    cos_e, sin_e = np.cos(ecc_anomaly), np.sin(ecc_anomaly)
+    factor = 1 - ecc * cos_e
+    root = np.sqrt(1 - ecc ** 2)
+    x, y = sma * (cos_e - ecc), sma * root * sin_e
+    vx, vy = -sin_e * n * sma / factor, root * cos_e * n * sma / factor
+    cos_i, sin_i = np.cos(np.radians(inc)), np.sin(np.radians(inc))
+    return np.stack((x, y * cos_i, y * sin_i, vx, vy * cos_i, vy * sin_i), axis=-1)
+
+
+class TestGeodetic(unittest.TestCase):
+    def test_round_trip(self):
+        lats = np.array([45.0, -89.9, 51.5, 10.0])
+        lons = np.array([90.0, -120.0, -0.1, 179.9])
+        alts = np.array([1.0, 400.0, 0.05, 35786.0])
+        geodetic = gpy.analysis.ecef_to_geodetic(gpy.analysis.geodetic_to_ecef(lats, lons, alts))
+        np.testing.assert_allclose(geodetic[:, 0], lats, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(geodetic[:, 1], lons, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(geodetic[:, 2], alts, rtol=0, atol=1e-6)
+
+    def test_equator_radius(self):
+        ecef = gpy.analysis.geodetic_to_ecef(np.array([0.0]), np.array([0.0]), np.array([0.0]))
+        np.testing.assert_allclose(ecef, [[gpy.analysis.EARTH_EQ_RADIUS, 0, 0]], rtol=0, atol=1e-12)
+
+
+class TestEvents(unittest.TestCase):
+    def setUp(self):
+        self.period = 2 * np.pi * np.sqrt(7000.0 ** 3 / MU)
+        secs = np.arange(0, 3 * self.period, 60.0)
+        self.ephemeris = gpy.analysis.Ephemeris(START_MJD + secs / 86400,
+                                                kepler_states(7000.0, 0.01, 28.5, secs), ['Sat'])
+
+    def test_periapsis_apoapsis_timing(self):
+        self.ephemeris.set_interpolation('lagrange', 9)
+        results = gpy.analysis.find_events(self.ephemeris, [gpy.analysis.Event.Periapsis(),
+                                                            gpy.analysis.Event.Apoapsis()], tol=1e-6)
+        periapses = (results.select('Periapsis').epochs - START_MJD) * 86400
+        apoapses = (results.select('Apoapsis').epochs - START_MJD) * 86400
+        self.assertEqual(len(periapses), 3)  # including the one at the first sample
+        self.assertEqual(len(apoapses), 3)
+        # Limited by the resolution of a ModJulian epoch (~3e-7 s)
+        np.testing.assert_allclose(periapses, self.period * np.arange(3), rtol=0, atol=1e-6)
+        np.testing.assert_allclose(apoapses, self.period * (np.arange(3) + 0.5), rtol=0, atol=1e-6)
+
+    def test_event_finder_matches_find_events(self):
+        events = [gpy.analysis.Event.AscendingNode(), gpy.analysis.Event.DescendingNode()]
+        expected = gpy.analysis.find_events(self.ephemeris, events)
+        finder = gpy.analysis.EventFinder(events, ['Sat'])
+        for start in range(0, len(self.ephemeris), 37):
+            finder.update(self.ephemeris.epochs[start:start + 37], self.ephemeris.states[0, start:start + 37])
+        found = finder.results
+        np.testing.assert_array_equal(found.event_indexes, expected.event_indexes)
+        np.testing.assert_allclose(found.epochs, expected.epochs, rtol=0, atol=1e-3 / 86400)
+
+    def test_invalid_direction(self):
+        with self.assertRaises(AttributeError):
+            gpy.analysis.Event('Bad', lambda states, epochs: states[..., 0], 2)
+
+
+class TestAccess(unittest.TestCase):
+    def test_window_edges_on_mask(self):
+        secs = np.arange(0, 86400.0, 30.0)
+        epochs = START_MJD + secs / 86400
+        ephemeris = gpy.analysis.Ephemeris(epochs, kepler_states(6778.0, 0.0, 51.6, secs), ['Sat'])
+        stations = gpy.analysis.StationSet(40.0, -75.0, 0.0, 10.0, ['Station'])
+        windows = gpy.analysis.access(ephemeris, stations)
+        self.assertGreater(len(windows), 0)
+        self.assertTrue(np.all(windows.durations > 0))
+
+        # Elevation at each rise and set, from the exact orbit rather than the interpolated one
+        edges = np.concatenate((windows.starts, windows.ends))
+        inside = (edges > epochs[0]) & (edges < epochs[-1])
+        edges = edges[inside]
+        positions = kepler_states(6778.0, 0.0, 51.6, (edges - START_MJD) * 86400)[:, :3]
+        relative = gpy.analysis.inertial_to_fixed(positions, edges) - stations.ecef[0]
+        sin_elevation = relative @ stations.up[0] / np.linalg.norm(relative, axis=1)
+        np.testing.assert_allclose(sin_elevation, np.sin(np.radians(10.0)), rtol=0, atol=1e-4)
+
+
+class TestEclipse(unittest.TestCase):
+    def setUp(self):
+        secs = np.arange(0, 86400.0, 30.0)
+        self.epochs = START_MJD + secs / 86400
+        self.ephemeris = gpy.analysis.Ephemeris(self.epochs, kepler_states(7000.0, 0.0, 28.5, secs), ['Sat'])
+
+    def test_cylindrical_umbra_duration(self):
+        results = gpy.analysis.eclipse(self.ephemeris, ['Earth'], 'cylindrical')
+        self.assertEqual(len(results.umbra), 15)
+        self.assertEqual(len(results.penumbra), 0)
+
+        # Shadow fraction of a circular orbit: arccos(sqrt(a^2 - R^2) / (a cos(beta))) / pi
+        beta = np.radians(np.interp(0.5 * (results.umbra.starts + results.umbra.ends), self.epochs,
+                                    results.beta[0]))
+        sma, radius = 7000.0, gpy.analysis.EARTH_EQ_RADIUS
+        period = 2 * np.pi * np.sqrt(sma ** 3 / MU)
+        expected = period / np.pi * np.arccos(np.sqrt(sma ** 2 - radius ** 2) / (sma * np.cos(beta)))
+        np.testing.assert_allclose(results.umbra.durations, expected, rtol=0, atol=1.0)  # s, the Sun moves meanwhile
+
+    def test_conical_penumbra_flanks_umbra(self):
+        results = gpy.analysis.eclipse(self.ephemeris, ['Earth'])
+        self.assertEqual(len(results.penumbra), 2 * len(results.umbra))
+        np.testing.assert_array_equal(results.penumbra.ends[0::2], results.umbra.starts)
+        np.testing.assert_array_equal(results.penumbra.starts[1::2], results.umbra.ends)
+        self.assertTrue(np.all((results.penumbra.durations > 5) & (results.penumbra.durations < 15)))
+        mid = 0.5 * (results.umbra.starts + results.umbra.ends)
+        np.testing.assert_array_equal(np.interp(mid, self.epochs, results.illumination[0]), 0)
+
+    def test_beta_angle(self):
+        results = gpy.analysis.eclipse(self.ephemeris, ['Earth'])
+        sun = gpy.analysis.sun_position(self.epochs)
+        ang_mom = np.cross(self.ephemeris.positions[0], self.ephemeris.velocities[0])
+        sin_beta = np.sum(ang_mom * sun, axis=1) / np.linalg.norm(ang_mom, axis=1) / np.linalg.norm(sun, axis=1)
+        np.testing.assert_allclose(results.beta[0], np.degrees(np.arcsin(sin_beta)), rtol=0, atol=1e-9)
+
+    def test_invalid_body(self):
+        with self.assertRaises(AttributeError):
+            gpy.analysis.eclipse(self.ephemeris, ['Sun'])
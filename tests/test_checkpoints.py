@@ -0,0 +1,143 @@
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class GmatObject:
+    # Stand-in for a configured object or command, identified by its generating string
+    def __init__(self, generating_string: str, type_name: str = 'Propagate'):
+        self.generating_string = generating_string
+        self.type_name = type_name
+
+    def GetGeneratingString(self) -> str:
+        return self.generating_string
+
+    def GetTypeName(self) -> str:
+        return self.type_name
+
+    def GetName(self) -> str:
+        return ''
+
+
+class Gmat:
+    # Stand-in for the gmat module's configuration lookups
+    def __init__(self, objects: dict[str, GmatObject]):
+        self.objects = objects
+        self.ConfigManager = self
+
+    def Instance(self):
+        return self
+
+    def GetListOfAllItems(self) -> list[str]:
+        return list(self.objects)
+
+    def GetObject(self, name: str) -> GmatObject:
+        return self.objects[name]
+
+
+def patch(test: unittest.TestCase, target, name: str, value):
+    patcher = mock.patch.object(target, name, value)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
+class TestPrefixKeys(unittest.TestCase):
+    def setUp(self):
+        self.objects = {'Sat': GmatObject('Create Spacecraft Sat;\nGMAT Sat.Tanks = {Tank};\n'),
+                        'Tank': GmatObject('Create ChemicalTank Tank;\nGMAT Tank.FuelMass = 700;\n'),
+                        'Prop': GmatObject('Create Propagator Prop;\n'),
+                        'Burn': GmatObject('Create ImpulsiveBurn Burn;\nGMAT Burn.Element1 = 0.1;\n'),
+                        'Unused': GmatObject('Create Spacecraft Unused;\n')}
+        self.mcs = [GmatObject('BeginMissionSequence;'), GmatObject('Propagate Prop(Sat) {Sat.ElapsedDays = 1};'),
+                    GmatObject('Maneuver Burn(Sat);'), GmatObject('Propagate Prop(Sat) {Sat.Earth.Periapsis};')]
+        self.environment_strings = []
+        patch(self, gpy.checkpoints, 'gmat', Gmat(self.objects))
+        patch(self, gpy, 'flush', lambda **_: None)
+        patch(self, gpy, 'extract_gmat_obj', lambda obj: obj)
+        patch(self, gpy.mission_cache, '_environment_key',
+              lambda strings: self.environment_strings.append(strings) or 'R2022a')
+
+    def test_prefixes(self):
+        keys = gpy.MissionCheckpoints.prefix_keys(self.mcs)
+        self.assertEqual(len(set(keys)), 3)
+        self.assertEqual(sorted(self.environment_strings[0]),
+                         sorted(obj.generating_string for obj in self.objects.values()))
+
+        # A change to the burn only changes the keys of the prefixes from the Maneuver on
+        self.objects['Burn'].generating_string = 'Create ImpulsiveBurn Burn;\nGMAT Burn.Element1 = 0.2;\n'
+        burn_keys = gpy.MissionCheckpoints.prefix_keys(self.mcs)
+        self.assertEqual(burn_keys[0], keys[0])
+        self.assertNotEqual(burn_keys[1:], keys[1:])
+
+        # Objects referred to indirectly count, unused ones don't
+        self.objects['Tank'].generating_string = 'Create ChemicalTank Tank;\nGMAT Tank.FuelMass = 650;\n'
+        tank_keys = gpy.MissionCheckpoints.prefix_keys(self.mcs)
+        self.assertTrue(all(tank_key != burn_key for tank_key, burn_key in zip(tank_keys, burn_keys)))
+        self.objects['Unused'].generating_string = 'Create Spacecraft Unused;\nGMAT Unused.DryMass = 1;\n'
+        self.assertEqual(gpy.MissionCheckpoints.prefix_keys(self.mcs), tank_keys)
+
+    def test_stage_ends(self):
+        commands = [GmatObject('', type_name) for type_name in
+                    ('Propagate', 'BeginFiniteBurn', 'Propagate', 'EndFiniteBurn', 'Maneuver', 'Propagate')]
+        self.assertEqual(gpy.checkpoints._stage_ends(commands, ['Tank']), [1, 4, 5, 6])
+        self.assertEqual(gpy.checkpoints._stage_ends(commands, ['Tank', 'Tank']), [6])
+
+
+class Result:
+    def __init__(self, stage: list):
+        self.stage = stage
+
+
+class TestRun(unittest.TestCase):
+    def setUp(self):
+        self.stages = []
+        self.applied = []
+        self.keys = ['key1', 'key2', 'key3']
+        patch(self, gpy.MissionCheckpoints, 'prefix_keys', staticmethod(lambda mcs: list(self.keys)))
+        patch(self, gpy.checkpoints, '_involved', lambda mcs: ([], [], []))
+        patch(self, gpy.checkpoints, '_stage_ends', lambda commands, tank_names: [1, 2, 3])
+        patch(self, gpy.checkpoints, '_run_stage', lambda stage, progress: self.stages.append(stage[1:]))
+        patch(self, gpy.checkpoints, '_capture',
+              lambda mcs: gpy.checkpoints._Checkpoint(Result(self.stages[-1]), {}))
+        patch(self, gpy.checkpoints, '_apply', lambda checkpoint: self.applied.append(checkpoint.result.stage))
+        patch(self, gpy, 'snapshot_objects', lambda *names: 'originals')
+        patch(self, gpy, 'restore_objects', lambda originals: self.applied.append(originals))
+        self.mcs = ['BeginMissionSequence', 'Propagate1', 'Maneuver', 'Propagate2']
+
+    def test_resume(self):
+        checkpoints = gpy.MissionCheckpoints()
+        result = checkpoints.run(self.mcs)
+        self.assertEqual(self.stages, [['Propagate1'], ['Maneuver'], ['Propagate2']])
+        self.assertEqual(result.stage, ['Propagate2'])
+        self.assertEqual((len(checkpoints), checkpoints.commands_skipped), (2, 0))
+        self.assertEqual(self.applied, [['Propagate1'], ['Maneuver'], 'originals'])
+
+        # Unchanged: the last stage still runs
+        self.stages, self.applied = [], []
+        checkpoints.run(self.mcs)
+        self.assertEqual(self.stages, [['Propagate2']])
+        self.assertEqual(checkpoints.commands_skipped, 2)
+        self.assertEqual(self.applied, [['Maneuver'], 'originals'])
+
+        # Changed from the Maneuver on: resume after the first command
+        self.stages, self.keys[1:] = [], ['changed2', 'changed3']
+        checkpoints.run(self.mcs)
+        self.assertEqual(self.stages, [['Maneuver'], ['Propagate2']])
+        self.assertEqual(checkpoints.commands_skipped, 1)
+
+    def test_max_checkpoints(self):
+        checkpoints = gpy.MissionCheckpoints(max_checkpoints=1)
+        checkpoints.run(self.mcs)
+        self.assertEqual(list(checkpoints._checkpoints), ['key2'])
+        checkpoints.invalidate()
+        self.assertEqual(len(checkpoints), 0)
+
+    def test_invalid(self):
+        with self.assertRaises(AttributeError):
+            gpy.MissionCheckpoints(max_checkpoints=0)
+        with self.assertRaises(AttributeError):
+            gpy.MissionCheckpoints().run(['BeginMissionSequence'])
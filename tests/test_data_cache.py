@@ -0,0 +1,109 @@
+import glob
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+SPACE_WEATHER = """DATATYPE CssiSpaceWeather
+BEGIN OBSERVED
+2000 01 01 2272  7 53 47 40 33 43 30 43 37  376  56 39 27 18 32 15 32 22  30 1.3 6  71 129.9 0 125.6 160.5 133.2 126.8 162.1
+2000 01 02 2272  8 30 27 17 17 10 17 20 13  151  15 12  6  6  4  6  7  5   8 0.4 2 112 132.4 0 126.1 160.6 135.8 127.3 162.2
+END OBSERVED
+BEGIN MONTHLY_PREDICTED
+2030 01 01 2525  0 150.0 0 148.0 147.0 151.0 149.0 148.0
+END MONTHLY_PREDICTED
+"""
+
+SCHATTEN = """ MONTH YEAR  VALUES
+  1  2030  150.1  140.2  130.3  12.0  10.0   8.0
+  2  2030  151.1  141.2  131.3  13.0  11.0   9.0
+"""
+
+EOP = """ Date      MJD      x          y        UT1-UTC       LOD         dX        dY
+1962   1   1  37665  -0.012700   0.213000   0.0326338   0.0017230   0.000000   0.000000   0.030000
+1962   1   2  37666  -0.015900   0.214100   0.0320547   0.0016690   0.000000   0.000000   0.030000
+"""
+
+
+class TestDataTables(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_env = os.environ.get('GMAT_PY_SIMPLE_CACHE')
+        os.environ['GMAT_PY_SIMPLE_CACHE'] = os.path.join(self.tmp_dir.name, 'cache')
+        self.paths = {}
+        for kind, text in (('space_weather', SPACE_WEATHER), ('schatten', SCHATTEN), ('eop', EOP)):
+            self.paths[kind] = os.path.join(self.tmp_dir.name, f'{kind}.txt')
+            with open(self.paths[kind], 'w') as f:
+                f.write(text)
+
+    def tearDown(self):
+        gpy.data_cache.clear()
+        if self.cache_env is None:
+            os.environ.pop('GMAT_PY_SIMPLE_CACHE', None)
+        else:
+            os.environ['GMAT_PY_SIMPLE_CACHE'] = self.cache_env
+        self.tmp_dir.cleanup()
+
+    def test_space_weather(self):
+        table = gpy.data_cache.space_weather(self.paths['space_weather'])
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table['mjd'][0], 21544.5)  # 0h UTC on 1 Jan 2000
+        np.testing.assert_array_equal(table['kp'][0], [5.3, 4.7, 4.0, 3.3, 4.3, 3.0, 4.3, 3.7])
+        np.testing.assert_array_equal(table['ap'][1], [15, 12, 6, 6, 4, 6, 7, 5])
+        np.testing.assert_array_equal(table['f107_obs'], [133.2, 135.8, 151.0])
+        np.testing.assert_array_equal(table['predicted'], [False, False, True])
+        self.assertTrue(np.isnan(table['ap_avg'][2]))  # monthly predictions have no Ap
+
+        # Daily values hold from 0h until the next row
+        np.testing.assert_array_equal(table.at('f107_adj', [21544.5, 21545.4, 21545.6]), [129.9, 129.9, 132.4])
+
+    def test_schatten_and_eop(self):
+        schatten = gpy.data_cache.schatten(self.paths['schatten'])
+        self.assertEqual(len(schatten), 2)
+        self.assertEqual(schatten['values'].shape, (2, 6))
+        np.testing.assert_array_equal(schatten['values'][1, :3], [151.1, 141.2, 131.3])
+
+        eop = gpy.data_cache.eop(self.paths['eop'])
+        np.testing.assert_array_equal(eop['mjd'], [37665 - 29999.5, 37666 - 29999.5])
+        np.testing.assert_array_equal(eop['ut1_utc'], [0.0326338, 0.0320547])
+
+    def test_binary_cache(self):
+        path = self.paths['space_weather']
+        first = gpy.data_cache.space_weather(path)
+        self.assertIs(gpy.data_cache.space_weather(path), first)  # same process: loaded once
+        npz_paths = glob.glob(os.path.join(gpy.data_cache.cache_dir(), 'space_weather_*.npz'))
+        self.assertEqual(len(npz_paths), 1)
+
+        # A new process reads the binary cache, which gives the same columns
+        gpy.data_cache._table_cache.clear()
+        second = gpy.data_cache.space_weather(path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.content_hash, first.content_hash)
+        for column in first.columns:
+            np.testing.assert_array_equal(second[column], first[column])
+
+        # A damaged cache file is rebuilt from the text
+        with open(npz_paths[0], 'wb') as f:
+            f.write(b'not a zip file')
+        gpy.data_cache._table_cache.clear()
+        np.testing.assert_array_equal(gpy.data_cache.space_weather(path)['kp'], first['kp'])
+        with np.load(npz_paths[0]) as data:
+            self.assertEqual(str(data['_hash']), first.content_hash)
+
+    def test_changed_file_reparsed(self):
+        path = self.paths['eop']
+        self.assertEqual(len(gpy.data_cache.eop(path)), 2)
+        with open(path, 'a') as f:
+            f.write('1962   1   3  37667  -0.019000   0.215200   0.0315526   0.0015820   0.000000   0.000000   '
+                    '0.030000\n')
+        self.assertEqual(len(gpy.data_cache.eop(path)), 3)
+
+    def test_invalid_kind(self):
+        with self.assertRaises(AttributeError):
+            gpy.data_cache.data_file('ephemeris')
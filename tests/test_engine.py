@@ -0,0 +1,157 @@
+import asyncio
+import queue
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+def fake_run_mission(mcs: list, return_result: bool = False, progress=None):
+    # Stand-in for gpy.RunMission, reporting the events GMAT's run would and returning 1 like GMAT when no result is
+    #  requested
+    if not mcs:
+        raise RuntimeError('Mission command sequence is empty')
+    for command in mcs:
+        progress(gpy.MissionProgress('INITIALIZING', command))
+    progress(gpy.MissionProgress('RUNNING'))
+    progress(gpy.MissionProgress('IDLE', mcs[-1], elapsed_secs=60.0))
+    return {'commands': list(mcs)} if return_result else 1
+
+
+def build_mission(*names: str) -> list[str]:
+    return list(names)
+
+
+class Process:
+    # Stand-in for a multiprocessing.Process that has already exited
+    exitcode = -9
+
+    def is_alive(self) -> bool:
+        return False
+
+    def join(self):
+        pass
+
+
+class TestRunMissionAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(gpy, 'RunMission', fake_run_mission)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_in_engine_thread(self):
+        run = gpy.run_mission_async(['Prop1', 'Prop2'], return_result=False)
+        states = [event.run_state async for event in run]
+        self.assertEqual(await run, 1)
+        self.assertEqual(states, ['QUEUED', 'INITIALIZING', 'INITIALIZING', 'RUNNING', 'IDLE'])
+        self.assertTrue(run.done())
+        self.assertFalse(run.cancel())  # runs in this process can't be stopped
+
+    async def test_in_engine_thread_failure(self):
+        run = gpy.run_mission_async([])
+        with self.assertRaises(RuntimeError):
+            await run
+        self.assertEqual(run.events[-1].run_state, 'FAILED')
+
+    def test_process_main(self):
+        # The worker process sends the same outcome as the run in this process would return
+        for return_result, expected in ((False, 1), (True, {'commands': ['Prop']})):
+            messages = queue.Queue()
+            gpy.engine._process_main(build_mission, ('Prop',), return_result, messages)
+            sent = [messages.get_nowait() for _ in range(messages.qsize())]
+            self.assertEqual([kind for kind, _ in sent], ['progress'] * 3 + ['result'])
+            self.assertEqual(sent[-1][1], expected)
+
+        messages = queue.Queue()
+        gpy.engine._process_main(build_mission, (), True, messages)
+        kind, text = messages.get_nowait()
+        self.assertEqual(kind, 'error')
+        self.assertTrue(text.startswith('RuntimeError: Mission command sequence is empty'))
+
+    async def test_forward_messages(self):
+        run = gpy.engine.MissionRun(asyncio.get_running_loop())
+        run._process = Process()
+        messages = queue.Queue()
+        for message in (('progress', gpy.MissionProgress('RUNNING')), ('result', 1)):
+            messages.put(message)
+        gpy.engine._forward_messages(run, messages)
+        self.assertEqual(await run, 1)
+        self.assertEqual([event.run_state for event in run.events], ['QUEUED', 'RUNNING'])
+
+    async def test_worker_died(self):
+        run = gpy.engine.MissionRun(asyncio.get_running_loop())
+        run._process = Process()
+        with mock.patch.object(gpy.engine, '_POLL_INTERVAL', 0.01):
+            gpy.engine._forward_messages(run, queue.Queue())
+        with self.assertRaisesRegex(RuntimeError, 'exited with code -9'):
+            await run
+
+
+class TestEngineActor(unittest.TestCase):
+    def setUp(self):
+        self.actor = gpy.EngineActor('test-engine')
+        self.addCleanup(self.actor.shutdown)
+
+    def block(self) -> threading.Event:
+        # Keep the engine thread busy until the returned event is set, so later calls stay queued
+        started, release = threading.Event(), threading.Event()
+        self.actor.submit(lambda: started.set() or release.wait(5))
+        started.wait(5)
+        return release
+
+    def test_submit(self):
+        future = self.actor.submit(lambda a, b=0: (threading.current_thread().name, a + b), 1, b=2)
+        self.assertEqual(future.result(5), ('test-engine', 3))
+        self.assertEqual(self.actor.call(max, [4, 7]), 7)
+        with self.assertRaises(ZeroDivisionError):
+            self.actor.call(lambda: 1 / 0)
+        self.assertEqual((self.actor.calls, self.actor.batches), (3, 3))
+
+    def test_batch(self):
+        order = []
+        release = self.block()
+        futures = self.actor.submit_batch([(order.append, ('a',)), (order.append, ('b',), {}),
+                                           (lambda: order.append('c') or len(order), ())])
+        other = self.actor.submit(order.append, 'other')
+        release.set()
+        self.assertEqual([future.result(5) for future in futures], [None, None, 3])
+        other.result(5)
+        self.assertEqual(order, ['a', 'b', 'c', 'other'])
+        self.assertEqual(self.actor.batches, 3)
+
+    def test_inline_from_engine_thread(self):
+        # A call that waits on another call can't deadlock, as calls from the engine thread run at once
+        def nested():
+            return self.actor.submit(threading.current_thread).result(5)
+
+        self.assertIs(self.actor.call(nested), self.actor._thread)
+        self.assertFalse(self.actor.on_engine_thread())
+
+    def test_proxy(self):
+        target = SimpleNamespace(version='R2022a', add=lambda a, b: a + b)
+        proxy = self.actor.proxy(target)
+        self.assertEqual(proxy.version, 'R2022a')
+        self.assertEqual(proxy.add(2, 3).result(5), 5)
+
+    def test_shutdown(self):
+        release = self.block()
+        queued = self.actor.submit(lambda: 'ran')
+        release.set()
+        self.actor.shutdown()
+        self.assertEqual(queued.result(0), 'ran')  # calls already queued run before the thread stops
+        self.assertFalse(self.actor._thread.is_alive())
+        with self.assertRaises(RuntimeError):
+            self.actor.submit(print)
+
+    def test_shutdown_cancel_futures(self):
+        release = self.block()
+        queued = self.actor.submit(lambda: 'ran')
+        self.actor.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        self.actor._thread.join(5)
+        self.assertTrue(queued.cancelled())
@@ -0,0 +1,73 @@
+import datetime
+import unittest
+from unittest import mock
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class SatObject:
+    # Stand-in for a GMAT Spacecraft, failing the test if anything but the numeric epoch is used
+    def __init__(self, a1_epoch: float):
+        self.a1_epoch = a1_epoch
+
+    def GetRealParameter(self, param: str) -> float:
+        assert param == 'A1Epoch', param
+        return self.a1_epoch
+
+    def __getattr__(self, attr: str):
+        raise AssertionError(f'{attr} should not be called')
+
+
+class Gmat:
+    # Stand-in for the gmat module's object lookups
+    def __init__(self, objects: dict[str, SatObject], runtime_objects: dict[str, SatObject]):
+        self.objects = objects
+        self.runtime_objects = runtime_objects
+
+    def GetObject(self, name: str) -> SatObject:
+        return self.objects[name]
+
+    def GetRuntimeObject(self, name: str) -> SatObject:
+        return self.runtime_objects[name]
+
+
+def make_sat(name: str, was_propagated: bool = False) -> gpy.Spacecraft:
+    sat = gpy.Spacecraft.__new__(gpy.Spacecraft)
+    sat.__dict__.update({'name': name, '_name': name, 'was_propagated': was_propagated})
+    return sat
+
+
+class TestEpochs(unittest.TestCase):
+    def setUp(self):
+        # 1 Jan 2017 00:00:00 UTC, just after a leap second, as A1
+        self.a1_epoch = 27754.5 + (37 + gpy.time.A1_MINUS_TAI) / 86400
+        gmat = Gmat({'Sat': SatObject(self.a1_epoch), 'Sat2': SatObject(21545.0)},
+                    {'Sat': SatObject(self.a1_epoch + 1)})
+        patcher = mock.patch.object(gpy.api_funcs, 'gmat', gmat)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_epoch_mjd(self):
+        sat = make_sat('Sat')
+        self.assertEqual(sat.epoch_mjd(), self.a1_epoch)
+        self.assertAlmostEqual(sat.epoch_mjd('TAI'), 27754.5 + 37 / 86400, delta=1e-11)
+        self.assertAlmostEqual(sat.epoch_mjd('UTC'), 27754.5, delta=1e-11)
+
+        # After a run, the runtime object holds the current epoch
+        self.assertEqual(make_sat('Sat', was_propagated=True).epoch_mjd(), self.a1_epoch + 1)
+
+    def test_get_epoch_as_datetime(self):
+        # Without switching DateFormat or parsing an epoch string (SatObject would fail the test)
+        epoch = make_sat('Sat').GetEpoch(as_datetime=True)
+        self.assertEqual(epoch, datetime.datetime(2017, 1, 1))
+
+    def test_epochs(self):
+        sats = [make_sat('Sat'), 'Sat2']
+        np.testing.assert_array_equal(gpy.epochs(sats), [self.a1_epoch, 21545.0])
+        np.testing.assert_array_equal(gpy.epochs(sats, 'UTC'),
+                                      [make_sat('Sat').epoch_mjd('UTC'), make_sat('Sat2').epoch_mjd('UTC')])
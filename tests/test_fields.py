@@ -0,0 +1,135 @@
+import unittest
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class DummyTank:
+    # Stand-in for a wrapper, recording the calls GmatField makes to it
+    pressure = gpy.GmatField('Pressure', 'SetRealParameter', float, reinitialize=True)
+    fuel_mass = gpy.GmatField('FuelMass', 'SetRealParameter', float)
+    allow_negative = gpy.GmatField('AllowNegativeFuelMass', 'SetField')
+
+    def __init__(self, name: str = 'Tank'):
+        self.name = name
+        self.values = {'Pressure': 1500.0, 'FuelMass': 756.0, 'AllowNegativeFuelMass': False}
+        self.calls = []
+        self.fail_fields = set()
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetRealParameter(self, field: str) -> float:
+        self.calls.append(('get', field))
+        return self.values[field]
+
+    def SetRealParameter(self, field: str, value: float) -> bool:
+        self.calls.append(('set', field, value))
+        if field in self.fail_fields:
+            raise ValueError(f'{field} is read-only')
+        self.values[field] = value
+        return True
+
+    def GetField(self, field: str):
+        self.calls.append(('get', field))
+        return self.values[field]
+
+    def SetField(self, field: str, value) -> bool:
+        return self.SetRealParameter(field, value)
+
+    def Initialize(self) -> bool:
+        self.calls.append(('initialize',))
+        return True
+
+
+class TestGmatField(unittest.TestCase):
+    def setUp(self):
+        gpy.fields.flush(initialize=False)  # start from no pending writes
+        gpy.fields._dirty_objects.clear()
+
+    def tearDown(self):
+        gpy.fields._dirty_objects.clear()
+
+    def test_lazy_read_once(self):
+        tank = DummyTank()
+        self.assertEqual(tank.calls, [])
+        self.assertEqual(tank.pressure, 1500.0)
+        self.assertEqual(tank.pressure, 1500.0)
+        self.assertEqual(tank.calls, [('get', 'Pressure')])
+
+    def test_writes_batched_until_flush(self):
+        tank = DummyTank()
+        tank.fuel_mass = 700
+        tank.fuel_mass = 650
+        tank.pressure = 1600
+        self.assertEqual(tank.calls, [])
+        self.assertEqual(tank.fuel_mass, 650)
+        self.assertEqual(gpy.fields.flush(), 2)
+        # In order of first assignment, the last value of each, then one Initialize
+        self.assertEqual(tank.calls, [('set', 'FuelMass', 650.0), ('set', 'Pressure', 1600.0), ('initialize',)])
+        self.assertEqual(gpy.fields.flush(), 0)
+
+    def test_redundant_assignment_dropped(self):
+        tank = DummyTank()
+        tank.fuel_mass = 700
+        gpy.fields.flush()
+        tank.calls.clear()
+        tank.fuel_mass = 650
+        tank.fuel_mass = 700  # back to the value GMAT already has
+        self.assertEqual(gpy.fields.flush(), 0)
+        self.assertEqual(tank.calls, [])
+
+        # Read values count as written, but True is not the same value as 1
+        self.assertEqual(tank.allow_negative, False)
+        tank.allow_negative = False
+        tank.allow_negative = 0
+        self.assertEqual(gpy.fields.flush(), 1)
+
+    def test_initialize_once_per_object(self):
+        tanks = [DummyTank('Tank1'), DummyTank('Tank2')]
+        for tank in tanks:
+            tank.pressure = 1600
+            tank.pressure = 1700
+        tanks[1].fuel_mass = 700
+        self.assertEqual(gpy.fields.flush(), 3)
+        for tank in tanks:
+            self.assertEqual(tank.calls.count(('initialize',)), 1)
+        self.assertEqual(tanks[1].calls[-1], ('initialize',))
+
+        # Fields not needing it don't initialize
+        tanks[0].fuel_mass = 600
+        gpy.fields.flush()
+        self.assertEqual(tanks[0].calls.count(('initialize',)), 1)
+
+    def test_deferred_initialize(self):
+        # As when the GMAT object is extracted before its other references are set
+        tank = DummyTank()
+        tank.pressure = 1600
+        self.assertEqual(gpy.fields._flush_object(tank, initialize=False), 1)
+        self.assertNotIn(('initialize',), tank.calls)
+        self.assertTrue(tank.__dict__['_needs_initialize'])
+        self.assertIn(id(tank), gpy.fields._dirty_objects)
+
+        self.assertEqual(gpy.fields.flush(), 0)  # nothing left to write, but still initializes
+        self.assertEqual(tank.calls, [('set', 'Pressure', 1600.0), ('initialize',)])
+        self.assertFalse(tank.__dict__['_needs_initialize'])
+        self.assertNotIn(id(tank), gpy.fields._dirty_objects)
+
+    def test_failed_write_keeps_remaining(self):
+        tanks = [DummyTank('Tank1'), DummyTank('Tank2')]
+        tanks[0].fail_fields.add('Pressure')
+        tanks[0].fuel_mass = 700
+        tanks[0].pressure = 1600
+        tanks[0].allow_negative = True
+        tanks[1].fuel_mass = 600
+        with self.assertRaises(RuntimeError):
+            gpy.fields.flush()
+
+        # The failed write is dropped, the writes after it and the other object's writes are kept
+        tanks[0].fail_fields.clear()
+        tanks[0].calls.clear()
+        self.assertEqual(gpy.fields.flush(), 2)
+        self.assertEqual(tanks[0].calls, [('set', 'AllowNegativeFuelMass', True)])
+        self.assertEqual(tanks[1].values['FuelMass'], 600.0)
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class ImagerObject:
+    # Stand-in for a GMAT Imager: like GMAT, SetRealParameter returns the value it set
+    def __init__(self):
+        self.values = {}
+        self.initialize_count = 0
+
+    def SetRealParameter(self, param_id: int, value: float) -> float:
+        self.values[param_id] = value
+        return value
+
+    def Initialize(self) -> bool:
+        self.initialize_count += 1
+        return True
+
+
+def make_imager(gmat_obj) -> gpy.Imager:
+    imager = gpy.Imager.__new__(gpy.Imager)
+    imager.__dict__.update({'gmat_obj': gmat_obj, '_name': 'Imager1', 'name': 'Imager1',
+                            '_pointing_ids': list(range(15))})
+    return imager
+
+
+class TestImagerPointing(unittest.TestCase):
+    def test_default_pointing(self):
+        # Zero components (returned as 0.0 by GMAT) must not count as failed writes
+        gmat_obj = ImagerObject()
+        imager = make_imager(gmat_obj)
+        imager.set_pointing([0, 0, 1], [0, 1, 0])  # GMAT's default DirectionX-Z and SecondDirectionX-Z
+        rot_mat = [[-1, 0, 0], [0, -1, 0], [0, 0, 1]]
+        self.assertEqual([gmat_obj.values[param_id] for param_id in range(15)],
+                         [0, 0, 1, 0, 1, 0] + np.reshape(rot_mat, -1).tolist())
+        self.assertEqual(gmat_obj.initialize_count, 1)
+        np.testing.assert_array_equal(imager.rotation_matrix, rot_mat)
+
+    def test_schedule(self):
+        gmat_obj = ImagerObject()
+        imager = make_imager(gmat_obj)
+        boresights = [[0, 0, 1], [1, 0, 0], [0, 1, 0]]
+        second_vecs = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        schedule = imager.apply_pointing_schedule(boresights, second_vecs)
+        self.assertEqual(gmat_obj.values, {})  # nothing written until the iterator is advanced
+        for index in schedule:
+            np.testing.assert_array_equal([gmat_obj.values[param_id] for param_id in range(3)], boresights[index])
+        self.assertEqual(gmat_obj.initialize_count, 3)
+
+        with self.assertRaises(AttributeError):  # not orthogonal, so rejected before anything is written
+            imager.apply_pointing_schedule(boresights, boresights)
+
+    def test_rejected_write(self):
+        gmat_obj = ImagerObject()
+        gmat_obj.SetRealParameter = lambda param_id, value: 0.5  # GMAT kept another value
+        with self.assertRaises(RuntimeError):
+            make_imager(gmat_obj).set_pointing([0, 0, 1], [1, 0, 0])
@@ -0,0 +1,109 @@
+import gc
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class ConfiguredObject:
+    def GetType(self) -> int:
+        return 0
+
+
+class Moderator:
+    # Stand-in for GMAT's Moderator, holding configured objects by name
+    def __init__(self):
+        self.configured: dict[str, ConfiguredObject] = {}
+        self.removed: list[str] = []
+
+    def Instance(self):
+        return self
+
+    def GetConfiguredObject(self, name: str):
+        return self.configured.get(name)
+
+    def RemoveObject(self, obj_type: int, name: str, only_if_unused: bool) -> bool:
+        del self.configured[name]
+        self.removed.append(name)
+        return True
+
+
+class Gmat:
+    def __init__(self):
+        self.Moderator = Moderator()
+
+
+class Interned:
+    # Stand-in for an interned ForceModel or PropSetup
+    def __init__(self, name: str):
+        self.name = name
+
+
+class TestInterning(unittest.TestCase):
+    def setUp(self):
+        self.gmat = Gmat()
+        for module in (gpy.orbit, gpy.api_funcs):
+            patcher = mock.patch.object(module, 'gmat', self.gmat)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.builds = []
+
+    def build(self, spec):
+        # Create the GMAT objects for spec, as _build_force_model() would
+        names = (f'ForceModel_{spec.key()}', f'GravField_{spec.key()}')
+        for name in names:
+            self.gmat.Moderator.configured[name] = ConfiguredObject()
+        self.builds.append(spec)
+        return Interned(names[0]), names
+
+    def intern(self, spec):
+        return gpy.orbit._intern(spec, lambda: self.build(spec))
+
+    def test_key(self):
+        spec = gpy.ForceModelSpec(point_masses=('Luna',))
+        self.assertEqual(spec.key(), gpy.ForceModelSpec(point_masses=('Luna',)).key())
+        self.assertNotEqual(spec.key(), gpy.ForceModelSpec().key())
+        self.assertNotEqual(gpy.PropSetupSpec(accuracy=1e-11).key(), gpy.PropSetupSpec().key())
+
+    def test_equal_specs_share_object(self):
+        first = self.intern(gpy.ForceModelSpec(srp=True))
+        self.assertIs(self.intern(gpy.ForceModelSpec(srp=True)), first)
+        self.assertIsNot(self.intern(gpy.ForceModelSpec()), first)
+        self.assertEqual(len(self.builds), 2)
+        del first
+        gc.collect()
+
+    def test_from_spec_normalizes_point_masses(self):
+        with mock.patch.object(gpy.orbit, '_build_force_model', self.build):
+            fm = gpy.ForceModel.from_spec(gpy.ForceModelSpec(point_masses=('Sun', 'Luna', 'Sun')))
+            self.assertIs(gpy.ForceModel.from_spec(gpy.ForceModelSpec(point_masses=('Luna', 'Sun'))), fm)
+        self.assertEqual(self.builds[0].point_masses, ('Luna', 'Sun'))
+
+    def test_released_when_unreferenced(self):
+        spec = gpy.ForceModelSpec(drag='JacchiaRoberts')
+        obj = self.intern(spec)
+        count = gpy.interned_count()
+        names = obj.__dict__['_intern'][1]
+        del obj
+        gc.collect()
+        self.assertEqual(self.gmat.Moderator.removed, list(names))
+        self.assertEqual(gpy.interned_count(), count - 1)
+
+    def test_rebuilt_after_clear(self):
+        spec = gpy.ForceModelSpec(relativistic_correction=True)
+        old = self.intern(spec)
+        self.gmat.Moderator.configured.clear()  # as gmat.Clear() would
+        new = self.intern(spec)
+        self.assertIsNot(new, old)
+
+        # The old object's finalizer must not remove the new GMAT objects of the same names
+        del old
+        gc.collect()
+        self.assertEqual(self.gmat.Moderator.removed, [])
+        self.assertIs(self.intern(spec), new)
+        del new
+        gc.collect()
+        self.assertEqual(len(self.gmat.Moderator.removed), 2)
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+from test_analysis import kepler_states, MU, START_MJD
+
+
+class TestEphemerisInterpolator(unittest.TestCase):
+    def setUp(self):
+        period = 2 * np.pi * np.sqrt(7000.0 ** 3 / MU)
+        self.secs = np.arange(0, 3 * period, 60.0)
+        self.epochs = START_MJD + self.secs / 86400
+        self.states = kepler_states(7000.0, 0.01, 28.5, self.secs)
+        self.query_secs = self.secs[:-1] + 30  # midpoints, where interpolation error is largest
+        self.expected = kepler_states(7000.0, 0.01, 28.5, self.query_secs)
+
+    def test_lagrange_accuracy(self):
+        interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, self.states, 'lagrange', 7)
+        states = interpolator.evaluate(START_MJD + self.query_secs / 86400)
+        self.assertLess(np.abs(states[:, :3] - self.expected[:, :3]).max(), 5e-6)  # km
+        self.assertLess(np.abs(states[:, 3:] - self.expected[:, 3:]).max(), 1e-8)  # km/s
+
+    def test_hermite_accuracy(self):
+        interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, self.states, 'hermite', 7)
+        states = interpolator.evaluate(START_MJD + self.query_secs / 86400)
+        self.assertLess(np.abs(states[:, :3] - self.expected[:, :3]).max(), 5e-6)
+
+    def test_exact_at_samples(self):
+        interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, self.states, 'lagrange', 7)
+        np.testing.assert_allclose(interpolator.evaluate(self.epochs), self.states, rtol=1e-12, atol=1e-9)
+
+    def test_several_sats(self):
+        states = np.stack((self.states, kepler_states(8000.0, 0.1, 98.0, self.secs)))
+        interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, states, 'lagrange', 7)
+        query = START_MJD + self.query_secs[:10] / 86400
+        both = interpolator.evaluate(query)
+        self.assertEqual(both.shape, (2, 10, 6))
+        second = interpolator.evaluate(query, sat_indexes=np.ones(10, dtype=int))
+        np.testing.assert_array_equal(second, both[1])
+
+    def test_segments_at_repeated_epochs(self):
+        # A repeated epoch (as either side of an impulsive burn) starts a new segment, and the later state is used
+        epochs = np.concatenate((self.epochs[:50], self.epochs[49:100]))
+        states = np.concatenate((self.states[:50], self.states[49:100] + [0, 0, 0, 0.1, 0, 0]))
+        interpolator = gpy.interpolation.EphemerisInterpolator(epochs, states, 'lagrange', 5)
+        self.assertEqual(len(interpolator.segment_starts), 2)
+        np.testing.assert_allclose(interpolator.evaluate(epochs[50])[0], states[50], rtol=1e-12, atol=1e-9)
+
+    def test_outside_span(self):
+        interpolator = gpy.interpolation.EphemerisInterpolator(self.epochs, self.states)
+        with self.assertRaises(AttributeError):
+            interpolator.evaluate(self.epochs[-1] + 1)
+
+    def test_invalid_order(self):
+        with self.assertRaises(AttributeError):
+            gpy.interpolation.EphemerisInterpolator(self.epochs, self.states, 'hermite', 4)
@@ -0,0 +1,226 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+from test_analysis import kepler_states, START_MJD
+
+
+class TestReportReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'report.txt')
+        self.num_rows = 10000  # more than one sidecar index stride
+        self.epochs = START_MJD + np.arange(self.num_rows) * 60 / 86400
+        self.states = kepler_states(7000.0, 0.01, 28.5, np.arange(self.num_rows) * 60.0)
+        gregorian = gpy.time.format_gregorian(self.epochs)
+        with open(self.path, 'w') as f:
+            f.write('Sat.UTCGregorian            Sat.A1ModJulian          Sat.X                    Sat.VX\n')
+            for row in range(self.num_rows):
+                f.write(f'{gregorian[row]}   {self.epochs[row]:.15f}   {self.states[row, 0]:.15e}   '
+                        f'{self.states[row, 3]:.15e}\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_read(self):
+        reader = gpy.io.ReportReader(self.path)
+        self.assertEqual(reader.columns, ['Sat.UTCGregorian', 'Sat.A1ModJulian', 'Sat.X', 'Sat.VX'])
+        self.assertEqual(reader.epoch_column, 'Sat.UTCGregorian')
+        data = reader.read()
+        np.testing.assert_allclose(data['Sat.UTCGregorian'], self.epochs, rtol=0, atol=0.5e-3 / 86400)
+        np.testing.assert_allclose(data['Sat.A1ModJulian'], self.epochs, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(data['Sat.X'], self.states[:, 0], rtol=1e-15)
+        np.testing.assert_allclose(data['Sat.VX'], self.states[:, 3], rtol=1e-15)
+
+    def test_blocks_match_read(self):
+        whole = gpy.io.ReportReader(self.path).read()
+        blocks = list(gpy.io.ReportReader(self.path, chunk_bytes=4096).blocks())
+        self.assertGreater(len(blocks), 1)
+        for column, values in whole.items():
+            np.testing.assert_array_equal(np.concatenate([block[column] for block in blocks]), values)
+
+    def test_time_range_with_index(self):
+        reader = gpy.io.ReportReader(self.path, chunk_bytes=4096)
+        start, stop = self.epochs[7000], self.epochs[7100]
+        reader.build_index()
+        self.assertTrue(os.path.isfile(self.path + '.gpyidx.npz'))
+        selected = reader.read(start, stop)  # seeks via the index
+        self.assertEqual(len(selected['Sat.X']), 101)
+        np.testing.assert_allclose(selected['Sat.X'], self.states[7000:7101, 0], rtol=1e-15)
+        np.testing.assert_array_equal(selected['Sat.A1ModJulian'], reader.read()['Sat.A1ModJulian'][7000:7101])
+
+    def test_no_header(self):
+        no_header = os.path.join(self.tmp_dir.name, 'no_header.txt')
+        with open(no_header, 'w') as f:
+            f.write('21545.0 1.5\n21545.5 2.5\n')
+        with self.assertRaises(AttributeError):
+            gpy.io.ReportReader(no_header)
+        data = gpy.io.ReportReader(no_header, columns=['Sat.A1ModJulian', 'Sat.X']).read()
+        np.testing.assert_array_equal(data['Sat.X'], [1.5, 2.5])
+
+
+class TestCcsdsWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        secs = np.arange(0, 6000.0, 60.0)
+        self.epochs = START_MJD + secs / 86400
+        self.states = kepler_states(7000.0, 0.01, 28.5, secs)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_oem_round_trip(self):
+        path = os.path.join(self.tmp_dir.name, 'sat.oem')
+        gpy.io.write_oem(path, self.epochs, self.states, {'OBJECT_NAME': 'Sat'})
+        reader = gpy.io.open_ephemeris(path)
+        segments = reader.read()
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(segments[0]['meta']['OBJECT_NAME'], 'Sat')
+        self.assertEqual(segments[0]['meta']['START_TIME'], '2000-01-01T12:00:00.000')
+        np.testing.assert_array_equal(segments[0]['epochs'], self.epochs)
+        np.testing.assert_allclose(segments[0]['states'], self.states, rtol=0, atol=7e-12)
+
+    def test_oem_segments_covariance_and_accelerations(self):
+        path = os.path.join(self.tmp_dir.name, 'sat.oem')
+        half = len(self.epochs) // 2
+        with gpy.io.OemWriter(path, version='2.0') as writer:
+            writer.segment({'OBJECT_NAME': 'Sat'})
+            writer.write(self.epochs[:half], self.states[:half], accelerations=np.zeros((half, 3)))
+            writer.write_covariance(self.epochs[0], np.eye(6))
+            with self.assertRaises(RuntimeError):
+                writer.write(self.epochs[half:], self.states[half:])  # data after covariance needs a new segment
+            writer.segment({'OBJECT_NAME': 'Sat', 'REF_FRAME': 'ICRF'})
+            writer.write(self.epochs[half:], self.states[half:])
+        segments = gpy.io.OemReader(path).read()
+        self.assertEqual([segment['meta']['REF_FRAME'] for segment in segments], ['EME2000', 'ICRF'])
+        np.testing.assert_array_equal(segments[0]['accelerations'], np.zeros((half, 3)))
+        np.testing.assert_allclose(np.concatenate([segment['states'] for segment in segments]), self.states,
+                                   rtol=0, atol=7e-12)
+
+    def test_decreasing_epochs(self):
+        with self.assertRaises(AttributeError):
+            gpy.io.write_oem(os.path.join(self.tmp_dir.name, 'bad.oem'), self.epochs[::-1], self.states,
+                             {'OBJECT_NAME': 'Sat'})
+
+    def test_value_formatting(self):
+        fields = gpy.io._format_fields(np.array([[7000.0, -1.2345678901234567e-5, 0.0]])).tobytes().decode().split()
+        self.assertEqual(fields, ['7.000000000000000e+03', '-1.234567890123457e-05', '0.000000000000000e+00'])
+
+        # Exponents of three digits widen the whole block
+        values = np.array([[6.02214076e23, -9.999999999999999e-301, 1.0 / 3]])
+        fields = gpy.io._format_fields(values).tobytes().decode().split()
+        self.assertEqual(fields, ['6.022140760000000e+023', '-9.999999999999999e-301', '3.333333333333333e-001'])
+
+    def test_value_formatting_matches_printf(self):
+        # Exactly rounded, including values near powers of ten and ties, for exponents of two digits
+        rng = np.random.default_rng(0)
+        powers = 10.0 ** np.arange(-98, 99)
+        values = np.concatenate((rng.normal(0, 7000, 20000), 10 ** rng.uniform(-98, 98, 20000), [1e23, 1.125, -0.0],
+                                 powers, np.nextafter(powers, 0), np.nextafter(powers, np.inf)))
+        for digits in (16, 3):
+            fields = gpy.io._format_fields(values.reshape(-1, 1), digits).tobytes().decode().split()
+            printf_fields = ['%.*e' % (digits - 1, value) for value in values]
+            self.assertEqual([(field, printf_field) for field, printf_field in zip(fields, printf_fields)
+                              if field != printf_field], [])
+
+    def test_aem_and_opm(self):
+        aem_path = os.path.join(self.tmp_dir.name, 'sat.aem')
+        quaternions = np.tile([0.0, 0.0, 0.0, 1.0], (len(self.epochs), 1))
+        gpy.io.write_aem(aem_path, self.epochs, quaternions, {'OBJECT_NAME': 'Sat'})
+        with open(aem_path) as f:
+            text = f.read()
+        self.assertIn('QUATERNION_TYPE = LAST', text)
+        self.assertEqual(text.count('1.000000000000000e+00\n'), len(self.epochs))
+
+        opm_path = os.path.join(self.tmp_dir.name, 'sat.opm')
+        gpy.io.write_opm(opm_path, self.epochs[0], self.states[0], {'OBJECT_NAME': 'Sat'}, spacecraft={'MASS': 850})
+        with open(opm_path) as f:
+            values = dict(line.split(' = ') for line in f.read().splitlines() if ' = ' in line)
+        self.assertEqual(values['EPOCH'], '2000-01-01T12:00:00.000')
+        self.assertEqual(float(values['X']), self.states[0, 0])
+        self.assertEqual(float(values['MASS']), 850.0)
+
+
+OEM_TEXT = """CCSDS_OEM_VERS = 2.0
+CREATION_DATE  = 2026-10-19T12:00:00
+ORIGINATOR     = GMAT USER
+
+META_START
+OBJECT_NAME          = Sat
+OBJECT_ID            = SatId
+CENTER_NAME          = Earth
+REF_FRAME            = EME2000
+TIME_SYSTEM          = UTC
+START_TIME           = 2000-01-01T11:58:55.816
+STOP_TIME            = 2000-01-01T12:00:55.816
+META_STOP
+
+COMMENT  Segment 1
+2000-01-01T11:58:55.816   7100.0   0.0   1300.0   0.0   7.35   1.0
+2000-01-01T11:59:55.816   7099.5   441.0   1299.9   -0.01   7.35   1.0
+2000-01-01T12:00:55.816   7098.0   882.0   1299.7   -0.02   7.34   1.0
+
+COVARIANCE_START
+EPOCH = 2000-01-01T12:00:55.816
+COV_REF_FRAME = EME2000
+   1.0
+   0.0   1.0
+COVARIANCE_STOP
+
+META_START
+OBJECT_NAME          = Sat
+OBJECT_ID            = SatId
+CENTER_NAME          = Earth
+REF_FRAME            = EME2000
+TIME_SYSTEM          = UTC
+START_TIME           = 2000-01-01T12:00:55.816
+STOP_TIME            = 2000-01-01T12:01:55.816
+META_STOP
+
+2000-01-01T12:00:55.816   7098.0   882.0   1299.7   0.0   7.44   1.0   0.0   0.0   -0.008
+2000-01-01T12:01:55.816   7095.0   1324.0   1299.5   -0.05   7.43   1.0   0.0   0.0   -0.008
+"""
+
+
+class TestOemReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'sat.oem')
+        with open(self.path, 'w') as f:
+            f.write(OEM_TEXT)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_segments(self):
+        reader = gpy.io.open_ephemeris(self.path)
+        segments = reader.read()
+        self.assertEqual(reader.header['ORIGINATOR'], 'GMAT USER')
+        self.assertEqual([len(segment['epochs']) for segment in segments], [3, 2])
+        self.assertEqual(segments[0]['meta']['START_TIME'], '2000-01-01T11:58:55.816')
+        np.testing.assert_allclose((segments[0]['epochs'] - START_MJD) * 86400, [-64.184, -4.184, 55.816],
+                                   rtol=0, atol=1e-6)
+        np.testing.assert_array_equal(segments[0]['states'][1], [7099.5, 441.0, 1299.9, -0.01, 7.35, 1.0])
+        self.assertNotIn('accelerations', segments[0])  # covariance rows are skipped, not read as states
+        np.testing.assert_array_equal(segments[1]['accelerations'][:, 2], [-0.008, -0.008])
+
+    def test_time_range(self):
+        start = START_MJD - 5 / 86400
+        segments = gpy.io.OemReader(self.path).read(start, START_MJD + 60 / 86400)
+        self.assertEqual([len(segment['epochs']) for segment in segments], [2, 1])
+        self.assertTrue(all(np.all(segment['epochs'] >= start) for segment in segments))
+
+    def test_other_formats_rejected(self):
+        for name, start in (('sat.bsp', b'DAF/SPK '), ('sat.eph', bytes(range(64)))):
+            path = os.path.join(self.tmp_dir.name, name)
+            with open(path, 'wb') as f:
+                f.write(start)
+            with self.assertRaises(AttributeError):
+                gpy.io.open_ephemeris(path)
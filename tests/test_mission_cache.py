@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+def make_result(x: float = 7000.0) -> gpy.MissionResult:
+    return gpy.MissionResult(['Sat'], [21545.5], [[x, 0, 0, 0, 7.5, 0]], ['EarthMJ2000Eq'], [850.0], [], [], [], [],
+                             [], [])
+
+
+class ConfiguredObject:
+    def __init__(self, generating_string: str):
+        self.generating_string = generating_string
+
+    def GetGeneratingString(self) -> str:
+        return self.generating_string
+
+
+class Gmat:
+    # Stand-in for the gmat module's configuration lookups
+    def __init__(self, objects: dict[str, ConfiguredObject]):
+        self.objects = objects
+        self.ConfigManager = self
+
+    def Instance(self):
+        return self
+
+    def GetListOfAllItems(self) -> list[str]:
+        return list(self.objects)
+
+    def GetObject(self, name: str) -> ConfiguredObject:
+        return self.objects[name]
+
+
+class TestMissionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = gpy.MissionCache(self.tmp_dir.name)
+
+    def entry_size(self) -> int:
+        self.cache.put('size', make_result())
+        size = os.path.getsize(self.cache._path('size'))
+        self.cache.invalidate('size')
+        return size
+
+    def set_last_used(self, key: str, seconds_ago: float):
+        mtime_ns = int((os.path.getmtime(self.cache._path(key)) - seconds_ago) * 1e9)
+        os.utime(self.cache._path(key), ns=(mtime_ns, mtime_ns))
+
+    def test_put_get(self):
+        self.assertIsNone(self.cache.get('missing'))
+        self.cache.put('a', make_result(7100.0))
+        self.assertIn('a', self.cache)
+        self.assertEqual(self.cache.get('a').states[0, 0], 7100.0)
+        self.assertEqual((len(self.cache), self.cache.hits, self.cache.misses), (1, 1, 1))
+
+    def test_damaged_entry_is_a_miss(self):
+        with open(self.cache._path('damaged'), 'wb') as f:
+            f.write(b'not an npz file')
+        self.assertIsNone(self.cache.get('damaged'))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_lru_eviction(self):
+        self.cache.max_bytes = 2 * self.entry_size()
+        for key, seconds_ago in (('a', 20), ('b', 10)):
+            self.cache.put(key, make_result())
+            self.set_last_used(key, seconds_ago)
+        self.cache.get('a')  # now the most recently used
+        self.cache.put('c', make_result())
+        self.assertEqual(sorted(entry.name for entry in self.cache._entries()), ['a.npz', 'c.npz'])
+
+    def test_newest_entry_kept(self):
+        self.cache.max_bytes = 1
+        self.cache.put('a', make_result())
+        self.cache.put('b', make_result())
+        self.assertEqual([entry.name for entry in self.cache._entries()], ['b.npz'])
+
+    def test_invalidate(self):
+        for key in ('a', 'b', 'c'):
+            self.cache.put(key, make_result())
+        self.assertEqual(self.cache.invalidate('a'), 1)
+        self.assertEqual(self.cache.invalidate('a'), 0)
+        self.assertEqual(self.cache.invalidate(), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalid_max_bytes(self):
+        with self.assertRaises(AttributeError):
+            gpy.MissionCache(self.tmp_dir.name, max_bytes=0)
+
+
+class TestKey(unittest.TestCase):
+    def setUp(self):
+        self.objects = {'Sat': ConfiguredObject("Create Spacecraft Sat;\nGMAT Sat.DryMass = 850;\n"),
+                        'Prop': ConfiguredObject("Create Propagator Prop;\n")}
+        self.commands = [ConfiguredObject('BeginMissionSequence;'), ConfiguredObject('Propagate Prop(Sat);')]
+        self.environment = 'R2022a'
+        for target, name, value in ((gpy.mission_cache, 'gmat', Gmat(self.objects)), (gpy, 'flush', lambda **_: None),
+                                    (gpy, 'extract_gmat_obj', lambda obj: obj),
+                                    (gpy.mission_cache, '_environment_key', lambda strings: self.environment)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_key_changes_with_inputs(self):
+        key = gpy.MissionCache.key(self.commands)
+        self.assertEqual(gpy.MissionCache.key(self.commands), key)
+
+        self.objects['Sat'].generating_string = "Create Spacecraft Sat;\nGMAT Sat.DryMass = 851;\n"
+        object_key = gpy.MissionCache.key(self.commands)
+        self.commands[1].generating_string = 'Propagate Prop(Sat) {Sat.ElapsedDays = 2};'
+        command_key = gpy.MissionCache.key(self.commands)
+        self.environment = 'R2025a'
+        environment_key = gpy.MissionCache.key(self.commands)
+        self.assertEqual(len({key, object_key, command_key, environment_key}), 4)
+
+    def test_potential_files(self):
+        generating_string = ("GMAT Prop_ForceModel.GravityField.Earth.PotentialFile = 'JGM2.cof';\n"
+                             "GMAT Prop_ForceModel.GravityField.Luna.PotentialFile = LP165P.cof;\n")
+        self.assertEqual(gpy.mission_cache._POTENTIAL_FILE_RE.findall(generating_string),
+                         [('Earth', 'JGM2.cof'), ('Luna', 'LP165P.cof')])
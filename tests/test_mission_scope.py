@@ -0,0 +1,128 @@
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class ConfiguredObject:
+    def GetType(self) -> int:
+        return 0
+
+
+class Command:
+    def __init__(self, name: str, next_command=None):
+        self.name = name
+        self.next = next_command
+
+    def GetNext(self):
+        return self.next
+
+
+class Engine:
+    # Stand-in for GMAT's ConfigManager and Moderator. An object can't be removed while another refers to it
+    def __init__(self, names: list[str], commands: list[str]):
+        self.objects: dict[str, ConfiguredObject] = {name: ConfiguredObject() for name in names}
+        self.references: dict[str, set[str]] = {}  # name -> names of the objects it refers to
+        self.first_command = None
+        self.set_commands(['NoOp'] + commands)
+        self.sandboxes_cleared = False
+
+    def set_commands(self, names: list[str]):
+        self.first_command = None
+        for name in reversed(names):
+            self.first_command = Command(name, self.first_command)
+
+    def command_names(self) -> list[str]:
+        names, command = [], self.first_command
+        while command is not None:
+            names.append(command.name)
+            command = command.GetNext()
+        return names
+
+    def Instance(self):
+        return self
+
+    # ConfigManager
+    def GetListOfAllItems(self) -> list[str]:
+        return list(self.objects)
+
+    # Moderator
+    def GetFirstCommand(self):
+        return self.first_command
+
+    def ClearCommandSeq(self, leave_first: bool, call_delete: bool):
+        self.set_commands(['NoOp'])
+
+    def DeleteCommand(self, command: Command):
+        self.set_commands([name for name in self.command_names() if name != command.name])
+
+    def ClearAllSandboxes(self):
+        self.sandboxes_cleared = True
+
+    def GetConfiguredObject(self, name: str):
+        return self.objects.get(name)
+
+    def RemoveObject(self, obj_type: int, name: str, only_if_unused: bool) -> bool:
+        if any(name in refs for other, refs in self.references.items() if other in self.objects):
+            return False
+        del self.objects[name]
+        return True
+
+
+class Gmat:
+    def __init__(self, engine: Engine):
+        self.ConfigManager = engine
+        self.Moderator = engine
+
+
+class TestMissionScope(unittest.TestCase):
+    def setUp(self):
+        self.engine = Engine(['EarthMJ2000Eq', 'OldSat'], ['OldPropagate'])
+        for module in (gpy.executive, gpy.api_funcs):
+            patcher = mock.patch.object(module, 'gmat', Gmat(self.engine))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create(self, name: str, refers_to: tuple[str, ...] = ()):
+        self.engine.objects[name] = ConfiguredObject()
+        self.engine.references[name] = set(refers_to)
+
+    def test_removes_created_objects_and_commands(self):
+        totals = (gpy.MissionScope.total_created, gpy.MissionScope.total_leaked)
+        with gpy.MissionScope() as scope:
+            self.create('Tank')
+            self.create('Sat', ('Tank',))  # removing Tank needs a second pass, after Sat
+            self.engine.set_commands(self.engine.command_names() + ['Propagate1', 'Propagate2'])
+
+        self.assertEqual(sorted(self.engine.objects), ['EarthMJ2000Eq', 'OldSat'])
+        self.assertEqual(self.engine.command_names(), ['NoOp', 'OldPropagate'])
+        self.assertTrue(self.engine.sandboxes_cleared)
+        self.assertEqual(sorted(scope.removed), ['Sat', 'Tank'])
+        self.assertEqual(scope.report(), {'created': 2, 'removed': 2, 'leaked': 0, 'commands_removed': 2})
+        self.assertEqual((gpy.MissionScope.total_created, gpy.MissionScope.total_leaked),
+                         (totals[0] + 2, totals[1]))
+
+    def test_whole_sequence_cleared(self):
+        self.engine.set_commands(['NoOp'])
+        with gpy.MissionScope(clear_sandbox=False) as scope:
+            self.engine.set_commands(['NoOp', 'BeginMissionSequence', 'Propagate1'])
+        self.assertEqual(self.engine.command_names(), ['NoOp'])
+        self.assertEqual(scope.commands_removed, 2)
+        self.assertFalse(self.engine.sandboxes_cleared)
+
+    def test_object_in_use_outside_scope_leaks(self):
+        with gpy.MissionScope() as scope:
+            self.create('Prop')
+            self.engine.references['OldSat'] = {'Prop'}
+        self.assertEqual(scope.leaked, ['Prop'])
+        self.assertIn('Prop', self.engine.objects)
+
+    def test_cleans_up_after_exception(self):
+        with self.assertRaises(ValueError):
+            with gpy.MissionScope():
+                self.create('Sat')
+                raise ValueError('raised within the scope')
+        self.assertNotIn('Sat', self.engine.objects)
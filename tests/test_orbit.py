@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class Spacecraft:
+    # Stand-in for a GMAT Spacecraft, recording the calls that set its fields
+    __module__ = 'gmatpy.gmat_py'
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, method: str):
+        if not method.startswith('Set'):
+            raise AttributeError(method)
+        return lambda field, value: self.calls.append((method, field, value))
+
+
+class TestApplyToSpacecraft(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(gpy.orbit, 'CoordSystems', lambda: ['EarthMJ2000Eq'])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(gpy.orbit._apply_plans, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_apply(self):
+        orbit = gpy.OrbitState.from_dict({'ECC': 0.01, 'SMA': 7000, 'DryMass': 850, 'DisplayStateType': 'Keplerian'})
+        orbit._epoch = 21545
+        sat = Spacecraft()
+        orbit.apply_to_spacecraft(sat)
+
+        # Settings first, in the order GMAT needs them, then the elements as floats, then the other fields
+        self.assertEqual(sat.calls, [
+            ('SetStringParameter', 'DateFormat', 'TAIModJulian'), ('SetStringParameter', 'Epoch', '21545'),
+            ('SetStringParameter', 'CoordinateSystem', 'EarthMJ2000Eq'),
+            ('SetStringParameter', 'DisplayStateType', 'Keplerian'),
+            ('SetRealParameter', 'ECC', 0.01), ('SetRealParameter', 'SMA', 7000.0), ('SetField', 'DryMass', 850)])
+
+    def test_none_skipped(self):
+        orbit = gpy.OrbitState(display_state_type='Cartesian', coord_sys=None)
+        orbit._x, orbit._y = 7000.0, None
+        sat = Spacecraft()
+        orbit.apply_to_spacecraft(sat)
+        self.assertEqual([field for _, field, _ in sat.calls], ['DateFormat', 'Epoch', 'DisplayStateType', 'X'])
+
+    def test_plan_cached(self):
+        first, second = gpy.OrbitState(), gpy.OrbitState(epoch='21546')
+        self.assertIs(first._apply_plan(), second._apply_plan())
+        self.assertEqual(len(gpy.orbit._apply_plans), 1)
+
+        # A different DisplayStateType or set of attributes has its own plan
+        keplerian = gpy.OrbitState(display_state_type='Keplerian')
+        self.assertIsNot(keplerian._apply_plan(), first._apply_plan())
+        second._v_x = 7.5  # as from_dict() names the VX attribute
+        self.assertEqual(second._apply_plan()[-1], ('_v_x', 'SetRealParameter', 'VX'))
+        self.assertEqual(len(gpy.orbit._apply_plans), 3)
+
+    def test_invalid_display_state_type(self):
+        orbit = gpy.OrbitState()
+        orbit._display_state_type = 'Polar'
+        with self.assertRaises(AttributeError):
+            orbit.apply_to_spacecraft(Spacecraft())
+        self.assertEqual(gpy.orbit._apply_plans, {})
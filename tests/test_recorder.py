@@ -0,0 +1,200 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+START_EPOCH = 21545.0  # A1 ModJulian
+
+
+class SatObject:
+    # Stand-in for a GMAT Spacecraft, moving along X at 1 km/s
+    def __init__(self):
+        self.epoch = START_EPOCH
+        self.state = [7000.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+        self.fields = {'DateFormat': 'UTCGregorian', 'Epoch': '01 Jan 2000 11:59:28.000',
+                       'DisplayStateType': 'Keplerian'}
+
+    def elapsed(self) -> float:
+        return (self.epoch - START_EPOCH) * 86400
+
+    def GetField(self, field: str) -> str:
+        return self.fields[field]
+
+    def SetField(self, field: str, value: str):
+        if field in gpy.results._CARTESIAN_ELEMENTS:
+            self.state[gpy.results._CARTESIAN_ELEMENTS.index(field)] = float(value)
+        elif field == 'Epoch':  # only the user's original string is set back in these tests
+            self.epoch = START_EPOCH
+        self.fields[field] = value
+
+    def GetRealParameter(self, param: str) -> float:
+        if param == 'A1Epoch':
+            return self.epoch
+        return self.state[gpy.results._CARTESIAN_ELEMENTS.index(param)]
+
+
+class Propagator:
+    # Stand-in for a GMAT Propagator whose own steps are 60 s
+    def __init__(self, sat: SatObject):
+        self.sat = sat
+        self.step_taken = 0.0
+        self.steps: list[float] = []
+
+    def Step(self, dt: float = 60.0) -> bool:
+        self.sat.epoch += dt / 86400
+        self.sat.state[0] += dt
+        self.step_taken = dt
+        self.steps.append(dt)
+        return True
+
+    def GetStepTaken(self) -> float:
+        return self.step_taken
+
+    def UpdateSpaceObject(self):
+        pass
+
+
+class PropSetup:
+    def __init__(self, gator: Propagator):
+        self.gator = gator
+        self.prop_objects: list = []
+
+    def GetName(self) -> str:
+        return 'Prop'
+
+    def AddPropObject(self, sat):
+        self.prop_objects.append(sat)
+
+    def PrepareInternals(self):
+        pass
+
+    def GetPropagator(self) -> Propagator:
+        return self.gator
+
+
+class Wrapper:
+    # Stand-in for a GMAT ElementWrapper
+    def __init__(self, evaluate):
+        self.evaluate = evaluate
+
+    def EvaluateReal(self) -> float:
+        return self.evaluate()
+
+
+class Gmat:
+    def __init__(self, sat: SatObject):
+        self.sat = sat
+
+    def GetObject(self, name: str) -> SatObject:
+        return self.sat
+
+
+def make_recorder(params: list[str] = ('Sat.X',), **kwargs) -> gpy.ParameterRecorder:
+    return gpy.ParameterRecorder(list(params), **kwargs)
+
+
+class TestBuffer(unittest.TestCase):
+    def test_growth(self):
+        recorder = make_recorder(['Sat.X', 'Sat.Y'], capacity=2)
+        for row in range(5):
+            recorder._append([row, 10 * row, 100 * row])
+        self.assertEqual(len(recorder), 5)
+        self.assertEqual(len(recorder._buffer), 8)
+        np.testing.assert_array_equal(recorder.epochs, np.arange(5))
+        np.testing.assert_array_equal(recorder['Sat.Y'], 100 * np.arange(5))
+
+    def test_ring(self):
+        recorder = make_recorder(capacity=3, ring=True)
+        for row in range(7):
+            recorder._append([row, -row])
+        self.assertEqual((len(recorder), recorder.count), (3, 7))
+        np.testing.assert_array_equal(recorder.epochs, [4, 5, 6])
+        np.testing.assert_array_equal(recorder['Sat.X'], [-4, -5, -6])
+
+    def test_clear(self):
+        recorder = make_recorder()
+        recorder._append([0, 1])
+        recorder.clear()
+        self.assertEqual(len(recorder), 0)
+        self.assertEqual(recorder.data.shape, (0, 2))
+
+    def test_invalid(self):
+        with self.assertRaises(AttributeError):
+            make_recorder([])
+        with self.assertRaises(AttributeError):
+            make_recorder(decimation=0)
+        with self.assertRaises(AttributeError):
+            make_recorder(cadence=-1)
+        with self.assertRaises(AttributeError):
+            make_recorder()['Sat.VX']
+
+
+class TestPropagate(unittest.TestCase):
+    def setUp(self):
+        self.sat_obj = SatObject()
+        patcher = mock.patch.object(gpy.results, 'gmat', Gmat(self.sat_obj))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.sat = gpy.Spacecraft.__new__(gpy.Spacecraft)
+        self.sat.__dict__.update({'name': 'Sat', '_name': 'Sat', 'gmat_obj': self.sat_obj})
+        self.gator = Propagator(self.sat_obj)
+        self.prop = PropSetup(self.gator)
+
+    def make_recorder(self, **kwargs) -> gpy.ParameterRecorder:
+        recorder = make_recorder(**kwargs)
+        recorder._wrappers = [Wrapper(lambda: self.sat_obj.state[0])]
+        return recorder
+
+    def assertRestored(self):
+        self.assertEqual(self.sat_obj.epoch, START_EPOCH)
+        self.assertEqual(self.sat_obj.state[0], 7000.0)
+        self.assertEqual(self.sat_obj.fields['DisplayStateType'], 'Keplerian')
+
+    def test_integrator_steps(self):
+        recorder = self.make_recorder(decimation=2)
+        data = recorder.propagate(self.prop, self.sat, 600)
+
+        # The start, then every second step of 60 s
+        np.testing.assert_allclose((data[:, 0] - START_EPOCH) * 86400, np.arange(0, 601, 120), atol=1e-6)
+        np.testing.assert_allclose(recorder['Sat.X'], 7000 + np.arange(0, 601, 120), atol=1e-6)
+        self.assertRestored()
+
+        # The Spacecraft is only added to the PropSetup once
+        recorder.propagate(self.prop, self.sat, 60)
+        self.assertEqual(len(self.prop.prop_objects), 1)
+
+    def test_cadence(self):
+        recorder = self.make_recorder(cadence=100)
+        recorder.propagate(self.prop, self.sat, 250)
+        self.assertEqual(self.gator.steps, [100, 100, 50])
+        np.testing.assert_allclose(recorder['Sat.X'], [7000, 7100, 7200, 7250])
+        self.assertRestored()
+
+    def test_stop_condition(self):
+        # Stop where the elapsed time squared crosses 2e4 s^2, between integrator steps, at about 141.42 s
+        stop_wrapper = Wrapper(lambda: self.sat_obj.elapsed() ** 2)
+        recorder = self.make_recorder()
+        recorder._propagate(self.prop, self.sat, 600, (stop_wrapper, 2e4, 1))
+        self.assertEqual(len(recorder), 4)
+        self.assertAlmostEqual(recorder['Sat.X'][-1], 7000 + 2e4 ** 0.5, delta=1e-6)
+        self.assertRestored()
+
+    def test_invalid_duration(self):
+        with self.assertRaises(AttributeError):
+            self.make_recorder().propagate(self.prop, self.sat, 0)
+
+
+class TestCrossing(unittest.TestCase):
+    def test_crossed(self):
+        self.assertTrue(gpy.recorder._crossed(-1, 1, 1))
+        self.assertFalse(gpy.recorder._crossed(1, -1, 1))
+        self.assertTrue(gpy.recorder._crossed(1, 0, -1))
+        self.assertFalse(gpy.recorder._crossed(-1, 1, -1))
+        self.assertTrue(gpy.recorder._crossed(1, -1, 0))
+        self.assertFalse(gpy.recorder._crossed(0, 0, 0))
@@ -0,0 +1,77 @@
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+def make_result(histories: dict = None) -> gpy.MissionResult:
+    return gpy.MissionResult(['Sat', 'Sat2'], [21545.5, 21546.0],
+                             [[7000.0, 0, 0, 0, 7.5, 0], [0, 8000.0, 0, -7.0, 0, 0.5]], ['EarthMJ2000Eq'] * 2,
+                             [850.0, 1000.0], ['Tank', 'Tank'], ['Sat', 'Sat2'], [740.5, 20.0],
+                             ['Burn', 'FiniteBurn'], [-1.25, np.nan], [True, False], ['DC'], ['Converged'],
+                             histories)
+
+
+class TestMissionResult(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.result = make_result({'rmag': np.linspace(7000.0, 7100.0, 11)})
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assertResultsEqual(self, first: gpy.MissionResult, second: gpy.MissionResult):
+        self.assertEqual(vars(first).keys(), vars(second).keys())
+        for name, value in vars(first).items():
+            if name == 'histories':
+                self.assertEqual(value.keys(), second.histories.keys())
+                for history, values in value.items():
+                    np.testing.assert_array_equal(second.histories[history], values)
+            else:
+                np.testing.assert_array_equal(getattr(second, name), value)
+
+    def test_save_load(self):
+        path = os.path.join(self.tmp_dir.name, 'result.npz')
+        self.result.save(path)
+        self.assertResultsEqual(self.result, gpy.MissionResult.load(path))
+
+    def test_save_load_file_object(self):
+        buffer = io.BytesIO()
+        self.result.save(buffer)
+        buffer.seek(0)
+        self.assertResultsEqual(self.result, gpy.MissionResult.load(buffer))
+
+    def test_load_incomplete_file(self):
+        path = os.path.join(self.tmp_dir.name, 'incomplete.npz')
+        np.savez(path, **{name: value for name, value in vars(self.result).items()
+                          if name not in ('solver_statuses', 'histories')})
+        with self.assertRaises(KeyError):
+            gpy.MissionResult.load(path)
+
+    def test_to_dict(self):
+        self.assertResultsEqual(self.result, gpy.MissionResult(**self.result.to_dict()))
+
+    def test_accessors(self):
+        result = self.result
+        np.testing.assert_array_equal(result.state('Sat2'), [0, 8000.0, 0, -7.0, 0, 0.5])
+        self.assertEqual(result.epoch('Sat'), 21545.5)
+        self.assertAlmostEqual(result.epoch('Sat', 'TAI'), 21545.5 - gpy.time.A1_MINUS_TAI / 86400, delta=1e-11)
+        self.assertEqual(result.total_mass('Sat2'), 1000.0)
+        self.assertEqual(result.fuel_mass('Tank', 'Sat2'), 20.0)
+        self.assertEqual(result.fuel_mass('Tank'), 740.5)  # the first entry with that name
+        self.assertEqual(result.delta_tank_mass('Burn'), -1.25)
+        self.assertTrue(np.isnan(result.delta_tank_mass('FiniteBurn')))
+        self.assertEqual(result.solver_status('DC'), 'Converged')
+
+    def test_missing_names(self):
+        for accessor, name in ((self.result.state, 'Sat3'), (self.result.fuel_mass, 'Tank2'),
+                               (self.result.delta_tank_mass, 'Burn2'), (self.result.solver_status, 'DC2')):
+            with self.assertRaises(AttributeError):
+                accessor(name)
@@ -0,0 +1,205 @@
+import http.client
+import json
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+    from gmat_py_simple import server
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+SCRIPT_JOB = {'kind': 'script', 'script': 'Create Spacecraft Sat;'}
+
+
+class Conn:
+    # Stand-in for a worker's end of its Pipe, recording what is sent to it
+    def __init__(self):
+        self.sent: list = []
+        self.closed = False
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+class Process:
+    # Stand-in for a worker process
+    exitcode = None
+
+    def __init__(self):
+        self.terminated = False
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self, timeout: float = None):
+        pass
+
+    def is_alive(self) -> bool:
+        return False
+
+
+class TestJobServer(unittest.TestCase):
+    def setUp(self):
+        # A server whose workers are stand-ins, so no worker processes are started
+        self.server = server.JobServer(num_workers=2)
+        patcher = mock.patch.object(self.server, '_spawn_worker', self.spawn_worker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.server._running = True
+        with self.server._lock:
+            for _ in range(self.server.num_workers):
+                self.server._spawn_worker()
+        self.dispatcher = threading.Thread(target=self.server._dispatch, daemon=True)
+        self.dispatcher.start()
+        self.addCleanup(self.stop)
+
+    def spawn_worker(self):
+        worker_id = next(self.server._worker_ids)
+        self.server._workers[worker_id] = server._Worker(worker_id, Process(), Conn())
+
+    def stop(self):
+        with self.server._lock:
+            self.server._running = False
+            self.server._lock.notify_all()
+        self.dispatcher.join(5)
+
+    def set_ready(self, *worker_ids: int):
+        with self.server._lock:
+            for worker_id in worker_ids:
+                self.server._workers[worker_id].ready = True
+            self.server._lock.notify_all()
+
+    def wait_for(self, predicate) -> bool:
+        # Poll, as the dispatcher starts jobs without notifying waiters
+        deadline = time.monotonic() + 5
+        with self.server._lock:
+            while not predicate() and time.monotonic() < deadline:
+                self.server._lock.wait(0.01)
+            return predicate()
+
+    def complete(self, job: server.Job):
+        # As the receiver thread does when a worker reports a result
+        with self.server._lock:
+            self.server._finish(job, 'done', result={'ok': True})
+
+    def test_priority_order(self):
+        low, high, mid, high2 = [self.server.submit(SCRIPT_JOB, priority) for priority in (0, 5, 1, 5)]
+        self.set_ready(1)
+        worker = self.server._workers[1]
+        for job in (high, high2, mid, low):
+            self.assertTrue(self.wait_for(lambda: job.state == 'running'))
+            self.assertEqual(worker.conn.sent[-1], (job.id, SCRIPT_JOB))
+            self.complete(job)
+        self.assertEqual([job_id for job_id, _ in worker.conn.sent], [high.id, high2.id, mid.id, low.id])
+
+    def test_cancel_queued(self):
+        job = self.server.submit(SCRIPT_JOB)
+        self.assertTrue(self.server.cancel(job.id))
+        self.assertFalse(self.server.cancel(job.id))
+        self.assertEqual((job.state, job.error), ('cancelled', 'Cancelled while queued'))
+
+        # The cancelled job is skipped when a worker becomes ready
+        next_job = self.server.submit(SCRIPT_JOB)
+        self.set_ready(1)
+        self.assertTrue(self.wait_for(lambda: next_job.state == 'running'))
+        self.assertEqual(self.server._workers[1].conn.sent, [(next_job.id, SCRIPT_JOB)])
+
+    def test_cancel_running(self):
+        job = self.server.submit(SCRIPT_JOB)
+        self.set_ready(1, 2)
+        self.assertTrue(self.wait_for(lambda: job.state == 'running'))
+        worker = self.server._workers[job.worker]
+        self.assertTrue(self.server.cancel(job.id))
+        self.assertEqual(job.state, 'cancelled')
+        self.assertTrue(worker.process.terminated and worker.conn.closed)
+        self.assertNotIn(worker.id, self.server._workers)
+        self.assertEqual(len(self.server._workers), 2)  # replaced
+
+    def test_timeout(self):
+        job = self.server.submit(SCRIPT_JOB, timeout=0.01)
+        self.set_ready(1)
+        self.assertTrue(self.wait_for(lambda: job.is_finished))
+        self.assertEqual(job.state, 'timeout')
+        self.assertTrue(job.finished_event.is_set())
+
+    def test_metrics(self):
+        done, running, queued = [self.server.submit(SCRIPT_JOB, priority) for priority in (2, 1, 0)]
+        self.set_ready(1, 2)
+        self.assertTrue(self.wait_for(lambda: running.state == 'running'))
+        time.sleep(0.01)
+        self.complete(done)
+
+        metrics = self.server.metrics()
+        self.assertEqual(metrics['queue_depth'], 1)
+        self.assertEqual({state: count for state, count in metrics['jobs'].items() if count},
+                         {'queued': 1, 'running': 1, 'done': 1})
+        self.assertEqual((metrics['workers'], metrics['workers_busy'], metrics['workers_starting']), (2, 1, 0))
+        self.assertGreater(metrics['throughput_per_min'], 0)
+        self.assertGreater(metrics['mean_run_secs'], 0)
+        self.assertTrue(0 < metrics['worker_utilization'] <= 1)
+
+    def test_submit_checks(self):
+        with self.assertRaises(AttributeError):
+            self.server.submit({'kind': 'builder', 'builder': 'no_function'})
+        with self.assertRaises(AttributeError):
+            self.server.submit(['not', 'a', 'dict'])
+        self.stop()
+        with self.assertRaises(RuntimeError):
+            self.server.submit(SCRIPT_JOB)
+
+
+class TestJob(unittest.TestCase):
+    def test_log_text(self):
+        job = server.Job(1, SCRIPT_JOB)
+        for chunk in ('first\n', 'second\n', 'third\n'):
+            job.log.append(chunk)
+            job.log_size += len(chunk)
+            job.log_ends.append(job.log_size)
+        self.assertEqual(job.log_text(), 'first\nsecond\nthird\n')
+        self.assertEqual(job.log_text(8), 'cond\nthird\n')
+        self.assertEqual(job.log_text(13), 'third\n')
+        self.assertEqual(job.log_text(job.log_size), '')
+
+
+class TestHandler(unittest.TestCase):
+    def setUp(self):
+        self.server = server.JobServer(num_workers=1)
+        self.server._running = True  # accepts jobs, without starting workers
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), server._make_handler(self.server))
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.addCleanup(self.httpd.server_close)
+        self.addCleanup(self.httpd.shutdown)
+
+    def request(self, method: str, path: str, body: bytes = None) -> tuple[int, object]:
+        conn = http.client.HTTPConnection('127.0.0.1', self.httpd.server_port, timeout=5)
+        try:
+            conn.request(method, path, body)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            conn.close()
+
+    def test_post(self):
+        status, body = self.request('POST', '/jobs', json.dumps(dict(SCRIPT_JOB, priority=3)).encode())
+        self.assertEqual((status, body['state'], body['priority']), (202, 'queued', 3))
+        for bad_body in (b'[]', b'1', b'"script"', b'{"kind": "unknown"}', b'not json'):
+            status, body = self.request('POST', '/jobs', bad_body)
+            self.assertEqual(status, 400, bad_body)
+            self.assertIn('error', body)
+
+    def test_get(self):
+        job = self.server.submit(SCRIPT_JOB)
+        self.assertEqual(self.request('GET', f'/jobs/{job.id}?wait=0')[1]['id'], job.id)
+        self.assertEqual(self.request('GET', f'/jobs/{job.id}?wait=-1')[0], 400)
+        self.assertEqual(self.request('GET', f'/jobs/{job.id}/log?offset=-1')[0], 400)
+        self.assertEqual(self.request('GET', '/jobs/99')[0], 404)
+        self.assertEqual(self.request('GET', '/metrics')[1]['queue_depth'], 1)
+        self.assertEqual(self.request('DELETE', f'/jobs/{job.id}')[0], 200)
+        self.assertEqual(self.request('DELETE', f'/jobs/{job.id}')[0], 409)
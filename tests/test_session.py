@@ -0,0 +1,195 @@
+import gc
+import io
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+# Stand-ins for GMAT's SWIG classes, which the session pickler recognizes by their module
+class GmatBase:
+    __module__ = 'gmatpy.gmat_py'
+
+    def __init__(self, name: str, type_name: str = 'Spacecraft', generating_string: str = ''):
+        self.name = name
+        self.type_name = type_name
+        self.generating_string = generating_string or f'Create {type_name} {name};\n'
+        self.fields: dict[str, str] = {}
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetTypeName(self) -> str:
+        return self.type_name
+
+    def GetGeneratingString(self) -> str:
+        return self.generating_string
+
+    def SetField(self, field: str, value: str):
+        self.fields[field] = value
+
+
+class Rvector:
+    __module__ = 'gmatpy.gmat_py'
+
+    def __init__(self, values: list[float]):
+        self.values = values
+
+    def GetSize(self) -> int:
+        return len(self.values)
+
+    def GetElement(self, index: int) -> float:
+        return self.values[index]
+
+
+class Rmatrix:
+    __module__ = 'gmatpy.gmat_py'
+
+    def __init__(self, rows: list[list[float]]):
+        self.rows = rows
+
+    def GetNumRows(self) -> int:
+        return len(self.rows)
+
+    def GetNumColumns(self) -> int:
+        return len(self.rows[0])
+
+    def GetElement(self, row: int, col: int) -> float:
+        return self.rows[row][col]
+
+
+class PropStateManager:
+    __module__ = 'gmatpy.gmat_py'
+
+
+class RuntimeSat(GmatBase):
+    def GetStringArrayParameter(self, param: str) -> list[str]:
+        return []
+
+    def GetRealParameter(self, param: str) -> float:
+        return 21546.0 if param == 'A1Epoch' else 1.0
+
+
+class Gmat:
+    # Stand-in for the gmat module's configuration
+    def __init__(self, version: str = 'R2022a'):
+        self.version = version
+        self.objects: dict[str, GmatBase] = {}
+        self.runtime_objects: dict[str, GmatBase] = {}
+        self.GmatGlobal = self
+        self.ConfigManager = self
+
+    def Instance(self):
+        return self
+
+    def GetGmatVersion(self) -> str:
+        return self.version
+
+    def GetListOfAllItems(self) -> list[str]:
+        return ['EarthMJ2000Eq', 'Sat.Earth.RMAG'] + list(self.objects)
+
+    def GetObject(self, name: str) -> GmatBase | None:
+        return self.objects.get(name)
+
+    def GetRuntimeObject(self, name: str) -> GmatBase | None:
+        return self.runtime_objects.get(name)
+
+
+def make_wrapper(cls: type, name: str, **attrs):
+    wrapper = cls.__new__(cls)
+    wrapper.__dict__.update({'name': name, '_name': name, **attrs})
+    return wrapper
+
+
+def round_trip(obj, gmat: Gmat):
+    buffer = io.BytesIO()
+    gpy.session._SessionPickler(buffer).dump(obj)
+    with mock.patch.object(gpy.session, 'gmat', gmat):
+        return gpy.session._SessionUnpickler(io.BytesIO(buffer.getvalue())).load()
+
+
+class TestPickler(unittest.TestCase):
+    def test_gmat_objects_by_name(self):
+        gmat = Gmat()
+        gmat.objects['Sat'] = GmatBase('Sat')  # the object as rebuilt from the script
+        wrapper = make_wrapper(gpy.Spacecraft, 'Sat', gmat_obj=GmatBase('Sat'), position=Rvector([7000.0, 0.0, 1.5]),
+                               dcm=Rmatrix([[1.0, 0.0], [0.0, -1.0]]))
+        loaded = round_trip({'sat': wrapper}, gmat)['sat']
+        self.assertIs(loaded.gmat_obj, gmat.objects['Sat'])
+        self.assertEqual(loaded.position, [7000.0, 0.0, 1.5])
+        self.assertEqual(loaded.dcm, [[1.0, 0.0], [0.0, -1.0]])
+
+    def test_unsupported_gmat_object(self):
+        with self.assertRaises(pickle.PicklingError):
+            round_trip({'psm': PropStateManager()}, Gmat())
+
+    def test_object_not_rebuilt(self):
+        wrapper = make_wrapper(gpy.Spacecraft, 'Sat', gmat_obj=GmatBase('Sat'))
+        with self.assertRaises(RuntimeError):
+            round_trip(wrapper, Gmat())
+
+    def test_interned_again(self):
+        key = ('ForceModelSpec', gpy.ForceModelSpec(srp=True))
+        gmat = Gmat()
+        gmat.objects['FM'] = GmatBase('FM', 'ForceModel')
+        fm = make_wrapper(gpy.ForceModel, 'FM', gmat_obj=GmatBase('FM', 'ForceModel'), _intern=(key, ('FM',)))
+        loaded = round_trip(fm, gmat)
+        self.assertIs(gpy.orbit._interned[key], loaded)
+        self.assertIs(loaded.gmat_obj, gmat.objects['FM'])
+
+        # and released like any interned object
+        with mock.patch.object(gpy, 'RemoveObject') as remove_object:
+            del loaded
+            gc.collect()
+        remove_object.assert_called_once_with('FM', only_if_unused=True)
+        self.assertNotIn(key, gpy.orbit._interned)
+
+
+class TestSaveLoad(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'session.gpys')
+        self.gmat = Gmat()
+        self.gmat.objects['Sat'] = GmatBase('Sat')
+        self.gmat.runtime_objects['Sat'] = RuntimeSat('Sat')
+        self.scripts = []
+        for target, name, value in ((gpy.session, 'gmat', self.gmat), (gpy, 'flush', lambda **_: None),
+                                    (gpy, 'LoadScript', self.load_script), (gpy, 'Initialize', lambda: None)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def load_script(self, path: str) -> bool:
+        with open(path) as f:
+            self.scripts.append(f.read())
+        return True
+
+    def test_round_trip(self):
+        sat = make_wrapper(gpy.Spacecraft, 'Sat', gmat_obj=self.gmat.objects['Sat'], was_propagated=True)
+        self.assertGreater(gpy.session.save(self.path, {'sat': sat, 'count': 3}), 0)
+
+        wrappers = gpy.session.load(self.path, runtime=True)
+        self.assertEqual(self.scripts, ['Create Spacecraft Sat;\n'])  # default and system objects left out
+        self.assertEqual(list(wrappers), ['sat'])
+        self.assertFalse(wrappers['sat'].was_propagated)
+        self.assertEqual(self.gmat.objects['Sat'].fields['Epoch'], '21546.0')  # runtime state applied
+        self.assertEqual(self.gmat.objects['Sat'].fields['VZ'], '1.0')
+
+    def test_version_mismatch(self):
+        gpy.session.save(self.path, [])
+        self.gmat.version = 'R2025a'
+        with self.assertRaises(AttributeError):
+            gpy.session.load(self.path)
+
+    def test_not_a_session(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'Create Spacecraft Sat;')
+        with self.assertRaises(AttributeError):
+            gpy.session.load(self.path)
@@ -0,0 +1,289 @@
+import unittest
+from functools import partialmethod
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+    from gmat_py_simple import gmat
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+# Fields of the stand-in GMAT types, and their GMAT parameter types
+FIELDS = {
+    'Spacecraft': {'DateFormat': gmat.STRING_TYPE, 'Epoch': gmat.STRING_TYPE, 'CoordinateSystem': gmat.OBJECT_TYPE,
+                   'DisplayStateType': gmat.ENUMERATION_TYPE, 'DryMass': gmat.REAL_TYPE, 'Id': gmat.STRING_TYPE,
+                   'NAIFId': gmat.INTEGER_TYPE, 'Tanks': gmat.STRINGARRAY_TYPE, 'Thrusters': gmat.STRINGARRAY_TYPE,
+                   'PowerSystem': gmat.OBJECT_TYPE, 'TotalMass': gmat.REAL_TYPE},
+    'ChemicalTank': {'FuelMass': gmat.REAL_TYPE, 'Pressure': gmat.REAL_TYPE},
+    'ChemicalThruster': {'Tank': gmat.STRINGARRAY_TYPE, 'DecrementMass': gmat.BOOLEAN_TYPE,
+                         'DutyCycle': gmat.REAL_TYPE},
+}
+READ_ONLY = {'TotalMass'}
+
+
+class GmatObject:
+    # Stand-in for a configured GMAT object, recording the calls that set its fields
+    def __init__(self, type_name: str, name: str, values: dict = None):
+        self.type_name = type_name
+        self.name = name
+        self.values = dict(values or {})
+        self.calls: list[tuple] = []
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetTypeName(self) -> str:
+        return self.type_name
+
+    def GetParameterID(self, field: str) -> int:
+        if field not in FIELDS[self.type_name]:
+            raise RuntimeError(f'Parameter id unavailable for "{field}"')  # as GMAT's APIException
+        return list(FIELDS[self.type_name]).index(field)
+
+    def field(self, param: int | str) -> str:
+        return list(FIELDS[self.type_name])[param] if isinstance(param, int) else param
+
+    def IsParameterReadOnly(self, param_id: int) -> bool:
+        return self.field(param_id) in READ_ONLY
+
+    def GetParameterType(self, param_id: int):
+        return FIELDS[self.type_name][self.field(param_id)]
+
+    def _set(self, method: str, param: int | str, value, *index: int):
+        self.calls.append((method, self.field(param), value))
+        if index:  # an element of an array
+            self.values[self.field(param)][index[0]] = value
+        else:
+            self.values[self.field(param)] = value
+
+    SetField = partialmethod(_set, 'SetField')
+    SetRealParameter = partialmethod(_set, 'SetRealParameter')
+    SetIntegerParameter = partialmethod(_set, 'SetIntegerParameter')
+    SetBooleanParameter = partialmethod(_set, 'SetBooleanParameter')
+    SetStringParameter = partialmethod(_set, 'SetStringParameter')
+
+    def GetField(self, field: str):
+        return self.values.get(field)
+
+    def GetBooleanParameter(self, field: str) -> bool:
+        return self.values.get(field, True)
+
+    def GetStringParameter(self, field: str) -> str:
+        return self.values.get(field, '')
+
+    def GetStringArrayParameter(self, param: int | str) -> list[str]:
+        return list(self.values.get(self.field(param), []))
+
+    def TakeAction(self, action: str, action_data: str) -> bool:
+        self.calls.append(('TakeAction', action, action_data))
+        return True
+
+    def Validate(self) -> bool:
+        return True
+
+
+class StandInTestCase(unittest.TestCase):
+    # Creates and removes stand-in GMAT objects, with empty field plan and builder caches
+    def setUp(self):
+        self.objects: dict[str, GmatObject] = {}
+        self.removed: list[str] = []
+        self.initializations = 0
+        for target, name, value in ((gpy, 'Construct', self.construct), (gpy, 'RemoveObject', self.remove_object),
+                                    (gpy, 'Initialize', self.initialize)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for cache in (gpy.spacecraft._field_plans, gpy.spacecraft._compiled_builders):
+            patcher = mock.patch.dict(cache, clear=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def construct(self, obj_type: str, name: str) -> GmatObject:
+        obj = self.objects[name] = GmatObject(obj_type, name)
+        return obj
+
+    def remove_object(self, name: str, only_if_unused: bool = True) -> bool:
+        self.removed.append(name)
+        return self.objects.pop(name) is not None
+
+    def initialize(self) -> bool:
+        self.initializations += 1
+        return True
+
+
+class TestSpacecraftBuilder(StandInTestCase):
+    @staticmethod
+    def make_spec(name: str, sma: float = 7000, fuel_mass: float = 700) -> dict:
+        return {'Name': name,
+                'Orbit': {'SMA': sma, 'ECC': 0.01, 'DisplayStateType': 'Keplerian', 'CoordSys': 'EarthMJ2000Eq',
+                          'Epoch': '21545'},
+                'DryMass': 850,
+                'Hardware': {'ChemicalTanks': [{'Name': f'{name}_Tank', 'FuelMass': fuel_mass}],
+                             'ChemicalThrusters': [{'Name': f'{name}_Thruster', 'Tanks': f'{name}_Tank',
+                                                    'DecrementMass': 'false'}]}}
+
+    def test_build_many(self):
+        builder = gpy.Spacecraft.compile_spec(self.make_spec('Sat'))
+        prototypes = list(self.removed)
+        self.assertEqual(sorted(prototypes), ['__gpy_prototype_ChemicalTank', '__gpy_prototype_ChemicalThruster',
+                                              '__gpy_prototype_Spacecraft'])
+
+        sats = builder.build_many([self.make_spec('Sat1', 7100), self.make_spec('Sat2', 7200, 650)])
+        self.assertEqual(self.initializations, 1)
+        self.assertEqual(self.removed, prototypes)  # fields resolved when compiled, not for each Spacecraft
+        self.assertEqual([sat.name for sat in sats], ['Sat1', 'Sat2'])
+
+        # Epoch and state settings first, then the elements, then the other fields, each with its typed setter
+        self.assertEqual(self.objects['Sat2'].calls, [
+            ('SetStringParameter', 'Epoch', '21545'), ('SetStringParameter', 'CoordinateSystem', 'EarthMJ2000Eq'),
+            ('SetStringParameter', 'DisplayStateType', 'Keplerian'), ('SetRealParameter', 'SMA', 7200.0),
+            ('SetRealParameter', 'ECC', 0.01), ('SetRealParameter', 'DryMass', 850.0),
+            ('SetField', 'Tanks', 'Sat2_Tank'), ('SetField', 'Thrusters', 'Sat2_Thruster')])
+        self.assertEqual(self.objects['Sat2_Tank'].calls, [('SetRealParameter', 'FuelMass', 650.0)])
+        self.assertEqual(self.objects['Sat2_Thruster'].calls,
+                         [('SetBooleanParameter', 'DecrementMass', False), ('SetField', 'Tank', 'Sat2_Tank')])
+
+        sat = sats[1]
+        self.assertIsNone(sat.orbit)
+        self.assertIs(sat.gmat_obj, self.objects['Sat2'])
+        self.assertEqual([tank.name for tank in sat.chem_tanks], ['Sat2_Tank'])
+        self.assertIs(sat.chem_tanks[0].spacecraft, sat)
+        thruster = sat.chem_thrusters[0]
+        self.assertEqual((thruster.tanks, thruster.mix_ratio, thruster._decrement_mass), ('Sat2_Tank', [1], False))
+        self.assertEqual(sat.hardware.chem_thrusters, [thruster])
+        self.assertIsNone(sat.elec_tanks)
+
+    def test_top_level_orbit_fields(self):
+        sat = gpy.SpacecraftBuilder({'Name': 'Sat', 'X': 7000, 'DateFormat': 'UTCGregorian'}).build(
+            {'Name': 'Sat', 'X': 7100, 'DateFormat': 'UTCGregorian'})
+        self.assertEqual(self.objects['Sat'].calls,
+                         [('SetStringParameter', 'DateFormat', 'UTCGregorian'), ('SetRealParameter', 'X', 7100.0)])
+        self.assertEqual(sat.hardware.chem_tanks, [])
+
+    def test_invalid_schema(self):
+        spec = self.make_spec('Sat')
+        for invalid in ({'DryMass': 850},  # no Name
+                        dict(spec, SMA=7000),  # both in Orbit and at the top level
+                        dict(spec, Orbit={'DisplayStateType': 'Polar'}),
+                        dict(spec, Orbit={'X': 7000, 'SMA': 7000}),  # SMA is not a Cartesian element
+                        dict(spec, Hardware={'Tanks': []}),
+                        dict(spec, Hardware={'ChemicalTanks': [{'FuelMass': 700}]}),
+                        dict(spec, Colour='red'),  # not a Spacecraft field
+                        dict(spec, TotalMass=900)):  # read-only
+            with self.assertRaises(AttributeError, msg=invalid):
+                gpy.SpacecraftBuilder(invalid)
+
+        # Empty hardware items are skipped, as from_dict() accepts them
+        builder = gpy.SpacecraftBuilder(dict(spec, Hardware={'ChemicalTanks': [{}]}))
+        self.assertEqual(builder._hardware_plans, [])
+
+    def test_schema_mismatch(self):
+        builder = gpy.Spacecraft.compile_spec(self.make_spec('Sat'))
+        with self.assertRaises(AttributeError):
+            builder.build(dict(self.make_spec('Sat1'), Id='SAT-1'))
+        other_state = self.make_spec('Sat2')
+        other_state['Orbit']['DisplayStateType'] = 'ModifiedKeplerian'
+        with self.assertRaises(AttributeError):
+            builder.build(other_state)
+        self.assertEqual(self.initializations, 0)
+
+    def test_from_dicts(self):
+        specs = [self.make_spec('Sat1'), {'Name': 'Sat2', 'NAIFId': '-10002'}, self.make_spec('Sat3')]
+        sats = gpy.Spacecraft.from_dicts(specs)
+        self.assertEqual([sat.name for sat in sats], ['Sat1', 'Sat2', 'Sat3'])
+        self.assertEqual(self.initializations, 1)
+        self.assertEqual(len(gpy.spacecraft._compiled_builders), 2)
+        self.assertEqual(self.objects['Sat2'].calls, [('SetIntegerParameter', 'NAIFId', -10002)])
+
+        # Builders are kept for later calls
+        builders = dict(gpy.spacecraft._compiled_builders)
+        gpy.Spacecraft.from_dicts([self.make_spec('Sat4')])
+        self.assertEqual(gpy.spacecraft._compiled_builders, builders)
+
+    def test_spec_signature(self):
+        signature = gpy.spacecraft._spec_signature
+        spec = self.make_spec('Sat')
+        self.assertEqual(signature(spec), signature(self.make_spec('Other', 8000, 100)))  # values don't count
+        self.assertNotEqual(signature(spec), signature(dict(spec, Id='SAT')))
+        self.assertNotEqual(signature(spec), signature({key: spec[key] for key in reversed(spec)}))  # key order does
+
+        two_tanks = self.make_spec('Sat')
+        two_tanks['Hardware']['ChemicalTanks'].append({'Name': 'Tank2', 'FuelMass': 10})
+        self.assertNotEqual(signature(spec), signature(two_tanks))
+
+        keplerian, cartesian = {'DisplayStateType': 'Keplerian'}, {'DisplayStateType': 'Cartesian'}
+        self.assertNotEqual(signature(keplerian), signature(cartesian))
+        self.assertIsNone(signature([]))
+
+
+class Gmat:
+    # Stand-in for the gmat module's object lookup and copying
+    def __init__(self, objects: dict[str, GmatObject]):
+        self.objects = objects
+
+    def GetObject(self, name: str) -> GmatObject:
+        return self.objects[name]
+
+    def Copy(self, obj: GmatObject, name: str) -> GmatObject:
+        copy = self.objects[name] = GmatObject(obj.type_name, name, {field: list(value) if isinstance(value, list)
+                                                                     else value for field, value in obj.values.items()})
+        return copy
+
+
+class TestSpacecraftTemplate(StandInTestCase):
+    def setUp(self):
+        super().setUp()
+        for target, name, value in ((gpy.spacecraft, 'gmat', Gmat(self.objects)), (gpy, 'flush', lambda **_: None)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.objects['Tank'] = GmatObject('ChemicalTank', 'Tank', {'FuelMass': 700.0})
+        self.objects['Thruster'] = GmatObject('ChemicalThruster', 'Thruster', {'Tank': ['Tank'], 'DecrementMass': True})
+        sat_obj = self.objects['Sat'] = GmatObject('Spacecraft', 'Sat', {'DryMass': 850.0, 'Tanks': ['Tank'],
+                                                                         'Thrusters': ['Thruster']})
+        thruster = gpy.spacecraft._wrap(gpy.ChemicalThruster, self.objects['Thruster'], mix_ratio=[1])
+        self.sat = gpy.spacecraft._wrap(gpy.Spacecraft, sat_obj, chem_thrusters=[thruster])
+        self.template = gpy.SpacecraftTemplate(self.sat)
+
+    def test_create_many(self):
+        sats = self.template.create_many({f'Sat{i}': {'DryMass': dry_mass, 'Tank': {'FuelMass': fuel_mass}}
+                                          for i, (dry_mass, fuel_mass) in enumerate(((900, 600), (950, 500)))})
+        self.assertEqual(self.initializations, 1)
+        self.assertEqual(sorted(self.removed), ['__gpy_prototype_ChemicalTank', '__gpy_prototype_Spacecraft'])
+        self.assertEqual([sat.name for sat in sats], ['Sat0', 'Sat1'])
+
+        # Copies refer to their own hardware, and take the overrides
+        self.assertEqual(self.objects['Sat1'].calls, [
+            ('TakeAction', 'RemoveTank', ''), ('SetField', 'Tanks', 'Sat1_Tank'),
+            ('TakeAction', 'RemoveThruster', ''), ('SetField', 'Thrusters', 'Sat1_Thruster'),
+            ('SetRealParameter', 'DryMass', 950.0)])
+        self.assertEqual(self.objects['Sat1_Tank'].values['FuelMass'], 500.0)
+        self.assertEqual(self.objects['Sat1_Thruster'].values['Tank'], ['Sat1_Tank'])
+        self.assertEqual(len(self.template._plans), 1)  # planned once for both variants
+
+        thruster = sats[1].chem_thrusters[0]
+        self.assertEqual((thruster.name, thruster.tanks, thruster.mix_ratio), ('Sat1_Thruster', 'Sat1_Tank', [1]))
+        self.assertEqual([tank.name for tank in sats[1].chem_tanks], ['Sat1_Tank'])
+
+        # The template's own objects are unchanged
+        self.assertEqual((self.objects['Sat'].calls, self.objects['Tank'].values['FuelMass']), ([], 700.0))
+        self.assertEqual(self.objects['Thruster'].values['Tank'], ['Tank'])
+
+    def test_clone(self):
+        copies = self.template.create_many(['Copy1', 'Copy2'])
+        self.assertEqual([copy.name for copy in copies], ['Copy1', 'Copy2'])
+        self.assertEqual(self.objects['Copy2'].values['DryMass'], 850.0)
+
+        self.sat.clone('Clone', {'Orbit': {'SMA': 7000, 'DisplayStateType': 'Keplerian'}, 'CoordSys': 'EarthFixed'})
+        self.assertEqual(self.objects['Clone'].calls[-3:], [
+            ('SetStringParameter', 'CoordinateSystem', 'EarthFixed'),
+            ('SetStringParameter', 'DisplayStateType', 'Keplerian'), ('SetRealParameter', 'SMA', 7000.0)])
+
+    def test_invalid_overrides(self):
+        for invalid in ({'Tank2': {'FuelMass': 100}},  # not hardware of the template
+                        {'Orbit': {'DryMass': 900}, 'DryMass': 900},  # both in Orbit and at the top level
+                        {'Colour': 'red'}, {'Tank': {'Colour': 'red'}}):  # not fields
+            with self.assertRaises(AttributeError, msg=invalid):
+                self.template.create('Variant', invalid)
+        self.assertEqual(self.initializations, 0)
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+# The entries since 1999 of GMAT's data/time/tai-utc.dat
+TAI_UTC_LINES = """ 1999 JAN  1 =JD 2451179.5  TAI-UTC=  32.0       S + (MJD - 41317.) X 0.0      S
+ 2006 JAN  1 =JD 2453736.5  TAI-UTC=  33.0       S + (MJD - 41317.) X 0.0      S
+ 2009 JAN  1 =JD 2454832.5  TAI-UTC=  34.0       S + (MJD - 41317.) X 0.0      S
+ 2012 JUL  1 =JD 2456109.5  TAI-UTC=  35.0       S + (MJD - 41317.) X 0.0      S
+ 2015 JUL  1 =JD 2457204.5  TAI-UTC=  36.0       S + (MJD - 41317.) X 0.0      S
+ 2017 JAN  1 =JD 2457754.5  TAI-UTC=  37.0       S + (MJD - 41317.) X 0.0      S
+"""
+
+
+class TestTime(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env = {'GMAT_PY_SIMPLE_CACHE': os.environ.get('GMAT_PY_SIMPLE_CACHE')}
+        os.environ['GMAT_PY_SIMPLE_CACHE'] = os.path.join(self.tmp_dir.name, 'cache')
+        self.leap_second_path = os.path.join(self.tmp_dir.name, 'tai-utc.dat')
+        with open(self.leap_second_path, 'w') as f:
+            f.write(TAI_UTC_LINES)
+        gpy.time.leap_seconds(self.leap_second_path)
+
+    def tearDown(self):
+        gpy.data_cache.clear()
+        for name, value in self.env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        gpy.time.leap_seconds(reload=True)
+        self.tmp_dir.cleanup()
+
+    def test_leap_second_2016_2017(self):
+        tai = gpy.time.convert(['31 Dec 2016 23:59:59.000', '01 Jan 2017 00:00:00.000'], 'UTCGregorian',
+                               'TAIGregorian')
+        self.assertEqual(list(tai), ['01 Jan 2017 00:00:35.000', '01 Jan 2017 00:00:37.000'])
+
+        utc = gpy.time.convert(['01 Jan 2017 00:00:35.000', '01 Jan 2017 00:00:37.000'], 'TAIGregorian',
+                               'UTCGregorian')
+        self.assertEqual(list(utc), ['31 Dec 2016 23:59:59.000', '01 Jan 2017 00:00:00.000'])
+
+    def test_tai_minus_utc(self):
+        table = gpy.time.leap_seconds()
+        self.assertEqual(len(table), 6)
+        utc = gpy.time.parse_gregorian(['01 Jan 2010 00:00:00.000', '01 Jan 2016 00:00:00.000',
+                                        '01 Jan 2020 00:00:00.000'])
+        np.testing.assert_array_equal(table.tai_minus_utc(utc), [34.0, 36.0, 37.0])
+
+    def test_file_matches_fallback(self):
+        utc = gpy.time.parse_gregorian(['01 Jul 2012 00:00:00.000', '30 Jun 2015 23:59:59.000',
+                                        '01 Jan 2024 00:00:00.000'])
+        np.testing.assert_array_equal(gpy.time.leap_seconds().tai_minus_utc(utc),
+                                      gpy.time.LeapSecondTable.fallback().tai_minus_utc(utc))
+
+    def test_j2000(self):
+        a1 = gpy.time.convert('01 Jan 2000 11:59:28.000', 'UTCGregorian', 'A1ModJulian')
+        self.assertAlmostEqual(float(a1[0]), 21545.0 + gpy.time.A1_MINUS_TAI / 86400, delta=1e-11)
+        tt = gpy.time.convert(21545.0, 'TAIModJulian', 'TTModJulian')
+        self.assertAlmostEqual(float(tt), 21545.0 + 32.184 / 86400, delta=1e-11)
+
+    def test_round_trips(self):
+        mjd = 21545.0 + np.linspace(-3000, 9000, 1001)
+        for system in gpy.time.TIME_SYSTEMS:
+            back = gpy.time.from_tai(gpy.time.to_tai(mjd, system), system)
+            np.testing.assert_allclose(back, mjd, rtol=0, atol=1e-10)
+
+    def test_gregorian_strings(self):
+        strings = np.array(['01 Jan 2000 11:59:28.000', '29 Feb 2024 23:59:59.999', '31 Dec 1999 00:00:00.001'])
+        np.testing.assert_array_equal(gpy.time.format_gregorian(gpy.time.parse_gregorian(strings)), strings)
+        # Strings not in GMAT's fixed-width form take the slow path
+        self.assertEqual(gpy.time.parse_gregorian(' 1 Jan 2000 12:00:00.0')[0], 21545.0)
+
+    def test_iso_strings(self):
+        calendar = gpy.time.parse_iso(['2017-01-01T00:00:37.125', '2000-01-01T12:00:00Z'])
+        day_of_year = gpy.time.parse_iso([b'2017-001T00:00:37.125', b'2000-001T12:00:00Z'])
+        np.testing.assert_array_equal(calendar, day_of_year)
+        self.assertEqual(calendar[1], 21545.0)
+        self.assertEqual(gpy.time.format_iso(calendar, 3)[0], b'2017-01-01T00:00:37.125')
+
+    def test_invalid_format(self):
+        with self.assertRaises(AttributeError):
+            gpy.time.convert(21545.0, 'GPSModJulian', 'UTCModJulian')
@@ -0,0 +1,47 @@
+import io
+import sys
+import threading
+import unittest
+from unittest import mock
+
+try:
+    import gmat_py_simple as gpy
+except (FileNotFoundError, ValueError) as ex:  # GMAT not installed, or its path not configured
+    raise unittest.SkipTest(f'gmat_py_simple could not load GMAT: {ex}')
+
+
+class TestCaptureStdout(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('sys.stdout', new_callable=io.StringIO)
+        self.stdout = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_other_threads_pass_through(self):
+        def show():
+            print('captured')
+            thread = threading.Thread(target=print, args=('from another thread',))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(gpy.capture_stdout(show), 'captured\n')
+        self.assertEqual(self.stdout.getvalue(), 'from another thread\n')
+
+    def test_concurrent_captures(self):
+        results = {}
+
+        def capture(name: str):
+            results[name] = gpy.capture_stdout(lambda: [print(name, line) for line in range(100)])
+
+        threads = [threading.Thread(target=capture, args=(name,)) for name in ('a', 'b', 'c')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for name, text in results.items():
+            self.assertEqual(text, ''.join(f'{name} {line}\n' for line in range(100)))
+        self.assertEqual(self.stdout.getvalue(), '')
+
+    def test_restored_after_exception(self):
+        with self.assertRaises(ValueError):
+            gpy.capture_stdout(int, 'not a number')
+        self.assertIs(sys.stdout, self.stdout)